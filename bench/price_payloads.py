@@ -0,0 +1,181 @@
+"""Serialization time and payload size of a 10,000-bar price series.
+
+Reproduces the table in ``sidecar/api/fast_json.py``. Seeds a throwaway
+SQLite database with 10,000 5-minute bars for one asset, then measures:
+
+- render time for the same rows as Pydantic models (the pre-orjson path)
+  and through ``fast_json.dumps`` with decimals as strings and as numbers;
+- the body of ``GET /api/prices/{symbol}/?limit=10000`` in each wire
+  format (``rows`` with both decimal encodings, ``columnar``, ``binary``)
+  before and after gzip at ``GZIP_LEVEL``, plus the request time
+  in-process.
+
+Run from the repository root::
+
+    PYTHONPATH=. python bench/price_payloads.py [--bars N] [--repeat N]
+
+Times are the median of ``--repeat`` runs and vary by machine; sizes are
+deterministic for a given ``--bars``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import math
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+SYMBOL = "BENCH"
+
+
+def _median_ms(fn: Callable[[], Any], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return statistics.median(samples)
+
+
+def _size(n: int) -> str:
+    return f"{n / 1e6:.2f} MB" if n >= 1e6 else f"{n / 1e3:.0f} KB"
+
+
+def _seed(bars: int) -> None:
+    from sidecar.db.engine import session_scope
+    from sidecar.db.models import Asset, AssetType, PricePoint
+
+    start = datetime(2024, 1, 2, 14, 30, tzinfo=UTC)
+    with session_scope() as s:
+        asset = Asset(symbol=SYMBOL, name=SYMBOL, asset_type=AssetType.STOCK)
+        s.add(asset)
+        s.flush()
+        for i in range(bars):
+            # A random-looking walk with cent-level prices, like real equities.
+            close = 150 + 20 * math.sin(i / 400) + 3 * math.sin(i / 7)
+            price = Decimal(f"{close:.2f}")
+            s.add(
+                PricePoint(
+                    asset_id=asset.id,
+                    timestamp=start + timedelta(minutes=5 * i),
+                    interval="5m",
+                    open=price - Decimal("0.12"),
+                    high=price + Decimal("0.31"),
+                    low=price - Decimal("0.27"),
+                    close=price,
+                    volume=10_000 + (i * 7919) % 90_000,
+                )
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bars", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=9)
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="fintrack-bench-")
+    os.environ["FINTRACK_DB_PATH"] = str(Path(tmp) / "bench.db")
+    os.environ.setdefault("FINTRACK_ENABLE_SCHEDULER", "false")
+    os.environ.setdefault("FINTRACK_ENABLE_SEED", "false")
+
+    from fastapi.testclient import TestClient
+    from sqlalchemy import select
+
+    from sidecar.api.fast_json import GZIP_LEVEL, DecimalFormat, decimal_encoder, dumps
+    from sidecar.api.prices import PricePointOut, PriceSeriesOut
+    from sidecar.db.engine import session_scope
+    from sidecar.db.migrations_runner import upgrade_to_head
+    from sidecar.db.models import PricePoint
+    from sidecar.main import app
+
+    upgrade_to_head()
+    _seed(args.bars)
+
+    # -- render time of the same rows --------------------------------------
+    with session_scope() as s:
+        orm_rows = list(
+            s.execute(select(PricePoint).order_by(PricePoint.timestamp)).scalars()
+        )
+
+        def points(decimals: DecimalFormat) -> list[dict[str, Any]]:
+            # What ``get_prices`` hands to orjson.
+            dec = decimal_encoder(decimals)
+            return [
+                {
+                    "timestamp": r.timestamp,
+                    "open": dec(r.open),
+                    "high": dec(r.high),
+                    "low": dec(r.low),
+                    "close": dec(r.close),
+                    "volume": r.volume,
+                }
+                for r in orm_rows
+            ]
+
+        def pydantic() -> bytes:
+            models = [PricePointOut.model_validate(r) for r in orm_rows]
+            out = PriceSeriesOut(symbol=SYMBOL, count=len(models), points=models)
+            return out.model_dump_json().encode()
+
+        def orjson_body(decimals: DecimalFormat) -> Callable[[], bytes]:
+            body = {"symbol": SYMBOL, "count": len(orm_rows), "points": points(decimals)}
+            return partial(dumps, body)
+
+        renders = [
+            ("Pydantic models (before)", pydantic),
+            ("orjson, decimals=string", orjson_body("string")),
+            ("orjson, decimals=number", orjson_body("number")),
+        ]
+        print(f"Render, {args.bars:,} bars (median of {args.repeat})\n")
+        print(f"{'path':<28} {'render':>9} {'body':>9} {'gzip':>9} {'+gzip':>8}")
+        for label, fn in renders:
+            body = fn()
+            ms = _median_ms(fn, args.repeat)
+            gz_ms = _median_ms(partial(gzip.compress, body, GZIP_LEVEL), args.repeat)
+            gz = len(gzip.compress(body, GZIP_LEVEL))
+            print(
+                f"{label:<28} {ms:>6.1f} ms {_size(len(body)):>9} "
+                f"{_size(gz):>9} {gz_ms:>5.1f} ms"
+            )
+
+    # -- wire formats through the endpoint ---------------------------------
+    formats = [
+        ("rows, decimals=string", {}),
+        ("rows, decimals=number", {"decimals": "number"}),
+        ("columnar", {"format": "columnar"}),
+        ("binary", {"format": "binary"}),
+    ]
+    print(f"\nGET /api/prices/{SYMBOL}/?limit={args.bars} (in-process, uncompressed)\n")
+    print(f"{'format':<28} {'request':>9} {'body':>9} {'gzip':>9}")
+    with TestClient(app) as client:
+        for label, extra in formats:
+            params = {"limit": args.bars, **extra}
+
+            def get(p: dict[str, Any] = params) -> bytes:
+                # ``identity`` keeps the middleware out of the timing and sizes.
+                r = client.get(
+                    f"/api/prices/{SYMBOL}/",
+                    params=p,
+                    headers={"Accept-Encoding": "identity"},
+                )
+                r.raise_for_status()
+                return bytes(r.content)
+
+            body = get()
+            ms = _median_ms(get, args.repeat)
+            gz = len(gzip.compress(body, GZIP_LEVEL))
+            print(f"{label:<28} {ms:>6.1f} ms {_size(len(body)):>9} {_size(gz):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,14 @@ Forecasting:
 - `ml.accuracy` — pure-compute: turn forecast snapshots + actual closes
   into MAPE / RMSE / directional metrics, broken out per engine so the
   user can see which model fits their data better.
+- `ml.backtest` — rolling-origin replay of the engines over stored history
+  (no waiting for live horizons to elapse); also a benchmarking CLI.
+- `ml.engine_selection` — per-asset winning engine for the "auto" engine
+  mode, picked from live accuracy or a backtest.
+
+Startup:
+- `ml.warmup` — opt-in background preload of the heavy imports above so
+  the first retrain / scoring pass doesn't stall on them.
 
 Sentiment:
 - `ml.sentiment` — VADER-based headline scorer; returns a compound score in
@@ -31,10 +39,13 @@ from __future__ import annotations
 
 __all__ = [
     "accuracy",
+    "backtest",
     "correlation",
+    "engine_selection",
     "forecast",
     "jobs",
     "persistence",
     "sentiment",
     "volatility",
+    "warmup",
 ]
@@ -18,25 +18,33 @@ Per-engine breakdown lets the user answer "should I switch from SARIMAX
 to Holt-Winters for this asset?" — the headline question that motivated
 Phase 2's two-engine design in the first place.
 
-Pure-compute boundary: this module reads from ``ml.persistence`` /
-``sidecar.db.engine`` but doesn't import statsmodels — it's a stats
-calculator over already-stored predictions, not a fitter. Lazy heavy
-imports kept upstream.
+Storage: ``compute_accuracy`` aggregates the ``accuracy_points`` table —
+one pre-paired (prediction, actual, last_close) row per snapshot forecast
+date, written by ``ml.persistence`` and filled as daily bars land — with
+SQL SUM / COUNT, so a read costs the same however many snapshots have
+accumulated. ``_compute_metrics`` keeps the pure-Python reference
+definition (the backtester scores with it).
+
+Pure-compute boundary: this module reads from ``sidecar.db`` but doesn't
+import statsmodels — it's a stats calculator over already-stored
+predictions, not a fitter. Lazy heavy imports kept upstream.
 """
 
 from __future__ import annotations
 
 import logging
 import math
-from dataclasses import dataclass, field
-from datetime import date
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import and_, case, func, select
+from sqlalchemy.orm import Session
 
 from ml.forecast import ForecastResult
-from ml.persistence import load_snapshots
 from sidecar.db.engine import session_scope
-from sidecar.db.models import Asset, PricePoint
+from sidecar.db.models import AccuracyPoint, Asset, ForecastSnapshot, PricePoint
 
 logger = logging.getLogger(__name__)
 
@@ -157,37 +165,135 @@ def _compute_metrics(
 # ---------------------------------------------------------------------------
 
 
-def _load_actuals_for_asset(
-    asset_id: int, *, since_days: int
-) -> dict[date, float]:
-    """Pull daily closes for an asset over the last N days, keyed by date.
-
-    Used as the truth-set when scoring snapshots. ``since_days`` is
-    intentionally generous — a snapshot's horizon may stretch up to
-    ``horizon_days`` past its ``generated_at``, so we want at least
-    ``since_days + horizon_days`` of actuals; the caller picks ``since_days``
-    accordingly via ``window_days``.
-    """
-    with session_scope() as session:
-        rows = session.execute(
-            select(PricePoint.timestamp, PricePoint.close).where(
-                PricePoint.asset_id == asset_id,
-                PricePoint.interval == "1d",
-            )
-        ).all()
-    actuals: dict[date, float] = {}
-    for ts, close in rows:
-        actuals[ts.date()] = float(close)
-    return actuals
+# Per-model sums over the paired rows. Everything is a SUM / COUNT so the
+# per-engine rows roll up into ``overall`` (and the naive baseline) in
+# Python without a second query.
+_ERR = AccuracyPoint.actual - AccuracyPoint.predicted
+_NAIVE_ERR = AccuracyPoint.actual - AccuracyPoint.last_close
+_NONZERO_ACTUAL = AccuracyPoint.actual != 0
+_DIRECTIONAL = and_(
+    AccuracyPoint.predicted != AccuracyPoint.last_close,
+    AccuracyPoint.actual != AccuracyPoint.last_close,
+)
 
 
 @dataclass
-class _EngineAccumulator:
-    """Per-engine running state — collected across snapshots within a
-    single accuracy run, then collapsed into an ``EngineAccuracy`` at the end."""
+class _Sums:
+    """Additive accuracy sums for one engine (or the rollup)."""
 
     snapshots: int = 0
-    pairs: list[tuple[float, float, float]] = field(default_factory=list)
+    points: int = 0
+    ape_sum: float = 0.0
+    ape_count: int = 0
+    se_sum: float = 0.0
+    dir_evaluable: int = 0
+    dir_hits: int = 0
+    naive_ape_sum: float = 0.0
+    naive_se_sum: float = 0.0
+
+    def add(self, other: _Sums) -> None:
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+
+    def metrics(self) -> tuple[float | None, float | None, float | None]:
+        """Same semantics as ``_compute_metrics`` over the summed pairs."""
+        if self.points < MIN_EVALUABLE_POINTS:
+            return None, None, None
+        return (
+            self.ape_sum / self.ape_count if self.ape_count else None,
+            math.sqrt(self.se_sum / self.points),
+            self.dir_hits / self.dir_evaluable if self.dir_evaluable else None,
+        )
+
+    def naive_metrics(self) -> tuple[float | None, float | None]:
+        if self.points < MIN_EVALUABLE_POINTS:
+            return None, None
+        return (
+            self.naive_ape_sum / self.ape_count if self.ape_count else None,
+            math.sqrt(self.naive_se_sum / self.points),
+        )
+
+
+def _load_sums(session: Session, asset_id: int, cutoff: datetime) -> dict[str, _Sums]:
+    """Two grouped queries: snapshots per model (pending ones included) and
+    the paired-point sums per model. Both are index range scans over the
+    window, independent of how much history has accumulated before it."""
+    by_model: dict[str, _Sums] = {}
+    for model, count in session.execute(
+        select(ForecastSnapshot.model, func.count())
+        .where(
+            ForecastSnapshot.asset_id == asset_id,
+            ForecastSnapshot.generated_at >= cutoff,
+        )
+        .group_by(ForecastSnapshot.model)
+    ):
+        by_model[model] = _Sums(snapshots=int(count))
+
+    rows: Sequence[Any] = session.execute(
+        select(
+            AccuracyPoint.model,
+            func.count(),
+            func.sum(case((_NONZERO_ACTUAL, func.abs(_ERR) / func.abs(AccuracyPoint.actual)))),
+            func.count(case((_NONZERO_ACTUAL, 1))),
+            func.sum(_ERR * _ERR),
+            func.count(case((_DIRECTIONAL, 1))),
+            func.count(
+                case(
+                    (
+                        and_(
+                            _DIRECTIONAL,
+                            (AccuracyPoint.predicted > AccuracyPoint.last_close)
+                            == (AccuracyPoint.actual > AccuracyPoint.last_close),
+                        ),
+                        1,
+                    )
+                )
+            ),
+            func.sum(
+                case((_NONZERO_ACTUAL, func.abs(_NAIVE_ERR) / func.abs(AccuracyPoint.actual)))
+            ),
+            func.sum(_NAIVE_ERR * _NAIVE_ERR),
+        )
+        .where(
+            AccuracyPoint.asset_id == asset_id,
+            AccuracyPoint.generated_at >= cutoff,
+            AccuracyPoint.actual.is_not(None),
+        )
+        .group_by(AccuracyPoint.model)
+    ).all()
+    for model, n, ape, ape_n, se, dir_n, hits, naive_ape, naive_se in rows:
+        sums = by_model.setdefault(model, _Sums())
+        sums.points = int(n)
+        sums.ape_sum = float(ape or 0.0) * 100.0
+        sums.ape_count = int(ape_n)
+        sums.se_sum = float(se or 0.0)
+        sums.dir_evaluable = int(dir_n)
+        sums.dir_hits = int(hits)
+        sums.naive_ape_sum = float(naive_ape or 0.0) * 100.0
+        sums.naive_se_sum = float(naive_se or 0.0)
+    return by_model
+
+
+def _count_actuals(session: Session, asset_id: int) -> int:
+    return int(
+        session.execute(
+            select(func.count()).where(
+                PricePoint.asset_id == asset_id, PricePoint.interval == "1d"
+            )
+        ).scalar_one()
+    )
+
+
+def _to_engine_accuracy(engine: str, sums: _Sums) -> EngineAccuracy:
+    mape, rmse, directional = sums.metrics()
+    return EngineAccuracy(
+        engine=engine,
+        snapshots=sums.snapshots,
+        evaluable_points=sums.points,
+        mape=mape,
+        rmse=rmse,
+        directional=directional,
+    )
 
 
 def compute_accuracy(symbol: str, *, days: int = 30) -> AccuracyReport:
@@ -198,6 +304,10 @@ def compute_accuracy(symbol: str, *, days: int = 30) -> AccuracyReport:
     that have landed since". Snapshots whose horizon hasn't fully elapsed
     still contribute their already-evaluable points, which keeps the
     metric fresh even with a 14-day default horizon.
+
+    Reads the pre-paired ``accuracy_points`` rows (kept current by the
+    daily ingest, see ``ml.persistence.sync_accuracy_actuals``) and
+    aggregates them in SQL — no snapshot decoding, no actuals load.
     """
     sym = symbol.strip().upper()
 
@@ -205,22 +315,29 @@ def compute_accuracy(symbol: str, *, days: int = 30) -> AccuracyReport:
         asset_id_row = session.execute(
             select(Asset.id).where(Asset.symbol == sym)
         ).scalar_one_or_none()
-    if asset_id_row is None:
-        return AccuracyReport(
-            symbol=sym,
-            days=days,
-            per_engine=[],
-            overall=None,
-            naive=None,
-            actuals_available=0,
-        )
-    asset_id = int(asset_id_row)
+        if asset_id_row is None:
+            return AccuracyReport(
+                symbol=sym,
+                days=days,
+                per_engine=[],
+                overall=None,
+                naive=None,
+                actuals_available=0,
+            )
+        return accuracy_for_asset(session, int(asset_id_row), sym, days=days)
+
 
-    snapshots = load_snapshots(asset_id, since_days=days)
-    actuals = _load_actuals_for_asset(asset_id, since_days=days)
-    actuals_available = len(actuals)
+def accuracy_for_asset(
+    session: Session, asset_id: int, symbol: str, *, days: int = 30
+) -> AccuracyReport:
+    """``compute_accuracy`` for an already-resolved asset, read through the
+    caller's ``session`` (the asset-detail bundle shares one snapshot)."""
+    sym = symbol
+    cutoff = datetime.now(UTC) - timedelta(days=days)
+    by_model = _load_sums(session, asset_id, cutoff)
+    actuals_available = _count_actuals(session, asset_id)
 
-    if not snapshots:
+    if not by_model:
         # No snapshots at all — nothing to score, regardless of how many
         # actuals are on file. Return an empty report so the UI shows
         # the "no accuracy data yet" CTA.
@@ -233,46 +350,14 @@ def compute_accuracy(symbol: str, *, days: int = 30) -> AccuracyReport:
             actuals_available=actuals_available,
         )
 
-    # When there are snapshots but no actuals (e.g. a brand-new install
-    # whose forecast horizons haven't elapsed yet), we still want to
-    # surface the snapshot count via per_engine so the UI can show
-    # "1 snapshot, 0 evaluable yet" instead of an empty panel. The
-    # per-snapshot loop below handles this — `_evaluable_pairs` returns
-    # [] when actuals is empty, so each snapshot increments only the
-    # `snapshots` counter.
-
-    by_engine: dict[str, _EngineAccumulator] = {}
-    overall = _EngineAccumulator()
-
-    for snap in snapshots:
-        pairs = _evaluable_pairs(snap, actuals)
-        if not pairs:
-            # Snapshot's horizon hasn't elapsed yet — still counts toward
-            # the "snapshots seen" tally (so the UI can say "5 snapshots,
-            # 0 evaluable yet") but contributes no pairs.
-            acc = by_engine.setdefault(snap.model, _EngineAccumulator())
-            acc.snapshots += 1
-            overall.snapshots += 1
-            continue
-        acc = by_engine.setdefault(snap.model, _EngineAccumulator())
-        acc.snapshots += 1
-        acc.pairs.extend(pairs)
-        overall.snapshots += 1
-        overall.pairs.extend(pairs)
-
+    # Snapshots whose horizon hasn't elapsed yet still appear per engine
+    # (snapshot count > 0, evaluable_points == 0) so the UI can say
+    # "5 snapshots, 0 evaluable yet" instead of an empty panel.
+    overall = _Sums()
     per_engine: list[EngineAccuracy] = []
-    for engine, acc in by_engine.items():
-        mape, rmse, directional = _compute_metrics(acc.pairs)
-        per_engine.append(
-            EngineAccuracy(
-                engine=engine,
-                snapshots=acc.snapshots,
-                evaluable_points=len(acc.pairs),
-                mape=mape,
-                rmse=rmse,
-                directional=directional,
-            )
-        )
+    for engine, sums in by_model.items():
+        overall.add(sums)
+        per_engine.append(_to_engine_accuracy(engine, sums))
 
     # Sort per-engine by MAPE ascending (best engine first). Engines with
     # None MAPE (no evaluable pairs yet) sink to the bottom.
@@ -280,36 +365,26 @@ def compute_accuracy(symbol: str, *, days: int = 30) -> AccuracyReport:
         key=lambda e: (e.mape is None, e.mape if e.mape is not None else 0.0)
     )
 
-    overall_mape, overall_rmse, overall_dir = _compute_metrics(overall.pairs)
-    overall_acc = EngineAccuracy(
-        engine="all",
-        snapshots=overall.snapshots,
-        evaluable_points=len(overall.pairs),
-        mape=overall_mape,
-        rmse=overall_rmse,
-        directional=overall_dir,
-    )
-
     # Naive random-walk baseline over the identical pairs: substitute the
-    # prediction with each pair's own ``last_close`` ("no change").
-    naive_pairs = [(last_close, actual, last_close) for _, actual, last_close in overall.pairs]
-    naive_mape, naive_rmse, naive_dir = _compute_metrics(naive_pairs)
+    # prediction with each pair's own ``last_close`` ("no change"). A
+    # no-change forecast makes no directional call, so that stays None.
     naive_acc: EngineAccuracy | None = None
-    if overall.pairs:
+    if overall.points:
+        naive_mape, naive_rmse = overall.naive_metrics()
         naive_acc = EngineAccuracy(
             engine="naive (no change)",
             snapshots=overall.snapshots,
-            evaluable_points=len(naive_pairs),
+            evaluable_points=overall.points,
             mape=naive_mape,
             rmse=naive_rmse,
-            directional=naive_dir,
+            directional=None,
         )
 
     return AccuracyReport(
         symbol=sym,
         days=days,
         per_engine=per_engine,
-        overall=overall_acc,
+        overall=_to_engine_accuracy("all", overall),
         naive=naive_acc,
         actuals_available=actuals_available,
     )
@@ -0,0 +1,178 @@
+"""Vectorized replay of an alert rule over a stored series.
+
+Answers "how often would this alert have fired?" before the user arms it.
+Every metric reduces to one observed value per bar (or per day for
+sentiment); the rule is then evaluated over the whole array at once:
+
+- ``satisfied = values >= threshold`` (``above``) or ``<= threshold``
+  (``below``), NaN (not enough history yet) counting as unsatisfied;
+- a *fire* is a rising edge — a satisfied observation whose predecessor
+  was valid and unsatisfied. That is what a one-shot alert re-armed right
+  after each notification would have done, and the very first observation
+  never fires (there is no "before" to cross from, mirroring the
+  already-crossed rejection on create).
+
+Metric series match the live evaluator in ``sidecar.services.alerts``:
+
+- ``price`` — bar high (above) / low (below), so intrabar spikes count.
+- ``pct_change`` — ``close[i] / close[i - n] - 1`` in percent.
+- ``volatility`` — rolling sample stdev of the last ``n`` log-returns,
+  annualized (``ml.volatility`` conventions), in percent. Rolling moments
+  come from cumulative sums, so the whole series is O(len).
+- ``volume_spike`` — ``volume[i] / median(volume[i - n : i])``.
+- ``sentiment`` — rolling mean over ``n`` days from daily sum / count
+  buckets, again by cumulative-sum differences.
+
+Pure array code: callers load the series (see
+``sidecar.services.alert_replay``). numpy ships with
+``requirements-ml.txt`` and is imported lazily.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from ml.forecast import _import_numpy
+from ml.volatility import TRADING_DAYS_PER_YEAR
+
+
+@dataclass(frozen=True)
+class ReplayHits:
+    """Indices into the replayed series where the rule fired, with the
+    observed metric value at each."""
+
+    indices: list[int]
+    values: list[float]
+    # Observations with a defined metric value (excludes warm-up bars).
+    evaluated: int
+
+
+# ---------------------------------------------------------------------------
+# Edge detection
+# ---------------------------------------------------------------------------
+
+
+def _rising_edges(np: Any, values: Any, threshold: float, above: bool) -> ReplayHits:
+    valid = ~np.isnan(values)
+    with np.errstate(invalid="ignore"):
+        satisfied = (values >= threshold) if above else (values <= threshold)
+    satisfied &= valid
+    fired = np.zeros(len(values), dtype=bool)
+    fired[1:] = satisfied[1:] & valid[:-1] & ~satisfied[:-1]
+    idx = np.flatnonzero(fired)
+    return ReplayHits(
+        indices=idx.tolist(),
+        values=values[idx].tolist(),
+        evaluated=int(valid.sum()),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Metric series
+# ---------------------------------------------------------------------------
+
+
+def _pct_change(np: Any, close: Any, n: int) -> Any:
+    out = np.full(len(close), np.nan)
+    if len(close) > n:
+        base = close[:-n]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out[n:] = np.where(base > 0, (close[n:] / base - 1.0) * 100.0, np.nan)
+    return out
+
+
+def _rolling_volatility(np: Any, close: Any, n: int) -> Any:
+    """Annualized % stdev of the ``n`` log-returns ending at each bar."""
+    out = np.full(len(close), np.nan)
+    if len(close) <= n or n < 2:
+        return out
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = np.diff(np.log(np.where(close > 0, close, np.nan)))
+    # A non-positive close poisons the windows that include it.
+    bad = np.cumsum(np.concatenate(([0], np.isnan(r).astype(np.int64))))
+    r = np.nan_to_num(r)
+    s1 = np.concatenate(([0.0], np.cumsum(r)))
+    s2 = np.concatenate(([0.0], np.cumsum(r * r)))
+    w1 = s1[n:] - s1[:-n]
+    w2 = s2[n:] - s2[:-n]
+    var = np.maximum((w2 - w1 * w1 / n) / (n - 1), 0.0)
+    vol = np.sqrt(var) * math.sqrt(TRADING_DAYS_PER_YEAR) * 100.0
+    vol[(bad[n:] - bad[:-n]) > 0] = np.nan
+    # Window of returns r[j-n .. j-1] ends at close index j.
+    out[n:] = vol
+    return out
+
+
+def _volume_spike(np: Any, volume: Any, n: int) -> Any:
+    out = np.full(len(volume), np.nan)
+    if len(volume) <= n:
+        return out
+    windows = np.lib.stride_tricks.sliding_window_view(volume[:-1], n)
+    baseline = np.median(windows, axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[n:] = np.where(baseline > 0, volume[n:] / baseline, np.nan)
+    return out
+
+
+def replay_bars(
+    metric: str,
+    *,
+    above: bool,
+    threshold: float,
+    window: int | None,
+    high: Sequence[float],
+    low: Sequence[float],
+    close: Sequence[float],
+    volume: Sequence[float],
+) -> ReplayHits:
+    """Replay a bar-driven rule (``price`` or a bar-derived metric)."""
+    np = _import_numpy()
+    if metric == "price":
+        values = np.asarray(high if above else low, dtype=np.float64)
+    else:
+        if window is None:
+            raise ValueError(f"{metric} replay needs a window")
+        closes = np.asarray(close, dtype=np.float64)
+        if metric == "pct_change":
+            values = _pct_change(np, closes, window)
+        elif metric == "volatility":
+            values = _rolling_volatility(np, closes, window)
+        elif metric == "volume_spike":
+            values = _volume_spike(np, np.asarray(volume, dtype=np.float64), window)
+        else:
+            raise ValueError(f"unknown bar metric {metric!r}")
+    return _rising_edges(np, values, threshold, above)
+
+
+def replay_daily_mean(
+    *,
+    above: bool,
+    threshold: float,
+    window: int,
+    sums: Sequence[float],
+    counts: Sequence[int],
+    warmup: int,
+) -> ReplayHits:
+    """Replay a rolling-mean rule over dense daily buckets.
+
+    ``sums`` / ``counts`` hold one entry per calendar day (zeros for days
+    without articles). The first ``warmup`` days only feed the rolling
+    window; indices in the result are relative to the day after them.
+    Days whose window has no articles are NaN (no signal).
+    """
+    np = _import_numpy()
+    s = np.concatenate(([0.0], np.cumsum(np.asarray(sums, dtype=np.float64))))
+    c = np.concatenate(([0], np.cumsum(np.asarray(counts, dtype=np.int64))))
+    days = len(sums)
+    # Window for day i covers days i - window .. i (``window_days`` back
+    # through today, as the live evaluator does).
+    ends = np.arange(1, days + 1)
+    starts = np.maximum(ends - window - 1, 0)
+    total = s[ends] - s[starts]
+    count = c[ends] - c[starts]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(count > 0, total / np.maximum(count, 1), np.nan)
+    return _rising_edges(np, mean[warmup:], threshold, above)
@@ -0,0 +1,532 @@
+"""Rolling-origin backtesting for the forecast engines.
+
+``ml.accuracy`` can only score snapshots that were produced live, so
+comparing engines that way means waiting weeks for horizons to elapse. This
+module replays history instead: for origins ``t0, t0 + k, t0 + 2k, …`` it
+fits each engine on the closes *before* the origin, forecasts
+``horizon_days`` forward, and scores the forecast against the closes that
+actually landed — the same MAPE / RMSE / directional metrics (and the same
+naive "no change" yardstick) the live accuracy panel uses.
+
+Execution:
+
+- Vectorized engines (``BATCH_ENGINES``) stack every origin as one row of
+  a right-aligned matrix and forecast them all in a single
+  ``forecast_matrix`` call.
+- statsmodels engines fan out one fit per (asset, origin) over a
+  ``concurrent.futures`` pool — threads by default (numpy / scipy release
+  the GIL for the heavy lifting, and it works inside the frozen sidecar),
+  processes from the CLI for a true multi-core benchmark.
+
+Results are cached in-process per *data fingerprint* — a hash of the close
+series plus the backtest parameters — so re-running after nothing changed
+is free, and a new daily bar naturally invalidates the entry.
+
+Entry points: ``backtest_symbol`` / ``backtest_symbols`` (used by
+``GET /api/forecast/{symbol}/backtest/``) and a CLI for benchmarking::
+
+    python -m ml.backtest AAPL MSFT --engines sarimax,theta --step 7
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import logging
+import struct
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import date, timedelta
+from threading import Lock
+
+from sqlalchemy import select
+
+from ml.accuracy import _compute_metrics
+from ml.forecast import (
+    BATCH_ENGINES,
+    ENGINES,
+    MIN_TRAINING_ROWS,
+    ForecastEngine,
+    ForecastError,
+    _import_numpy,
+    forecast_series,
+)
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Asset
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STEP_DAYS = 7
+DEFAULT_MAX_ORIGINS = 26  # ~6 months of weekly origins
+MAX_ORIGINS_CAP = 260
+DEFAULT_WORKERS = 4
+# Entries are small (a handful of floats per engine); the cap just keeps a
+# long-running sidecar from accumulating reports for every parameter combo
+# ever requested.
+CACHE_MAX_ENTRIES = 128
+
+# (predicted, actual, last_close) — same triple ``ml.accuracy`` scores.
+_Pair = tuple[float, float, float]
+
+
+class BacktestError(ForecastError):
+    """Invalid backtest parameters (unknown engine, bad step, ...)."""
+
+
+@dataclass(frozen=True)
+class EngineBacktest:
+    """Aggregate backtest metrics for one engine over every origin.
+
+    ``fit_seconds`` is the summed wall time of this engine's fits — with
+    ``origins`` it doubles as a per-engine CPU benchmark.
+    """
+
+    engine: str
+    origins: int
+    evaluable_points: int
+    failures: int
+    mape: float | None
+    rmse: float | None
+    directional: float | None
+    fit_seconds: float
+
+
+@dataclass(frozen=True)
+class BacktestReport:
+    """Rolling-origin backtest result for one asset.
+
+    ``per_engine`` is sorted by MAPE ascending (best first), like
+    ``AccuracyReport``. ``naive`` scores "last close for the whole horizon"
+    over every origin.
+    """
+
+    symbol: str
+    horizon_days: int
+    step_days: int
+    origins: int
+    training_rows: int
+    per_engine: list[EngineBacktest]
+    naive: EngineBacktest | None
+    fingerprint: str
+    elapsed_seconds: float
+    cached: bool = False
+
+
+# ---------------------------------------------------------------------------
+# Origins + scoring
+# ---------------------------------------------------------------------------
+
+
+def _origins(n: int, *, step_days: int, max_origins: int) -> list[int]:
+    """Origin indices, oldest-first: the most recent ``max_origins`` split
+    points spaced ``step_days`` apart, each with at least MIN_TRAINING_ROWS
+    closes before it and at least one close after it."""
+    out = list(range(n - 1, MIN_TRAINING_ROWS - 1, -step_days))[:max_origins]
+    out.reverse()
+    return out
+
+
+def _score_origin(
+    closes: Sequence[tuple[date, float]],
+    origin: int,
+    predictions: Sequence[tuple[date, float]],
+    actuals: dict[date, float],
+) -> list[_Pair]:
+    last_close = closes[origin - 1][1]
+    pairs: list[_Pair] = []
+    for fdate, yhat in predictions:
+        actual = actuals.get(fdate)
+        if actual is not None:
+            pairs.append((yhat, actual, last_close))
+    return pairs
+
+
+def _fit_one(
+    closes: Sequence[tuple[date, float]],
+    origin: int,
+    horizon_days: int,
+    engine: ForecastEngine,
+) -> tuple[list[tuple[date, float]] | None, float]:
+    """Fit one statsmodels engine at one origin. Module-level so it pickles
+    for the process pool. Returns ``(predictions | None, seconds)``."""
+    started = time.perf_counter()
+    try:
+        result = forecast_series(
+            list(closes[:origin]), horizon_days=horizon_days, engine=engine
+        )
+    except ForecastError:
+        return None, time.perf_counter() - started
+    preds = [(p.forecast_date, p.yhat) for p in result.points]
+    return preds, time.perf_counter() - started
+
+
+def _batch_predictions(
+    closes: Sequence[tuple[date, float]],
+    origins: Sequence[int],
+    horizon_days: int,
+    engine: ForecastEngine,
+) -> list[list[tuple[date, float]]]:
+    """Every origin as one row of a right-aligned matrix — one vectorized call."""
+    from ml.batch_forecast import forecast_matrix
+
+    np = _import_numpy()
+    values = [c for _, c in closes]
+    width = origins[-1]
+    matrix = np.empty((len(origins), width), dtype=np.float64)
+    for row, origin in enumerate(origins):
+        pad = width - origin
+        matrix[row, pad:] = values[:origin]
+        matrix[row, :pad] = values[0]
+    out = forecast_matrix(
+        matrix, np.array(origins), horizon_days=horizon_days, engine=engine
+    )
+    yhat = out.yhat.tolist()
+    return [
+        [
+            (closes[origin - 1][0] + timedelta(days=h + 1), yhat[row][h])
+            for h in range(horizon_days)
+        ]
+        for row, origin in enumerate(origins)
+    ]
+
+
+def _summarise(
+    engine: str,
+    origins: int,
+    pairs: list[_Pair],
+    failures: int,
+    fit_seconds: float,
+) -> EngineBacktest:
+    mape, rmse, directional = _compute_metrics(pairs)
+    return EngineBacktest(
+        engine=engine,
+        origins=origins,
+        evaluable_points=len(pairs),
+        failures=failures,
+        mape=mape,
+        rmse=rmse,
+        directional=directional,
+        fit_seconds=fit_seconds,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+_cache: OrderedDict[str, BacktestReport] = OrderedDict()
+_cache_lock = Lock()
+
+
+def _fingerprint(
+    closes: Sequence[tuple[date, float]],
+    engines: Sequence[str],
+    *,
+    horizon_days: int,
+    step_days: int,
+    max_origins: int,
+) -> str:
+    digest = hashlib.sha1(usedforsecurity=False)
+    digest.update(
+        f"{','.join(engines)}|{horizon_days}|{step_days}|{max_origins}|".encode()
+    )
+    for d, c in closes:
+        digest.update(struct.pack("<id", d.toordinal(), c))
+    return digest.hexdigest()
+
+
+def _cache_get(key: str) -> BacktestReport | None:
+    with _cache_lock:
+        hit = _cache.get(key)
+        if hit is not None:
+            _cache.move_to_end(key)
+        return hit
+
+
+def _cache_put(key: str, report: BacktestReport) -> None:
+    with _cache_lock:
+        _cache[key] = report
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def _validate(
+    engines: Sequence[str], horizon_days: int, step_days: int, max_origins: int
+) -> list[ForecastEngine]:
+    unknown = [e for e in engines if e not in ENGINES]
+    if unknown:
+        raise BacktestError(
+            f"unknown engine(s) {unknown}; expected any of {sorted(ENGINES)}"
+        )
+    if not engines:
+        raise BacktestError("at least one engine is required")
+    if horizon_days < 1 or horizon_days > 90:
+        raise BacktestError(f"horizon_days must be 1..90, got {horizon_days}")
+    if step_days < 1:
+        raise BacktestError(f"step_days must be >= 1, got {step_days}")
+    if max_origins < 1 or max_origins > MAX_ORIGINS_CAP:
+        raise BacktestError(f"max_origins must be 1..{MAX_ORIGINS_CAP}")
+    return [e for e in ENGINES if e in engines]
+
+
+def backtest_series_many(
+    series: Mapping[str, Sequence[tuple[date, float]]],
+    *,
+    engines: Sequence[str] = ENGINES,
+    horizon_days: int = 14,
+    step_days: int = DEFAULT_STEP_DAYS,
+    max_origins: int = DEFAULT_MAX_ORIGINS,
+    executor: Executor | None = None,
+) -> dict[str, BacktestReport]:
+    """Backtest several ``(date, close)`` series, keyed by symbol.
+
+    Every statsmodels fit across every asset and origin is submitted to one
+    pool, so the wall time is bounded by total fits / workers rather than
+    assets x origins. Cached entries are returned without refitting.
+
+    Raises:
+        BacktestError: unknown engine or out-of-range parameters.
+    """
+    ordered = _validate(engines, horizon_days, step_days, max_origins)
+    reports: dict[str, BacktestReport] = {}
+    pending: dict[str, tuple[str, list[int], float]] = {}
+
+    for symbol, closes in series.items():
+        key = _fingerprint(
+            closes,
+            ordered,
+            horizon_days=horizon_days,
+            step_days=step_days,
+            max_origins=max_origins,
+        )
+        hit = _cache_get(key)
+        if hit is not None:
+            reports[symbol] = replace(hit, symbol=symbol, cached=True)
+            continue
+        pending[symbol] = (
+            key,
+            _origins(len(closes), step_days=step_days, max_origins=max_origins),
+            time.perf_counter(),
+        )
+
+    slow = [e for e in ordered if e not in BATCH_ENGINES]
+    own_pool = (
+        executor is None
+        and bool(slow)
+        and any(origins for _, origins, _ in pending.values())
+    )
+    pool = ThreadPoolExecutor(max_workers=DEFAULT_WORKERS) if own_pool else executor
+    try:
+        futures = {
+            (symbol, engine, origin): pool.submit(
+                _fit_one, series[symbol], origin, horizon_days, engine
+            )
+            for symbol, (_, origins, _) in pending.items()
+            for engine in slow
+            for origin in origins
+            if pool is not None
+        }
+
+        for symbol, (key, origins, started) in pending.items():
+            closes = series[symbol]
+            actuals = dict(closes)
+            per_engine: list[EngineBacktest] = []
+            naive_pairs: list[_Pair] = []
+            for origin in origins:
+                # "No change" over the same calendar window the engines
+                # forecast: every close that landed within the horizon.
+                origin_date, last_close = closes[origin - 1]
+                cutoff = origin_date + timedelta(days=horizon_days)
+                naive_pairs.extend(
+                    (last_close, actual, last_close)
+                    for d, actual in closes[origin : origin + horizon_days]
+                    if d <= cutoff
+                )
+            for engine in ordered:
+                pairs: list[_Pair] = []
+                failures = 0
+                fit_seconds = 0.0
+                if not origins:
+                    per_engine.append(_summarise(engine, 0, pairs, 0, 0.0))
+                    continue
+                if engine in BATCH_ENGINES:
+                    t = time.perf_counter()
+                    preds = _batch_predictions(closes, origins, horizon_days, engine)
+                    fit_seconds = time.perf_counter() - t
+                    for origin, p in zip(origins, preds, strict=True):
+                        pairs.extend(_score_origin(closes, origin, p, actuals))
+                else:
+                    for origin in origins:
+                        p_or_none, secs = futures[(symbol, engine, origin)].result()
+                        fit_seconds += secs
+                        if p_or_none is None:
+                            failures += 1
+                            continue
+                        pairs.extend(_score_origin(closes, origin, p_or_none, actuals))
+                per_engine.append(
+                    _summarise(engine, len(origins), pairs, failures, fit_seconds)
+                )
+
+            per_engine.sort(
+                key=lambda e: (e.mape is None, e.mape if e.mape is not None else 0.0)
+            )
+            report = BacktestReport(
+                symbol=symbol,
+                horizon_days=horizon_days,
+                step_days=step_days,
+                origins=len(origins),
+                training_rows=len(closes),
+                per_engine=per_engine,
+                naive=(
+                    _summarise("naive (no change)", len(origins), naive_pairs, 0, 0.0)
+                    if naive_pairs
+                    else None
+                ),
+                fingerprint=key,
+                elapsed_seconds=time.perf_counter() - started,
+            )
+            _cache_put(key, report)
+            reports[symbol] = report
+    finally:
+        if own_pool and pool is not None:
+            pool.shutdown(wait=True)
+    return reports
+
+
+def backtest_symbols(
+    symbols: Sequence[str],
+    *,
+    engines: Sequence[str] = ENGINES,
+    horizon_days: int = 14,
+    step_days: int = DEFAULT_STEP_DAYS,
+    max_origins: int = DEFAULT_MAX_ORIGINS,
+    executor: Executor | None = None,
+) -> dict[str, BacktestReport]:
+    """DB-aware wrapper: load every symbol's daily closes in one query, then
+    ``backtest_series_many``. Unknown symbols are silently dropped."""
+    from ml.jobs import _load_daily_closes_many
+
+    wanted = [s.strip().upper() for s in symbols if s.strip()]
+    with session_scope() as session:
+        rows = session.execute(
+            select(Asset.id, Asset.symbol).where(Asset.symbol.in_(wanted))
+        ).all()
+        id_to_symbol = {aid: sym for aid, sym in rows}
+        closes = _load_daily_closes_many(session, list(id_to_symbol))
+    series = {id_to_symbol[aid]: c for aid, c in closes.items()}
+    ordered = {s: series[s] for s in wanted if s in series}
+    return backtest_series_many(
+        ordered,
+        engines=engines,
+        horizon_days=horizon_days,
+        step_days=step_days,
+        max_origins=max_origins,
+        executor=executor,
+    )
+
+
+def backtest_symbol(
+    symbol: str,
+    *,
+    engines: Sequence[str] = ENGINES,
+    horizon_days: int = 14,
+    step_days: int = DEFAULT_STEP_DAYS,
+    max_origins: int = DEFAULT_MAX_ORIGINS,
+) -> BacktestReport | None:
+    """Single-asset convenience wrapper. None when the symbol is unknown."""
+    sym = symbol.strip().upper()
+    return backtest_symbols(
+        [sym],
+        engines=engines,
+        horizon_days=horizon_days,
+        step_days=step_days,
+        max_origins=max_origins,
+    ).get(sym)
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+
+def _fmt(value: float | None, spec: str) -> str:
+    return "-" if value is None else format(value, spec)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m ml.backtest",
+        description="Rolling-origin backtest of FinTrack forecast engines.",
+    )
+    parser.add_argument("symbols", nargs="+", help="tracked asset symbols")
+    parser.add_argument(
+        "--engines", default=",".join(ENGINES), help="comma-separated engine list"
+    )
+    parser.add_argument("--horizon", type=int, default=14)
+    parser.add_argument("--step", type=int, default=DEFAULT_STEP_DAYS)
+    parser.add_argument("--max-origins", type=int, default=DEFAULT_MAX_ORIGINS)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="fit statsmodels engines in worker processes instead of threads",
+    )
+    args = parser.parse_args(argv)
+
+    engines = [e.strip() for e in args.engines.split(",") if e.strip()]
+    pool_cls = ProcessPoolExecutor if args.processes else ThreadPoolExecutor
+    started = time.perf_counter()
+    try:
+        with pool_cls(max_workers=args.workers) as pool:
+            reports = backtest_symbols(
+                args.symbols,
+                engines=engines,
+                horizon_days=args.horizon,
+                step_days=args.step,
+                max_origins=args.max_origins,
+                executor=pool,
+            )
+    except BacktestError as exc:
+        print(f"error: {exc}", file=sys.stderr)
+        return 2
+
+    for symbol in args.symbols:
+        report = reports.get(symbol.strip().upper())
+        if report is None:
+            print(f"{symbol.upper()}: no daily closes tracked")
+            continue
+        print(
+            f"\n{report.symbol}: {report.origins} origins, "
+            f"h={report.horizon_days}, step={report.step_days}, "
+            f"{report.training_rows} closes"
+        )
+        print(f"  {'engine':<14}{'MAPE%':>8}{'RMSE':>10}{'dir':>7}{'fails':>7}{'fit s':>9}")
+        rows = [*report.per_engine, *([report.naive] if report.naive else [])]
+        for e in rows:
+            print(
+                f"  {e.engine[:14]:<14}{_fmt(e.mape, '.2f'):>8}"
+                f"{_fmt(e.rmse, '.3f'):>10}{_fmt(e.directional, '.2f'):>7}"
+                f"{e.failures:>7}{e.fit_seconds:>9.3f}"
+            )
+    print(f"\ntotal {time.perf_counter() - started:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+"""Vectorized lightweight forecast engines — the whole universe in one pass.
+
+SARIMAX and Holt-Winters (``ml.forecast``) fit one statsmodels model per
+series: ~0.5-1 s each, so a 1,000-symbol universe is a multi-minute job.
+The engines here trade likelihood-based fitting for fixed smoothing
+constants, which turns every one of them into plain array arithmetic over
+an ``(assets x days)`` matrix. Forecasting the full universe costs a few
+milliseconds — cheap enough to refresh every forecast after each daily
+ingest.
+
+Engines:
+
+- ``drift`` — random walk with drift: last close plus the average daily
+  change over the series, ``y_n + h · (y_n - y_1) / (n - 1)``.
+- ``ewma`` — simple exponential smoothing level (flat forecast), computed
+  in closed form as one matrix-vector product.
+- ``damped_trend`` — Holt's additive trend with a damping factor, so the
+  projected slope decays instead of extrapolating forever.
+- ``theta`` — the classic Theta method via the Hyndman & Billah (2003)
+  equivalence: SES level plus half the OLS trend slope.
+
+Matrix layout: each row is one asset's closes, **right-aligned** so column
+``-1`` is every asset's own last close. Shorter series are left-padded by
+repeating their first close. A constant prefix is a fixed point of every
+smoothing recurrence here (level stays put, trend stays zero), so padding
+never moves the fitted state; the drift / slope / volatility terms use an
+explicit validity mask instead.
+
+Uncertainty comes from the same RiskMetrics volatility cone
+``ml.forecast._apply_volatility_bands`` applies to the statsmodels engines,
+vectorized: ``z · sigma_i · sqrt(h) · |yhat_ih|``.
+
+numpy is imported lazily (it arrives with ``requirements-ml.txt``), same
+as statsmodels in ``ml.forecast``.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Hashable, Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Generic, TypeVar
+
+from ml.forecast import (
+    _EWMA_LAMBDA,
+    _Z80,
+    _Z95,
+    BATCH_ENGINES,
+    DAMPED_TREND_MODEL_NAME,
+    DRIFT_MODEL_NAME,
+    EWMA_MODEL_NAME,
+    THETA_MODEL_NAME,
+    ForecastEngine,
+    ForecastError,
+    ForecastPoint,
+    ForecastResult,
+    _import_numpy,
+    _validate_inputs,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fixed smoothing constants. Per-asset optimisation would mean a sequential
+# optimiser per series — exactly the cost these engines exist to avoid.
+# The values are deliberately middle-of-the-road for daily closes; the
+# accuracy panel's per-engine breakdown is the place to judge them.
+EWMA_ALPHA = 0.5
+DAMPED_ALPHA = 0.5
+DAMPED_BETA = 0.1
+DAMPED_PHI = 0.9
+THETA_ALPHA = 0.5
+
+_MODEL_NAMES: dict[str, str] = {
+    "drift": DRIFT_MODEL_NAME,
+    "ewma": EWMA_MODEL_NAME,
+    "damped_trend": DAMPED_TREND_MODEL_NAME,
+    "theta": THETA_MODEL_NAME,
+}
+
+K = TypeVar("K", bound=Hashable)
+
+
+@dataclass(frozen=True)
+class BatchForecast:
+    """Raw ``(assets x horizon)`` output of ``forecast_matrix``.
+
+    Every field is a 2-D float64 ndarray; row ``i`` lines up with row ``i``
+    of the input matrix, column ``h`` is ``h + 1`` days ahead.
+    """
+
+    yhat: Any
+    lower_80: Any
+    upper_80: Any
+    lower_95: Any
+    upper_95: Any
+
+
+@dataclass(frozen=True)
+class BatchForecastOutcome(Generic[K]):
+    """Per-key results of ``forecast_batch``.
+
+    Series that fail validation (too short, non-ascending dates) land in
+    ``errors`` with the same exception ``forecast_series`` would raise, so
+    callers can log them exactly like the per-series path.
+    """
+
+    results: dict[K, ForecastResult] = field(default_factory=dict)
+    errors: dict[K, ForecastError] = field(default_factory=dict)
+
+
+# ---------------------------------------------------------------------------
+# Engines — each maps (values, counts, horizon) → yhat of shape (N, H)
+# ---------------------------------------------------------------------------
+
+
+def _valid_mask(np: Any, counts: Any, width: int) -> Any:
+    """Boolean (N, width) mask of the real (non-padding) columns per row."""
+    cols = np.arange(width)[None, :]
+    return cols >= (width - counts)[:, None]
+
+
+def _first_valid(np: Any, values: Any, counts: Any) -> Any:
+    width = values.shape[1]
+    return values[np.arange(values.shape[0]), width - counts]
+
+
+def _ses_level(np: Any, values: Any, alpha: float) -> Any:
+    """Closed-form simple-exponential-smoothing level at the last column.
+
+    ``level_T = (1-a)^(T-1) · y_0 + a · Σ_{t≥1} (1-a)^(T-1-t) · y_t`` — one
+    matrix-vector product instead of a T-step recurrence.
+    """
+    width = values.shape[1]
+    decay = (1.0 - alpha) ** np.arange(width - 2, -1, -1)
+    level = alpha * (values[:, 1:] @ decay)
+    return level + (1.0 - alpha) ** (width - 1) * values[:, 0]
+
+
+def _engine_drift(np: Any, values: Any, counts: Any, steps: Any) -> Any:
+    last = values[:, -1]
+    slope = (last - _first_valid(np, values, counts)) / (counts - 1)
+    return last[:, None] + slope[:, None] * steps[None, :]
+
+
+def _engine_ewma(np: Any, values: Any, counts: Any, steps: Any) -> Any:
+    level = _ses_level(np, values, EWMA_ALPHA)
+    return np.repeat(level[:, None], steps.shape[0], axis=1)
+
+
+def _engine_damped_trend(np: Any, values: Any, counts: Any, steps: Any) -> Any:
+    # Holt's recurrence is inherently sequential in time, but every step is
+    # a vector op across all assets — T iterations, not N x T.
+    level = values[:, 0].copy()
+    trend = np.zeros_like(level)
+    for t in range(1, values.shape[1]):
+        prev_level = level
+        level = DAMPED_ALPHA * values[:, t] + (1.0 - DAMPED_ALPHA) * (
+            prev_level + DAMPED_PHI * trend
+        )
+        trend = DAMPED_BETA * (level - prev_level) + (
+            1.0 - DAMPED_BETA
+        ) * DAMPED_PHI * trend
+    # Σ_{j=1..h} phi^j — the damped cumulative trend multiplier per step.
+    damping = np.cumsum(DAMPED_PHI ** steps)
+    return level[:, None] + damping[None, :] * trend[:, None]
+
+
+def _engine_theta(np: Any, values: Any, counts: Any, steps: Any) -> Any:
+    width = values.shape[1]
+    mask = _valid_mask(np, counts, width)
+    t = np.broadcast_to(np.arange(width, dtype=float), values.shape)
+    n = counts.astype(float)
+    t_mean = np.where(mask, t, 0.0).sum(axis=1) / n
+    y_mean = np.where(mask, values, 0.0).sum(axis=1) / n
+    t_dev = np.where(mask, t - t_mean[:, None], 0.0)
+    slope = (t_dev * (values - y_mean[:, None])).sum(axis=1) / (t_dev**2).sum(axis=1)
+
+    level = _ses_level(np, values, THETA_ALPHA)
+    a = THETA_ALPHA
+    drift_term = (steps[None, :] - 1.0 + 1.0 / a) - ((1.0 - a) ** n / a)[:, None]
+    return level[:, None] + 0.5 * slope[:, None] * drift_term
+
+
+_BATCH_ENGINES = {
+    "drift": _engine_drift,
+    "ewma": _engine_ewma,
+    "damped_trend": _engine_damped_trend,
+    "theta": _engine_theta,
+}
+
+
+# ---------------------------------------------------------------------------
+# Vectorized volatility cone
+# ---------------------------------------------------------------------------
+
+
+def _ewma_daily_vol_matrix(np: Any, values: Any, counts: Any) -> Any:
+    """Row-wise equivalent of ``ml.forecast._ewma_daily_vol``.
+
+    The scalar version seeds the EWMA with the population variance of the
+    log-returns, then runs ``var = λ·var + (1-λ)·r²`` over them. Unrolled,
+    the final variance is ``λ^n · var0 + Σ_k (1-λ)·λ^k · r²_{n-1-k}`` — a
+    weighted sum by distance from the end, which is the same for every
+    right-aligned row.
+    """
+    width = values.shape[1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rets = np.log(values[:, 1:] / values[:, :-1])
+    mask = _valid_mask(np, counts - 1, width - 1)
+    mask &= np.isfinite(rets) & (values[:, 1:] > 0) & (values[:, :-1] > 0)
+    rets = np.where(mask, rets, 0.0)
+
+    n = mask.sum(axis=1)
+    safe_n = np.maximum(n, 1)
+    mean_r = rets.sum(axis=1) / safe_n
+    var0 = (np.where(mask, rets - mean_r[:, None], 0.0) ** 2).sum(axis=1) / safe_n
+    weights = (1.0 - _EWMA_LAMBDA) * _EWMA_LAMBDA ** np.arange(width - 2, -1, -1)
+    var = _EWMA_LAMBDA**n * var0 + (rets**2) @ weights
+    return np.where(n >= 2, np.sqrt(var), 0.0)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def forecast_matrix(
+    values: Any,
+    counts: Any,
+    *,
+    horizon_days: int,
+    engine: ForecastEngine,
+) -> BatchForecast:
+    """Forecast every row of a right-aligned ``(N, T)`` close matrix at once.
+
+    ``counts[i]`` is the number of real closes in row ``i`` (the rest is the
+    left padding described in the module docstring). No validation beyond
+    the engine name — ``forecast_batch`` is the checked entry point.
+    """
+    if engine not in _BATCH_ENGINES:
+        raise ForecastError(
+            f"{engine!r} is not a batch engine; expected one of {sorted(_BATCH_ENGINES)}"
+        )
+    np = _import_numpy()
+    values = np.asarray(values, dtype=np.float64)
+    counts = np.asarray(counts, dtype=np.int64)
+    steps = np.arange(1, horizon_days + 1, dtype=np.float64)
+
+    yhat = _BATCH_ENGINES[engine](np, values, counts, steps)
+
+    sigma = _ewma_daily_vol_matrix(np, values, counts)
+    std = sigma[:, None] * np.sqrt(steps)[None, :] * np.abs(yhat)
+    return BatchForecast(
+        yhat=yhat,
+        lower_80=yhat - _Z80 * std,
+        upper_80=yhat + _Z80 * std,
+        lower_95=yhat - _Z95 * std,
+        upper_95=yhat + _Z95 * std,
+    )
+
+
+def forecast_batch(
+    series: Mapping[K, Sequence[tuple[date, float]]],
+    *,
+    horizon_days: int = 14,
+    engine: ForecastEngine,
+) -> BatchForecastOutcome[K]:
+    """Validate, stack and forecast many ``(date, close)`` series in one pass.
+
+    Each series gets the same checks ``forecast_series`` applies
+    (``MIN_TRAINING_ROWS``, strictly ascending dates); failures are reported
+    per key in ``errors`` rather than aborting the batch.
+
+    Raises:
+        ForecastError: ``horizon_days`` outside 1..90 or ``engine`` is not
+            one of ``BATCH_ENGINES``.
+    """
+    if engine not in BATCH_ENGINES:
+        raise ForecastError(
+            f"{engine!r} is not a batch engine; expected one of {sorted(BATCH_ENGINES)}"
+        )
+    if horizon_days < 1 or horizon_days > 90:
+        raise ForecastError(f"horizon_days must be 1..90, got {horizon_days}")
+
+    outcome: BatchForecastOutcome[K] = BatchForecastOutcome()
+    keys: list[K] = []
+    last_dates: list[date] = []
+    rows: list[list[float]] = []
+    for key, closes in series.items():
+        try:
+            dates, vals = _validate_inputs(closes, horizon_days)
+        except ForecastError as exc:
+            outcome.errors[key] = exc
+            continue
+        keys.append(key)
+        last_dates.append(dates[-1])
+        rows.append(vals)
+    if not keys:
+        return outcome
+
+    np = _import_numpy()
+    width = max(len(r) for r in rows)
+    counts = np.fromiter((len(r) for r in rows), dtype=np.int64, count=len(rows))
+    matrix = np.empty((len(rows), width), dtype=np.float64)
+    for i, vals in enumerate(rows):
+        pad = width - len(vals)
+        matrix[i, pad:] = vals
+        matrix[i, :pad] = vals[0]
+
+    batch = forecast_matrix(matrix, counts, horizon_days=horizon_days, engine=engine)
+
+    model_name = _MODEL_NAMES[engine]
+    generated_at = datetime.now(UTC)
+    yhat = batch.yhat.tolist()
+    lo80 = batch.lower_80.tolist()
+    hi80 = batch.upper_80.tolist()
+    lo95 = batch.lower_95.tolist()
+    hi95 = batch.upper_95.tolist()
+    for i, key in enumerate(keys):
+        last_date = last_dates[i]
+        outcome.results[key] = ForecastResult(
+            model=model_name,
+            horizon_days=horizon_days,
+            training_rows=int(counts[i]),
+            last_close=Decimal(str(rows[i][-1])),
+            last_close_date=last_date,
+            generated_at=generated_at,
+            points=[
+                ForecastPoint(
+                    forecast_date=last_date + timedelta(days=h + 1),
+                    yhat=yhat[i][h],
+                    lower_80=lo80[i][h],
+                    upper_80=hi80[i][h],
+                    lower_95=lo95[i][h],
+                    upper_95=hi95[i][h],
+                )
+                for h in range(horizon_days)
+            ],
+        )
+    logger.debug(
+        "forecast_batch: %s over %d series (%d rejected)",
+        engine,
+        len(keys),
+        len(outcome.errors),
+    )
+    return outcome
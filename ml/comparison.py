@@ -0,0 +1,216 @@
+"""Normalized multi-asset comparison for the Compare page.
+
+"Which of these had the better run since D?" needs every series on one
+date axis and rebased to a common starting value. The browser used to do
+this per symbol after downloading each full series; here it is one query
+and a handful of array operations:
+
+1. ``compute_comparison`` reads the daily closes of every requested asset
+   in a single statement — each asset's bars on or after ``start`` plus
+   its last bar *before* ``start``, so a series that did not trade on the
+   start date still has a value there.
+2. ``align_and_rebase`` puts them on the union of their dates. A series
+   with no bar on a given date carries its last close forward (LOCF: a
+   weekend for equities, a holiday on one exchange but not another);
+   before its first bar it has none. Each series is then divided by its
+   first value on the axis and scaled to ``base``.
+
+Values are rounded to ``DECIMALS`` places — index points to 1e-4 are
+already far below what a chart can show.
+
+numpy ships with ``requirements-ml.txt`` and is imported lazily; callers
+see ``ImportError`` without it.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+
+from sqlalchemy import Float, Integer, case, cast, func, select
+
+from ml.forecast import _import_numpy
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Asset, PricePoint
+
+DECIMALS = 4
+SECONDS_PER_DAY = 86400
+
+
+@dataclass(frozen=True)
+class AlignedSeries:
+    """Series on a shared axis. ``values[k]`` is series ``k`` rebased, NaN
+    before its first observation; ``first_close`` / ``last_close`` are its
+    raw closes at the rebase point and at the end (NaN for empty series)."""
+
+    days: list[int]
+    values: list[list[float]]
+    first_close: list[float]
+    last_close: list[float]
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """``AlignedSeries`` for the ``symbols`` that had data, by symbol.
+
+    ``days`` are days since the epoch (UTC). ``missing`` lists requested
+    symbols that are unknown or have no daily bars in the window.
+    """
+
+    symbols: list[str]
+    missing: list[str]
+    base: float
+    days: list[int]
+    values: dict[str, list[float]]
+    first_close: dict[str, float]
+    last_close: dict[str, float]
+
+
+# ---------------------------------------------------------------------------
+# Pure compute
+# ---------------------------------------------------------------------------
+
+
+def align_and_rebase(
+    series_idx: Sequence[int],
+    days: Sequence[int],
+    closes: Sequence[float],
+    n_series: int,
+    *,
+    start_day: int | None = None,
+    base: float = 100.0,
+) -> AlignedSeries:
+    """Align ``(series, day, close)`` rows on their shared dates and rebase.
+
+    Rows must be in time order within each series. Rows dated before
+    ``start_day`` are moved onto it (the bar carried into the window);
+    where two rows land on one date the later one wins.
+    """
+    if not len(days):
+        nan = float("nan")
+        return AlignedSeries(
+            days=[],
+            values=[[] for _ in range(n_series)],
+            first_close=[nan] * n_series,
+            last_close=[nan] * n_series,
+        )
+
+    np = _import_numpy()
+    code = np.asarray(series_idx, dtype=np.int64)
+    day = np.asarray(days, dtype=np.int64)
+    close = np.asarray(closes, dtype=np.float64)
+    if start_day is not None:
+        day = np.maximum(day, start_day)
+
+    axis = np.unique(day)
+    row = np.searchsorted(axis, day)
+    cell = row * n_series + code
+    # Last row per (date, series): first occurrence in the reversed rows.
+    _, from_end = np.unique(cell[::-1], return_index=True)
+    keep = len(cell) - 1 - from_end
+    grid = np.full((len(axis), n_series), np.nan)
+    grid[row[keep], code[keep]] = close[keep]
+
+    # LOCF: index of the latest observed row at or above each cell.
+    cols = np.arange(n_series)
+    seen = np.where(np.isnan(grid), 0, np.arange(len(axis))[:, None])
+    np.maximum.accumulate(seen, axis=0, out=seen)
+    filled = grid[seen, cols]
+
+    first = filled[np.argmax(~np.isnan(filled), axis=0), cols]
+    divisor = np.where(first > 0, first, np.nan)
+    rebased = np.round(filled / divisor * base, DECIMALS)
+    return AlignedSeries(
+        days=axis.tolist(),
+        values=rebased.T.tolist(),
+        first_close=first.tolist(),
+        last_close=filled[-1].tolist(),
+    )
+
+
+# ---------------------------------------------------------------------------
+# DB-aware orchestration
+# ---------------------------------------------------------------------------
+
+
+def compute_comparison(
+    symbols: Sequence[str],
+    *,
+    start: date | None = None,
+    base: float = 100.0,
+) -> Comparison:
+    """Daily closes of ``symbols`` since ``start`` (all history when None),
+    aligned and rebased to ``base`` — see the module docstring."""
+    requested = list(dict.fromkeys(s.strip().upper() for s in symbols if s.strip()))
+    # Naive, like the stored timestamps (SQLite compares them as strings).
+    start_dt = None if start is None else datetime.combine(start, datetime.min.time())
+
+    with session_scope() as session:
+        ids: dict[int, str] = {
+            aid: symbol
+            for aid, symbol in session.execute(
+                select(Asset.id, Asset.symbol).where(Asset.symbol.in_(requested))
+            )
+        }
+        if not ids:
+            return Comparison(
+                symbols=[],
+                missing=requested,
+                base=base,
+                days=[],
+                values={},
+                first_close={},
+                last_close={},
+            )
+        column = {aid: k for k, aid in enumerate(ids)}
+        daily = (PricePoint.asset_id.in_(list(ids)), PricePoint.interval == "1d")
+        # Rows arrive as (series index, days since epoch, close): ready for
+        # the array code, no per-row Python.
+        stmt = select(
+            case(column, value=PricePoint.asset_id),
+            cast(func.strftime("%s", PricePoint.timestamp), Integer) // SECONDS_PER_DAY,
+            cast(PricePoint.close, Float),
+        ).where(*daily)
+        if start_dt is not None:
+            # Each asset's last bar before the window, so LOCF has a value
+            # to carry onto the start date.
+            carried = (
+                select(
+                    PricePoint.asset_id.label("asset_id"),
+                    func.max(PricePoint.timestamp).label("ts"),
+                )
+                .where(*daily, PricePoint.timestamp < start_dt)
+                .group_by(PricePoint.asset_id)
+                .subquery()
+            )
+            stmt = stmt.outerjoin(carried, carried.c.asset_id == PricePoint.asset_id).where(
+                PricePoint.timestamp >= func.coalesce(carried.c.ts, start_dt)
+            )
+        rows = session.connection().execute(stmt.order_by(PricePoint.timestamp)).all()
+
+    series_idx, days, closes = zip(*rows, strict=True) if rows else ((), (), ())
+    aligned = align_and_rebase(
+        series_idx,
+        days,
+        closes,
+        len(ids),
+        start_day=None if start is None else (start - date(1970, 1, 1)).days,
+        base=base,
+    )
+    by_symbol = {ids[aid]: k for aid, k in column.items()}
+    present = [
+        s
+        for s in requested
+        if s in by_symbol and not math.isnan(aligned.first_close[by_symbol[s]])
+    ]
+    return Comparison(
+        symbols=present,
+        missing=[s for s in requested if s not in present],
+        base=base,
+        days=aligned.days,
+        values={s: aligned.values[by_symbol[s]] for s in present},
+        first_close={s: aligned.first_close[by_symbol[s]] for s in present},
+        last_close={s: aligned.last_close[by_symbol[s]] for s in present},
+    )
@@ -0,0 +1,217 @@
+"""Per-asset engine selection for the ``"auto"`` forecast engine mode.
+
+With ``forecast.default_engine = "auto"`` the retrain job stops fitting one
+global engine for everything. Each asset instead carries a *winning* engine
+in ``forecast_engine_selections``, and each run fits only that winner.
+
+How a winner is picked:
+
+1. **Live accuracy** (``ml.accuracy``) once at least two engines have
+   ``MIN_ACCURACY_POINTS`` evaluable points for the asset — lowest MAPE
+   wins. This is the evidence that matters: real forecasts, scored against
+   closes that landed afterwards.
+2. **Rolling-origin backtest** (``ml.backtest``) until then — a fresh
+   install has no elapsed horizons yet, so the weekly job replays a few
+   origins instead.
+
+Winners are re-evaluated on the weekly retrain once they are older than
+``forecast.auto_reevaluate_days``. Between evaluations the job refits one
+*challenger* engine per asset, round-robin, and stores it as a snapshot only
+(never the displayed forecast) so every engine keeps accruing live accuracy
+evidence. Evaluations and challengers share a time budget
+(``forecast.auto_budget_seconds``), so the nightly cost stays close to
+"one fit per asset" rather than "every engine for every asset".
+
+This module holds the selection rules and the table access; orchestration
+lives in ``ml.jobs``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Literal, TypeAlias
+
+from sqlalchemy import select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from ml.accuracy import AccuracyReport
+from ml.backtest import BacktestReport
+from ml.forecast import (
+    DEFAULT_ENGINE,
+    ENGINES,
+    MODEL_NAME_TO_ENGINE,
+    ForecastEngine,
+)
+from sidecar.db.engine import session_scope
+from sidecar.db.models import ForecastEngineSelection
+
+AUTO_ENGINE = "auto"
+# What ``forecast.default_engine`` may hold: a concrete engine or "auto".
+EngineMode: TypeAlias = ForecastEngine | Literal["auto"]
+SelectionSource: TypeAlias = Literal["accuracy", "backtest"]
+
+# Engine fitted for an asset that has no selection row yet (new asset, or
+# the evaluation budget ran out before reaching it).
+AUTO_FALLBACK_ENGINE: ForecastEngine = DEFAULT_ENGINE
+
+# Live accuracy overrides the backtest once at least two engines have this
+# many evaluable (snapshot, day) pairs — roughly two elapsed 14-day horizons.
+MIN_ACCURACY_POINTS = 20
+ACCURACY_WINDOW_DAYS = 90
+
+# Backtest used while live evidence is thin: weekly origins, kept short so a
+# first-run evaluation of a statsmodels engine is a handful of fits.
+BACKTEST_STEP_DAYS = 7
+BACKTEST_MAX_ORIGINS = 8
+
+DEFAULT_REEVALUATE_DAYS = 7
+DEFAULT_BUDGET_SECONDS = 120
+
+
+@dataclass(frozen=True)
+class EngineSelection:
+    """One row of ``forecast_engine_selections``."""
+
+    asset_id: int
+    engine: ForecastEngine
+    source: SelectionSource
+    mape: float | None
+    evaluable_points: int
+    evaluated_at: datetime
+    last_challenger: ForecastEngine | None
+    challenger_fitted_at: datetime | None
+
+
+@dataclass(frozen=True)
+class Winner:
+    engine: ForecastEngine
+    source: SelectionSource
+    mape: float | None
+    evaluable_points: int
+
+
+# ---------------------------------------------------------------------------
+# Selection rules
+# ---------------------------------------------------------------------------
+
+
+def _as_engine(raw: str | None) -> ForecastEngine | None:
+    return next((e for e in ENGINES if e == raw), None)
+
+
+def winner_from_accuracy(
+    report: AccuracyReport, *, min_points: int = MIN_ACCURACY_POINTS
+) -> Winner | None:
+    """Lowest-MAPE engine among those with enough live evidence.
+
+    None unless at least two engines qualify — a single engine's track
+    record isn't a comparison, so the caller falls back to the backtest.
+    """
+    candidates = [
+        (MODEL_NAME_TO_ENGINE[e.engine], e)
+        for e in report.per_engine
+        if e.engine in MODEL_NAME_TO_ENGINE
+        and e.mape is not None
+        and e.evaluable_points >= min_points
+    ]
+    if len(candidates) < 2:
+        return None
+    engine, best = min(candidates, key=lambda c: c[1].mape or 0.0)
+    return Winner(
+        engine=engine,
+        source="accuracy",
+        mape=best.mape,
+        evaluable_points=best.evaluable_points,
+    )
+
+
+def winner_from_backtest(report: BacktestReport) -> Winner | None:
+    """Best backtested engine (``per_engine`` is already MAPE-sorted)."""
+    for e in report.per_engine:
+        engine = _as_engine(e.engine)
+        if e.mape is not None and engine is not None:
+            return Winner(
+                engine=engine,
+                source="backtest",
+                mape=e.mape,
+                evaluable_points=e.evaluable_points,
+            )
+    return None
+
+
+def next_challenger(
+    winner: ForecastEngine, last: ForecastEngine | None
+) -> ForecastEngine:
+    """Round-robin over every engine except the winner, resuming after ``last``."""
+    rotation = [e for e in ENGINES if e != winner]
+    if last is None or last not in rotation:
+        return rotation[0]
+    return rotation[(rotation.index(last) + 1) % len(rotation)]
+
+
+# ---------------------------------------------------------------------------
+# Storage
+# ---------------------------------------------------------------------------
+
+
+def load_selections(
+    session: Session, asset_ids: Sequence[int]
+) -> dict[int, EngineSelection]:
+    """Selection rows for ``asset_ids``. Rows naming an engine that no longer
+    exists are skipped, so the asset falls back and gets re-evaluated."""
+    if not asset_ids:
+        return {}
+    rows = session.execute(
+        select(ForecastEngineSelection).where(
+            ForecastEngineSelection.asset_id.in_(asset_ids)
+        )
+    ).scalars()
+    out: dict[int, EngineSelection] = {}
+    for row in rows:
+        engine = _as_engine(row.engine)
+        if engine is None:
+            continue
+        out[row.asset_id] = EngineSelection(
+            asset_id=row.asset_id,
+            engine=engine,
+            source="accuracy" if row.source == "accuracy" else "backtest",
+            mape=row.mape,
+            evaluable_points=row.evaluable_points,
+            evaluated_at=row.evaluated_at.replace(tzinfo=UTC)
+            if row.evaluated_at.tzinfo is None
+            else row.evaluated_at,
+            last_challenger=_as_engine(row.last_challenger),
+            challenger_fitted_at=row.challenger_fitted_at,
+        )
+    return out
+
+
+def save_selection(
+    asset_id: int, winner: Winner, *, evaluated_at: datetime | None = None
+) -> None:
+    """Upsert the winner for ``asset_id``; the challenger cursor is preserved."""
+    values = {
+        "engine": winner.engine,
+        "source": winner.source,
+        "mape": winner.mape,
+        "evaluable_points": winner.evaluable_points,
+        "evaluated_at": evaluated_at or datetime.now(UTC),
+    }
+    with session_scope() as session:
+        session.execute(
+            sqlite_insert(ForecastEngineSelection)
+            .values(asset_id=asset_id, **values)
+            .on_conflict_do_update(index_elements=["asset_id"], set_=values)
+        )
+
+
+def record_challenger(asset_id: int, engine: ForecastEngine) -> None:
+    with session_scope() as session:
+        session.execute(
+            update(ForecastEngineSelection)
+            .where(ForecastEngineSelection.asset_id == asset_id)
+            .values(last_challenger=engine, challenger_fitted_at=datetime.now(UTC))
+        )
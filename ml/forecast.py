@@ -31,7 +31,9 @@ Inputs:
   no gaps on trading days. If the caller hands us PricePoint rows tagged
   `interval="1d"` in ascending order this is exactly what we need.
 - `horizon_days`: default 14 (user's explicit request in project settings).
-- `engine`: `"sarimax"` (default) or `"holt_winters"` (ETS).
+- `engine`: `"sarimax"` (default) or `"holt_winters"` (ETS), or one of the
+  vectorized lightweight engines in `ml.batch_forecast` (`"drift"`,
+  `"ewma"`, `"damped_trend"`, `"theta"`).
 
 Output: a `ForecastResult` wrapping a list of `ForecastPoint` rows with
 80% and 95% CI bands pulled straight from the model's `conf_int()` call at
@@ -69,13 +71,41 @@ MIN_TRAINING_ROWS = 60
 # caption can show "SARIMAX(1,1,1) · trained 2h ago" or
 # "Holt-Winters (ETS A,A,N) · trained 2h ago" without re-deriving from
 # config.
-ForecastEngine: TypeAlias = Literal["sarimax", "holt_winters"]
-ENGINES: tuple[ForecastEngine, ...] = ("sarimax", "holt_winters")
+ForecastEngine: TypeAlias = Literal[
+    "sarimax", "holt_winters", "drift", "ewma", "damped_trend", "theta"
+]
+ENGINES: tuple[ForecastEngine, ...] = (
+    "sarimax",
+    "holt_winters",
+    "drift",
+    "ewma",
+    "damped_trend",
+    "theta",
+)
+# Lightweight engines implemented as NumPy array ops over the whole universe
+# at once (see `ml.batch_forecast`). No statsmodels fit involved.
+BATCH_ENGINES: tuple[ForecastEngine, ...] = ("drift", "ewma", "damped_trend", "theta")
 DEFAULT_ENGINE: ForecastEngine = "sarimax"
 
 # Display names persisted in `Forecast.model`. Used in the UI caption.
 SARIMAX_MODEL_NAME = "SARIMAX(1,1,1)"
 HOLT_WINTERS_MODEL_NAME = "Holt-Winters (ETS A,A,N)"
+DRIFT_MODEL_NAME = "Random walk + drift"
+EWMA_MODEL_NAME = "EWMA level"
+DAMPED_TREND_MODEL_NAME = "Damped trend (Holt)"
+THETA_MODEL_NAME = "Theta"
+
+# Reverse lookup: persisted `model` string -> engine id. Accuracy reports
+# are keyed by the persisted display name; the auto engine mode maps them
+# back to something `forecast_series` accepts.
+MODEL_NAME_TO_ENGINE: dict[str, ForecastEngine] = {
+    SARIMAX_MODEL_NAME: "sarimax",
+    HOLT_WINTERS_MODEL_NAME: "holt_winters",
+    DRIFT_MODEL_NAME: "drift",
+    EWMA_MODEL_NAME: "ewma",
+    DAMPED_TREND_MODEL_NAME: "damped_trend",
+    THETA_MODEL_NAME: "theta",
+}
 
 # Backwards-compat alias for callers / tests written against the original
 # single-engine API. New code should import ``SARIMAX_MODEL_NAME``.
@@ -155,6 +185,20 @@ def _validate_inputs(
     return dates, values
 
 
+# ---------------------------------------------------------------------------
+# Lazy imports
+# ---------------------------------------------------------------------------
+
+
+def _import_numpy() -> Any:
+    """Lazy import — numpy ships with ``requirements-ml.txt``. The array
+    modules in ``ml`` all import it from here, so the sidecar still boots
+    without the ML extra."""
+    import numpy as np
+
+    return np
+
+
 # ---------------------------------------------------------------------------
 # SARIMAX engine
 # ---------------------------------------------------------------------------
@@ -434,17 +478,27 @@ def forecast_series(
         closes: ``(date, close_price)`` tuples, oldest-first, strictly
             ascending dates.
         horizon_days: number of calendar days forward to predict (1..90).
-        engine: ``"sarimax"`` (default) or ``"holt_winters"``.
+        engine: ``"sarimax"`` (default), ``"holt_winters"``, or one of the
+            lightweight ``BATCH_ENGINES`` (routed through
+            ``ml.batch_forecast`` as a one-row batch).
 
     Raises:
         ForecastError: invalid horizon, non-ascending dates, or unknown engine.
         InsufficientDataError: fewer than MIN_TRAINING_ROWS training rows.
         ForecastFitError: engine raised during fit or forecast.
     """
-    if engine not in _ENGINES:
+    if engine not in ENGINES:
         raise ForecastError(
-            f"unknown engine {engine!r}; expected one of {sorted(_ENGINES)}"
+            f"unknown engine {engine!r}; expected one of {sorted(ENGINES)}"
         )
+    if engine in BATCH_ENGINES:
+        # Local import: ml.batch_forecast imports this module.
+        from ml.batch_forecast import forecast_batch
+
+        outcome = forecast_batch({0: closes}, horizon_days=horizon_days, engine=engine)
+        if 0 in outcome.errors:
+            raise outcome.errors[0]
+        return outcome.results[0]
 
     dates, values = _validate_inputs(closes, horizon_days)
     last_date = dates[-1]
@@ -8,6 +8,19 @@ Forecasting entry points:
 - ``train_one(symbol)`` — user-triggered "retrain now" from the UI. Raises
   so the API layer can surface the error (distinguish InsufficientData from
   Fit failures from Unknown symbol).
+- ``refresh_batch_forecasts()`` — post-daily-ingest hook. When the
+  configured engine is one of the vectorized ``BATCH_ENGINES`` every stale
+  forecast is refit in a single pass; otherwise a no-op.
+
+With ``forecast.default_engine = "auto"`` each asset is fitted with its own
+winning engine from ``forecast_engine_selections`` (see
+``ml.engine_selection``). The weekly ``train_forecasts`` run also
+re-evaluates expired winners and refits a few challengers within a time
+budget; the stale refresh only evaluates assets that have no winner yet.
+
+With a batch engine, ``train_forecasts`` / ``refresh_stale_forecasts`` load
+every series in one query and forecast the whole universe at once instead
+of looping per asset.
 
 Sentiment entry points:
 - ``score_articles(batch_size=...)`` — scheduler job. Picks up unscored
@@ -30,13 +43,32 @@ Design notes:
 from __future__ import annotations
 
 import logging
+import time
 from collections.abc import Sequence
-from datetime import date
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
 
 from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
+from ml.engine_selection import (
+    ACCURACY_WINDOW_DAYS,
+    AUTO_ENGINE,
+    AUTO_FALLBACK_ENGINE,
+    BACKTEST_MAX_ORIGINS,
+    BACKTEST_STEP_DAYS,
+    DEFAULT_BUDGET_SECONDS,
+    DEFAULT_REEVALUATE_DAYS,
+    EngineSelection,
+    load_selections,
+    next_challenger,
+    record_challenger,
+    save_selection,
+    winner_from_accuracy,
+    winner_from_backtest,
+)
 from ml.forecast import (
+    BATCH_ENGINES,
     DEFAULT_ENGINE,
     ENGINES,
     ForecastEngine,
@@ -46,7 +78,7 @@ from ml.forecast import (
     InsufficientDataError,
     forecast_series,
 )
-from ml.persistence import load_forecast, save_forecast
+from ml.persistence import load_forecast, save_forecast, save_snapshot
 from ml.sentiment import SentimentBackendError, score_many
 from sidecar.db.engine import session_scope
 from sidecar.db.models import Article, Asset, PricePoint
@@ -58,12 +90,32 @@ DEFAULT_HORIZON_DAYS = 14
 DEFAULT_SENTIMENT_BATCH_SIZE = 200
 
 
+def _load_forecast_config() -> dict[str, Any]:
+    """The user's effective Settings. Lazy import of the settings service
+    avoids a circular import (ml → sidecar.services → sidecar.db → models
+    which already imports ml indirectly via SQLEnums in some test paths).
+    """
+    try:
+        from sidecar.services.settings import load_effective_config
+
+        return load_effective_config()
+    except Exception:  # pragma: no cover — defensive (DB not migrated yet, etc.)
+        return {}
+
+
+def _auto_mode(engine: ForecastEngine | None) -> bool:
+    """True when no explicit engine was given and Settings says ``"auto"``."""
+    return (
+        engine is None
+        and _load_forecast_config().get("forecast.default_engine") == AUTO_ENGINE
+    )
+
+
 def _resolve_engine(engine: ForecastEngine | None) -> ForecastEngine:
     """Pick the effective engine — explicit arg wins, otherwise the user's
-    Settings choice, otherwise the hard-coded default. Lazy import of the
-    settings service avoids a circular import (ml → sidecar.services →
-    sidecar.db → models which already imports ml indirectly via SQLEnums in
-    some test paths).
+    Settings choice, otherwise the hard-coded default. ``"auto"`` resolves
+    to ``AUTO_FALLBACK_ENGINE`` here; per-asset winners are looked up by
+    the auto paths themselves.
     """
     if engine is not None:
         if engine not in ENGINES:
@@ -71,12 +123,9 @@ def _resolve_engine(engine: ForecastEngine | None) -> ForecastEngine:
                 f"unknown engine {engine!r}; expected one of {sorted(ENGINES)}"
             )
         return engine
-    try:
-        from sidecar.services.settings import load_effective_config
-
-        configured = load_effective_config().get("forecast.default_engine")
-    except Exception:  # pragma: no cover — defensive (DB not migrated yet, etc.)
-        return DEFAULT_ENGINE
+    configured = _load_forecast_config().get("forecast.default_engine")
+    if configured == AUTO_ENGINE:
+        return AUTO_FALLBACK_ENGINE
     if isinstance(configured, str) and configured in ENGINES:
         return configured
     return DEFAULT_ENGINE
@@ -113,6 +162,62 @@ def _load_daily_closes(
     return sorted(seen.items())
 
 
+def _load_daily_closes_many(
+    session: Session, asset_ids: Sequence[int]
+) -> dict[int, list[tuple[date, float]]]:
+    """Multi-asset ``_load_daily_closes`` — one query for the whole batch.
+
+    Feeds the vectorized engines, which want every series up front rather
+    than one SELECT per asset.
+    """
+    if not asset_ids:
+        return {}
+    rows = session.execute(
+        select(PricePoint.asset_id, PricePoint.timestamp, PricePoint.close)
+        .where(
+            PricePoint.asset_id.in_(asset_ids),
+            PricePoint.interval == "1d",
+        )
+        .order_by(PricePoint.asset_id.asc(), PricePoint.timestamp.asc())
+    ).all()
+    by_asset: dict[int, dict[date, float]] = {aid: {} for aid in asset_ids}
+    for aid, ts, close in rows:
+        by_asset[aid][ts.date()] = float(close)
+    return {aid: sorted(seen.items()) for aid, seen in by_asset.items()}
+
+
+def _train_batch(
+    assets: Sequence[tuple[int, str]],
+    *,
+    horizon_days: int,
+    engine: ForecastEngine,
+    closes: dict[int, list[tuple[date, float]]] | None = None,
+) -> int:
+    """Fit a vectorized engine for every asset in one pass, persist each.
+
+    ``closes`` may be passed when the caller already loaded them (the stale
+    refresh does, to decide what's stale). Returns the count persisted.
+    """
+    from ml.batch_forecast import forecast_batch
+
+    if closes is None:
+        with session_scope() as session:
+            closes = _load_daily_closes_many(session, [aid for aid, _ in assets])
+    symbols = dict(assets)
+    outcome = forecast_batch(
+        {aid: closes.get(aid, []) for aid, _ in assets},
+        horizon_days=horizon_days,
+        engine=engine,
+    )
+    for aid, exc in outcome.errors.items():
+        logger.info(
+            "batch forecast: skipping %s (%s)", symbols.get(aid, aid), exc
+        )
+    for aid, result in outcome.results.items():
+        save_forecast(aid, result)
+    return len(outcome.results)
+
+
 def _active_asset_symbol_ids(session: Session) -> list[tuple[int, str]]:
     rows = session.execute(
         select(Asset.id, Asset.symbol)
@@ -126,6 +231,7 @@ def train_forecasts(
     *,
     horizon_days: int = DEFAULT_HORIZON_DAYS,
     engine: ForecastEngine | None = None,
+    auto_budget_seconds: float | None = None,
 ) -> int:
     """Retrain the forecast for every active asset. Returns count of successes.
 
@@ -135,10 +241,11 @@ def train_forecasts(
     retrains use ``train_one`` which surfaces errors.
 
     ``engine=None`` defers to the user's Settings choice (or the default
-    SARIMAX when no setting is configured).
+    SARIMAX when no setting is configured). In ``"auto"`` mode each asset
+    gets its own winning engine; ``auto_budget_seconds`` caps the extra
+    re-evaluation / challenger work (``None`` = the configured budget, ``0``
+    = winners only, as the synchronous "retrain all" endpoint wants).
     """
-    effective_engine = _resolve_engine(engine)
-    successes = 0
     with session_scope() as session:
         assets = _active_asset_symbol_ids(session)
 
@@ -146,6 +253,42 @@ def train_forecasts(
         logger.info("train_forecasts: no active assets, skipping")
         return 0
 
+    if _auto_mode(engine):
+        config = _load_forecast_config()
+        budget = (
+            float(config.get("forecast.auto_budget_seconds", DEFAULT_BUDGET_SECONDS))
+            if auto_budget_seconds is None
+            else auto_budget_seconds
+        )
+        max_age = timedelta(
+            days=int(
+                config.get("forecast.auto_reevaluate_days", DEFAULT_REEVALUATE_DAYS)
+            )
+        )
+        return _train_auto(
+            assets,
+            horizon_days=horizon_days,
+            budget_seconds=budget,
+            reevaluate_after=max_age,
+            challengers=True,
+        )
+
+    effective_engine = _resolve_engine(engine)
+    successes = 0
+
+    if effective_engine in BATCH_ENGINES:
+        # Vectorized engines forecast the whole universe in one pass.
+        successes = _train_batch(
+            assets, horizon_days=horizon_days, engine=effective_engine
+        )
+        logger.info(
+            "train_forecasts: retrained %d / %d active assets via %s (batch)",
+            successes,
+            len(assets),
+            effective_engine,
+        )
+        return successes
+
     for asset_id, symbol in assets:
         try:
             _train_one_inner(
@@ -194,11 +337,28 @@ def refresh_stale_forecasts(
     startup (and periodically) keeps the projection anchored to the present
     instead of whenever the app last happened to be open on a Sunday.
     """
-    effective_engine = _resolve_engine(engine)
-    retrained = 0
     with session_scope() as session:
         assets = _active_asset_symbol_ids(session)
 
+    if _auto_mode(engine):
+        # Between weekly runs only never-evaluated assets get scored, so a
+        # newly added asset doesn't sit on the fallback engine for a week.
+        budget = float(
+            _load_forecast_config().get(
+                "forecast.auto_budget_seconds", DEFAULT_BUDGET_SECONDS
+            )
+        )
+        return _train_auto(
+            assets, horizon_days=horizon_days, budget_seconds=budget, stale_only=True
+        )
+
+    effective_engine = _resolve_engine(engine)
+    retrained = 0
+    if effective_engine in BATCH_ENGINES:
+        return _refresh_stale_batch(
+            assets, horizon_days=horizon_days, engine=effective_engine
+        )
+
     for asset_id, symbol in assets:
         with session_scope() as session:
             closes = _load_daily_closes(session, asset_id)
@@ -239,6 +399,268 @@ def refresh_stale_forecasts(
     return retrained
 
 
+def _refresh_stale_batch(
+    assets: Sequence[tuple[int, str]],
+    *,
+    horizon_days: int,
+    engine: ForecastEngine,
+) -> int:
+    """Batch-engine flavour of ``refresh_stale_forecasts``: one query for the
+    closes, one vectorized pass over just the stale subset."""
+    with session_scope() as session:
+        closes = _load_daily_closes_many(session, [aid for aid, _ in assets])
+    stale: list[tuple[int, str]] = []
+    for asset_id, symbol in assets:
+        series = closes.get(asset_id)
+        if not series:
+            continue
+        existing = load_forecast(asset_id)
+        if existing is not None and existing.last_close_date >= series[-1][0]:
+            continue
+        stale.append((asset_id, symbol))
+    retrained = (
+        _train_batch(stale, horizon_days=horizon_days, engine=engine, closes=closes)
+        if stale
+        else 0
+    )
+    logger.info(
+        "refresh_stale_forecasts: retrained %d stale forecast(s) via %s (batch)",
+        retrained,
+        engine,
+    )
+    return retrained
+
+
+def refresh_batch_forecasts(*, horizon_days: int = DEFAULT_HORIZON_DAYS) -> int:
+    """Refresh stale forecasts after a daily ingest — batch engines only.
+
+    Called by ``ingest_prices_daily`` once new daily bars land. With a
+    vectorized engine configured the whole universe re-forecasts in
+    milliseconds, so the projection tracks every new close. With a
+    statsmodels engine this is a no-op: those stay on the weekly cron + 6h
+    stale refresh, where their per-asset fit cost belongs. In ``"auto"``
+    mode the assets whose winner is a batch engine are refreshed.
+    """
+    if _auto_mode(None):
+        with session_scope() as session:
+            assets = _active_asset_symbol_ids(session)
+        return _train_auto(
+            assets, horizon_days=horizon_days, stale_only=True, batch_only=True
+        )
+    effective_engine = _resolve_engine(None)
+    if effective_engine not in BATCH_ENGINES:
+        return 0
+    return refresh_stale_forecasts(horizon_days=horizon_days, engine=effective_engine)
+
+
+# ---------------------------------------------------------------------------
+# "auto" engine mode
+# ---------------------------------------------------------------------------
+
+
+def _evaluate_engines(
+    asset_id: int,
+    symbol: str,
+    closes: list[tuple[date, float]],
+    *,
+    horizon_days: int,
+) -> None:
+    """Pick and store the winning engine for one asset — live accuracy when
+    there's enough of it, otherwise a short rolling-origin backtest."""
+    from ml.accuracy import compute_accuracy
+    from ml.backtest import backtest_series_many
+
+    winner = winner_from_accuracy(
+        compute_accuracy(symbol, days=ACCURACY_WINDOW_DAYS)
+    )
+    if winner is None:
+        report = backtest_series_many(
+            {symbol: closes},
+            horizon_days=horizon_days,
+            step_days=BACKTEST_STEP_DAYS,
+            max_origins=BACKTEST_MAX_ORIGINS,
+        )[symbol]
+        winner = winner_from_backtest(report)
+    if winner is None:
+        logger.info("auto engine: no evidence to score %s yet", symbol)
+        return
+    save_selection(asset_id, winner)
+    logger.info(
+        "auto engine: %s -> %s (%s, MAPE=%s)",
+        symbol,
+        winner.engine,
+        winner.source,
+        winner.mape,
+    )
+
+
+def _fit_and_save(
+    asset_id: int,
+    symbol: str,
+    closes: list[tuple[date, float]],
+    *,
+    horizon_days: int,
+    engine: ForecastEngine,
+    snapshot_only: bool = False,
+) -> bool:
+    """Fit one statsmodels-or-batch engine for one asset, swallowing the
+    usual per-asset failures like ``train_forecasts`` does."""
+    try:
+        result = forecast_series(closes, horizon_days=horizon_days, engine=engine)
+    except InsufficientDataError as exc:
+        logger.info("auto engine: skipping %s (insufficient data: %s)", symbol, exc)
+        return False
+    except ForecastFitError as exc:
+        logger.warning("auto engine: %s fit failed for %s: %s", engine, symbol, exc)
+        return False
+    except Exception:  # pragma: no cover — truly defensive
+        logger.exception("auto engine: unexpected error for %s", symbol)
+        return False
+    if snapshot_only:
+        save_snapshot(asset_id, result)
+    else:
+        save_forecast(asset_id, result)
+    return True
+
+
+def _train_auto(
+    assets: Sequence[tuple[int, str]],
+    *,
+    horizon_days: int,
+    budget_seconds: float = 0.0,
+    reevaluate_after: timedelta | None = None,
+    challengers: bool = False,
+    stale_only: bool = False,
+    batch_only: bool = False,
+) -> int:
+    """Fit every asset with its own winning engine. Returns count persisted.
+
+    Three phases, only the first and last of which are budgeted:
+
+    1. Evaluate — assets with no winner yet (and, when ``reevaluate_after``
+       is given, winners older than that) are re-scored until
+       ``budget_seconds`` runs out; the rest wait for the next run.
+    2. Fit winners — grouped by engine, so batch-engine winners still go
+       through one vectorized pass. Assets without a winner use
+       ``AUTO_FALLBACK_ENGINE``.
+    3. Challengers — with whatever budget is left, refit one non-winning
+       engine per asset (least recently challenged first) as a snapshot
+       only, so its live accuracy keeps accruing.
+    """
+    deadline = time.monotonic() + budget_seconds
+    asset_ids = [aid for aid, _ in assets]
+    with session_scope() as session:
+        closes = _load_daily_closes_many(session, asset_ids)
+        selections = load_selections(session, asset_ids)
+
+    now = datetime.now(UTC)
+    to_evaluate = [
+        (aid, sym)
+        for aid, sym in assets
+        if closes.get(aid)
+        and (
+            aid not in selections
+            or (
+                reevaluate_after is not None
+                and now - selections[aid].evaluated_at >= reevaluate_after
+            )
+        )
+    ]
+    evaluated = 0
+    for aid, sym in to_evaluate:
+        if time.monotonic() >= deadline:
+            break
+        _evaluate_engines(aid, sym, closes[aid], horizon_days=horizon_days)
+        evaluated += 1
+    if evaluated:
+        with session_scope() as session:
+            selections = load_selections(session, asset_ids)
+
+    groups: dict[ForecastEngine, list[tuple[int, str]]] = {}
+    for aid, sym in assets:
+        series = closes.get(aid)
+        if not series:
+            continue
+        if stale_only:
+            existing = load_forecast(aid)
+            if existing is not None and existing.last_close_date >= series[-1][0]:
+                continue
+        selection = selections.get(aid)
+        engine = selection.engine if selection is not None else AUTO_FALLBACK_ENGINE
+        if batch_only and engine not in BATCH_ENGINES:
+            continue
+        groups.setdefault(engine, []).append((aid, sym))
+
+    fitted = 0
+    for engine, members in groups.items():
+        if engine in BATCH_ENGINES:
+            fitted += _train_batch(
+                members, horizon_days=horizon_days, engine=engine, closes=closes
+            )
+            continue
+        for aid, sym in members:
+            if _fit_and_save(
+                aid, sym, closes[aid], horizon_days=horizon_days, engine=engine
+            ):
+                fitted += 1
+
+    challenged = 0
+    if challengers:
+        challenged = _fit_challengers(
+            assets, selections, closes, horizon_days=horizon_days, deadline=deadline
+        )
+
+    logger.info(
+        "auto engine: %d fitted (%s), %d evaluated, %d challenger fit(s)",
+        fitted,
+        {e: len(m) for e, m in groups.items()},
+        evaluated,
+        challenged,
+    )
+    return fitted
+
+
+def _fit_challengers(
+    assets: Sequence[tuple[int, str]],
+    selections: dict[int, EngineSelection],
+    closes: dict[int, list[tuple[date, float]]],
+    *,
+    horizon_days: int,
+    deadline: float,
+) -> int:
+    epoch = datetime.min.replace(tzinfo=UTC)
+    queue = sorted(
+        (
+            (aid, sym, selections[aid])
+            for aid, sym in assets
+            if aid in selections and closes.get(aid)
+        ),
+        key=lambda item: (
+            item[2].challenger_fitted_at.replace(tzinfo=UTC)
+            if item[2].challenger_fitted_at is not None
+            else epoch
+        ),
+    )
+    done = 0
+    for aid, sym, selection in queue:
+        if time.monotonic() >= deadline:
+            break
+        challenger = next_challenger(selection.engine, selection.last_challenger)
+        # The cursor advances even when the fit fails, so one engine that
+        # can't fit this series doesn't starve the rest of the rotation.
+        record_challenger(aid, challenger)
+        if _fit_and_save(
+            aid,
+            sym,
+            closes[aid],
+            horizon_days=horizon_days,
+            engine=challenger,
+            snapshot_only=True,
+        ):
+            done += 1
+    return done
+
+
 def train_one(
     symbol: str,
     *,
@@ -247,7 +669,8 @@ def train_one(
 ) -> ForecastResult:
     """Retrain the forecast for a single symbol and return the fitted result.
 
-    ``engine`` defers to the configured default when ``None``.
+    ``engine`` defers to the configured default when ``None`` — in
+    ``"auto"`` mode, the asset's winning engine.
 
     Raises:
         UnknownSymbolError: when ``symbol`` doesn't match a tracked asset.
@@ -261,9 +684,14 @@ def train_one(
         ).scalar_one_or_none()
     if row is None:
         raise UnknownSymbolError(f"no tracked asset with symbol {sym!r}")
-    return _train_one_inner(
-        int(row), sym, horizon_days=horizon_days, engine=_resolve_engine(engine)
-    )
+    asset_id = int(row)
+    if _auto_mode(engine):
+        with session_scope() as session:
+            selection = load_selections(session, [asset_id]).get(asset_id)
+        chosen = selection.engine if selection is not None else AUTO_FALLBACK_ENGINE
+    else:
+        chosen = _resolve_engine(engine)
+    return _train_one_inner(asset_id, sym, horizon_days=horizon_days, engine=chosen)
 
 
 def _train_one_inner(
@@ -10,6 +10,12 @@ Responsibilities:
   ``forecasts`` stays single-row-per-asset (fast chart overlay lookup);
   ``forecast_snapshots`` is the historical record the accuracy module
   consumes once horizon dates elapse.
+- Pack snapshot points into a compact binary blob (``points_blob``) —
+  see the codec section below — and thin old snapshots to one per week
+  per engine (``thin_snapshots``).
+- Explode each snapshot into ``accuracy_points`` (one row per forecast
+  date) and pair them with actual closes as daily bars land — see
+  ``sync_accuracy_actuals``. ``ml.accuracy`` aggregates those rows in SQL.
 
 We use SQLite's `INSERT ... ON CONFLICT(asset_id) DO UPDATE` so the happy path
 is a single round-trip, and the unique constraint guarantees we can't ever
@@ -21,20 +27,31 @@ from __future__ import annotations
 
 import json
 import logging
-from datetime import UTC, date
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
 from typing import Any, cast
 
-from sqlalchemy import delete, select
+from sqlalchemy import Float, delete, func, select, update
+from sqlalchemy import cast as sql_cast
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.engine import CursorResult
 from sqlalchemy.orm import Session
 
 from ml.forecast import ForecastPoint, ForecastResult
 from sidecar.db.engine import session_scope
-from sidecar.db.models import Forecast, ForecastSnapshot
+from sidecar.db.models import AccuracyPoint, Forecast, ForecastSnapshot, PricePoint
 
 logger = logging.getLogger(__name__)
 
+# A pending accuracy point whose date is this far behind the asset's newest
+# daily bar will never get a close (weekend / holiday / data gap) — it is
+# dropped so the pending set, and the per-ingest fill, stays small.
+UNFILLABLE_GRACE_DAYS = 7
+
 
 def _encode_points(points: list[ForecastPoint]) -> str:
     """Serialize the forecast points to a JSON string for the Text column.
@@ -78,6 +95,128 @@ def _decode_points(raw: str) -> list[ForecastPoint]:
     return out
 
 
+# ---------------------------------------------------------------------------
+# Snapshot points codec
+# ---------------------------------------------------------------------------
+#
+# ``forecast_snapshots.points_blob`` layout, little-endian:
+#
+#   header   <BiH   version, first forecast_date as a date ordinal, n points
+#   v2 only  n x int32  forecast_date ordinals
+#   yhat     n x float64
+#   bands    n x float32 each: lower_80, upper_80, lower_95, upper_95
+#
+# Version 1 (every engine's output) implies contiguous daily dates from the
+# start ordinal; version 2 carries explicit ordinals for the odd legacy row
+# with gaps. The point estimate keeps full precision; float32 holds the
+# bands to ~7 significant digits, far below their statistical resolution.
+# A 14-day snapshot is 343 bytes vs ~1.7 KB of JSON, and decoding is a
+# handful of ``array.frombytes`` copies rather than a parse per point.
+
+_BLOB_HEADER = struct.Struct("<BiH")
+_BLOB_CONTIGUOUS = 1
+_BLOB_EXPLICIT_DATES = 2
+_BAND_FIELDS = ("lower_80", "upper_80", "lower_95", "upper_95")
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+@dataclass(frozen=True)
+class PackedPoints:
+    """Column arrays decoded from a ``points_blob``, one entry per point."""
+
+    ordinals: array[int]
+    yhat: array[float]
+    lower_80: array[float]
+    upper_80: array[float]
+    lower_95: array[float]
+    upper_95: array[float]
+
+    def to_points(self) -> list[ForecastPoint]:
+        return [
+            ForecastPoint(
+                forecast_date=date.fromordinal(o),
+                yhat=y,
+                lower_80=l80,
+                upper_80=u80,
+                lower_95=l95,
+                upper_95=u95,
+            )
+            for o, y, l80, u80, l95, u95 in zip(
+                self.ordinals,
+                self.yhat,
+                self.lower_80,
+                self.upper_80,
+                self.lower_95,
+                self.upper_95,
+                strict=True,
+            )
+        ]
+
+
+def _le_bytes(values: array[Any]) -> bytes:
+    if _BIG_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _read_array(typecode: str, blob: bytes, offset: int, n: int) -> array[Any]:
+    out = array(typecode)
+    end = offset + n * out.itemsize
+    if end > len(blob):
+        raise ValueError("points_blob is truncated")
+    out.frombytes(blob[offset:end])
+    if _BIG_ENDIAN:
+        out.byteswap()
+    return out
+
+
+def encode_points_blob(points: Sequence[ForecastPoint]) -> bytes:
+    """Pack forecast points into the ``points_blob`` format (see above)."""
+    ordinals = [p.forecast_date.toordinal() for p in points]
+    start = ordinals[0] if ordinals else 0
+    contiguous = ordinals == list(range(start, start + len(ordinals)))
+    parts = [
+        _BLOB_HEADER.pack(
+            _BLOB_CONTIGUOUS if contiguous else _BLOB_EXPLICIT_DATES,
+            start,
+            len(ordinals),
+        )
+    ]
+    if not contiguous:
+        parts.append(_le_bytes(array("i", ordinals)))
+    parts.append(_le_bytes(array("d", [p.yhat for p in points])))
+    for field in _BAND_FIELDS:
+        parts.append(_le_bytes(array("f", [getattr(p, field) for p in points])))
+    return b"".join(parts)
+
+
+def decode_points_blob(blob: bytes) -> PackedPoints:
+    """Unpack a ``points_blob`` into column arrays without per-point parsing.
+
+    Raises ValueError for an unknown version byte or a truncated blob.
+    """
+    if len(blob) < _BLOB_HEADER.size:
+        raise ValueError("points_blob is truncated")
+    version, start, n = _BLOB_HEADER.unpack_from(blob)
+    offset = _BLOB_HEADER.size
+    if version == _BLOB_CONTIGUOUS:
+        ordinals = array("i", range(start, start + n))
+    elif version == _BLOB_EXPLICIT_DATES:
+        ordinals = _read_array("i", blob, offset, n)
+        offset += n * ordinals.itemsize
+    else:
+        raise ValueError(f"unknown points_blob version {version}")
+    yhat = _read_array("d", blob, offset, n)
+    offset += n * yhat.itemsize
+    bands: list[array[float]] = []
+    for _ in _BAND_FIELDS:
+        band = _read_array("f", blob, offset, n)
+        offset += n * band.itemsize
+        bands.append(band)
+    return PackedPoints(ordinals, yhat, *bands)
+
+
 def _row_to_result(row: Forecast) -> ForecastResult:
     """Hydrate a `Forecast` ORM row into the dataclass the API / UI consume.
 
@@ -100,6 +239,141 @@ def _row_to_result(row: Forecast) -> ForecastResult:
     )
 
 
+def _row_payload(asset_id: int, result: ForecastResult) -> dict[str, Any]:
+    return {
+        "asset_id": asset_id,
+        "model": result.model,
+        "horizon_days": result.horizon_days,
+        "training_rows": result.training_rows,
+        "last_close": result.last_close,
+        "last_close_date": result.last_close_date,
+        "generated_at": result.generated_at,
+        "points_json": _encode_points(result.points),
+    }
+
+
+def _snapshot_payload(asset_id: int, result: ForecastResult) -> dict[str, Any]:
+    payload = _row_payload(asset_id, result)
+    del payload["points_json"]
+    payload["points_blob"] = encode_points_blob(result.points)
+    return payload
+
+
+def _append_snapshot(
+    session: Session, payload: dict[str, Any], result: ForecastResult
+) -> None:
+    """Insert the snapshot row plus its ``accuracy_points``, pairing any
+    forecast dates whose close is already on file."""
+    snapshot_id = int(
+        session.execute(
+            sqlite_insert(ForecastSnapshot)
+            .values(**payload)
+            .returning(ForecastSnapshot.id)
+        ).scalar_one()
+    )
+    if not result.points:
+        return
+    last_close = float(result.last_close)
+    session.execute(
+        sqlite_insert(AccuracyPoint),
+        [
+            {
+                "snapshot_id": snapshot_id,
+                "forecast_date": p.forecast_date,
+                "asset_id": payload["asset_id"],
+                "model": result.model,
+                "generated_at": result.generated_at,
+                "predicted": p.yhat,
+                "last_close": last_close,
+            }
+            for p in result.points
+        ],
+    )
+    _fill_actuals(session, AccuracyPoint.snapshot_id == snapshot_id)
+
+
+def _fill_actuals(session: Session, *criteria: Any) -> int:
+    """Pair pending ``accuracy_points`` (narrowed by ``criteria``) with the
+    daily close on their ``forecast_date``. Returns rows filled.
+
+    Daily bars are stamped at midnight, so "the bar on date D" is the
+    ``[D, D+1)`` timestamp range — an index range probe on
+    ``uq_price_points_asset_ts_interval`` rather than a ``date()`` scan.
+    """
+    close_on_date = (
+        select(sql_cast(PricePoint.close, Float))
+        .where(
+            PricePoint.asset_id == AccuracyPoint.asset_id,
+            PricePoint.interval == "1d",
+            PricePoint.timestamp >= AccuracyPoint.forecast_date,
+            PricePoint.timestamp < func.date(AccuracyPoint.forecast_date, "+1 day"),
+        )
+        .order_by(PricePoint.timestamp.asc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    result = cast(
+        CursorResult[Any],
+        session.execute(
+            update(AccuracyPoint)
+            .where(
+                AccuracyPoint.actual.is_(None),
+                close_on_date.is_not(None),
+                *criteria,
+            )
+            .values(actual=close_on_date)
+            .execution_options(synchronize_session=False)
+        ),
+    )
+    return result.rowcount or 0
+
+
+def sync_accuracy_actuals(asset_ids: Sequence[int] | None = None) -> int:
+    """Fill ``accuracy_points.actual`` from newly landed daily bars.
+
+    Called by the daily price ingest. Only still-pending rows are touched
+    (served by the partial ``ix_accuracy_points_pending`` index), then
+    pending rows more than ``UNFILLABLE_GRACE_DAYS`` behind the asset's
+    newest daily bar are dropped — no close will ever arrive for them.
+    Returns the number of rows filled.
+    """
+    scope: list[Any] = []
+    if asset_ids is not None:
+        if not asset_ids:
+            return 0
+        scope.append(AccuracyPoint.asset_id.in_(list(asset_ids)))
+    latest_bar = (
+        select(func.max(PricePoint.timestamp))
+        .where(
+            PricePoint.asset_id == AccuracyPoint.asset_id,
+            PricePoint.interval == "1d",
+        )
+        .scalar_subquery()
+    )
+    with session_scope() as session:
+        filled = _fill_actuals(session, *scope)
+        dropped = cast(
+            CursorResult[Any],
+            session.execute(
+                delete(AccuracyPoint)
+                .where(
+                    AccuracyPoint.actual.is_(None),
+                    AccuracyPoint.forecast_date
+                    < func.date(latest_bar, f"-{UNFILLABLE_GRACE_DAYS} days"),
+                    *scope,
+                )
+                .execution_options(synchronize_session=False)
+            ),
+        ).rowcount
+    if filled or dropped:
+        logger.info(
+            "sync_accuracy_actuals: filled %d point(s), dropped %d unfillable",
+            filled,
+            dropped,
+        )
+    return filled
+
+
 def save_forecast(asset_id: int, result: ForecastResult) -> None:
     """Upsert the latest forecast for ``asset_id`` AND append to history.
 
@@ -114,16 +388,7 @@ def save_forecast(asset_id: int, result: ForecastResult) -> None:
     guarantees idempotency on the latest-row half. The snapshot append is
     not deduped (every save is a real new record).
     """
-    payload = {
-        "asset_id": asset_id,
-        "model": result.model,
-        "horizon_days": result.horizon_days,
-        "training_rows": result.training_rows,
-        "last_close": result.last_close,
-        "last_close_date": result.last_close_date,
-        "generated_at": result.generated_at,
-        "points_json": _encode_points(result.points),
-    }
+    payload = _row_payload(asset_id, result)
     # Everything except the PK (id) and FK (asset_id) is overwritten on
     # conflict — a retrain is semantically a full replacement, not a merge.
     update_set = {k: v for k, v in payload.items() if k != "asset_id"}
@@ -138,9 +403,9 @@ def save_forecast(asset_id: int, result: ForecastResult) -> None:
             )
         )
         session.execute(stmt)
-        # Append-only history. Same payload, no conflict resolution — every
-        # save is a real new snapshot.
-        session.execute(sqlite_insert(ForecastSnapshot).values(**payload))
+        # Append-only history, no conflict resolution — every save is a
+        # real new snapshot.
+        _append_snapshot(session, _snapshot_payload(asset_id, result), result)
     logger.info(
         "save_forecast: asset_id=%d horizon=%d training_rows=%d last_close=%s",
         asset_id,
@@ -150,7 +415,66 @@ def save_forecast(asset_id: int, result: ForecastResult) -> None:
     )
 
 
-def _load_in_session(session: Session, asset_id: int) -> ForecastResult | None:
+def save_snapshot(asset_id: int, result: ForecastResult) -> None:
+    """Append ``result`` to ``forecast_snapshots`` WITHOUT touching ``forecasts``.
+
+    Used for challenger fits in the ``"auto"`` engine mode: the run should
+    accumulate accuracy evidence for a non-winning engine, but the chart
+    overlay must keep showing the winner's forecast.
+    """
+    with session_scope() as session:
+        _append_snapshot(session, _snapshot_payload(asset_id, result), result)
+    logger.info(
+        "save_snapshot: asset_id=%d model=%s last_close=%s",
+        asset_id,
+        result.model,
+        result.last_close,
+    )
+
+
+def thin_snapshots(older_than_days: int, *, now: datetime | None = None) -> int:
+    """Thin snapshots older than ``older_than_days`` to one per week per engine.
+
+    Within each (asset, model, calendar week) bucket past the cutoff only
+    the newest snapshot survives; its ``accuracy_points`` go with the
+    deleted rows via the FK cascade. Recent history is untouched, so
+    short-window accuracy (and the ``"auto"`` engine choice) keeps every
+    snapshot while long-run history stays a weekly sample. Returns the
+    number of snapshots deleted.
+    """
+    if older_than_days <= 0:
+        return 0
+    cutoff = (now or datetime.now(UTC)) - timedelta(days=older_than_days)
+    is_old = ForecastSnapshot.generated_at < cutoff
+    keep = (
+        select(func.max(ForecastSnapshot.id))
+        .where(is_old)
+        .group_by(
+            ForecastSnapshot.asset_id,
+            ForecastSnapshot.model,
+            func.strftime("%Y-%W", ForecastSnapshot.generated_at),
+        )
+    )
+    with session_scope() as session:
+        deleted = cast(
+            CursorResult[Any],
+            session.execute(
+                delete(ForecastSnapshot)
+                .where(is_old, ForecastSnapshot.id.not_in(keep))
+                .execution_options(synchronize_session=False)
+            ),
+        ).rowcount or 0
+    if deleted:
+        logger.info(
+            "thin_snapshots: removed %d snapshot(s) older than %d days",
+            deleted,
+            older_than_days,
+        )
+    return deleted
+
+
+def load_forecast_in_session(session: Session, asset_id: int) -> ForecastResult | None:
+    """``load_forecast`` inside the caller's session."""
     row = session.execute(
         select(Forecast).where(Forecast.asset_id == asset_id)
     ).scalar_one_or_none()
@@ -162,7 +486,7 @@ def _load_in_session(session: Session, asset_id: int) -> ForecastResult | None:
 def load_forecast(asset_id: int) -> ForecastResult | None:
     """Return the latest forecast for ``asset_id`` or None if none exists."""
     with session_scope() as session:
-        return _load_in_session(session, asset_id)
+        return load_forecast_in_session(session, asset_id)
 
 
 def load_forecast_by_symbol(symbol: str) -> tuple[int, ForecastResult] | None:
@@ -182,7 +506,7 @@ def load_forecast_by_symbol(symbol: str) -> tuple[int, ForecastResult] | None:
         ).scalar_one_or_none()
         if asset_id is None:
             return None
-        result = _load_in_session(session, asset_id)
+        result = load_forecast_in_session(session, asset_id)
         if result is None:
             return None
         return asset_id, result
@@ -223,8 +547,6 @@ def load_snapshots(
     the last N days are returned. None pulls the full history. Used by the
     accuracy module to build rolling metrics.
     """
-    from datetime import datetime, timedelta
-
     from sqlalchemy import and_
 
     with session_scope() as session:
@@ -255,5 +577,5 @@ def _snapshot_to_result(row: ForecastSnapshot) -> ForecastResult:
         last_close=row.last_close,
         last_close_date=row.last_close_date,
         generated_at=generated,
-        points=_decode_points(row.points_json),
+        points=decode_points_blob(row.points_blob).to_points(),
     )
@@ -195,8 +195,19 @@ def compute_volatility(
         ).scalar_one_or_none()
         if asset_row is None:
             return _empty_report(sym, lookback_days)
-        cutoff = (datetime.now(UTC) - timedelta(days=lookback_days)).date()
-        closes = _load_daily_closes(session, int(asset_row), since=cutoff)
+        return volatility_for_asset(
+            session, int(asset_row), sym, lookback_days=lookback_days
+        )
+
+
+def volatility_for_asset(
+    session: Session, asset_id: int, symbol: str, *, lookback_days: int = 30
+) -> VolatilityReport:
+    """``compute_volatility`` for an already-resolved asset, read through
+    the caller's ``session``."""
+    sym = symbol
+    cutoff = (datetime.now(UTC) - timedelta(days=lookback_days)).date()
+    closes = _load_daily_closes(session, asset_id, since=cutoff)
 
     returns = _log_returns(closes)
     if len(returns) < MIN_RETURNS_FOR_VOL:
@@ -0,0 +1,179 @@
+"""Background warm-up of the heavy ML imports.
+
+``ml.forecast`` and ``ml.sentiment`` import statsmodels / pandas / VADER
+lazily so a sidecar without ``requirements-ml.txt`` still boots. The flip
+side is that whoever calls them first pays the one-off import cost — ~1-2 s
+for statsmodels + pandas, a few hundred ms for the VADER lexicon — and that
+is usually a user click ("Retrain now") or the first inline scoring pass in
+``ingest_news``.
+
+``start_background_warmup()`` moves that cost onto a low-priority daemon
+thread started from the ``sidecar.main.lifespan`` hook. The thread waits
+until the first ``/api/health/`` probe has been answered (the Tauri shell
+gates the window on it) so cold start is never slowed, then pulls each
+module in through the same lazy helpers the real code paths use. Python's
+module import lock makes this safe against a concurrent real caller: the
+second importer simply blocks until the first finishes, it never imports
+twice.
+
+Opt-in via ``FINTRACK_ENABLE_ML_WARMUP``. Readiness is reported on the
+health endpoint via ``warmup_status()``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Literal, TypeAlias
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long the warm-up thread waits for the first health
+# probe before starting anyway — covers standalone runs where nothing ever
+# polls /api/health/.
+HEALTH_WAIT_TIMEOUT_SECONDS = 10.0
+
+# ``nice`` increment applied to the warm-up thread where the OS lets us
+# re-prioritise a single thread (Linux: threads are schedulable tasks with
+# their own nice value). Elsewhere the thread runs at normal priority —
+# it's a one-off of a couple of seconds either way.
+WARMUP_NICE_INCREMENT = 10
+
+# Overall lifecycle: "disabled" (flag off) → "pending" (waiting for the
+# first health probe) → "running" → "done". Per-component status is one of
+# "pending" / "ready" / "unavailable" (ML deps not installed or failed to load).
+WarmupState: TypeAlias = Literal["disabled", "pending", "running", "done"]
+ComponentState: TypeAlias = Literal["pending", "ready", "unavailable"]
+
+
+@dataclass
+class _WarmupTracker:
+    state: WarmupState = "disabled"
+    components: dict[str, ComponentState] = field(default_factory=dict)
+    elapsed_ms: float | None = None
+
+
+@dataclass(frozen=True)
+class WarmupStatus:
+    """Snapshot of the warm-up tracker, safe to hand to the API layer."""
+
+    state: WarmupState
+    components: dict[str, ComponentState]
+    elapsed_ms: float | None
+
+
+_tracker = _WarmupTracker()
+_tracker_lock = threading.Lock()
+_serving = threading.Event()
+_thread: threading.Thread | None = None
+
+
+def _warm_forecast() -> None:
+    from ml.forecast import _import_ets_and_pandas, _import_sarimax
+
+    _import_sarimax()
+    _import_ets_and_pandas()
+
+
+def _warm_sentiment() -> None:
+    from ml.sentiment import _get_analyzer
+
+    _get_analyzer()
+
+
+# Ordered — forecast first since it's the multi-second one.
+_COMPONENTS: tuple[tuple[str, Callable[[], None]], ...] = (
+    ("forecast", _warm_forecast),
+    ("sentiment", _warm_sentiment),
+)
+
+
+def _set_component(name: str, status: ComponentState) -> None:
+    with _tracker_lock:
+        _tracker.components[name] = status
+
+
+def _lower_thread_priority() -> None:
+    """Best-effort: nice the current thread so request threads win the CPU."""
+    if not sys.platform.startswith("linux"):
+        return
+    with contextlib.suppress(OSError, AttributeError):
+        os.setpriority(
+            os.PRIO_PROCESS,
+            threading.get_native_id(),
+            os.getpriority(os.PRIO_PROCESS, threading.get_native_id())
+            + WARMUP_NICE_INCREMENT,
+        )
+
+
+def run_warmup() -> WarmupStatus:
+    """Import every heavy ML module now, recording per-component readiness.
+
+    Synchronous — ``start_background_warmup`` wraps this on a thread, tests
+    call it directly. Never raises: a missing backend marks the component
+    ``"unavailable"`` and the owning code path raises its usual error when
+    actually used.
+    """
+    started = time.perf_counter()
+    with _tracker_lock:
+        _tracker.state = "running"
+        for name, _ in _COMPONENTS:
+            _tracker.components.setdefault(name, "pending")
+
+    for name, warm in _COMPONENTS:
+        try:
+            warm()
+        except Exception as exc:  # ImportError, SentimentBackendError, ...
+            logger.info("ML warm-up: %s unavailable (%s)", name, exc)
+            _set_component(name, "unavailable")
+            continue
+        _set_component(name, "ready")
+
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    with _tracker_lock:
+        _tracker.state = "done"
+        _tracker.elapsed_ms = elapsed_ms
+    logger.info("ML warm-up finished in %.0f ms: %s", elapsed_ms, _tracker.components)
+    return warmup_status()
+
+
+def _warmup_main() -> None:
+    _serving.wait(timeout=HEALTH_WAIT_TIMEOUT_SECONDS)
+    _lower_thread_priority()
+    run_warmup()
+
+
+def start_background_warmup() -> bool:
+    """Spawn the warm-up daemon thread. Returns False if already started."""
+    global _thread
+    with _tracker_lock:
+        if _thread is not None:
+            return False
+        _tracker.state = "pending"
+        for name, _ in _COMPONENTS:
+            _tracker.components[name] = "pending"
+        _thread = threading.Thread(
+            target=_warmup_main, name="ml-warmup", daemon=True
+        )
+    _thread.start()
+    return True
+
+
+def notify_serving() -> None:
+    """Signal that the HTTP server is answering. Called by the health probe."""
+    _serving.set()
+
+
+def warmup_status() -> WarmupStatus:
+    with _tracker_lock:
+        return WarmupStatus(
+            state=_tracker.state,
+            components=dict(_tracker.components),
+            elapsed_ms=_tracker.elapsed_ms,
+        )
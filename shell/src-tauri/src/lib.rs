@@ -113,6 +113,7 @@ fn spawn_sidecar(app: &AppHandle, port: u16, token: &str) -> std::io::Result<Chi
         Command::new(&frozen)
             .env("FINTRACK_PORT", port.to_string())
             .env("FINTRACK_AUTH_TOKEN", token)
+            .env("FINTRACK_ENABLE_ML_WARMUP", "true")
             .stdout(out)
             .stderr(err)
             .spawn()
@@ -127,6 +128,7 @@ fn spawn_sidecar(app: &AppHandle, port: u16, token: &str) -> std::io::Result<Chi
             .current_dir(&root)
             .env("FINTRACK_PORT", port.to_string())
             .env("FINTRACK_AUTH_TOKEN", token)
+            .env("FINTRACK_ENABLE_ML_WARMUP", "true")
             .stdout(out)
             .stderr(err)
             .spawn()
@@ -98,6 +98,23 @@ async function apiGet<T>(
   return (await res.json()) as T;
 }
 
+/** GET a binary body (e.g. `format=binary` series) as an ArrayBuffer. */
+async function apiGetBuffer(
+  path: string,
+  opts: { params?: Record<string, QueryValue>; signal?: AbortSignal } = {},
+): Promise<ArrayBuffer> {
+  const base = await getBaseUrl();
+  const url = `${base}${path}${buildQuery(opts.params)}`;
+  const res = await fetch(url, {
+    signal: opts.signal,
+    headers: await authHeaders(),
+  });
+  if (!res.ok) {
+    throw new ApiError(res.status, url, `GET ${path} → HTTP ${res.status}`);
+  }
+  return res.arrayBuffer();
+}
+
 async function apiPut<T, B>(
   path: string,
   body: B,
@@ -177,9 +194,17 @@ async function _detail(
 
 // ---------- Health ----------
 
+export type WarmupComponentState = "pending" | "ready" | "unavailable";
+
 export interface HealthResponse {
   status: string;
   version: string;
+  /** Background ML import warm-up — `state` is "disabled" unless opted in. */
+  warmup: {
+    state: "disabled" | "pending" | "running" | "done";
+    components: Record<string, WarmupComponentState>;
+    elapsed_ms: number | null;
+  };
 }
 
 export function getHealth(signal?: AbortSignal): Promise<HealthResponse> {
@@ -291,6 +316,173 @@ export function createAsset(
   );
 }
 
+/** Bars inserted since a delta-sync mark, keyed by symbol. */
+export interface PriceChanges {
+  /** Mark to pass as `sinceVersion` on the next poll. */
+  version: number;
+  since_version: number | null;
+  interval: string;
+  /** Only symbols with new bars appear; bars ascending. */
+  changes: Record<string, PricePoint[]>;
+  /** Symbols to reload in full (too many new bars, or an unknown mark). */
+  resync: string[];
+}
+
+/**
+ * Delta sync. Without `sinceVersion` this only reads the current mark — do
+ * that *before* a full load, then poll from it and merge the returned bars
+ * with `mergePriceSeries`.
+ */
+export function getPriceChanges(
+  opts: {
+    sinceVersion?: number;
+    symbols?: string[];
+    interval?: string;
+    limit?: number;
+    signal?: AbortSignal;
+  } = {},
+): Promise<PriceChanges> {
+  return apiGet<PriceChanges>("/api/prices/changes/", {
+    params: {
+      since_version: opts.sinceVersion,
+      symbols: opts.symbols?.join(","),
+      interval: opts.interval,
+      limit: opts.limit,
+    },
+    signal: opts.signal,
+  });
+}
+
+/**
+ * `series` with `bars` merged in by timestamp (a bar already present is
+ * replaced), keeping the newest `maxBars`.
+ */
+export function mergePriceSeries(
+  series: PriceSeries,
+  bars: PricePoint[],
+  maxBars: number,
+): PriceSeries {
+  if (bars.length === 0) return series;
+  const byTs = new Map(series.points.map((p) => [p.timestamp, p]));
+  for (const bar of bars) byTs.set(bar.timestamp, bar);
+  const points = [...byTs.values()]
+    .sort((x, y) => parseUtcMs(x.timestamp) - parseUtcMs(y.timestamp))
+    .slice(-maxBars);
+  return { ...series, count: points.length, points };
+}
+
+/** One line of the `/api/prices/export/` NDJSON stream. */
+export interface ExportedBar extends PricePoint {
+  symbol: string;
+}
+
+/**
+ * Stream full price history (every bar, no `limit`) for `symbols` — all
+ * assets when omitted — calling `onBatch` as NDJSON lines arrive, so a
+ * multi-year export never sits in memory as one string. Resolves with the
+ * number of bars read.
+ */
+export async function streamPriceHistory(
+  onBatch: (bars: ExportedBar[]) => void,
+  opts: {
+    symbols?: string[];
+    interval?: string;
+    from?: string;
+    to?: string;
+    signal?: AbortSignal;
+  } = {},
+): Promise<number> {
+  const base = await getBaseUrl();
+  const url = `${base}/api/prices/export/${buildQuery({
+    symbols: opts.symbols?.join(","),
+    interval: opts.interval,
+    from: opts.from,
+    to: opts.to,
+  })}`;
+  const res = await fetch(url, {
+    signal: opts.signal,
+    headers: await authHeaders(),
+  });
+  if (!res.ok || !res.body) {
+    throw new ApiError(res.status, url, `GET ${url} → HTTP ${res.status}`);
+  }
+  const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+  let pending = "";
+  let total = 0;
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (value) pending += value;
+    const cut = done ? pending.length : pending.lastIndexOf("\n") + 1;
+    if (cut > 0) {
+      const bars = pending
+        .slice(0, cut)
+        .split("\n")
+        .filter((line) => line.length > 0)
+        .map((line) => JSON.parse(line) as ExportedBar);
+      pending = pending.slice(cut);
+      total += bars.length;
+      if (bars.length) onBatch(bars);
+    }
+    if (done) return total;
+  }
+}
+
+/** Full price history as a CSV download (see `streamPriceHistory`). */
+export async function exportPricesCsv(
+  opts: { symbols?: string[]; interval?: string; signal?: AbortSignal } = {},
+): Promise<{ blob: Blob; filename: string }> {
+  const base = await getBaseUrl();
+  const url = `${base}/api/prices/export/${buildQuery({
+    symbols: opts.symbols?.join(","),
+    interval: opts.interval,
+    format: "csv",
+  })}`;
+  const res = await fetch(url, { signal: opts.signal, headers: await authHeaders() });
+  if (!res.ok) {
+    throw new ApiError(res.status, url, `GET ${url} → HTTP ${res.status}`);
+  }
+  const blob = await res.blob();
+  const cd = res.headers.get("content-disposition") ?? "";
+  const match = cd.match(/filename="([^"]+)"/);
+  const filename =
+    match?.[1] ??
+    `fintrack-prices-${new Date().toISOString().slice(0, 10).replace(/-/g, "")}.csv`;
+  return { blob, filename };
+}
+
+// ---------- Columnar series ----------
+
+/** Undo the server's delta encoding of a columnar `t` array. */
+function undelta(t: number[]): number[] {
+  let acc = 0;
+  return t.map((d) => (acc += d));
+}
+
+/**
+ * Decode a `format=binary` series: a 16-byte header (`FTCB`, version,
+ * column count, row count) followed by one little-endian float64 array per
+ * column. The arrays are views on `buf` — no copying or parsing.
+ */
+export function decodeColumns(buf: ArrayBuffer): Float64Array[] {
+  const view = new DataView(buf);
+  const magic = String.fromCharCode(
+    view.getUint8(0),
+    view.getUint8(1),
+    view.getUint8(2),
+    view.getUint8(3),
+  );
+  if (magic !== "FTCB" || view.getUint16(4, true) !== 1) {
+    throw new Error("unrecognised binary series payload");
+  }
+  const ncols = view.getUint16(6, true);
+  const count = view.getUint32(8, true);
+  const cols: Float64Array[] = [];
+  for (let i = 0; i < ncols; i++) {
+    cols.push(new Float64Array(buf, 16 + i * count * 8, count));
+  }
+  return cols;
+}
+
 // ---------- Prices ----------
 
 export interface PricePoint {
@@ -306,8 +498,13 @@ export interface PriceSeries {
   symbol: string;
   count: number;
   points: PricePoint[];
+  /** Cursor for the next `afterTs` page; null on the last page. */
+  next_after_ts: string | null;
 }
 
+/** How `maxPoints` reduces price bars: candle merge or LTTB on closes. */
+export type Downsample = "ohlc" | "lttb";
+
 export function getPriceSeries(
   symbol: string,
   opts: {
@@ -316,6 +513,17 @@ export function getPriceSeries(
     limit?: number;
     /** Bar resolution: "5m" (intraday, default) or "1d" (daily closes). */
     interval?: string;
+    /**
+     * Server-side downsampling of the selected bars to at most this many
+     * (>= 3): merged candles, or LTTB-picked bars with `downsample: "lttb"`.
+     */
+    maxPoints?: number;
+    downsample?: Downsample;
+    /**
+     * Keyset paging: the oldest `limit` bars strictly after this timestamp.
+     * Pass the previous page's `next_after_ts` until it comes back null.
+     */
+    afterTs?: string;
     signal?: AbortSignal;
   } = {},
 ): Promise<PriceSeries> {
@@ -325,6 +533,9 @@ export function getPriceSeries(
       to: opts.to,
       limit: opts.limit,
       interval: opts.interval,
+      max_points: opts.maxPoints,
+      downsample: opts.downsample,
+      after_ts: opts.afterTs,
     },
     signal: opts.signal,
   });
@@ -371,6 +582,165 @@ export function getQuote(symbol: string, signal?: AbortSignal): Promise<Quote> {
   return apiGet<Quote>(`/api/quotes/${encodeURIComponent(symbol)}/`, { signal });
 }
 
+/** Ranking windows: "1d" is the quote's day change; "5d" / "1m" count
+ *  sessions (5 / 21 daily bars back); "24h" is rolling from now. */
+export type MoverWindow = "1d" | "5d" | "1m" | "24h";
+
+export interface Mover {
+  asset_id: number;
+  symbol: string;
+  name: string;
+  asset_type: AssetType;
+  last_price: string;
+  last_at: string | null; // ISO 8601 — treat as UTC
+  /** Price at the start of the window. */
+  base_price: string;
+  change: string;
+  change_pct: number;
+}
+
+export interface Movers {
+  window: MoverWindow;
+  computed_at: string;
+  /** Assets considered / assets with a return for the window. */
+  universe: number;
+  ranked: number;
+  by_type: Record<string, number>;
+  /** Best first; only positive changes. */
+  gainers: Mover[];
+  /** Worst first; only negative changes. */
+  losers: Mover[];
+}
+
+/** Server-ranked top-k gainers and losers; cached until the next ingest. */
+export function getMovers(
+  opts: { k?: number; window?: MoverWindow; signal?: AbortSignal } = {},
+): Promise<Movers> {
+  return apiGet<Movers>("/api/quotes/movers/", {
+    params: { k: opts.k, window: opts.window },
+    signal: opts.signal,
+  });
+}
+
+// ---------- Dashboard ----------
+
+/** Packed sparkline: parallel arrays, oldest first. */
+export interface SparklineData {
+  interval: string;
+  /** Bar open times, epoch seconds (UTC). */
+  t: number[];
+  close: number[];
+}
+
+export interface DashboardItem {
+  asset_id: number;
+  is_active: boolean;
+  quote: Quote;
+  sparkline: SparklineData;
+}
+
+export interface DashboardData {
+  /** Null when no default watchlist exists and all active assets are shown. */
+  watchlist_id: number | null;
+  watchlist_name: string | null;
+  count: number;
+  items: DashboardItem[];
+}
+
+/** Every card on the Dashboard — quotes + sparklines — in one request. */
+export function getDashboard(
+  opts: {
+    watchlistId?: number;
+    /** Sparkline length in bars (default 60). */
+    points?: number;
+    interval?: string;
+    signal?: AbortSignal;
+  } = {},
+): Promise<DashboardData> {
+  return apiGet<DashboardData>("/api/dashboard/", {
+    params: {
+      watchlist_id: opts.watchlistId,
+      points: opts.points,
+      interval: opts.interval,
+    },
+    signal: opts.signal,
+  });
+}
+
+/** Price bars as parallel arrays, oldest first; `t` in epoch seconds. */
+export interface PriceColumns {
+  symbol: string;
+  count: number;
+  t: number[];
+  open: number[];
+  high: number[];
+  low: number[];
+  close: number[];
+  volume: number[];
+  /** Keyset cursor (epoch seconds) when paging with `afterTs`. */
+  next_after_ts: number | null;
+}
+
+type PriceSeriesOpts = {
+  from?: string;
+  to?: string;
+  limit?: number;
+  interval?: string;
+  maxPoints?: number;
+  downsample?: Downsample;
+  /** ISO timestamp or epoch seconds (a columnar `next_after_ts`). */
+  afterTs?: string | number;
+  signal?: AbortSignal;
+};
+
+/** `getPriceSeries` in the columnar wire format (~3x smaller, numbers). */
+export async function getPriceColumns(
+  symbol: string,
+  opts: PriceSeriesOpts = {},
+): Promise<PriceColumns> {
+  const raw = await apiGet<PriceColumns>(
+    `/api/prices/${encodeURIComponent(symbol)}/`,
+    {
+      params: {
+        from: opts.from,
+        to: opts.to,
+        limit: opts.limit,
+        interval: opts.interval,
+        max_points: opts.maxPoints,
+        downsample: opts.downsample,
+        after_ts: opts.afterTs,
+        format: "columnar",
+      },
+      signal: opts.signal,
+    },
+  );
+  return { ...raw, t: undelta(raw.t) };
+}
+
+/**
+ * `getPriceSeries` as float64 typed arrays, in `PRICE_COLUMNS` order:
+ * t, open, high, low, close, volume.
+ */
+export async function getPriceColumnsBinary(
+  symbol: string,
+  opts: PriceSeriesOpts = {},
+): Promise<Float64Array[]> {
+  const buf = await apiGetBuffer(`/api/prices/${encodeURIComponent(symbol)}/`, {
+    params: {
+      from: opts.from,
+      to: opts.to,
+      limit: opts.limit,
+      interval: opts.interval,
+      max_points: opts.maxPoints,
+      downsample: opts.downsample,
+      after_ts: opts.afterTs,
+      format: "binary",
+    },
+    signal: opts.signal,
+  });
+  return decodeColumns(buf);
+}
+
 // ---------- Macro ----------
 
 export interface MacroIndicator {
@@ -409,6 +779,8 @@ export function getMacroSeries(
     from?: string;
     to?: string;
     limit?: number;
+    /** Server-side LTTB downsampling to at most this many points (>= 3). */
+    maxPoints?: number;
     signal?: AbortSignal;
   } = {},
 ): Promise<MacroSeries> {
@@ -417,11 +789,46 @@ export function getMacroSeries(
       from: opts.from,
       to: opts.to,
       limit: opts.limit,
+      max_points: opts.maxPoints,
     },
     signal: opts.signal,
   });
 }
 
+/** Macro observations as parallel arrays; `t` is the date at 00:00 UTC. */
+export interface MacroColumns {
+  series_id: string;
+  count: number;
+  t: number[];
+  value: number[];
+}
+
+export async function getMacroColumns(
+  seriesId: string,
+  opts: {
+    from?: string;
+    to?: string;
+    limit?: number;
+    maxPoints?: number;
+    signal?: AbortSignal;
+  } = {},
+): Promise<MacroColumns> {
+  const raw = await apiGet<MacroColumns>(
+    `/api/macro/${encodeURIComponent(seriesId)}/`,
+    {
+      params: {
+        from: opts.from,
+        to: opts.to,
+        limit: opts.limit,
+        max_points: opts.maxPoints,
+        format: "columnar",
+      },
+      signal: opts.signal,
+    },
+  );
+  return { ...raw, t: undelta(raw.t) };
+}
+
 // ---------- News ----------
 
 export type SentimentBucket = "positive" | "neutral" | "negative";
@@ -693,7 +1100,16 @@ export function reorderWatchlistItems(
 // ---------- Price Alerts ----------
 
 export type AlertDirection = "above" | "below";
-export type AlertMetric = "price" | "sentiment";
+/** ``pct_change`` / ``volatility`` / ``volume_spike`` read the last
+ *  ``window_days`` daily bars: percent change of the close (signed %),
+ *  annualized realized volatility (%), and latest volume as a multiple of
+ *  the median volume. */
+export type AlertMetric =
+  | "price"
+  | "sentiment"
+  | "pct_change"
+  | "volatility"
+  | "volume_spike";
 
 export interface PriceAlert {
   id: number;
@@ -714,6 +1130,10 @@ export interface PriceAlert {
   created_at: string;
   last_price: string | null; // Decimal-as-string, null if no bars yet
   last_price_at: string | null;
+  /** Price alerts: the bar that crossed and its high ("above") or low
+   *  ("below"). Null until the alert fires. */
+  trigger_bar_at: string | null;
+  trigger_price: string | null; // Decimal-as-string
   /** The metric's most recent observed value (latest close for price
    *  alerts, rolling-mean sentiment for sentiment alerts). */
   current_value: string | null;
@@ -771,6 +1191,49 @@ export function createAlert(
   return apiPost<PriceAlert, CreateAlertBody>("/api/alerts/", body, { signal });
 }
 
+export interface ReplayAlertBody {
+  asset_id: number;
+  threshold: string | number;
+  direction: AlertDirection;
+  metric?: AlertMetric;
+  window_days?: number | null;
+  /** History to replay, in days (default 60, max 365). */
+  days?: number;
+  /** Price rules only: bar series to replay (default "5m"). */
+  interval?: string | null;
+}
+
+export interface AlertReplay {
+  asset_id: number;
+  symbol: string;
+  metric: AlertMetric;
+  direction: AlertDirection;
+  threshold: string;
+  window_days: number | null;
+  interval: string;
+  days: number;
+  /** Bars (or days, for sentiment) in range with a defined metric value. */
+  observations: number;
+  first_at: string | null;
+  last_at: string | null;
+  /** Every fresh crossing in range — "notifications you would have had". */
+  fire_count: number;
+  /** True when `fires` lists only the first of `fire_count` crossings. */
+  truncated: boolean;
+  fires: { at: string; value: string }[];
+}
+
+/** Backtest a rule against stored history before arming it. 503 when the
+ *  sidecar was built without the ML extras. */
+export function replayAlert(
+  body: ReplayAlertBody,
+  signal?: AbortSignal,
+): Promise<AlertReplay> {
+  return apiPost<AlertReplay, ReplayAlertBody>("/api/alerts/replay/", body, {
+    signal,
+  });
+}
+
 export interface UpdateAlertBody {
   threshold?: string | number;
   direction?: AlertDirection;
@@ -804,6 +1267,111 @@ export function markAlertNotified(
   );
 }
 
+// ---------- Push stream ----------
+
+/**
+ * Server-push events from ``GET /api/stream/`` (Server-Sent Events).
+ *
+ *   - ``alert``: an alert fired — ``data`` is a ``PriceAlert``.
+ *   - ``quote``: new bars landed — ``data`` is a ``Quote``.
+ *   - ``job``: a scheduler job finished.
+ *   - ``ready``: connected (after replaying anything missed on reconnect).
+ *   - ``reset``: the sidecar could not replay what was missed (it restarted,
+ *     or we were away too long) — re-read state over REST.
+ */
+export type StreamEvent =
+  | { event: "alert"; data: PriceAlert }
+  | { event: "quote"; data: Quote }
+  | {
+      event: "job";
+      data: {
+        job_id: string;
+        finished_at: string;
+        ok: boolean;
+        error: string | null;
+      };
+    }
+  | { event: "ready"; data: { resumed: boolean; replayed: number } }
+  | { event: "reset"; data: { reason: string } };
+
+type StreamListener = (evt: StreamEvent) => void;
+
+const STREAM_RECONNECT_MS = 3_000;
+const streamListeners = new Set<StreamListener>();
+let streamController: AbortController | null = null;
+
+/**
+ * One shared stream connection for the whole shell, opened on the first
+ * ``onStreamEvent`` and closed when the last listener unsubscribes.
+ *
+ * Uses ``fetch`` streaming rather than ``EventSource`` because the sidecar
+ * requires the ``X-FinTrack-Token`` header, which ``EventSource`` cannot
+ * send. Reconnects after ``STREAM_RECONNECT_MS`` with ``Last-Event-ID`` so
+ * the sidecar replays whatever was missed.
+ */
+async function runStream(signal: AbortSignal): Promise<void> {
+  let lastEventId: string | null = null;
+  while (!signal.aborted) {
+    try {
+      const base = await getBaseUrl();
+      const headers = await authHeaders(
+        lastEventId ? { "Last-Event-ID": lastEventId } : undefined,
+      );
+      const res = await fetch(`${base}/api/stream/`, { signal, headers });
+      if (!res.ok || !res.body) {
+        throw new ApiError(res.status, res.url, `stream → HTTP ${res.status}`);
+      }
+      const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+      let buffer = "";
+      for (;;) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += value;
+        let sep: number;
+        while ((sep = buffer.indexOf("\n\n")) >= 0) {
+          const frame = buffer.slice(0, sep);
+          buffer = buffer.slice(sep + 2);
+          let event = "message";
+          let data = "";
+          for (const line of frame.split("\n")) {
+            if (line.startsWith("id: ")) lastEventId = line.slice(4);
+            else if (line.startsWith("event: ")) event = line.slice(7);
+            else if (line.startsWith("data: ")) data += line.slice(6);
+          }
+          if (!data) continue; // retry hint / keepalive comment
+          const parsed = { event, data: JSON.parse(data) } as StreamEvent;
+          for (const listener of streamListeners) {
+            try {
+              listener(parsed);
+            } catch (err) {
+              console.warn("[stream] listener failed:", err);
+            }
+          }
+        }
+      }
+    } catch (err) {
+      if (signal.aborted) return;
+      console.warn("[stream] connection dropped:", err);
+    }
+    await new Promise((resolve) => setTimeout(resolve, STREAM_RECONNECT_MS));
+  }
+}
+
+export function onStreamEvent(listener: StreamListener): () => void {
+  streamListeners.add(listener);
+  if (!streamController) {
+    streamController = new AbortController();
+    void runStream(streamController.signal);
+  }
+  return () => {
+    streamListeners.delete(listener);
+    if (streamListeners.size === 0 && streamController) {
+      streamController.abort();
+      streamController = null;
+    }
+  };
+}
+
 // ---------- Portfolio ----------
 
 export type TransactionType = "buy" | "sell";
@@ -930,10 +1498,13 @@ export interface PortfolioPerformance {
 }
 
 export function getPortfolioPerformance(
-  opts: { lookbackDays?: number; signal?: AbortSignal } = {},
+  opts: { lookbackDays?: number; maxPoints?: number; signal?: AbortSignal } = {},
 ): Promise<PortfolioPerformance> {
   return apiGet<PortfolioPerformance>("/api/portfolio/performance/", {
-    params: { lookback_days: opts.lookbackDays ?? 90 },
+    params: {
+      lookback_days: opts.lookbackDays ?? 90,
+      max_points: opts.maxPoints,
+    },
     signal: opts.signal,
   });
 }
@@ -992,7 +1563,13 @@ export async function exportPortfolioTransactionsCsv(
 
 /** Server-supported engines. Stays as a literal union here so the UI can
  *  present a typed selector without doing its own validation. */
-export type ForecastEngine = "sarimax" | "holt_winters";
+export type ForecastEngine =
+  | "sarimax"
+  | "holt_winters"
+  | "drift"
+  | "ewma"
+  | "damped_trend"
+  | "theta";
 
 export interface ForecastPoint {
   forecast_date: string; // YYYY-MM-DD
@@ -1105,6 +1682,61 @@ export function getForecastAccuracy(
   );
 }
 
+export interface EngineBacktestEntry {
+  engine: string;
+  origins: number;
+  evaluable_points: number;
+  /** Origins where the engine failed to fit (statsmodels non-convergence). */
+  failures: number;
+  mape: number | null;
+  rmse: number | null;
+  directional: number | null;
+  /** Summed fit wall time across every origin, seconds. */
+  fit_seconds: number;
+}
+
+export interface ForecastBacktestReport {
+  symbol: string;
+  horizon_days: number;
+  step_days: number;
+  origins: number;
+  training_rows: number;
+  /** Sorted by MAPE ascending — best engine first. */
+  per_engine: EngineBacktestEntry[];
+  naive: EngineBacktestEntry | null;
+  fingerprint: string;
+  elapsed_seconds: number;
+  /** True when served from the sidecar's per-fingerprint cache. */
+  cached: boolean;
+}
+
+/** Rolling-origin backtest — replays each engine over the stored history
+ *  instead of waiting for live forecast horizons to elapse. Synchronous;
+ *  the statsmodels engines can take a few seconds on long histories. */
+export function getForecastBacktest(
+  symbol: string,
+  opts: {
+    engines?: ForecastEngine[];
+    horizonDays?: number;
+    stepDays?: number;
+    maxOrigins?: number;
+    signal?: AbortSignal;
+  } = {},
+): Promise<ForecastBacktestReport> {
+  return apiGet<ForecastBacktestReport>(
+    `/api/forecast/${encodeURIComponent(symbol)}/backtest/`,
+    {
+      params: {
+        engines: opts.engines?.join(","),
+        horizon_days: opts.horizonDays,
+        step_days: opts.stepDays,
+        max_origins: opts.maxOrigins,
+      },
+      signal: opts.signal,
+    },
+  );
+}
+
 export interface VolatilityReport {
   symbol: string;
   lookback_days: number;
@@ -1142,6 +1774,64 @@ export function getVolatility(
   );
 }
 
+// ---------- Asset bundle ----------
+
+export type AssetBundleSection =
+  | "quote"
+  | "prices"
+  | "daily"
+  | "forecast"
+  | "accuracy"
+  | "volatility"
+  | "sentiment"
+  | "sentiment_timeseries"
+  | "news";
+
+/** Everything AssetDetail renders, read in one server-side snapshot. Each
+ *  section has its standalone endpoint's shape; sections not requested are
+ *  absent, and `forecast` is null when none has been trained. */
+export interface AssetBundle {
+  asset: Asset;
+  include: AssetBundleSection[];
+  quote?: Quote;
+  prices?: PriceSeries;
+  daily?: PriceSeries;
+  forecast?: Forecast | null;
+  accuracy?: ForecastAccuracyReport;
+  volatility?: VolatilityReport;
+  sentiment?: SentimentSummary;
+  sentiment_timeseries?: SentimentTimeseries;
+  news?: ArticleList;
+}
+
+/** One round-trip for the asset page. `limit` caps both bar series; `days`
+ *  is the accuracy / volatility / sentiment-summary window. */
+export function getAssetBundle(
+  symbol: string,
+  opts: {
+    include?: AssetBundleSection[];
+    limit?: number;
+    days?: number;
+    timeseriesDays?: number;
+    newsLimit?: number;
+    signal?: AbortSignal;
+  } = {},
+): Promise<AssetBundle> {
+  return apiGet<AssetBundle>(
+    `/api/assets/${encodeURIComponent(symbol)}/bundle/`,
+    {
+      params: {
+        include: opts.include?.join(","),
+        limit: opts.limit,
+        days: opts.days,
+        timeseries_days: opts.timeseriesDays,
+        news_limit: opts.newsLimit,
+      },
+      signal: opts.signal,
+    },
+  );
+}
+
 // ---------- Analytics ----------
 
 export interface CorrelationCell {
@@ -1191,6 +1881,37 @@ export function getDefaultWatchlistCorrelations(
   );
 }
 
+/** Closes of several symbols on one daily axis, rebased to `base` at the
+ *  first date. `values[sym][i]` is null before `sym`'s first bar. */
+export interface Comparison {
+  symbols: string[];
+  /** Requested symbols that are unknown or have no daily bars. */
+  missing: string[];
+  base: number;
+  count: number;
+  /** Epoch seconds, ascending (delta-decoded). */
+  t: number[];
+  values: Record<string, (number | null)[]>;
+  first_close: Record<string, number>;
+  last_close: Record<string, number>;
+}
+
+export async function getComparison(
+  symbols: string[],
+  opts: {
+    /** ISO date; omit for the full history. */
+    from?: string;
+    base?: number;
+    signal?: AbortSignal;
+  } = {},
+): Promise<Comparison> {
+  const raw = await apiGet<Comparison>("/api/analytics/compare/", {
+    params: { symbols: symbols.join(","), from: opts.from, base: opts.base },
+    signal: opts.signal,
+  });
+  return { ...raw, t: undelta(raw.t) };
+}
+
 export function retrainAllForecasts(
   opts: { engine?: ForecastEngine | null; signal?: AbortSignal } = {},
 ): Promise<RetrainAllResult> {
@@ -26,11 +26,95 @@ interface AlertCreateModalProps {
   onCreated: (alert: PriceAlert) => void;
 }
 
-const SENTIMENT_WINDOW_OPTIONS: { value: number; label: string }[] = [
-  { value: 1, label: "1 day" },
-  { value: 7, label: "7 days" },
-  { value: 30, label: "30 days" },
-];
+interface WindowOption {
+  value: number;
+  label: string;
+}
+
+interface MetricSpec {
+  label: string;
+  help: string;
+  thresholdLabel: string;
+  placeholder: string;
+  /** Default threshold / direction / window when the metric is picked. */
+  threshold: string;
+  direction: AlertDirection;
+  windows: WindowOption[];
+  /** Inclusive lower bound on the threshold (exclusive when ``strict``). */
+  min: number | null;
+  max: number | null;
+  strict: boolean;
+}
+
+const bars = (ns: number[]): WindowOption[] =>
+  ns.map((n) => ({ value: n, label: `${n} bar${n === 1 ? "" : "s"}` }));
+
+const METRICS: Record<AlertMetric, MetricSpec> = {
+  price: {
+    label: "Price",
+    help: "Fires when the latest close crosses your threshold.",
+    thresholdLabel: "Threshold price",
+    placeholder: "e.g. 150.00",
+    threshold: "",
+    direction: "above",
+    windows: [],
+    min: 0,
+    max: null,
+    strict: true,
+  },
+  sentiment: {
+    label: "Sentiment",
+    help: "Fires when the rolling-mean compound sentiment crosses your threshold.",
+    thresholdLabel: "Threshold (compound)",
+    placeholder: "e.g. -0.30",
+    threshold: "-0.3",
+    direction: "below",
+    windows: [
+      { value: 1, label: "1 day" },
+      { value: 7, label: "7 days" },
+      { value: 30, label: "30 days" },
+    ],
+    min: -1,
+    max: 1,
+    strict: false,
+  },
+  pct_change: {
+    label: "% change",
+    help: "Fires when the close has moved this many percent over the window of daily bars.",
+    thresholdLabel: "Threshold (%)",
+    placeholder: "e.g. -5",
+    threshold: "-5",
+    direction: "below",
+    windows: bars([1, 5, 20]),
+    min: null,
+    max: null,
+    strict: false,
+  },
+  volatility: {
+    label: "Volatility",
+    help: "Fires when annualized realized volatility over the window crosses your threshold.",
+    thresholdLabel: "Threshold (% annualized)",
+    placeholder: "e.g. 40",
+    threshold: "40",
+    direction: "above",
+    windows: bars([10, 20, 60]),
+    min: 0,
+    max: null,
+    strict: true,
+  },
+  volume_spike: {
+    label: "Volume spike",
+    help: "Fires when the latest daily volume is this many times the window's median volume.",
+    thresholdLabel: "Threshold (x median)",
+    placeholder: "e.g. 3",
+    threshold: "3",
+    direction: "above",
+    windows: bars([10, 20, 50]),
+    min: 0,
+    max: null,
+    strict: true,
+  },
+};
 
 export function AlertCreateModal({
   assetId,
@@ -46,22 +130,21 @@ export function AlertCreateModal({
   );
   const [direction, setDirection] = useState<AlertDirection>("above");
   const [windowDays, setWindowDays] = useState<number>(7);
+  const spec = METRICS[metric];
   const [note, setNote] = useState<string>("");
   const [submitting, setSubmitting] = useState(false);
   const [error, setError] = useState<string | null>(null);
 
   const onMetricChange = (m: AlertMetric) => {
     setMetric(m);
-    // Swap the threshold to a sensible default for the new metric so the
-    // user doesn't have to clear the prefilled price when picking
-    // sentiment (and vice-versa).
-    if (m === "sentiment") {
-      setThreshold("-0.3");
-      setDirection("below");
-    } else {
-      setThreshold(lastPrice !== null ? lastPrice.toFixed(2) : "");
-      setDirection("above");
-    }
+    // Swap the threshold / direction / window to sensible defaults for the
+    // new metric so the user doesn't have to clear the prefilled price.
+    const next = METRICS[m];
+    setThreshold(
+      m === "price" ? (lastPrice !== null ? lastPrice.toFixed(2) : "") : next.threshold,
+    );
+    setDirection(next.direction);
+    if (next.windows.length > 0) setWindowDays(next.windows[1].value);
   };
 
   useEffect(() => {
@@ -77,9 +160,10 @@ export function AlertCreateModal({
     if (threshold.trim() === "") return false;
     const n = Number(threshold);
     if (!Number.isFinite(n)) return false;
-    if (metric === "price") return n > 0;
-    // sentiment: threshold must lie in [-1, +1]
-    return n >= -1 && n <= 1;
+    if (spec.min !== null && (spec.strict ? n <= spec.min : n < spec.min)) {
+      return false;
+    }
+    return spec.max === null || n <= spec.max;
   })();
 
   const submit = () => {
@@ -92,7 +176,7 @@ export function AlertCreateModal({
       threshold: threshold.trim(),
       direction,
       metric,
-      window_days: metric === "sentiment" ? windowDays : null,
+      window_days: spec.windows.length > 0 ? windowDays : null,
       note: trimmedNote === "" ? null : trimmedNote,
     })
       .then((a) => {
@@ -148,27 +232,25 @@ export function AlertCreateModal({
             >
               Metric
             </label>
-            <div className="mt-1.5 grid grid-cols-2 gap-2">
-              {(["price", "sentiment"] as const).map((m) => (
+            <div className="mt-1.5 grid grid-cols-3 gap-2">
+              {(Object.keys(METRICS) as AlertMetric[]).map((m) => (
                 <button
                   key={m}
                   type="button"
                   onClick={() => onMetricChange(m)}
                   className={[
-                    "rounded-md border px-3 py-2 text-sm font-medium capitalize transition-colors",
+                    "rounded-md border px-3 py-2 text-sm font-medium transition-colors",
                     metric === m
                       ? "border-emerald-500 bg-emerald-500/10 text-emerald-700 dark:border-emerald-500 dark:text-emerald-300"
                       : "border-zinc-200 bg-white text-zinc-700 hover:bg-zinc-50 dark:border-zinc-700 dark:bg-zinc-900 dark:text-zinc-300 dark:hover:bg-zinc-800",
                   ].join(" ")}
                 >
-                  {m}
+                  {METRICS[m].label}
                 </button>
               ))}
             </div>
             <p className="mt-1.5 text-[11px] text-zinc-500 dark:text-zinc-400">
-              {metric === "price"
-                ? "Fires when the latest close crosses your threshold."
-                : "Fires when the rolling-mean compound sentiment crosses your threshold."}
+              {spec.help}
             </p>
           </div>
 
@@ -198,7 +280,7 @@ export function AlertCreateModal({
             </div>
           </div>
 
-          {metric === "sentiment" && (
+          {spec.windows.length > 0 && (
             <div>
               <label
                 htmlFor="alert-window"
@@ -207,7 +289,7 @@ export function AlertCreateModal({
                 Rolling window
               </label>
               <div className="mt-1.5 grid grid-cols-3 gap-2">
-                {SENTIMENT_WINDOW_OPTIONS.map((opt) => (
+                {spec.windows.map((opt) => (
                   <button
                     key={opt.value}
                     type="button"
@@ -231,19 +313,19 @@ export function AlertCreateModal({
               htmlFor="alert-threshold"
               className="block text-[11px] font-medium uppercase tracking-wide text-zinc-500 dark:text-zinc-400"
             >
-              {metric === "price" ? "Threshold price" : "Threshold (compound)"}
+              {spec.thresholdLabel}
             </label>
             <input
               id="alert-threshold"
               type="number"
               inputMode="decimal"
               step="any"
-              min={metric === "price" ? "0" : "-1"}
-              max={metric === "sentiment" ? "1" : undefined}
+              min={spec.min !== null ? String(spec.min) : undefined}
+              max={spec.max !== null ? String(spec.max) : undefined}
               value={threshold}
               onChange={(e) => setThreshold(e.target.value)}
               className="mt-1.5 block w-full rounded-md border border-zinc-200 bg-white px-3 py-2 font-mono text-sm tabular-nums text-zinc-900 focus:border-emerald-500 focus:outline-none focus:ring-1 focus:ring-emerald-500 dark:border-zinc-700 dark:bg-zinc-900 dark:text-zinc-100"
-              placeholder={metric === "price" ? "e.g. 150.00" : "e.g. -0.30"}
+              placeholder={spec.placeholder}
             />
             {metric === "price" ? (
               lastPrice !== null && (
@@ -252,10 +334,12 @@ export function AlertCreateModal({
                 </p>
               )
             ) : (
-              <p className="mt-1 text-[11px] text-zinc-400 dark:text-zinc-500">
-                Range: -1 (very negative) to +1 (very positive). VADER's
-                conventional thresholds are ±0.05 / ±0.30.
-              </p>
+              metric === "sentiment" && (
+                <p className="mt-1 text-[11px] text-zinc-400 dark:text-zinc-500">
+                  Range: -1 (very negative) to +1 (very positive). VADER's
+                  conventional thresholds are ±0.05 / ±0.30.
+                </p>
+              )
             )}
           </div>
 
@@ -1,11 +1,12 @@
 import { Link } from "react-router-dom";
 import { ArrowDownRight, ArrowUpRight, Minus } from "lucide-react";
-import type { Asset, PriceSeries, Quote } from "../api/client";
+import type { Asset, Quote } from "../api/client";
 import { Sparkline } from "./Sparkline";
 
 interface Props {
-  asset: Asset;
-  series: PriceSeries | null;
+  asset: Pick<Asset, "symbol" | "name" | "asset_type">;
+  /** Sparkline closes, oldest first. Null while loading. */
+  closes: number[] | null;
   /** Server-computed day-change quote (canonical). Null falls back to last close. */
   quote?: Quote | null;
   loading?: boolean;
@@ -23,8 +24,8 @@ function fmtPct(pct: number): string {
   return `${sign}${pct.toFixed(2)}%`;
 }
 
-export function AssetCard({ asset, series, quote, loading, error }: Props) {
-  const closes = series?.points.map((p) => Number(p.close)) ?? [];
+export function AssetCard({ asset, closes: sparkline, quote, loading, error }: Props) {
+  const closes = sparkline ?? [];
   // Last price prefers the server quote (which also drives the day change);
   // fall back to the latest sparkline close when the quote is unavailable.
   const quoteLast = quote?.last_price != null ? Number(quote.last_price) : null;
@@ -75,7 +76,7 @@ export function AssetCard({ asset, series, quote, loading, error }: Props) {
             {last === null ? "—" : fmtPrice(last)}
           </div>
           <div className="mt-0.5 text-[10px] uppercase tracking-wide text-zinc-400 dark:text-zinc-500">
-            {loading && !series ? "Loading…" : error ? "Error" : series ? `${series.count} bars` : "No data"}
+            {loading && !sparkline ? "Loading…" : error ? "Error" : closes.length ? `${closes.length} bars` : "No data"}
           </div>
         </div>
         <Sparkline values={closes} width={110} height={36} />
@@ -1,4 +1,4 @@
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { Activity, Loader2, Target } from "lucide-react";
 import {
   getForecastAccuracy,
@@ -24,6 +24,9 @@ interface Props {
    * previous numbers visible until the new ones land.
    */
   refreshTick?: number;
+  /** Report that came with the page (asset bundle); used instead of the
+   *  first fetch when its window matches `days`. */
+  initial?: ForecastAccuracyReport;
 }
 
 /**
@@ -35,8 +38,19 @@ interface Props {
  * a glance — the user can see whether SARIMAX or Holt-Winters has been
  * fitting their data better and act on it via Settings → ML controls.
  */
-export function ForecastAccuracyPanel({ symbol, days = 30, refreshTick = 0 }: Props) {
-  const [state, setState] = useState<State>(INITIAL);
+export function ForecastAccuracyPanel({
+  symbol,
+  days = 30,
+  refreshTick = 0,
+  initial,
+}: Props) {
+  const [state, setState] = useState<State>(() =>
+    initial && initial.days === days
+      ? { status: "ready", data: initial, error: null }
+      : INITIAL,
+  );
+  // Skips the first effect run only; a retrain tick always re-fetches.
+  const seeded = useRef(state.status === "ready");
 
   // React 19's `react-hooks/set-state-in-effect` rule forbids synchronous
   // setState inside an effect body. We rely on this in our favour: when
@@ -44,6 +58,10 @@ export function ForecastAccuracyPanel({ symbol, days = 30, refreshTick = 0 }: Pr
   // visible until the .then handler swaps it for the freshly-computed
   // metrics, which feels nicer than a flicker back to the spinner.
   useEffect(() => {
+    if (seeded.current) {
+      seeded.current = false;
+      return;
+    }
     const ac = new AbortController();
     getForecastAccuracy(symbol, { days, signal: ac.signal })
       .then((data) => setState({ status: "ready", data, error: null }))
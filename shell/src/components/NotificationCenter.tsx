@@ -12,8 +12,9 @@
  *      this resolves to "FinTrack" via ``identifier`` in tauri.conf.json,
  *      but until then the in-app bell is the canonical surface.
  *
- * Polls ``listAlerts()`` every ``POLL_INTERVAL_MS`` and filters client-side
- * for ``triggered_at != null``. Unread count is anything triggered AFTER
+ * Re-reads ``listAlerts()`` when the push stream reports a fired alert (or
+ * (re)connects / resets), with a slow ``FALLBACK_POLL_MS`` timer in case the
+ * stream is down, and filters client-side for ``triggered_at != null``. Unread count is anything triggered AFTER
  * the ``lastSeenAt`` timestamp in the ``useNotifications`` store.
  */
 
@@ -21,10 +22,10 @@ import { Bell, BellRing, ExternalLink } from "lucide-react";
 import { useEffect, useMemo, useRef, useState } from "react";
 import { Link } from "react-router-dom";
 
-import { listAlerts, type PriceAlert } from "../api/client";
+import { listAlerts, onStreamEvent, type PriceAlert } from "../api/client";
 import { useNotifications } from "../stores/useNotifications";
 
-const POLL_INTERVAL_MS = 60_000;
+const FALLBACK_POLL_MS = 300_000;
 const MAX_VISIBLE = 12;
 
 // SQLite stores naive UTC; coerce if there's no offset/Z suffix.
@@ -69,13 +70,15 @@ export function NotificationCenter() {
   const panelRef = useRef<HTMLDivElement | null>(null);
   const buttonRef = useRef<HTMLButtonElement | null>(null);
 
-  // ---- Poll ----------------------------------------------------------
+  // ---- Fetch on push ----------------------------------------------------------
   useEffect(() => {
     let cancelled = false;
     let timer: ReturnType<typeof setTimeout> | null = null;
 
     const fetchOnce = (): void => {
       if (cancelled) return;
+      if (timer !== null) clearTimeout(timer);
+      timer = null;
       listAlerts()
         .then((list) => {
           if (cancelled) return;
@@ -93,16 +96,25 @@ export function NotificationCenter() {
           });
         })
         .finally(() => {
-          if (!cancelled) timer = setTimeout(fetchOnce, POLL_INTERVAL_MS);
+          if (!cancelled && timer === null) {
+            timer = setTimeout(fetchOnce, FALLBACK_POLL_MS);
+          }
         });
     };
 
+    const unsubscribe = onStreamEvent((evt) => {
+      if (evt.event === "alert" || evt.event === "ready" || evt.event === "reset") {
+        fetchOnce();
+      }
+    });
+
     // First fetch delayed slightly so the sidecar has time to come up
     // on a cold Tauri launch (same pattern as useAlertNotifier).
     timer = setTimeout(fetchOnce, 1_500);
 
     return () => {
       cancelled = true;
+      unsubscribe();
       if (timer !== null) clearTimeout(timer);
     };
   }, []);
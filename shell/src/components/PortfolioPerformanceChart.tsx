@@ -23,6 +23,9 @@ type State =
 
 const INITIAL: State = { status: "loading", data: null, error: null };
 
+// Daily points beyond this are LTTB-downsampled by the sidecar (10y = ~3650).
+const MAX_POINTS = 1000;
+
 const LOOKBACK_OPTIONS: { value: number; label: string }[] = [
   { value: 30, label: "30d" },
   { value: 90, label: "90d" },
@@ -88,7 +91,11 @@ export function PortfolioPerformanceChart({ refreshTick }: Props) {
   // Fetch on mount, lookback change, or external refresh tick.
   useEffect(() => {
     const ac = new AbortController();
-    getPortfolioPerformance({ lookbackDays: lookback, signal: ac.signal })
+    getPortfolioPerformance({
+      lookbackDays: lookback,
+      maxPoints: MAX_POINTS,
+      signal: ac.signal,
+    })
       .then((data) => setState({ status: "ready", data, error: null }))
       .catch((err: unknown) => {
         if (ac.signal.aborted) return;
@@ -1,4 +1,4 @@
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { ArrowDown, ArrowUp, Loader2, Minus, Sparkles } from "lucide-react";
 import {
   classifySentiment,
@@ -31,6 +31,9 @@ interface Props {
   symbol: string;
   /** Window length for the rollup (defaults to 30 days). */
   days?: number;
+  /** Rollup and timeseries that came with the page (asset bundle); used
+   *  instead of the first fetch when their window matches `days`. */
+  initial?: { summary: SentimentSummary; series: SentimentTimeseries };
 }
 
 /**
@@ -43,10 +46,20 @@ interface Props {
  * change via the `key` prop, which keeps state transitions clean for the
  * React 19 `set-state-in-effect` rule.
  */
-export function SentimentSummaryPanel({ symbol, days = 30 }: Props) {
-  const [state, setState] = useState<State>(INITIAL);
+export function SentimentSummaryPanel({ symbol, days = 30, initial }: Props) {
+  const [state, setState] = useState<State>(() =>
+    initial && initial.summary.days === days
+      ? { status: "ready", data: initial.summary, series: initial.series, error: null }
+      : INITIAL,
+  );
+  // Skips the first effect run only; later changes always fetch.
+  const seeded = useRef(state.status === "ready");
 
   useEffect(() => {
+    if (seeded.current) {
+      seeded.current = false;
+      return;
+    }
     const ac = new AbortController();
     Promise.all([
       getSentimentSummary(symbol, { days, signal: ac.signal }),
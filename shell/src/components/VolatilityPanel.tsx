@@ -1,4 +1,4 @@
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { Loader2, TrendingUp } from "lucide-react";
 import { getVolatility, type VolatilityReport } from "../api/client";
 
@@ -13,6 +13,9 @@ interface Props {
   symbol: string;
   /** Window length for the realized-vol stdev (default 30 days). */
   lookbackDays?: number;
+  /** Report that came with the page (asset bundle); used instead of the
+   *  first fetch when its window matches `lookbackDays`. */
+  initial?: VolatilityReport;
 }
 
 /**
@@ -28,10 +31,20 @@ interface Props {
  * way the accuracy panel does — initial INITIAL.status='loading' drives
  * the spinner; subsequent fetches only update via .then handlers.
  */
-export function VolatilityPanel({ symbol, lookbackDays = 30 }: Props) {
-  const [state, setState] = useState<State>(INITIAL);
+export function VolatilityPanel({ symbol, lookbackDays = 30, initial }: Props) {
+  const [state, setState] = useState<State>(() =>
+    initial && initial.lookback_days === lookbackDays
+      ? { status: "ready", data: initial, error: null }
+      : INITIAL,
+  );
+  // Skips the first effect run only; later changes always fetch.
+  const seeded = useRef(state.status === "ready");
 
   useEffect(() => {
+    if (seeded.current) {
+      seeded.current = false;
+      return;
+    }
     const ac = new AbortController();
     getVolatility(symbol, { lookbackDays, signal: ac.signal })
       .then((data) => setState({ status: "ready", data, error: null }))
@@ -1,9 +1,11 @@
 /**
  * Shell-side alert notifier.
  *
- * Polls ``/api/alerts/pending-notifications/`` every ``POLL_INTERVAL_MS``,
- * fires a native OS notification for each pending alert, then POSTs to
- * ``/mark-notified/`` so the sidecar stops returning them.
+ * Reads ``/api/alerts/pending-notifications/`` whenever the push stream
+ * reports a fired alert (or (re)connects / resets), fires a native OS
+ * notification for each pending alert, then POSTs to ``/mark-notified/`` so
+ * the sidecar stops returning them. A slow ``FALLBACK_POLL_MS`` timer covers
+ * the stream being unavailable.
  *
  * Permission handling:
  *   - On mount, request permission once. If denied, the hook still runs but
@@ -27,10 +29,11 @@ import { useEffect, useRef } from "react";
 import {
   listPendingAlertNotifications,
   markAlertNotified,
+  onStreamEvent,
   type PriceAlert,
 } from "../api/client";
 
-const POLL_INTERVAL_MS = 30_000;
+const FALLBACK_POLL_MS = 300_000;
 
 function formatTitle(a: PriceAlert): string {
   const arrow = a.direction === "above" ? "↑" : "↓";
@@ -93,8 +96,18 @@ export function useAlertNotifier(): void {
     let timer: ReturnType<typeof setTimeout> | null = null;
     const controller = new AbortController();
 
+    let running = false;
+    let rerun = false;
+
     const tick = (): void => {
       if (cancelled) return;
+      if (running) {
+        // An alert arrived mid-pass; go again once this one finishes.
+        rerun = true;
+        return;
+      }
+      if (timer !== null) clearTimeout(timer);
+      running = true;
       void (async () => {
         try {
           if (permissionRef.current === null) {
@@ -104,21 +117,34 @@ export function useAlertNotifier(): void {
         } catch (err) {
           // Network error, sidecar not up yet, or aborted on unmount — swallow,
           // retry next tick.
-          console.warn("[alerts] poll tick failed:", err);
+          console.warn("[alerts] notify pass failed:", err);
         } finally {
+          running = false;
           if (!cancelled) {
-            timer = setTimeout(tick, POLL_INTERVAL_MS);
+            if (rerun) {
+              rerun = false;
+              tick();
+            } else {
+              timer = setTimeout(tick, FALLBACK_POLL_MS);
+            }
           }
         }
       })();
     };
 
+    const unsubscribe = onStreamEvent((evt) => {
+      if (evt.event === "alert" || evt.event === "ready" || evt.event === "reset") {
+        tick();
+      }
+    });
+
     // Fire first tick soon after mount so the dashboard shows notifications
     // quickly on launch (but not synchronously in the mount frame).
     timer = setTimeout(tick, 1_500);
 
     return () => {
       cancelled = true;
+      unsubscribe();
       controller.abort();
       if (timer !== null) clearTimeout(timer);
     };
@@ -37,6 +37,23 @@ function fmtThreshold(a: PriceAlert): string {
   });
 }
 
+/** Short window + metric tag for non-price alerts, e.g. "7d sent", "20b vol". */
+function metricBadge(a: PriceAlert): string {
+  const w = a.window_days ?? "?";
+  switch (a.metric) {
+    case "sentiment":
+      return `${w}d sent`;
+    case "pct_change":
+      return `${w}b %chg`;
+    case "volatility":
+      return `${w}b vol`;
+    case "volume_spike":
+      return `${w}b vol×`;
+    default:
+      return "";
+  }
+}
+
 function fmtLastPrice(a: PriceAlert): string {
   if (a.last_price === null) return "—";
   return Number(a.last_price).toLocaleString(undefined, {
@@ -285,9 +302,9 @@ export function Alerts() {
                       </div>
                     </td>
                     <td className="px-4 py-3 text-right font-mono tabular-nums text-zinc-800 dark:text-zinc-200">
-                      {a.metric === "sentiment" && (
+                      {a.metric !== "price" && (
                         <span className="mr-1 rounded bg-indigo-100 px-1 py-0.5 text-[9px] font-semibold uppercase tracking-wide text-indigo-700 dark:bg-indigo-900/40 dark:text-indigo-300">
-                          {a.window_days ?? "?"}d sent
+                          {metricBadge(a)}
                         </span>
                       )}
                       <span className="text-[11px] uppercase text-zinc-400 dark:text-zinc-500">
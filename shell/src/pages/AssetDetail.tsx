@@ -1,4 +1,4 @@
-import { useCallback, useEffect, useMemo, useState } from "react";
+import { useCallback, useEffect, useMemo, useRef, useState } from "react";
 import { Link, useParams } from "react-router-dom";
 import {
   Activity,
@@ -19,7 +19,9 @@ import {
 } from "lucide-react";
 import {
   type Article,
+  type ArticleList,
   type Asset,
+  type AssetBundle,
   ApiError,
   type Forecast,
   type MacroIndicator,
@@ -27,16 +29,18 @@ import {
   type PricePoint,
   type PriceSeries,
   type Quote,
+  type SentimentTimeseries,
   type SentimentTimeseriesPoint,
+  getAssetBundle,
   getForecast,
   getMacroSeries,
-  getPriceSeries,
+  getPriceChanges,
   getQuote,
   getSentimentTimeseries,
   listAlerts,
-  listAssets,
   listMacroIndicators,
   listNews,
+  mergePriceSeries,
   retrainForecast,
 } from "../api/client";
 import { AlertCreateModal } from "../components/AlertCreateModal";
@@ -58,6 +62,8 @@ interface State {
    *  ever span ~1 day, so the multi-day views need daily resolution). */
   dailySeries: PriceSeries | null;
   quote: Quote | null;
+  /** Panel data from the page's asset bundle (see `AssetBody`). */
+  bundle: AssetBundle | null;
   loading: boolean;
   error: string | null;
   notFound: boolean;
@@ -68,6 +74,7 @@ const INITIAL: State = {
   series: null,
   dailySeries: null,
   quote: null,
+  bundle: null,
   loading: true,
   error: null,
   notFound: false,
@@ -77,6 +84,9 @@ const INITIAL: State = {
 // for a brand-new install; settles higher as scheduler runs accumulate.
 // yfinance 5-min history tops out ~60 days, so this is also a soft ceiling.
 const MAX_BARS = 3000;
+// Sentiment markers on the candle chart cover this many days.
+const SENTIMENT_MARKER_DAYS = 90;
+const NEWS_LIMIT = 10;
 
 function fmtPrice(n: number): string {
   if (n >= 1000) return n.toLocaleString(undefined, { maximumFractionDigits: 2 });
@@ -126,6 +136,13 @@ export function AssetDetail() {
   const [state, setState] = useState<State>(INITIAL);
   const [tick, setTick] = useState(0);
   const resolved = useResolvedTheme();
+  // Delta-sync mark of the loaded series (see `getPriceChanges`); null until
+  // a full load of `symbol` has succeeded.
+  const syncRef = useRef<{
+    symbol: string;
+    version: number;
+    hasDaily: boolean;
+  } | null>(null);
 
   useEffect(() => {
     if (!symbol) return;
@@ -133,39 +150,91 @@ export function AssetDetail() {
     let cancelled = false;
     (async () => {
       try {
-        const [assets, series, dailySeries, quote] = await Promise.all([
-          listAssets({ activeOnly: false, signal: controller.signal }),
-          getPriceSeries(symbol, { limit: MAX_BARS, signal: controller.signal }),
-          // Daily closes for the 1W-and-longer timeframes. Tolerate absence (a
-          // brand-new asset has no daily bars until the daily job runs).
-          getPriceSeries(symbol, {
-            interval: "1d",
+        const mark = syncRef.current?.symbol === symbol ? syncRef.current : null;
+        if (mark) {
+          // Refresh: fetch only the bars inserted since the last load.
+          const [intraday, daily, quote] = await Promise.all([
+            getPriceChanges({
+              sinceVersion: mark.version,
+              symbols: [symbol],
+              signal: controller.signal,
+            }),
+            getPriceChanges({
+              sinceVersion: mark.version,
+              symbols: [symbol],
+              interval: "1d",
+              signal: controller.signal,
+            }),
+            getQuote(symbol, controller.signal).catch(() => null),
+          ]);
+          if (cancelled) return;
+          const newDaily = daily.changes[symbol] ?? [];
+          const mergeable =
+            intraday.resync.length === 0 &&
+            daily.resync.length === 0 &&
+            (mark.hasDaily || newDaily.length === 0);
+          if (mergeable) {
+            syncRef.current = {
+              ...mark,
+              version: Math.min(intraday.version, daily.version),
+            };
+            setState((s) => ({
+              ...s,
+              series:
+                s.series &&
+                mergePriceSeries(s.series, intraday.changes[symbol] ?? [], MAX_BARS),
+              dailySeries:
+                s.dailySeries && mergePriceSeries(s.dailySeries, newDaily, MAX_BARS),
+              quote: quote ?? s.quote,
+              loading: false,
+            }));
+            return;
+          }
+        }
+        // Read the mark *before* the full load: bars landing in between are
+        // returned again by the next refresh and merge away.
+        const probe = await getPriceChanges({
+          symbols: [symbol],
+          signal: controller.signal,
+        }).catch(() => null);
+        // One round-trip for the bars, the quote and every panel's first
+        // render, all read from one snapshot server-side.
+        let bundle: AssetBundle;
+        try {
+          bundle = await getAssetBundle(symbol, {
             limit: MAX_BARS,
+            timeseriesDays: SENTIMENT_MARKER_DAYS,
+            newsLimit: NEWS_LIMIT,
             signal: controller.signal,
-          }).catch(() => null),
-          // Day change comes from the server quote; tolerate its absence
-          // (e.g. no daily bars yet) so the page still renders.
-          getQuote(symbol, controller.signal).catch(() => null),
-        ]);
-        const asset = assets.find(
-          (a) => a.symbol.toUpperCase() === symbol.toUpperCase(),
-        );
-        if (cancelled) return;
-        if (!asset) {
-          setState({ ...INITIAL, loading: false, notFound: true });
-          return;
+          });
+        } catch (err) {
+          if (cancelled) return;
+          if (err instanceof ApiError && err.status === 404) {
+            setState({ ...INITIAL, loading: false, notFound: true });
+            return;
+          }
+          throw err;
         }
+        if (cancelled) return;
+        // Daily closes feed the 1W-and-longer timeframes; a brand-new asset
+        // has none until the daily job runs.
+        const dailySeries = bundle.daily ?? null;
+        syncRef.current = probe
+          ? { symbol, version: probe.version, hasDaily: dailySeries !== null }
+          : null;
         setState({
-          asset,
-          series,
+          asset: bundle.asset,
+          series: bundle.prices ?? null,
           dailySeries,
-          quote,
+          quote: bundle.quote ?? null,
+          bundle,
           loading: false,
           error: null,
           notFound: false,
         });
       } catch (err) {
         if (cancelled || controller.signal.aborted) return;
+        syncRef.current = null;
         setState({
           ...INITIAL,
           loading: false,
@@ -235,6 +304,7 @@ export function AssetDetail() {
           series={state.series}
           dailySeries={state.dailySeries}
           quote={state.quote}
+          initial={state.bundle}
           dark={resolved === "dark"}
         />
       )}
@@ -343,19 +413,32 @@ const FORECAST_INITIAL: ForecastState = {
   retraining: false,
 };
 
+/** `series` trimmed to its last `days` days (UTC dates). */
+function lastDays(series: SentimentTimeseries, days: number): SentimentTimeseries {
+  const cutoff = new Date(Date.now() - days * _DAY).toISOString().slice(0, 10);
+  return { ...series, days, points: series.points.filter((p) => p.date >= cutoff) };
+}
+
 function AssetBody({
   asset,
   series,
   dailySeries,
   quote,
+  initial,
   dark,
 }: {
   asset: Asset;
   series: PriceSeries;
   dailySeries: PriceSeries | null;
   quote: Quote | null;
+  /** Asset bundle the page loaded with. Read once, at mount: panels render
+   *  from it instead of fetching and re-fetch on their own afterwards. */
+  initial: AssetBundle | null;
   dark: boolean;
 }) {
+  const [seed] = useState(initial);
+  // `undefined` = not bundled (fetch), `null` = bundled, none trained.
+  const forecastSeed = useRef(seed?.forecast);
   const [alertOpen, setAlertOpen] = useState(false);
   const [lastCreatedAlert, setLastCreatedAlert] = useState<PriceAlert | null>(
     null,
@@ -381,7 +464,7 @@ function AssetBody({
   const [showSentimentMarkers, setShowSentimentMarkers] = useState(true);
   const [sentimentSeries, setSentimentSeries] = useState<
     SentimentTimeseriesPoint[]
-  >([]);
+  >(seed?.sentiment_timeseries?.points ?? []);
   // Macro overlay — user picks a FRED indicator from the chart header
   // dropdown and we fetch + render it as a secondary-axis line. ``null``
   // hides the overlay; the same null state hides the left price scale.
@@ -407,9 +490,16 @@ function AssetBody({
     let cancelled = false;
     const latestDailyDate = dailySeries?.points.at(-1)?.timestamp.slice(0, 10);
 
+    const seeded = forecastSeed.current;
+    forecastSeed.current = undefined;
+
     void (async () => {
       try {
-        const data = await getForecast(asset.symbol, controller.signal);
+        if (seeded === null) {
+          setFc({ data: null, status: "not_trained", error: null, retraining: false });
+          return;
+        }
+        const data = seeded ?? (await getForecast(asset.symbol, controller.signal));
         if (cancelled) return;
         const stale =
           !!latestDailyDate &&
@@ -451,9 +541,10 @@ function AssetBody({
   // candle chart to flag strong-news days as colored markers. Errors
   // are non-fatal — markers just stay hidden.
   useEffect(() => {
+    if (seed?.sentiment_timeseries) return;
     const controller = new AbortController();
     getSentimentTimeseries(asset.symbol, {
-      days: 90,
+      days: SENTIMENT_MARKER_DAYS,
       signal: controller.signal,
     })
       .then((data) => setSentimentSeries(data.points))
@@ -462,7 +553,7 @@ function AssetBody({
         setSentimentSeries([]);
       });
     return () => controller.abort();
-  }, [asset.symbol]);
+  }, [asset.symbol, seed]);
 
   // Macro indicator catalog — populates the chart-header dropdown.
   // Asset-independent, so we fetch once on mount and never refresh.
@@ -877,8 +968,20 @@ function AssetBody({
         </div>
 
         <aside className="flex flex-col gap-4">
-          <SentimentSummaryPanel key={`sentiment-${asset.symbol}`} symbol={asset.symbol} />
-          <NewsPanel key={asset.symbol} symbol={asset.symbol} />
+          <SentimentSummaryPanel
+            key={`sentiment-${asset.symbol}`}
+            symbol={asset.symbol}
+            initial={
+              seed?.sentiment && seed.sentiment_timeseries
+                ? {
+                    summary: seed.sentiment,
+                    // The bundle's timeseries is the 90-day marker series.
+                    series: lastDays(seed.sentiment_timeseries, seed.sentiment.days),
+                  }
+                : undefined
+            }
+          />
+          <NewsPanel key={asset.symbol} symbol={asset.symbol} initial={seed?.news} />
         </aside>
       </div>
 
@@ -891,8 +994,9 @@ function AssetBody({
         <ForecastAccuracyPanel
           symbol={asset.symbol}
           refreshTick={fcRetrainTick}
+          initial={seed?.accuracy}
         />
-        <VolatilityPanel symbol={asset.symbol} />
+        <VolatilityPanel symbol={asset.symbol} initial={seed?.volatility} />
       </div>
 
       <StrongSentimentDaysPanel
@@ -1366,15 +1470,28 @@ const INITIAL_NEWS_STATE: NewsPanelState = {
   error: null,
 };
 
-function NewsPanel({ symbol }: { symbol: string }) {
+function NewsPanel({
+  symbol,
+  initial,
+}: {
+  symbol: string;
+  /** Articles that came with the page's asset bundle; skips the fetch. */
+  initial?: ArticleList;
+}) {
   // `key={symbol}` at the call site resets this component on navigation,
   // so initial state is {loading: true, articles: []} on every symbol change.
-  const [state, setState] = useState<NewsPanelState>(INITIAL_NEWS_STATE);
+  const [state, setState] = useState<NewsPanelState>(() =>
+    initial
+      ? { articles: initial.articles, loading: false, error: null }
+      : INITIAL_NEWS_STATE,
+  );
+  const seeded = initial !== undefined;
 
   useEffect(() => {
+    if (seeded) return;
     const controller = new AbortController();
     let cancelled = false;
-    listNews({ symbol, limit: 10, signal: controller.signal })
+    listNews({ symbol, limit: NEWS_LIMIT, signal: controller.signal })
       .then((data) => {
         if (!cancelled) {
           setState({ articles: data.articles, loading: false, error: null });
@@ -1392,7 +1509,7 @@ function NewsPanel({ symbol }: { symbol: string }) {
       cancelled = true;
       controller.abort();
     };
-  }, [symbol]);
+  }, [symbol, seeded]);
 
   return (
     <div className="rounded-lg border border-zinc-200 bg-white p-4 dark:border-zinc-800 dark:bg-zinc-950">
@@ -3,8 +3,8 @@ import { useSearchParams } from "react-router-dom";
 import { GitCompare, Loader2, RefreshCw, X } from "lucide-react";
 import {
   type Asset,
-  type PriceSeries,
-  getPriceSeries,
+  type Comparison,
+  getComparison,
   listAssets,
 } from "../api/client";
 import { ComparisonChart } from "../components/ComparisonChart";
@@ -12,14 +12,14 @@ import { type UTCTimestamp } from "lightweight-charts";
 
 interface State {
   assets: Asset[];
-  series: Record<string, PriceSeries>;
+  comparison: Comparison | null;
   loading: boolean;
   error: string | null;
 }
 
 const INITIAL: State = {
   assets: [],
-  series: {},
+  comparison: null,
   loading: true,
   error: null,
 };
@@ -83,39 +83,29 @@ export function Compare() {
     return n;
   }, [searchParams]);
 
-  // Fetch the asset catalog once + the price series for each tracked symbol.
-  // Series fetched in parallel; per-symbol failures are surfaced but don't
-  // block other symbols from rendering.
+  // Fetch the asset catalog (for the picker) and the comparison itself.
+  // The server aligns every symbol on one daily axis and rebases it, so
+  // the whole chart is one request however many symbols are selected;
+  // unknown symbols come back in ``missing`` rather than failing it.
   useEffect(() => {
     const ac = new AbortController();
     let cancelled = false;
     (async () => {
       try {
-        const assets = await listAssets({
-          activeOnly: false,
-          signal: ac.signal,
-        });
-        const knownSymbols = new Set(assets.map((a) => a.symbol));
-        const wanted = urlSymbols.filter((s) => knownSymbols.has(s));
-        const seriesEntries = await Promise.all(
-          wanted.map((sym) =>
-            getPriceSeries(sym, { limit: 5000, signal: ac.signal }).then(
-              (ps) => [sym, ps] as const,
-              () => [sym, null] as const,
-            ),
-          ),
-        );
+        const [assets, comparison] = await Promise.all([
+          listAssets({ activeOnly: false, signal: ac.signal }),
+          getComparison(urlSymbols, {
+            from: lookback === 0 ? undefined : isoDaysAgo(lookback),
+            signal: ac.signal,
+          }),
+        ]);
         if (cancelled) return;
-        const series: Record<string, PriceSeries> = {};
-        for (const [sym, ps] of seriesEntries) {
-          if (ps) series[sym] = ps;
-        }
-        setState({ assets, series, loading: false, error: null });
+        setState({ assets, comparison, loading: false, error: null });
       } catch (err) {
         if (cancelled || ac.signal.aborted) return;
         setState({
           assets: [],
-          series: {},
+          comparison: null,
           loading: false,
           error: err instanceof Error ? err.message : String(err),
         });
@@ -125,7 +115,7 @@ export function Compare() {
       cancelled = true;
       ac.abort();
     };
-  }, [urlSymbols, tick]);
+  }, [urlSymbols, lookback, tick]);
 
   const onAddSymbol = (symbol: string) => {
     if (urlSymbols.includes(symbol)) return;
@@ -150,6 +140,7 @@ export function Compare() {
     if (value === 90) next.delete("days");
     else next.set("days", String(value));
     setSearchParams(next);
+    setState((s) => ({ ...s, loading: true }));
   };
 
   const refresh = () => {
@@ -158,9 +149,8 @@ export function Compare() {
   };
 
   const comparison = useMemo(
-    () =>
-      buildComparison(state.series, urlSymbols, lookback),
-    [state.series, urlSymbols, lookback],
+    () => buildComparison(state.comparison, urlSymbols),
+    [state.comparison, urlSymbols],
   );
 
   const sortedAssets = useMemo(
@@ -240,7 +230,7 @@ export function Compare() {
         </div>
       )}
 
-      {state.loading && Object.keys(state.series).length === 0 ? (
+      {state.loading && state.comparison === null ? (
         <div className="flex items-center gap-2 py-10 text-sm text-zinc-500 dark:text-zinc-400">
           <Loader2 className="h-4 w-4 animate-spin" />
           Loading price series for {urlSymbols.length} asset
@@ -273,30 +263,32 @@ interface BuiltSeries {
   changePct: number;
 }
 
+/** ISO date ``days`` before today (UTC). */
+function isoDaysAgo(days: number): string {
+  return new Date(Date.now() - days * 86_400_000).toISOString().slice(0, 10);
+}
+
 function buildComparison(
-  series: Record<string, PriceSeries>,
+  comparison: Comparison | null,
   symbols: string[],
-  lookbackDays: number,
 ): { series: BuiltSeries[] } {
-  const now = Date.now();
-  const cutoffMs =
-    lookbackDays === 0 ? 0 : now - lookbackDays * 24 * 60 * 60 * 1000;
   const out: BuiltSeries[] = [];
+  if (!comparison) return { series: out };
 
+  // Colors follow the chip order in the URL, not the server's order.
   for (let i = 0; i < symbols.length; i++) {
     const sym = symbols[i];
-    const ps = series[sym];
-    if (!ps || ps.points.length === 0) continue;
-    // Filter to the lookback window.
-    const inWindow = ps.points.filter((p) => parseTs(p.timestamp) >= cutoffMs);
-    if (inWindow.length === 0) continue;
-    const first = Number(inWindow[0].close);
-    if (!first || !Number.isFinite(first)) continue;
-    const points = inWindow.map((p) => ({
-      time: (parseTs(p.timestamp) / 1000) as UTCTimestamp,
-      value: (Number(p.close) / first) * 100,
-    }));
-    const last = Number(inWindow[inWindow.length - 1].close);
+    const values = comparison.values[sym];
+    if (!values) continue;
+    // Already aligned and rebased server-side; null = before the first bar.
+    const points: { time: UTCTimestamp; value: number }[] = [];
+    for (let j = 0; j < comparison.count; j++) {
+      const v = values[j];
+      if (v !== null) points.push({ time: comparison.t[j] as UTCTimestamp, value: v });
+    }
+    const first = comparison.first_close[sym];
+    const last = comparison.last_close[sym];
+    if (!first || points.length === 0) continue;
     out.push({
       symbol: sym,
       color: LINE_COLORS[i % LINE_COLORS.length],
@@ -309,12 +301,6 @@ function buildComparison(
   return { series: out };
 }
 
-function parseTs(iso: string): number {
-  // Sidecar emits naive UTC; coerce by appending Z when missing.
-  const s = /[zZ]|[+-]\d{2}:?\d{2}$/.test(iso) ? iso : `${iso}Z`;
-  return Date.parse(s);
-}
-
 function SymbolChip({
   symbol,
   color,
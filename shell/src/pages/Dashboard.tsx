@@ -1,42 +1,25 @@
 import { useEffect, useState } from "react";
 import { Link } from "react-router-dom";
 import { ListPlus, Plus, RefreshCw } from "lucide-react";
-import {
-  ApiError,
-  type Asset,
-  type PriceSeries,
-  type Quote,
-  type WatchlistDetail,
-  getDefaultWatchlist,
-  getPriceSeries,
-  listAssets,
-  listQuotes,
-} from "../api/client";
+import { type DashboardItem, getDashboard } from "../api/client";
 import { AddAssetModal } from "../components/AddAssetModal";
 import { AssetCard } from "../components/AssetCard";
 import { PortfolioSummaryStrip } from "../components/PortfolioSummaryStrip";
 
 interface LoadState {
-  /** Ordered list of assets to render. Driven by the default watchlist when present. */
-  assets: Asset[];
+  /** Cards in watchlist order: server quote + packed sparkline per asset. */
+  items: DashboardItem[];
   watchlistName: string | null;
   /** True when no default watchlist exists (vs. exists-but-empty). */
   noDefault: boolean;
-  series: Record<string, PriceSeries>;
-  /** Server-computed day-change quotes, keyed by symbol. */
-  quotes: Record<string, Quote>;
-  errors: Record<string, string>;
   assetsError: string | null;
   loading: boolean;
 }
 
 const INITIAL: LoadState = {
-  assets: [],
+  items: [],
   watchlistName: null,
   noDefault: false,
-  series: {},
-  quotes: {},
-  errors: {},
   assetsError: null,
   loading: true,
 };
@@ -44,72 +27,14 @@ const INITIAL: LoadState = {
 async function loadAll(
   signal: AbortSignal,
 ): Promise<Omit<LoadState, "loading">> {
-  // Pull both the default watchlist and every known asset. The watchlist drives
-  // ordering and filters; the full asset list is the fallback when there isn't
-  // one yet (first-run, before seed_default_watchlist runs).
-  let detail: WatchlistDetail | null = null;
-  let noDefault = false;
-  try {
-    detail = await getDefaultWatchlist(signal);
-  } catch (err) {
-    // A 404 means no default exists yet — show all active assets so the
-    // dashboard is never blank before migrations+seed complete.
-    if (err instanceof ApiError && err.status === 404) {
-      noDefault = true;
-    } else {
-      throw err;
-    }
-  }
-
-  const allAssets = await listAssets({ activeOnly: false, signal });
-
-  let assets: Asset[];
-  if (detail) {
-    const byId = new Map(allAssets.map((a) => [a.id, a]));
-    assets = detail.items
-      .map((item) => byId.get(item.asset_id))
-      .filter((a): a is Asset => a !== undefined);
-  } else {
-    assets = allAssets.filter((a) => a.is_active);
-  }
-
-  const series: Record<string, PriceSeries> = {};
-  const errors: Record<string, string> = {};
-  const quotes: Record<string, Quote> = {};
-
-  // Day-change comes from the server quote (previous-session close vs. live
-  // price) — not from differencing two intraday bars. Sparklines still use the
-  // intraday series.
-  const quotesPromise = assets.length
-    ? listQuotes({ symbols: assets.map((a) => a.symbol), activeOnly: false, signal })
-        .then((res) => {
-          for (const q of res.quotes) quotes[q.symbol] = q;
-        })
-        .catch(() => {
-          /* non-fatal — cards fall back to last close with no change */
-        })
-    : Promise.resolve();
-
-  await Promise.all([
-    quotesPromise,
-    ...assets.map(async (a) => {
-      try {
-        series[a.symbol] = await getPriceSeries(a.symbol, {
-          limit: 60,
-          signal,
-        });
-      } catch (err) {
-        errors[a.symbol] = err instanceof Error ? err.message : String(err);
-      }
-    }),
-  ]);
+  // One request for the whole grid: the server resolves the default
+  // watchlist (falling back to every active asset before one exists) and
+  // returns each asset's day-change quote plus its 60-bar intraday closes.
+  const data = await getDashboard({ points: 60, signal });
   return {
-    assets,
-    watchlistName: detail?.name ?? null,
-    noDefault,
-    series,
-    quotes,
-    errors,
+    items: data.items,
+    watchlistName: data.watchlist_name,
+    noDefault: data.watchlist_id === null,
     assetsError: null,
   };
 }
@@ -151,10 +76,10 @@ export function Dashboard() {
   const subtitle = state.loading
     ? "Loading assets…"
     : state.noDefault
-      ? `${state.assets.length} active asset${state.assets.length === 1 ? "" : "s"} · no default watchlist`
+      ? `${state.items.length} active asset${state.items.length === 1 ? "" : "s"} · no default watchlist`
       : state.watchlistName
-        ? `${state.assets.length} asset${state.assets.length === 1 ? "" : "s"} on "${state.watchlistName}"`
-        : `${state.assets.length} active asset${state.assets.length === 1 ? "" : "s"}`;
+        ? `${state.items.length} asset${state.items.length === 1 ? "" : "s"} on "${state.watchlistName}"`
+        : `${state.items.length} active asset${state.items.length === 1 ? "" : "s"}`;
 
   return (
     <div className="p-6">
@@ -214,7 +139,7 @@ export function Dashboard() {
         </div>
       )}
 
-      {!state.loading && state.assets.length === 0 && !state.assetsError && (
+      {!state.loading && state.items.length === 0 && !state.assetsError && (
         <div className="rounded-lg border border-dashed border-zinc-300 bg-zinc-50 p-8 text-center text-sm text-zinc-500 dark:border-zinc-700 dark:bg-zinc-900/60 dark:text-zinc-400">
           {state.noDefault ? (
             <>
@@ -236,14 +161,13 @@ export function Dashboard() {
       )}
 
       <div className="grid grid-cols-1 gap-3 sm:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4">
-        {state.assets.map((a) => (
+        {state.items.map((item) => (
           <AssetCard
-            key={a.id}
-            asset={a}
-            series={state.series[a.symbol] ?? null}
-            quote={state.quotes[a.symbol] ?? null}
+            key={item.asset_id}
+            asset={item.quote}
+            closes={item.sparkline.close}
+            quote={item.quote}
             loading={state.loading}
-            error={state.errors[a.symbol] ?? null}
           />
         ))}
       </div>
@@ -18,7 +18,8 @@ import { useResolvedTheme } from "../stores/useSettings";
 
 // Upper bound on points per series — most FRED series in our seed set are
 // monthly or quarterly, so even multi-decade spans come in under 1k points.
-// CPIAUCSL goes back to 1947 → ~950 monthly points by 2026.
+// CPIAUCSL goes back to 1947 → ~950 monthly points by 2026. The whole history
+// is requested; longer (daily) series are LTTB-downsampled by the sidecar.
 const MAX_POINTS = 2000;
 
 interface SeriesState {
@@ -86,7 +87,11 @@ export function Macro() {
   useEffect(() => {
     if (!selected) return;
     const controller = new AbortController();
-    getMacroSeries(selected, { limit: MAX_POINTS, signal: controller.signal })
+    getMacroSeries(selected, {
+      limit: 10000,
+      maxPoints: MAX_POINTS,
+      signal: controller.signal,
+    })
       .then((series) => {
         setSeriesState({ loading: false, series, error: null });
       })
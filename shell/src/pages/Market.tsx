@@ -1,26 +1,39 @@
 import { useEffect, useMemo, useState } from "react";
 import { Link } from "react-router-dom";
 import { ArrowDownRight, ArrowUpRight, RefreshCw } from "lucide-react";
-import { type AssetType, listQuotes } from "../api/client";
+import { type Mover, type MoverWindow, type Movers, getMovers } from "../api/client";
 import { CorrelationHeatmap } from "../components/CorrelationHeatmap";
 
 interface MoverRow {
   symbol: string;
   name: string;
-  assetType: AssetType;
   lastClose: number | null;
   changePct: number | null;
 }
 
 interface State {
-  rows: MoverRow[];
+  movers: Movers | null;
   loading: boolean;
   error: string | null;
 }
 
-const INITIAL: State = { rows: [], loading: true, error: null };
+const INITIAL: State = { movers: null, loading: true, error: null };
+
+const KNOWN_TYPES = ["stock", "etf", "crypto", "commodity", "index"];
 
-const KNOWN_TYPES: AssetType[] = ["stock", "etf", "crypto", "commodity", "index"];
+const WINDOWS: { value: MoverWindow; label: string }[] = [
+  { value: "1d", label: "1D" },
+  { value: "24h", label: "24H" },
+  { value: "5d", label: "5D" },
+  { value: "1m", label: "1M" },
+];
+
+const WINDOW_CAPTION: Record<MoverWindow, string> = {
+  "1d": "change vs. previous close",
+  "24h": "change vs. 24h earlier",
+  "5d": "change over 5 sessions",
+  "1m": "change over 21 sessions",
+};
 
 function fmtPrice(n: number): string {
   if (n >= 1000) return n.toLocaleString(undefined, { maximumFractionDigits: 2 });
@@ -33,36 +46,33 @@ function fmtPct(pct: number): string {
   return `${sign}${pct.toFixed(2)}%`;
 }
 
-async function loadRows(signal: AbortSignal): Promise<MoverRow[]> {
-  // Day change comes from the server quote (previous-session close vs. live
-  // price), so gainers/losers reflect a real daily move — not a delta between
-  // two adjacent 5-minute bars (which are often identical off-hours, leaving
-  // the losers board permanently empty).
-  const { quotes } = await listQuotes({ activeOnly: true, signal });
-  return quotes.map((q) => ({
-    symbol: q.symbol,
-    name: q.name,
-    assetType: q.asset_type,
-    lastClose: q.last_price != null ? Number(q.last_price) : null,
-    changePct: q.change_pct,
-  }));
+function toRow(m: Mover): MoverRow {
+  return {
+    symbol: m.symbol,
+    name: m.name,
+    lastClose: Number(m.last_price),
+    changePct: m.change_pct,
+  };
 }
 
 export function Market() {
   const [state, setState] = useState<State>(INITIAL);
   const [tick, setTick] = useState(0);
+  const [moverWindow, setMoverWindow] = useState<MoverWindow>("1d");
 
   useEffect(() => {
     const controller = new AbortController();
     let cancelled = false;
     (async () => {
       try {
-        const rows = await loadRows(controller.signal);
-        if (!cancelled) setState({ rows, loading: false, error: null });
+        // Ranked server-side (heap top-k over the whole universe) and cached
+        // there until the next price ingest.
+        const movers = await getMovers({ k: 5, window: moverWindow, signal: controller.signal });
+        if (!cancelled) setState({ movers, loading: false, error: null });
       } catch (err) {
         if (cancelled || controller.signal.aborted) return;
         setState({
-          rows: [],
+          movers: null,
           loading: false,
           error: err instanceof Error ? err.message : String(err),
         });
@@ -72,7 +82,7 @@ export function Market() {
       cancelled = true;
       controller.abort();
     };
-  }, [tick]);
+  }, [tick, moverWindow]);
 
   const refresh = () => {
     setState((s) => ({ ...s, loading: true }));
@@ -80,22 +90,16 @@ export function Market() {
   };
 
   const { gainers, losers, byType } = useMemo(() => {
-    const ranked = state.rows.filter((r) => r.changePct !== null);
-    ranked.sort((a, b) => (b.changePct ?? 0) - (a.changePct ?? 0));
-    const gainers = ranked.filter((r) => (r.changePct ?? 0) > 0).slice(0, 5);
-    const losers = ranked
-      .filter((r) => (r.changePct ?? 0) < 0)
-      .slice(-5)
-      .reverse();
-
-    // Seed the known buckets (so the grid is stable) but accumulate
-    // defensively — a new/unmapped asset_type from the backend must not turn a
-    // cell into NaN.
+    const gainers = state.movers?.gainers.map(toRow) ?? [];
+    const losers = state.movers?.losers.map(toRow) ?? [];
+
+    // Seed the known buckets (so the grid is stable); a new/unmapped
+    // asset_type from the backend just adds a cell.
     const byType: Record<string, number> = {};
     for (const t of KNOWN_TYPES) byType[t] = 0;
-    for (const r of state.rows) byType[r.assetType] = (byType[r.assetType] ?? 0) + 1;
+    Object.assign(byType, state.movers?.by_type ?? {});
     return { gainers, losers, byType };
-  }, [state.rows]);
+  }, [state.movers]);
 
   return (
     <div className="p-6">
@@ -107,18 +111,39 @@ export function Market() {
           <p className="text-xs text-zinc-500 dark:text-zinc-400">
             {state.loading
               ? "Loading…"
-              : `${state.rows.length} tracked assets · change vs. 24h earlier`}
+              : `${state.movers?.universe ?? 0} tracked assets · ${WINDOW_CAPTION[moverWindow]}`}
           </p>
         </div>
-        <button
-          type="button"
-          onClick={refresh}
-          disabled={state.loading}
-          className="inline-flex items-center gap-2 rounded-md border border-zinc-200 bg-white px-3 py-1.5 text-xs font-medium text-zinc-700 hover:bg-zinc-50 disabled:opacity-50 dark:border-zinc-700 dark:bg-zinc-900 dark:text-zinc-200 dark:hover:bg-zinc-800"
-        >
-          <RefreshCw className={`h-3.5 w-3.5 ${state.loading ? "animate-spin" : ""}`} />
-          Refresh
-        </button>
+        <div className="flex items-center gap-2">
+          <div className="inline-flex rounded-md border border-zinc-200 bg-white p-0.5 dark:border-zinc-700 dark:bg-zinc-900">
+            {WINDOWS.map((w) => (
+              <button
+                key={w.value}
+                type="button"
+                onClick={() => {
+                  setState((s) => ({ ...s, loading: true }));
+                  setMoverWindow(w.value);
+                }}
+                className={`rounded px-2 py-1 text-xs font-medium ${
+                  moverWindow === w.value
+                    ? "bg-zinc-900 text-white dark:bg-zinc-100 dark:text-zinc-900"
+                    : "text-zinc-600 hover:bg-zinc-50 dark:text-zinc-300 dark:hover:bg-zinc-800"
+                }`}
+              >
+                {w.label}
+              </button>
+            ))}
+          </div>
+          <button
+            type="button"
+            onClick={refresh}
+            disabled={state.loading}
+            className="inline-flex items-center gap-2 rounded-md border border-zinc-200 bg-white px-3 py-1.5 text-xs font-medium text-zinc-700 hover:bg-zinc-50 disabled:opacity-50 dark:border-zinc-700 dark:bg-zinc-900 dark:text-zinc-200 dark:hover:bg-zinc-800"
+          >
+            <RefreshCw className={`h-3.5 w-3.5 ${state.loading ? "animate-spin" : ""}`} />
+            Refresh
+          </button>
+        </div>
       </div>
 
       {state.error && (
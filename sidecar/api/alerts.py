@@ -4,9 +4,13 @@ CRUD + the shell-poller handshake (``/pending-notifications/`` +
 ``/{id}/mark-notified``). See :mod:`sidecar.services.alerts` for the design
 notes on why polling rather than SSE.
 
+``POST /replay/`` backtests a proposed rule against stored history before
+the user arms it (see :mod:`sidecar.services.alert_replay`).
+
 Error mapping:
 - 404 — alert / asset not found
 - 400 — validation error (bad threshold, bad direction, note too long)
+- 503 — replay requested but the ML extras (numpy) are not installed
 """
 
 from __future__ import annotations
@@ -18,6 +22,14 @@ from typing import Annotated, Literal
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, Field
 
+from sidecar.api.conditional import versioned
+from sidecar.services.alert_replay import (
+    PRICE_INTERVAL_DEFAULT,
+    REPLAY_DAYS_DEFAULT,
+    REPLAY_DAYS_MAX,
+    ReplayReport,
+    replay_alert,
+)
 from sidecar.services.alerts import (
     AlertError,
     AlertNotFoundError,
@@ -42,7 +54,9 @@ router = APIRouter(prefix="/api/alerts", tags=["alerts"])
 
 
 AlertDirectionLiteral = Literal["above", "below"]
-AlertMetricLiteral = Literal["price", "sentiment"]
+AlertMetricLiteral = Literal[
+    "price", "sentiment", "pct_change", "volatility", "volume_spike"
+]
 
 
 class AlertOutModel(BaseModel):
@@ -61,6 +75,9 @@ class AlertOutModel(BaseModel):
     created_at: datetime
     last_price: Decimal | None
     last_price_at: datetime | None
+    # Price alerts: the bar whose high (above) / low (below) crossed.
+    trigger_bar_at: datetime | None
+    trigger_price: Decimal | None
     # Most recent observed value for the alert's metric — latest close
     # for price alerts, rolling-mean sentiment for sentiment alerts.
     current_value: Decimal | None
@@ -73,9 +90,11 @@ class AlertListOut(BaseModel):
 
 class CreateAlertIn(BaseModel):
     """Threshold validation is intentionally loose at the schema level
-    (no ``gt=0``) — sentiment thresholds can be in [-1, 0]. The service
-    layer enforces metric-specific bounds (``> 0`` for price, [-1, +1]
-    for sentiment) so the API surfaces 400 instead of a half-clear 422.
+    (no ``gt=0``) — sentiment and percent-change thresholds can be
+    negative. The service layer enforces metric-specific bounds (``> 0``
+    for price / volatility / volume spike, [-1, +1] for sentiment) and
+    ``window_days`` ranges so the API surfaces 400 instead of a half-clear
+    422.
     """
 
     asset_id: int
@@ -86,6 +105,46 @@ class CreateAlertIn(BaseModel):
     window_days: int | None = Field(default=None, ge=1, le=365)
 
 
+class ReplayAlertIn(BaseModel):
+    """A rule as it would be created, plus the history to replay it over.
+
+    ``interval`` picks the bar series for price rules; derived metrics
+    replay the daily series their live evaluation reads.
+    """
+
+    asset_id: int
+    threshold: Decimal
+    direction: AlertDirectionLiteral
+    metric: AlertMetricLiteral = "price"
+    window_days: int | None = Field(default=None, ge=1, le=365)
+    days: int = Field(default=REPLAY_DAYS_DEFAULT, ge=1, le=REPLAY_DAYS_MAX)
+    interval: str | None = Field(default=None, examples=[PRICE_INTERVAL_DEFAULT])
+
+
+class ReplayFireOut(BaseModel):
+    at: datetime
+    # Observed metric value on the firing bar / day.
+    value: Decimal
+
+
+class ReplayOut(BaseModel):
+    asset_id: int
+    symbol: str
+    metric: AlertMetricLiteral
+    direction: AlertDirectionLiteral
+    threshold: Decimal
+    window_days: int | None
+    interval: str
+    days: int
+    observations: int
+    first_at: datetime | None
+    last_at: datetime | None
+    # Every fresh crossing in range; ``fires`` lists the first of them.
+    fire_count: int
+    truncated: bool
+    fires: list[ReplayFireOut]
+
+
 class UpdateAlertIn(BaseModel):
     threshold: Decimal | None = None
     direction: AlertDirectionLiteral | None = None
@@ -118,16 +177,41 @@ def _to_model(a: AlertOut) -> AlertOutModel:
         created_at=a.created_at,
         last_price=a.last_price,
         last_price_at=a.last_price_at,
+        trigger_bar_at=a.trigger_bar_at,
+        trigger_price=a.trigger_price,
         current_value=a.current_value,
     )
 
 
+def _replay_to_model(r: ReplayReport) -> ReplayOut:
+    return ReplayOut(
+        asset_id=r.asset_id,
+        symbol=r.symbol,
+        metric=r.metric.value,
+        direction=r.direction.value,
+        threshold=r.threshold,
+        window_days=r.window_days,
+        interval=r.interval,
+        days=r.days,
+        observations=r.observations,
+        first_at=r.first_at,
+        last_at=r.last_at,
+        fire_count=r.fire_count,
+        truncated=r.truncated,
+        fires=[ReplayFireOut(at=f.at, value=f.value) for f in r.fires],
+    )
+
+
 # ---------------------------------------------------------------------------
 # Routes
 # ---------------------------------------------------------------------------
 
 
-@router.get("/", response_model=AlertListOut)
+@router.get(
+    "/",
+    response_model=AlertListOut,
+    dependencies=[versioned("alerts", "prices", "news")],
+)
 def list_alerts_route(
     asset_id: Annotated[int | None, Query()] = None,
     active_only: Annotated[bool, Query()] = False,
@@ -136,7 +220,11 @@ def list_alerts_route(
     return AlertListOut(count=len(alerts), alerts=[_to_model(a) for a in alerts])
 
 
-@router.get("/pending-notifications/", response_model=AlertListOut)
+@router.get(
+    "/pending-notifications/",
+    response_model=AlertListOut,
+    dependencies=[versioned("alerts", "prices", "news")],
+)
 def list_pending_notifications_route() -> AlertListOut:
     alerts = list_pending_notifications()
     return AlertListOut(count=len(alerts), alerts=[_to_model(a) for a in alerts])
@@ -163,7 +251,44 @@ def create_alert_route(body: CreateAlertIn) -> AlertOutModel:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
-@router.get("/{alert_id}/", response_model=AlertOutModel)
+@router.post("/replay/", response_model=ReplayOut)
+def replay_alert_route(body: ReplayAlertIn) -> ReplayOut:
+    """How many times the rule would have fired over the last ``days``.
+
+    Each fresh crossing counts (the rule is treated as re-armed after every
+    notification), so the count reads as "notifications you would have
+    received" — a quick check for a threshold that is too noisy.
+    """
+    try:
+        report = replay_alert(
+            asset_id=body.asset_id,
+            threshold=body.threshold,
+            direction=body.direction,
+            metric=body.metric,
+            window_days=body.window_days,
+            days=body.days,
+            interval=body.interval,
+        )
+    except ImportError as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=(
+                "Alert replay needs the ML extras in this build "
+                f"({exc}); run pip install -r requirements-ml.txt"
+            ),
+        ) from exc
+    except AssetNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
+    except AlertError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return _replay_to_model(report)
+
+
+@router.get(
+    "/{alert_id}/",
+    response_model=AlertOutModel,
+    dependencies=[versioned("alerts", "prices", "news")],
+)
 def get_alert_route(alert_id: int) -> AlertOutModel:
     try:
         return _to_model(get_alert(alert_id))
@@ -16,30 +16,42 @@ Currently exposes:
   convenience wrapper that resolves the user's default watchlist and
   feeds its assets to the correlation engine. UI uses this for the
   zero-config "show me the heatmap" path.
+- ``GET /api/analytics/compare/?symbols=A,B,C&from=D&base=100`` — daily
+  closes of every symbol on one date axis (last close carried forward),
+  rebased to ``base`` at the start. Drives the Compare page in one
+  request; see :mod:`ml.comparison`.
 """
 
 from __future__ import annotations
 
 import logging
+from datetime import date
 from typing import Annotated
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel
 from sqlalchemy import select
 
+from ml.comparison import compute_comparison
 from ml.correlation import (
     MIN_OVERLAP_DAYS,
     CorrelationCell,
     CorrelationMatrix,
     compute_correlation_matrix,
 )
+from sidecar.api.conditional import asset_tags, versioned
+from sidecar.api.fast_json import delta_encode, dumps, fast_json
 from sidecar.db.engine import session_scope
 from sidecar.db.models import Asset, Watchlist, WatchlistItem
+from sidecar.response_cache import response_cache
 
 router = APIRouter(prefix="/api/analytics", tags=["analytics"])
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on ``/compare/`` symbols; the payload grows with each one.
+MAX_COMPARE_SYMBOLS = 50
+
 
 class CorrelationCellModel(BaseModel):
     symbol_a: str
@@ -91,7 +103,24 @@ def _parse_symbols(raw: str) -> list[str]:
     return list(dict.fromkeys(parts))
 
 
-@router.get("/correlations/", response_model=CorrelationMatrixModel)
+def _cached_matrix(symbols: list[str], lookback_days: int) -> CorrelationMatrixModel:
+    """Correlation matrix through the response cache — both routes share
+    entries, keyed on the ordered symbol list."""
+    return response_cache.get_or_compute(
+        "analytics.correlations",
+        (tuple(symbols), lookback_days),
+        asset_tags("prices", symbols),
+        lambda: _matrix_to_model(
+            compute_correlation_matrix(symbols, lookback_days=lookback_days)
+        ),
+    )
+
+
+@router.get(
+    "/correlations/",
+    response_model=CorrelationMatrixModel,
+    dependencies=[versioned("prices")],
+)
 def get_correlations(
     symbols: Annotated[str, Query(min_length=1)],
     lookback_days: Annotated[int, Query(ge=7, le=730)] = 90,
@@ -110,12 +139,13 @@ def get_correlations(
         raise HTTPException(
             status_code=422, detail="symbols must include at least one valid ticker"
         )
-    matrix = compute_correlation_matrix(parsed, lookback_days=lookback_days)
-    return _matrix_to_model(matrix)
+    return _cached_matrix(parsed, lookback_days)
 
 
 @router.get(
-    "/correlations/default-watchlist/", response_model=CorrelationMatrixModel
+    "/correlations/default-watchlist/",
+    response_model=CorrelationMatrixModel,
+    dependencies=[versioned("prices", "watchlists")],
 )
 def get_default_watchlist_correlations(
     lookback_days: Annotated[int, Query(ge=7, le=730)] = 90,
@@ -143,5 +173,91 @@ def get_default_watchlist_correlations(
         ).scalars().all()
         symbols = list(rows)
 
-    matrix = compute_correlation_matrix(symbols, lookback_days=lookback_days)
-    return _matrix_to_model(matrix)
+    return _cached_matrix(symbols, lookback_days)
+
+
+class ComparisonModel(BaseModel):
+    """Columnar comparison payload.
+
+    ``t`` is the shared date axis — UTC midnights in epoch seconds,
+    delta-encoded like the prices columnar format. ``values[symbol][i]``
+    is that symbol at ``t[i]`` rebased to ``base``, null before its first
+    bar. ``first_close`` / ``last_close`` are the raw closes the rebase
+    started from and ended at. ``missing`` lists requested symbols that
+    are unknown or have no daily bars in the window.
+    """
+
+    symbols: list[str]
+    missing: list[str]
+    base: float
+    count: int
+    t: list[int]
+    values: dict[str, list[float | None]]
+    first_close: dict[str, float]
+    last_close: dict[str, float]
+
+
+def _comparison_json(symbols: list[str], start: date | None, base: float) -> bytes:
+    try:
+        c = compute_comparison(symbols, start=start, base=base)
+    except ImportError as exc:
+        raise HTTPException(
+            status_code=503,
+            detail=(
+                "comparison needs the ML extras in this build "
+                f"({exc}); run pip install -r requirements-ml.txt"
+            ),
+        ) from exc
+    # NaN (no bar yet) renders as null.
+    return dumps(
+        {
+            "symbols": c.symbols,
+            "missing": c.missing,
+            "base": c.base,
+            "count": len(c.days),
+            "t": delta_encode([d * 86400 for d in c.days]),
+            "values": c.values,
+            "first_close": c.first_close,
+            "last_close": c.last_close,
+        }
+    )
+
+
+@router.get(
+    "/compare/",
+    response_model=ComparisonModel,
+    dependencies=[versioned("prices")],
+)
+def get_comparison(
+    response: Response,
+    symbols: Annotated[str, Query(min_length=1)],
+    start: Annotated[date | None, Query(alias="from")] = None,
+    base: Annotated[float, Query(gt=0, le=1_000_000)] = 100.0,
+) -> Response:
+    """Daily closes of ``symbols`` aligned on one date axis and rebased to
+    ``base`` on ``from`` (or each series' first bar, if later).
+
+    One query for every symbol. A series without a bar on some date
+    carries its previous close forward, so ten assets on different
+    exchange calendars still line up row by row. Unknown symbols are
+    reported under ``missing`` rather than failing the request, like the
+    correlation matrix. 422 when ``symbols`` parses empty or names more
+    than ``MAX_COMPARE_SYMBOLS``.
+    """
+    parsed = _parse_symbols(symbols)
+    if not parsed:
+        raise HTTPException(
+            status_code=422, detail="symbols must include at least one valid ticker"
+        )
+    if len(parsed) > MAX_COMPARE_SYMBOLS:
+        raise HTTPException(
+            status_code=422,
+            detail=f"at most {MAX_COMPARE_SYMBOLS} symbols can be compared",
+        )
+    body = response_cache.get_or_compute(
+        "analytics.compare",
+        (tuple(parsed), start, base),
+        asset_tags("prices", parsed),
+        lambda: _comparison_json(parsed, start, base),
+    )
+    return fast_json(body, response)
@@ -0,0 +1,202 @@
+"""Asset-detail bundle: ``GET /api/assets/{symbol}/bundle/``.
+
+The asset page used to open with about ten requests — the asset list,
+intraday and daily bars, the quote, then forecast, volatility, accuracy,
+sentiment summary and timeseries, and news — each with its own
+``session_scope()`` and its own symbol lookup. This endpoint resolves the
+symbol once and runs the requested sections back to back inside one read
+transaction (``sidecar.db.engine.read_snapshot``), so every section
+describes the same committed state and the page pays one round-trip.
+
+``include`` is a comma-separated subset of ``BUNDLE_SECTIONS`` (default:
+all of them); sections left out come back ``null``. Each section has the
+shape of its standalone endpoint:
+
+=======================  ==============================================
+section                  same body as
+=======================  ==============================================
+``quote``                ``/api/quotes/{symbol}/``
+``prices``               ``/api/prices/{symbol}/?limit=``
+``daily``                ``/api/prices/{symbol}/?interval=1d&limit=``
+``forecast``             ``/api/forecast/{symbol}/`` (``null`` if none)
+``accuracy``             ``/api/forecast/{symbol}/accuracy/?days=``
+``volatility``           ``/api/forecast/{symbol}/volatility/``
+``sentiment``            ``/api/news/sentiment-summary/{symbol}/?days=``
+``sentiment_timeseries`` ``/api/news/sentiment-timeseries/{symbol}/``
+``news``                 ``/api/news/?symbol=&limit=``
+=======================  ==============================================
+
+Sections run sequentially: a SQLite snapshot belongs to one connection,
+and a connection executes one statement at a time, so fanning out to
+threads would mean giving up the shared snapshot. Each section is a few
+indexed queries; the round-trips were the cost.
+
+Error mapping:
+- 404 — unknown symbol
+- 422 — unknown section in ``include``
+"""
+
+from __future__ import annotations
+
+from typing import Annotated, Any
+
+from fastapi import APIRouter, HTTPException, Query, Response
+from pydantic import BaseModel
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ml.accuracy import accuracy_for_asset
+from ml.persistence import load_forecast_in_session
+from ml.volatility import volatility_for_asset
+from sidecar.api.assets import AssetOut
+from sidecar.api.conditional import versioned
+from sidecar.api.fast_json import DecimalFormat, fast_json
+from sidecar.api.forecast import (
+    AccuracyReportModel,
+    ForecastResponseModel,
+    VolatilityReportModel,
+    _accuracy_to_model,
+    _to_response,
+    _volatility_to_model,
+)
+from sidecar.api.news import (
+    ArticleListOut,
+    SentimentSummaryOut,
+    SentimentTimeseriesOut,
+    _article_rows,
+    _sentiment_points,
+    _sentiment_summary,
+)
+from sidecar.api.prices import PriceSeriesOut, _recent_points
+from sidecar.api.quotes import QuoteOut
+from sidecar.db.engine import read_snapshot
+from sidecar.db.models import Asset
+from sidecar.services.quotes import build_quote
+
+router = APIRouter(prefix="/api/assets", tags=["assets"])
+
+BUNDLE_SECTIONS = (
+    "quote",
+    "prices",
+    "daily",
+    "forecast",
+    "accuracy",
+    "volatility",
+    "sentiment",
+    "sentiment_timeseries",
+    "news",
+)
+
+
+class AssetBundleOut(BaseModel):
+    asset: AssetOut
+    include: list[str]
+    quote: QuoteOut | None = None
+    prices: PriceSeriesOut | None = None
+    daily: PriceSeriesOut | None = None
+    forecast: ForecastResponseModel | None = None
+    accuracy: AccuracyReportModel | None = None
+    volatility: VolatilityReportModel | None = None
+    sentiment: SentimentSummaryOut | None = None
+    sentiment_timeseries: SentimentTimeseriesOut | None = None
+    news: ArticleListOut | None = None
+
+
+def _parse_include(raw: str | None) -> list[str]:
+    """Requested sections in ``BUNDLE_SECTIONS`` order; 422 on unknowns."""
+    if raw is None:
+        return list(BUNDLE_SECTIONS)
+    wanted = {p.strip().lower() for p in raw.split(",") if p.strip()}
+    unknown = wanted - set(BUNDLE_SECTIONS)
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                f"unknown bundle sections {sorted(unknown)}; "
+                f"expected a subset of {list(BUNDLE_SECTIONS)}"
+            ),
+        )
+    return [name for name in BUNDLE_SECTIONS if name in wanted]
+
+
+@router.get(
+    "/{symbol}/bundle/",
+    response_model=AssetBundleOut,
+    dependencies=[versioned("assets", "prices", "forecasts", "news", per_asset="symbol")],
+)
+def asset_bundle(
+    symbol: str,
+    response: Response,
+    include: Annotated[str | None, Query(max_length=200)] = None,
+    limit: Annotated[int, Query(ge=1, le=10000)] = 500,
+    decimals: Annotated[DecimalFormat, Query()] = "string",
+    days: Annotated[int, Query(ge=7, le=365)] = 30,
+    timeseries_days: Annotated[int, Query(ge=1, le=365)] = 30,
+    news_limit: Annotated[int, Query(ge=1, le=500)] = 10,
+) -> Response:
+    """Everything the asset page renders, in one response.
+
+    ``limit`` caps both bar series (newest bars, ascending). ``days`` is
+    the window of the accuracy, volatility and sentiment-summary sections,
+    ``timeseries_days`` that of ``sentiment_timeseries``.
+    """
+    sections = _parse_include(include)
+    symbol = symbol.upper()
+    with read_snapshot() as s:
+        asset = s.execute(select(Asset).where(Asset.symbol == symbol)).scalar_one_or_none()
+        if asset is None:
+            raise HTTPException(status_code=404, detail=f"Unknown symbol: {symbol}")
+        body: dict[str, Any] = {
+            "asset": AssetOut.model_validate(asset).model_dump(mode="json"),
+            "include": sections,
+        }
+        for name in sections:
+            body[name] = _section(
+                s, asset, name, limit, decimals, days, timeseries_days, news_limit
+            )
+    return fast_json(body, response)
+
+
+def _section(
+    s: Session,
+    asset: Asset,
+    name: str,
+    limit: int,
+    decimals: DecimalFormat,
+    days: int,
+    timeseries_days: int,
+    news_limit: int,
+) -> Any:
+    """Body of one bundle section (``None`` for a missing forecast)."""
+    if name in ("prices", "daily"):
+        interval = "5m" if name == "prices" else "1d"
+        points = _recent_points(s, asset.id, interval, limit, decimals)
+        return {
+            "symbol": asset.symbol,
+            "count": len(points),
+            "points": points,
+            "next_after_ts": None,
+        }
+    if name == "news":
+        articles = _article_rows(s, asset_id=asset.id, limit=news_limit)
+        return {"count": len(articles), "articles": articles}
+
+    model: BaseModel | None
+    if name == "quote":
+        model = QuoteOut.from_quote(build_quote(s, asset))
+    elif name == "forecast":
+        result = load_forecast_in_session(s, asset.id)
+        model = None if result is None else _to_response(asset.symbol, asset.id, result)
+    elif name == "accuracy":
+        model = _accuracy_to_model(accuracy_for_asset(s, asset.id, asset.symbol, days=days))
+    elif name == "volatility":
+        model = _volatility_to_model(
+            volatility_for_asset(s, asset.id, asset.symbol, lookback_days=days)
+        )
+    elif name == "sentiment":
+        model = _sentiment_summary(s, asset, days)
+    elif name == "sentiment_timeseries":
+        model = _sentiment_points(s, asset, timeseries_days)
+    else:
+        raise ValueError(f"unknown bundle section {name!r}")
+    return None if model is None else model.model_dump(mode="json")
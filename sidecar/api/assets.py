@@ -30,6 +30,7 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import select
 
+from sidecar.api.conditional import versioned
 from sidecar.db.engine import session_scope
 from sidecar.db.models import Asset, AssetType
 from sidecar.services.assets import (
@@ -119,7 +120,11 @@ class SearchOut(BaseModel):
 # ---------------------------------------------------------------------------
 
 
-@router.get("/", response_model=list[AssetOut])
+@router.get(
+    "/",
+    response_model=list[AssetOut],
+    dependencies=[versioned("assets")],
+)
 def list_assets(active_only: bool = True) -> list[AssetOut]:
     with session_scope() as s:
         stmt = select(Asset).order_by(Asset.symbol)
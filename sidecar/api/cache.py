@@ -0,0 +1,96 @@
+"""Response-cache introspection (see :mod:`sidecar.response_cache`).
+
+- ``GET /api/cache/`` — size, hit ratios per endpoint and the most
+  expensive cached entries with their compute cost.
+- ``DELETE /api/cache/`` — drop every entry and reset the counters.
+"""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+from pydantic import BaseModel
+
+from sidecar.response_cache import response_cache
+
+router = APIRouter(prefix="/api/cache", tags=["cache"])
+
+
+class CacheEntryOut(BaseModel):
+    endpoint: str
+    params: str
+    size_bytes: int
+    compute_ms: float
+    hits: int
+    age_seconds: float
+
+
+class CacheEndpointOut(BaseModel):
+    endpoint: str
+    entries: int
+    hits: int
+    misses: int
+    coalesced: int
+    hit_ratio: float | None
+    mean_compute_ms: float | None
+
+
+class CacheStatsOut(BaseModel):
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    coalesced: int
+    hit_ratio: float | None
+    invalidations: int
+    evictions: int
+    endpoints: list[CacheEndpointOut]
+    top_entries: list[CacheEntryOut]
+
+
+@router.get("/", response_model=CacheStatsOut)
+def cache_stats(
+    top: Annotated[int, Query(ge=0, le=200)] = 20,
+) -> CacheStatsOut:
+    s = response_cache.stats(top=top)
+    return CacheStatsOut(
+        entries=s.entries,
+        size_bytes=s.size_bytes,
+        max_bytes=s.max_bytes,
+        hits=s.hits,
+        misses=s.misses,
+        coalesced=s.coalesced,
+        hit_ratio=s.hit_ratio,
+        invalidations=s.invalidations,
+        evictions=s.evictions,
+        endpoints=[
+            CacheEndpointOut(
+                endpoint=e.endpoint,
+                entries=e.entries,
+                hits=e.hits,
+                misses=e.misses,
+                coalesced=e.coalesced,
+                hit_ratio=e.hit_ratio,
+                mean_compute_ms=e.mean_compute_ms,
+            )
+            for e in s.endpoints
+        ],
+        top_entries=[
+            CacheEntryOut(
+                endpoint=e.endpoint,
+                params=e.params,
+                size_bytes=e.size_bytes,
+                compute_ms=e.compute_ms,
+                hits=e.hits,
+                age_seconds=e.age_seconds,
+            )
+            for e in s.top_entries
+        ],
+    )
+
+
+@router.delete("/", status_code=204)
+def clear_cache() -> None:
+    response_cache.clear()
@@ -0,0 +1,130 @@
+"""Conditional GETs: weak ETags from data versions, ``304 Not Modified``.
+
+Read endpoints declare which data domains their response is derived from::
+
+    @router.get("/{symbol}/", dependencies=[versioned("prices", per_asset="symbol")])
+
+and the dependency runs before the endpoint body. It builds a weak ETag
+from the current versions of those domains (``sidecar.data_version``) and,
+when the request's ``If-None-Match`` already names it, short-circuits with
+``304`` — the endpoint, and therefore the database, is never reached.
+Otherwise the tag rides on the normal response together with
+``Cache-Control: no-cache``, which makes the WebView keep the body and
+revalidate it on every fetch without any client-side code.
+
+Every tag also carries
+
+- the ``assets`` version: deleting an asset cascades to its prices, news
+  links, alerts... without any ORM event for those rows;
+- the UTC date: several responses are relative to "now" (trailing
+  lookbacks, rolling windows) and must not validate forever.
+
+``per_asset`` names a path parameter holding a symbol; keyed domains
+(``prices``) then use that asset's version, so an unrelated ingest does not
+invalidate the response. Symbols resolve through an in-memory map rebuilt
+only when the ``assets`` version moves.
+
+Endpoints that return a ``Response`` themselves (CSV exports, the SSE
+stream) must not use this: FastAPI drops dependency-set headers there.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from threading import Lock
+from typing import Any
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import select
+
+from sidecar.data_version import DOMAIN_TABLES, KEY_COLUMNS, data_versions
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Asset
+
+CACHE_CONTROL = "no-cache, private"
+
+_KEYED_DOMAINS = frozenset(
+    d for d, tables in DOMAIN_TABLES.items() if any(t in KEY_COLUMNS for t in tables)
+)
+
+_symbols_lock = Lock()
+# (assets version it was built at, symbol -> asset id)
+_symbols: tuple[str, dict[str, int]] | None = None
+
+
+def _asset_id(symbol: str) -> int | None:
+    global _symbols
+    version = data_versions.version("assets")
+    with _symbols_lock:
+        cached = _symbols
+    if cached is None or cached[0] != version:
+        with session_scope() as s:
+            ids = {sym: aid for sym, aid in s.execute(select(Asset.symbol, Asset.id))}
+        # Stored under the version read *before* the query, so a concurrent
+        # asset write forces another rebuild rather than hiding behind it.
+        cached = (version, ids)
+        with _symbols_lock:
+            _symbols = cached
+    return cached[1].get(symbol.upper())
+
+
+def asset_tags(domain: str, symbols: Iterable[str]) -> list[tuple[str, int | None]]:
+    """Response-cache tags for ``symbols``' slices of a keyed ``domain``.
+
+    Unknown symbols get no tag: they contribute nothing until the asset is
+    created, and an ``assets`` write drops every cached response anyway.
+    """
+    ids = (_asset_id(sym) for sym in symbols)
+    return [(domain, aid) for aid in ids if aid is not None]
+
+
+def current_etag(domains: tuple[str, ...], asset_id: int | None = None) -> str:
+    """The weak ETag for a response derived from ``domains``."""
+    parts = [data_versions.epoch, datetime.now(UTC).strftime("%Y%m%d")]
+    for domain in ("assets", *(d for d in domains if d != "assets")):
+        if asset_id is not None and domain in _KEYED_DOMAINS:
+            parts.append(f"{domain}.{data_versions.version(domain, asset_id)}")
+        else:
+            parts.append(f"{domain}.{data_versions.version(domain)}")
+    return 'W/"' + "-".join(parts) + '"'
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an ``If-None-Match`` header."""
+    if not if_none_match:
+        return False
+    wanted = _opaque(etag)
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or _opaque(candidate) == wanted:
+            return True
+    return False
+
+
+def versioned(*domains: str, per_asset: str | None = None) -> Any:
+    """Route dependency: ETag the response, ``304`` on a matching request."""
+    unknown = set(domains) - set(DOMAIN_TABLES)
+    if unknown:
+        raise ValueError(f"unknown data domains: {sorted(unknown)}")
+
+    def check(request: Request, response: Response) -> None:
+        asset_id = None
+        if per_asset is not None:
+            symbol = request.path_params.get(per_asset)
+            if symbol is not None:
+                asset_id = _asset_id(str(symbol))
+        etag = current_etag(domains, asset_id)
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(
+                status_code=304,
+                headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+            )
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = CACHE_CONTROL
+
+    return Depends(check)
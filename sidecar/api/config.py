@@ -7,6 +7,7 @@ from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, ConfigDict, Field
 
 from sidecar import scheduler as sched_mod
+from sidecar.api.conditional import versioned
 from sidecar.config import settings as env_settings
 from sidecar.services.settings import (
     SETTINGS_SPECS,
@@ -96,7 +97,11 @@ def _build_response() -> ConfigOut:
     )
 
 
-@router.get("/", response_model=ConfigOut)
+@router.get(
+    "/",
+    response_model=ConfigOut,
+    dependencies=[versioned("settings")],
+)
 def get_config() -> ConfigOut:
     return _build_response()
 
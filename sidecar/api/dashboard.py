@@ -0,0 +1,89 @@
+"""Dashboard endpoint: ``GET /api/dashboard/``.
+
+One round-trip for the Dashboard grid — every card's quote and sparkline
+for a watchlist (see :mod:`sidecar.services.dashboard`).
+
+Error mapping:
+- 404 — ``watchlist_id`` not found
+"""
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel
+
+from sidecar.api.conditional import versioned
+from sidecar.api.quotes import QuoteOut
+from sidecar.services.dashboard import (
+    SPARKLINE_POINTS,
+    SPARKLINE_POINTS_MAX,
+    Dashboard,
+    get_dashboard,
+)
+from sidecar.services.watchlists import WatchlistNotFoundError
+
+router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
+
+
+class SparklineOut(BaseModel):
+    interval: str
+    # Parallel arrays, oldest first: epoch seconds and closes.
+    t: list[int]
+    close: list[float]
+
+
+class DashboardItemOut(BaseModel):
+    asset_id: int
+    is_active: bool
+    quote: QuoteOut
+    sparkline: SparklineOut
+
+
+class DashboardOut(BaseModel):
+    watchlist_id: int | None
+    watchlist_name: str | None
+    count: int
+    items: list[DashboardItemOut]
+
+
+def _to_model(d: Dashboard) -> DashboardOut:
+    return DashboardOut(
+        watchlist_id=d.watchlist_id,
+        watchlist_name=d.watchlist_name,
+        count=len(d.items),
+        items=[
+            DashboardItemOut(
+                asset_id=i.asset_id,
+                is_active=i.is_active,
+                quote=QuoteOut.from_quote(i.quote),
+                sparkline=SparklineOut(
+                    interval=i.sparkline.interval,
+                    t=i.sparkline.t,
+                    close=i.sparkline.close,
+                ),
+            )
+            for i in d.items
+        ],
+    )
+
+
+@router.get(
+    "/",
+    response_model=DashboardOut,
+    dependencies=[versioned("prices", "watchlists")],
+)
+def dashboard(
+    watchlist_id: Annotated[int | None, Query()] = None,
+    points: Annotated[int, Query(ge=2, le=SPARKLINE_POINTS_MAX)] = SPARKLINE_POINTS,
+    interval: Annotated[str, Query(min_length=1, max_length=16)] = "5m",
+) -> DashboardOut:
+    """Quote + sparkline for each asset on ``watchlist_id`` (default list
+    when omitted; all active assets when no default watchlist exists)."""
+    try:
+        return _to_model(
+            get_dashboard(watchlist_id=watchlist_id, points=points, interval=interval)
+        )
+    except WatchlistNotFoundError as exc:
+        raise HTTPException(status_code=404, detail=str(exc)) from exc
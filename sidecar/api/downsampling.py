@@ -0,0 +1,109 @@
+"""``max_points``: server-side downsampling for the chart series endpoints.
+
+``/api/prices/{symbol}/``, ``/api/macro/{series_id}/`` and
+``/api/portfolio/performance/`` select their rows exactly as before (range,
+newest ``limit``, ascending) and, when ``max_points`` is given and the
+selection is longer, reduce it with ``ml.downsample`` before rendering:
+
+- line series (macro, portfolio value, ``downsample=lttb`` on prices) keep
+  the rows LTTB picks, unchanged;
+- candles (``downsample=ohlc``, the prices default) merge consecutive bars
+  into one candle each: first timestamp and open, highest high, lowest low,
+  last close, summed volume.
+
+The response shape does not change — ``count`` is the number of points
+actually returned — so payload and render time stay bounded however long
+the history is. Every output format (rows, columnar, binary) goes through
+the same row-level reduction.
+
+numpy is an ML extra; without it a ``max_points`` request answers ``503``
+and everything else keeps working.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from datetime import UTC, date, datetime
+from typing import Annotated, Any, Literal, TypeVar
+
+from fastapi import HTTPException, Query
+
+from ml.downsample import MIN_POINTS
+
+T = TypeVar("T")
+
+Downsample = Literal["ohlc", "lttb"]
+
+MaxPoints = Annotated[
+    int | None,
+    Query(
+        ge=MIN_POINTS,
+        le=10000,
+        description="Downsample the selected rows to at most this many points.",
+    ),
+]
+
+_EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+def _unavailable(exc: ImportError) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail=(
+            "max_points needs the ML extras in this build "
+            f"({exc}); run pip install -r requirements-ml.txt"
+        ),
+    )
+
+
+def _x(value: Any) -> float:
+    """A row's x coordinate in epoch seconds (naive datetimes are UTC)."""
+    if isinstance(value, datetime):
+        aware: datetime = value if value.tzinfo else value.replace(tzinfo=UTC)
+        return aware.timestamp()
+    if isinstance(value, date):
+        return float((value.toordinal() - _EPOCH_ORDINAL) * 86400)
+    return float(value)
+
+
+def lttb_rows(
+    rows: Sequence[T],
+    max_points: int,
+    x: Callable[[T], Any],
+    y: Callable[[T], Any],
+) -> list[T]:
+    """The subset of ``rows`` LTTB keeps; ``x`` is a date, datetime or
+    number, ``y`` anything ``float()`` accepts."""
+    if len(rows) <= max_points:
+        return list(rows)
+    try:
+        from ml.downsample import lttb
+
+        keep = lttb([_x(x(r)) for r in rows], [float(y(r)) for r in rows], max_points)
+    except ImportError as exc:
+        raise _unavailable(exc) from exc
+    return [rows[i] for i in keep]
+
+
+def ohlc_rows(rows: Sequence[Sequence[Any]], max_points: int) -> list[tuple[Any, ...]]:
+    """Merge ``(t, open, high, low, close, volume)`` rows into at most
+    ``max_points`` candles, keeping each column's original type."""
+    if len(rows) <= max_points:
+        return [tuple(r) for r in rows]
+    try:
+        from ml.downsample import ohlc_buckets
+
+        b = ohlc_buckets([float(r[2]) for r in rows], [float(r[3]) for r in rows], max_points)
+    except ImportError as exc:
+        raise _unavailable(exc) from exc
+    return [
+        (
+            rows[start][0],
+            rows[start][1],
+            rows[hi][2],
+            rows[lo][3],
+            rows[end - 1][4],
+            sum(r[5] for r in rows[start:end]),
+        )
+        for start, end, hi, lo in zip(b.starts, b.ends, b.high_idx, b.low_idx, strict=True)
+    ]
@@ -11,9 +11,15 @@
   Writes the new forecast to the ``forecasts`` table and returns it. Both
   SARIMAX and Holt-Winters fit in under a second on the modern-daily-bar
   volume we carry, so we don't need a background-job indirection here.
+  Concurrent retrains of one symbol and engine (a double click, two open
+  windows) share a single fit via ``sidecar.single_flight``.
 - ``POST /api/forecast/retrain-all/`` — kick off a synchronous full-batch
   retrain across every active asset. Per-asset failures are swallowed by
   the underlying ``ml.jobs.train_forecasts``; the response reports counts.
+- ``GET /api/forecast/{symbol}/backtest/`` — rolling-origin backtest of
+  one or more engines over the asset's stored history (``ml.backtest``).
+  Cached per data fingerprint, so repeat calls are cheap until a new bar
+  lands.
 - ``DELETE /api/forecast/`` — wipe every stored forecast (used after the
   user switches engines and wants a clean slate). Doesn't touch
   ``price_points`` / ``articles`` — only the ``forecasts`` table.
@@ -35,6 +41,16 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from ml.accuracy import AccuracyReport, EngineAccuracy, compute_accuracy
+from ml.backtest import (
+    DEFAULT_MAX_ORIGINS,
+    DEFAULT_STEP_DAYS,
+    MAX_ORIGINS_CAP,
+    BacktestError,
+    BacktestReport,
+    EngineBacktest,
+    backtest_symbol,
+)
+from ml.engine_selection import AUTO_ENGINE
 from ml.forecast import (
     ENGINES,
     ForecastEngine,
@@ -55,6 +71,9 @@ from ml.persistence import (
     load_forecast_by_symbol,
 )
 from ml.volatility import VolatilityReport, compute_volatility
+from sidecar.api.conditional import asset_tags, versioned
+from sidecar.response_cache import response_cache
+from sidecar.single_flight import single_flight
 
 router = APIRouter(prefix="/api/forecast", tags=["forecast"])
 
@@ -146,6 +165,40 @@ class AccuracyReportModel(BaseModel):
     actuals_available: int
 
 
+class EngineBacktestModel(BaseModel):
+    """Wire shape for ``ml.backtest.EngineBacktest``."""
+
+    engine: str
+    origins: int
+    evaluable_points: int
+    failures: int
+    mape: float | None
+    rmse: float | None
+    directional: float | None
+    fit_seconds: float
+
+
+class BacktestReportModel(BaseModel):
+    """Wire shape for ``ml.backtest.BacktestReport``.
+
+    ``per_engine`` is sorted by MAPE ascending (best engine first), same as
+    the live accuracy report; ``naive`` is the no-change baseline over the
+    same origins. ``cached`` is true when the report was served from the
+    per-fingerprint cache without refitting.
+    """
+
+    symbol: str
+    horizon_days: int
+    step_days: int
+    origins: int
+    training_rows: int
+    per_engine: list[EngineBacktestModel]
+    naive: EngineBacktestModel | None
+    fingerprint: str
+    elapsed_seconds: float
+    cached: bool
+
+
 class VolatilityReportModel(BaseModel):
     """Wire shape for ``ml.volatility.VolatilityReport``.
 
@@ -201,7 +254,11 @@ def _to_response(symbol: str, asset_id: int, r: ForecastResult) -> ForecastRespo
 # ---------------------------------------------------------------------------
 
 
-@router.get("/", response_model=ForecastAvailabilityModel)
+@router.get(
+    "/",
+    response_model=ForecastAvailabilityModel,
+    dependencies=[versioned("forecasts", "prices")],
+)
 def list_forecast_availability() -> ForecastAvailabilityModel:
     """Return the symbols eligible to forecast + those that already have one,
     plus the canonical list of engines the backend can fit.
@@ -256,7 +313,11 @@ def _validate_engine_param(raw: str | None) -> ForecastEngine | None:
     return raw
 
 
-@router.get("/{symbol}/", response_model=ForecastResponseModel)
+@router.get(
+    "/{symbol}/",
+    response_model=ForecastResponseModel,
+    dependencies=[versioned("forecasts", "prices", "settings", per_asset="symbol")],
+)
 def get_forecast(symbol: str) -> ForecastResponseModel:
     """Return the latest stored forecast for ``symbol``.
 
@@ -281,13 +342,17 @@ def retrain_forecast(
 ) -> ForecastResponseModel:
     """Fit a forecast synchronously and persist the result. Returns the new forecast.
 
-    ``engine`` accepts ``"sarimax"`` or ``"holt_winters"``; omit the query
+    ``engine`` accepts any of ``ml.forecast.ENGINES``; omit the query
     parameter to defer to the user's Settings choice.
     """
     sym = symbol.strip().upper()
     chosen = _validate_engine_param(engine)
     try:
-        result = train_one(sym, engine=chosen)
+        # A retrain that is already running for the same symbol and engine
+        # is joined, not repeated: one fit, one persisted snapshot.
+        result = single_flight.do(
+            "forecast.retrain", (sym, chosen), lambda: train_one(sym, engine=chosen)
+        )
     except UnknownSymbolError as exc:
         raise HTTPException(status_code=404, detail=str(exc)) from exc
     except InsufficientDataError as exc:
@@ -329,13 +394,17 @@ def retrain_all_forecasts(
     (successes), and `skipped` (the difference). UI shows the counts with
     a hint to check the asset detail pages for which ones bombed.
 
-    ``engine`` accepts ``"sarimax"`` or ``"holt_winters"`` (omit to use
-    the user's Settings default).
+    ``engine`` accepts any of ``ml.forecast.ENGINES`` (omit to use the
+    user's Settings default, which may be ``"auto"`` — each asset's own
+    winning engine). Batch engines refit every asset in one vectorized pass.
     """
     chosen = _validate_engine_param(engine)
     eligible = list(symbols_eligible_for_forecast())
     requested = len(eligible)
-    trained = train_forecasts(engine=chosen)
+    # ``auto_budget_seconds=0``: in "auto" mode fit each asset's winner but
+    # leave engine re-scoring and challenger fits to the weekly job — this
+    # endpoint is synchronous.
+    trained = train_forecasts(engine=chosen, auto_budget_seconds=0)
     return RetrainAllResponse(
         requested=requested,
         trained=trained,
@@ -357,7 +426,9 @@ def _resolved_default_engine() -> str:
         from sidecar.services.settings import load_effective_config
 
         configured = load_effective_config().get("forecast.default_engine")
-        if isinstance(configured, str) and configured in ENGINES:
+        if isinstance(configured, str) and (
+            configured in ENGINES or configured == AUTO_ENGINE
+        ):
             return configured
     except Exception:  # pragma: no cover — defensive
         pass
@@ -412,7 +483,11 @@ def _accuracy_to_model(report: AccuracyReport) -> AccuracyReportModel:
     )
 
 
-@router.get("/{symbol}/accuracy/", response_model=AccuracyReportModel)
+@router.get(
+    "/{symbol}/accuracy/",
+    response_model=AccuracyReportModel,
+    dependencies=[versioned("forecasts", "prices", per_asset="symbol")],
+)
 def get_forecast_accuracy(
     symbol: str,
     days: Annotated[int, Query(ge=1, le=365)] = 30,
@@ -429,8 +504,88 @@ def get_forecast_accuracy(
     can render a "no accuracy data yet" hint without a separate
     error-handling branch.
     """
-    report = compute_accuracy(symbol, days=days)
-    return _accuracy_to_model(report)
+    return response_cache.get_or_compute(
+        "forecast.accuracy",
+        (symbol.upper(), days),
+        [("forecasts", None), *asset_tags("prices", [symbol])],
+        lambda: _accuracy_to_model(compute_accuracy(symbol, days=days)),
+    )
+
+
+def _engine_backtest_to_model(eb: EngineBacktest) -> EngineBacktestModel:
+    return EngineBacktestModel(
+        engine=eb.engine,
+        origins=eb.origins,
+        evaluable_points=eb.evaluable_points,
+        failures=eb.failures,
+        mape=eb.mape,
+        rmse=eb.rmse,
+        directional=eb.directional,
+        fit_seconds=eb.fit_seconds,
+    )
+
+
+def _backtest_to_model(report: BacktestReport) -> BacktestReportModel:
+    return BacktestReportModel(
+        symbol=report.symbol,
+        horizon_days=report.horizon_days,
+        step_days=report.step_days,
+        origins=report.origins,
+        training_rows=report.training_rows,
+        per_engine=[_engine_backtest_to_model(e) for e in report.per_engine],
+        naive=(
+            _engine_backtest_to_model(report.naive)
+            if report.naive is not None
+            else None
+        ),
+        fingerprint=report.fingerprint,
+        elapsed_seconds=report.elapsed_seconds,
+        cached=report.cached,
+    )
+
+
+@router.get(
+    "/{symbol}/backtest/",
+    response_model=BacktestReportModel,
+    dependencies=[versioned("prices", "settings", per_asset="symbol")],
+)
+def get_forecast_backtest(
+    symbol: str,
+    engines: Annotated[str | None, Query(max_length=200)] = None,
+    horizon_days: Annotated[int, Query(ge=1, le=90)] = 14,
+    step_days: Annotated[int, Query(ge=1, le=90)] = DEFAULT_STEP_DAYS,
+    max_origins: Annotated[int, Query(ge=1, le=MAX_ORIGINS_CAP)] = DEFAULT_MAX_ORIGINS,
+) -> BacktestReportModel:
+    """Rolling-origin backtest for ``symbol``.
+
+    ``engines`` is a comma-separated subset of ``ENGINES`` (default: all).
+    Each origin refits on the closes before it, so this is synchronous and
+    can take a few seconds for the statsmodels engines on long histories —
+    the vectorized engines are effectively free. Assets too short for a
+    single origin return a report with ``origins == 0``.
+
+    404 for an unknown symbol; 422 for an unknown engine.
+    """
+    engine_list = (
+        [e.strip() for e in engines.split(",") if e.strip()]
+        if engines
+        else list(ENGINES)
+    )
+    try:
+        report = backtest_symbol(
+            symbol,
+            engines=engine_list,
+            horizon_days=horizon_days,
+            step_days=step_days,
+            max_origins=max_origins,
+        )
+    except BacktestError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
+    if report is None:
+        raise HTTPException(
+            status_code=404, detail=f"unknown symbol {symbol.upper()}"
+        )
+    return _backtest_to_model(report)
 
 
 def _volatility_to_model(report: VolatilityReport) -> VolatilityReportModel:
@@ -448,7 +603,11 @@ def _volatility_to_model(report: VolatilityReport) -> VolatilityReportModel:
     )
 
 
-@router.get("/{symbol}/volatility/", response_model=VolatilityReportModel)
+@router.get(
+    "/{symbol}/volatility/",
+    response_model=VolatilityReportModel,
+    dependencies=[versioned("prices", per_asset="symbol")],
+)
 def get_volatility(
     symbol: str,
     lookback_days: Annotated[int, Query(ge=7, le=365)] = 30,
@@ -464,5 +623,11 @@ def get_volatility(
     No 404 — unknown symbols return an empty report (parallel to the
     accuracy endpoint) so the UI keeps a single render path.
     """
-    report = compute_volatility(symbol, lookback_days=lookback_days)
-    return _volatility_to_model(report)
+    return response_cache.get_or_compute(
+        "forecast.volatility",
+        (symbol.upper(), lookback_days),
+        asset_tags("prices", [symbol]),
+        lambda: _volatility_to_model(
+            compute_volatility(symbol, lookback_days=lookback_days)
+        ),
+    )
@@ -3,16 +3,42 @@ from __future__ import annotations
 from fastapi import APIRouter
 from pydantic import BaseModel
 
+from ml.warmup import notify_serving, warmup_status
 from sidecar import __version__
 
 router = APIRouter(prefix="/api", tags=["health"])
 
 
+class WarmupModel(BaseModel):
+    """ML warm-up readiness — see ``ml.warmup``.
+
+    ``state`` is ``"disabled"`` unless ``FINTRACK_ENABLE_ML_WARMUP`` is on.
+    ``components`` maps ``forecast`` / ``sentiment`` to ``"pending"``,
+    ``"ready"`` or ``"unavailable"`` (ML deps not installed).
+    """
+
+    state: str
+    components: dict[str, str]
+    elapsed_ms: float | None
+
+
 class HealthResponse(BaseModel):
     status: str
     version: str
+    warmup: WarmupModel
 
 
 @router.get("/health/", response_model=HealthResponse)
 def health() -> HealthResponse:
-    return HealthResponse(status="ok", version=__version__)
+    # First answered probe releases the warm-up thread (no-op afterwards).
+    notify_serving()
+    status = warmup_status()
+    return HealthResponse(
+        status="ok",
+        version=__version__,
+        warmup=WarmupModel(
+            state=status.state,
+            components=dict(status.components),
+            elapsed_ms=status.elapsed_ms,
+        ),
+    )
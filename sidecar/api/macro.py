@@ -2,12 +2,24 @@ from __future__ import annotations
 
 from datetime import date
 from decimal import Decimal
-from typing import Annotated
+from operator import itemgetter
+from typing import Annotated, Any
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import select
-
+from sqlalchemy import Float, Integer, cast, func, select
+
+from sidecar.api.conditional import versioned
+from sidecar.api.downsampling import MaxPoints, lttb_rows
+from sidecar.api.fast_json import (
+    DecimalFormat,
+    WireFormat,
+    binary_response,
+    columns_of,
+    decimal_encoder,
+    delta_encode,
+    fast_json,
+)
 from sidecar.db.engine import session_scope
 from sidecar.db.models import MacroDataPoint, MacroIndicator
 
@@ -39,7 +51,11 @@ class MacroSeriesOut(BaseModel):
     points: list[MacroDataPointOut]
 
 
-@router.get("/", response_model=list[MacroIndicatorOut])
+@router.get(
+    "/",
+    response_model=list[MacroIndicatorOut],
+    dependencies=[versioned("macro")],
+)
 def list_indicators(active_only: bool = True) -> list[MacroIndicatorOut]:
     with session_scope() as s:
         stmt = select(MacroIndicator).order_by(MacroIndicator.series_id)
@@ -49,13 +65,33 @@ def list_indicators(active_only: bool = True) -> list[MacroIndicatorOut]:
         return [MacroIndicatorOut.model_validate(r) for r in rows]
 
 
-@router.get("/{series_id}/", response_model=MacroSeriesOut)
+# Column order of ``format=columnar`` / ``format=binary``; ``t`` is the
+# observation date as epoch seconds (00:00 UTC).
+MACRO_COLUMNS = ("t", "value")
+
+
+@router.get(
+    "/{series_id}/",
+    response_model=MacroSeriesOut,
+    dependencies=[versioned("macro")],
+)
 def get_series(
     series_id: str,
+    response: Response,
     start: Annotated[date | None, Query(alias="from")] = None,
     end: Annotated[date | None, Query(alias="to")] = None,
     limit: Annotated[int, Query(ge=1, le=10000)] = 500,
-) -> MacroSeriesOut:
+    decimals: Annotated[DecimalFormat, Query()] = "string",
+    fmt: Annotated[WireFormat, Query(alias="format")] = "rows",
+    max_points: MaxPoints = None,
+) -> Response:
+    """Observations for ``series_id``, oldest first (the newest ``limit``).
+
+    ``format=columnar`` returns ``{series_id, count, t, value}`` with one
+    array per field (``t`` delta-encoded); ``format=binary`` the same
+    ``MACRO_COLUMNS`` as float64 typed arrays (see ``sidecar.api.fast_json``).
+    ``max_points`` keeps at most that many observations, picked by LTTB.
+    """
     series_id_up = series_id.upper()
     with session_scope() as s:
         indicator = s.execute(
@@ -64,14 +100,36 @@ def get_series(
         if indicator is None:
             raise HTTPException(status_code=404, detail=f"Unknown series: {series_id_up}")
 
-        stmt = select(MacroDataPoint).where(MacroDataPoint.indicator_id == indicator.id)
+        if fmt == "rows":
+            cols: tuple[Any, ...] = (MacroDataPoint.date, MacroDataPoint.value)
+        else:
+            cols = (
+                cast(func.strftime("%s", MacroDataPoint.date), Integer),
+                cast(MacroDataPoint.value, Float),
+            )
+        stmt = select(*cols).where(MacroDataPoint.indicator_id == indicator.id)
         if start is not None:
             stmt = stmt.where(MacroDataPoint.date >= start)
         if end is not None:
             stmt = stmt.where(MacroDataPoint.date <= end)
         stmt = stmt.order_by(MacroDataPoint.date.desc()).limit(limit)
-
-        rows = list(s.execute(stmt).scalars().all())
-        rows.reverse()
-        points = [MacroDataPointOut.model_validate(r) for r in rows]
-        return MacroSeriesOut(series_id=series_id_up, count=len(points), points=points)
+        # Core execution: plain rows, no ORM result processing.
+        rows: list[Any] = list(s.connection().execute(stmt).all())
+    rows.reverse()
+    if max_points is not None:
+        rows = lttb_rows(rows, max_points, x=itemgetter(0), y=itemgetter(1))
+
+    if fmt == "binary":
+        return binary_response(columns_of(rows, len(MACRO_COLUMNS)), response)
+    if fmt == "columnar":
+        body: dict[str, Any] = {"series_id": series_id_up, "count": len(rows)}
+        columns = columns_of(rows, len(MACRO_COLUMNS))
+        columns[0] = delta_encode(columns[0])
+        body.update(zip(MACRO_COLUMNS, columns, strict=True))
+        return fast_json(body, response)
+
+    dec = decimal_encoder(decimals)
+    points = [{"date": d, "value": dec(v)} for d, v in rows]
+    return fast_json(
+        {"series_id": series_id_up, "count": len(points), "points": points}, response
+    )
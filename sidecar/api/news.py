@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel, ConfigDict
 from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 
+from sidecar.api.conditional import versioned
+from sidecar.api.fast_json import fast_json
 from sidecar.db.engine import session_scope
 from sidecar.db.models import Article, ArticleAsset, Asset
+from sidecar.response_cache import response_cache
 
 router = APIRouter(prefix="/api/news", tags=["news"])
 
@@ -102,14 +106,19 @@ class ScoreNowResponse(BaseModel):
     scored: int
 
 
-@router.get("/", response_model=ArticleListOut)
+@router.get(
+    "/",
+    response_model=ArticleListOut,
+    dependencies=[versioned("news")],
+)
 def list_news(
+    response: Response,
     symbol: Annotated[str | None, Query()] = None,
     start: Annotated[datetime | None, Query(alias="from")] = None,
     end: Annotated[datetime | None, Query(alias="to")] = None,
     sentiment: Annotated[SentimentBucket | None, Query()] = None,
     limit: Annotated[int, Query(ge=1, le=500)] = 50,
-) -> ArticleListOut:
+) -> Response:
     """List recent articles, newest first.
 
     Optional filters:
@@ -120,7 +129,7 @@ def list_news(
       "neutral" doesn't accidentally include backlog rows).
     """
     with session_scope() as s:
-        stmt = select(Article)
+        asset_id = None
         if symbol is not None:
             symbol_upper = symbol.upper()
             asset = s.execute(
@@ -130,62 +139,87 @@ def list_news(
                 raise HTTPException(
                     status_code=404, detail=f"Unknown symbol: {symbol_upper}"
                 )
-            stmt = stmt.join(
-                ArticleAsset, ArticleAsset.article_id == Article.id
-            ).where(ArticleAsset.asset_id == asset.id)
-
-        start_n = _to_naive_utc(start)
-        end_n = _to_naive_utc(end)
-        if start_n is not None:
-            stmt = stmt.where(Article.published_at >= start_n)
-        if end_n is not None:
-            stmt = stmt.where(Article.published_at <= end_n)
-
-        if sentiment == "positive":
-            stmt = stmt.where(Article.sentiment >= POSITIVE_THRESHOLD)
-        elif sentiment == "negative":
-            stmt = stmt.where(Article.sentiment <= NEGATIVE_THRESHOLD)
-        elif sentiment == "neutral":
-            stmt = stmt.where(
-                Article.sentiment.is_not(None),
-                Article.sentiment > NEGATIVE_THRESHOLD,
-                Article.sentiment < POSITIVE_THRESHOLD,
-            )
+            asset_id = asset.id
+        out = _article_rows(
+            s,
+            asset_id=asset_id,
+            start=_to_naive_utc(start),
+            end=_to_naive_utc(end),
+            sentiment=sentiment,
+            limit=limit,
+        )
+    return fast_json({"count": len(out), "articles": out}, response)
+
+
+def _article_rows(
+    s: Session,
+    *,
+    asset_id: int | None,
+    limit: int,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    sentiment: SentimentBucket | None = None,
+) -> list[dict[str, Any]]:
+    """``ArticleOut``-shaped dicts, newest first (see ``list_news``)."""
+    stmt = select(Article)
+    if asset_id is not None:
+        stmt = stmt.join(
+            ArticleAsset, ArticleAsset.article_id == Article.id
+        ).where(ArticleAsset.asset_id == asset_id)
+
+    if start is not None:
+        stmt = stmt.where(Article.published_at >= start)
+    if end is not None:
+        stmt = stmt.where(Article.published_at <= end)
+
+    if sentiment == "positive":
+        stmt = stmt.where(Article.sentiment >= POSITIVE_THRESHOLD)
+    elif sentiment == "negative":
+        stmt = stmt.where(Article.sentiment <= NEGATIVE_THRESHOLD)
+    elif sentiment == "neutral":
+        stmt = stmt.where(
+            Article.sentiment.is_not(None),
+            Article.sentiment > NEGATIVE_THRESHOLD,
+            Article.sentiment < POSITIVE_THRESHOLD,
+        )
 
-        stmt = stmt.order_by(Article.published_at.desc()).limit(limit)
-
-        articles = list(s.execute(stmt).scalars().unique().all())
-        if not articles:
-            return ArticleListOut(count=0, articles=[])
-
-        # Hydrate associated symbols in one query (article_id -> [symbol...])
-        ids = [a.id for a in articles]
-        assoc = s.execute(
-            select(ArticleAsset.article_id, Asset.symbol)
-            .join(Asset, Asset.id == ArticleAsset.asset_id)
-            .where(ArticleAsset.article_id.in_(ids))
-        ).all()
-        symbols_by_article: dict[int, list[str]] = {}
-        for article_id, sym in assoc:
-            symbols_by_article.setdefault(article_id, []).append(sym)
-
-        out = [
-            ArticleOut(
-                id=a.id,
-                url=a.url,
-                headline=a.headline,
-                source=a.source,
-                published_at=a.published_at,
-                summary=a.summary,
-                sentiment=a.sentiment,
-                symbols=sorted(symbols_by_article.get(a.id, [])),
-            )
-            for a in articles
-        ]
-        return ArticleListOut(count=len(out), articles=out)
+    stmt = stmt.order_by(Article.published_at.desc()).limit(limit)
+
+    articles = list(s.execute(stmt).scalars().unique().all())
+    if not articles:
+        return []
+
+    # Hydrate associated symbols in one query (article_id -> [symbol...])
+    ids = [a.id for a in articles]
+    assoc = s.execute(
+        select(ArticleAsset.article_id, Asset.symbol)
+        .join(Asset, Asset.id == ArticleAsset.asset_id)
+        .where(ArticleAsset.article_id.in_(ids))
+    ).all()
+    symbols_by_article: dict[int, list[str]] = {}
+    for article_id, sym in assoc:
+        symbols_by_article.setdefault(article_id, []).append(sym)
+
+    return [
+        {
+            "id": a.id,
+            "url": a.url,
+            "headline": a.headline,
+            "source": a.source,
+            "published_at": a.published_at,
+            "summary": a.summary,
+            "sentiment": a.sentiment,
+            "symbols": sorted(symbols_by_article.get(a.id, [])),
+        }
+        for a in articles
+    ]
 
 
-@router.get("/sentiment-summary/{symbol}/", response_model=SentimentSummaryOut)
+@router.get(
+    "/sentiment-summary/{symbol}/",
+    response_model=SentimentSummaryOut,
+    dependencies=[versioned("news")],
+)
 def sentiment_summary(
     symbol: str,
     days: Annotated[int, Query(ge=1, le=365)] = 7,
@@ -198,7 +232,6 @@ def sentiment_summary(
     every render of the AssetDetail sentiment panel.
     """
     symbol_upper = symbol.upper()
-    cutoff = datetime.now(UTC) - timedelta(days=days)
 
     with session_scope() as s:
         asset = s.execute(
@@ -208,62 +241,67 @@ def sentiment_summary(
             raise HTTPException(
                 status_code=404, detail=f"Unknown symbol: {symbol_upper}"
             )
+        return _sentiment_summary(s, asset, days)
 
-        # One aggregate query for the whole rollup. `func.sum` over a
-        # boolean-cast-to-int gives us per-bucket counts inline.
-        positive_case = func.coalesce(
-            func.sum(
-                func.iif(Article.sentiment >= POSITIVE_THRESHOLD, 1, 0)
-            ),
-            0,
-        )
-        negative_case = func.coalesce(
-            func.sum(
-                func.iif(Article.sentiment <= NEGATIVE_THRESHOLD, 1, 0)
-            ),
-            0,
-        )
-        scored_case = func.coalesce(
-            func.sum(func.iif(Article.sentiment.is_not(None), 1, 0)),
-            0,
-        )
 
-        row = s.execute(
-            select(
-                func.count(Article.id),
-                scored_case,
-                positive_case,
-                negative_case,
-                func.avg(Article.sentiment),
-            )
-            .join(ArticleAsset, ArticleAsset.article_id == Article.id)
-            .where(
-                ArticleAsset.asset_id == asset.id,
-                Article.published_at >= cutoff,
-            )
-        ).one()
-
-        total = int(row[0] or 0)
-        scored = int(row[1] or 0)
-        positive = int(row[2] or 0)
-        negative = int(row[3] or 0)
-        mean_raw = row[4]
-        mean = float(mean_raw) if mean_raw is not None else None
-        # Neutrals = scored - positive - negative (saves another SUM/CASE in SQL).
-        neutral = max(scored - positive - negative, 0)
-        unscored = max(total - scored, 0)
-
-        return SentimentSummaryOut(
-            symbol=symbol_upper,
-            days=days,
-            total=total,
-            scored=scored,
-            unscored=unscored,
-            positive=positive,
-            neutral=neutral,
-            negative=negative,
-            mean=mean,
+def _sentiment_summary(s: Session, asset: Asset, days: int) -> SentimentSummaryOut:
+    cutoff = datetime.now(UTC) - timedelta(days=days)
+
+    # One aggregate query for the whole rollup. `func.sum` over a
+    # boolean-cast-to-int gives us per-bucket counts inline.
+    positive_case = func.coalesce(
+        func.sum(
+            func.iif(Article.sentiment >= POSITIVE_THRESHOLD, 1, 0)
+        ),
+        0,
+    )
+    negative_case = func.coalesce(
+        func.sum(
+            func.iif(Article.sentiment <= NEGATIVE_THRESHOLD, 1, 0)
+        ),
+        0,
+    )
+    scored_case = func.coalesce(
+        func.sum(func.iif(Article.sentiment.is_not(None), 1, 0)),
+        0,
+    )
+
+    row = s.execute(
+        select(
+            func.count(Article.id),
+            scored_case,
+            positive_case,
+            negative_case,
+            func.avg(Article.sentiment),
+        )
+        .join(ArticleAsset, ArticleAsset.article_id == Article.id)
+        .where(
+            ArticleAsset.asset_id == asset.id,
+            Article.published_at >= cutoff,
         )
+    ).one()
+
+    total = int(row[0] or 0)
+    scored = int(row[1] or 0)
+    positive = int(row[2] or 0)
+    negative = int(row[3] or 0)
+    mean_raw = row[4]
+    mean = float(mean_raw) if mean_raw is not None else None
+    # Neutrals = scored - positive - negative (saves another SUM/CASE in SQL).
+    neutral = max(scored - positive - negative, 0)
+    unscored = max(total - scored, 0)
+
+    return SentimentSummaryOut(
+        symbol=asset.symbol,
+        days=days,
+        total=total,
+        scored=scored,
+        unscored=unscored,
+        positive=positive,
+        neutral=neutral,
+        negative=negative,
+        mean=mean,
+    )
 
 
 @router.post("/score-now/", response_model=ScoreNowResponse)
@@ -292,7 +330,9 @@ def score_now() -> ScoreNowResponse:
 
 
 @router.get(
-    "/sentiment-timeseries/{symbol}/", response_model=SentimentTimeseriesOut
+    "/sentiment-timeseries/{symbol}/",
+    response_model=SentimentTimeseriesOut,
+    dependencies=[versioned("news")],
 )
 def sentiment_timeseries(
     symbol: str,
@@ -306,8 +346,15 @@ def sentiment_timeseries(
     interpolation rather than rendering misleading zero values.
     """
     symbol_upper = symbol.upper()
-    cutoff = datetime.now(UTC) - timedelta(days=days)
+    return response_cache.get_or_compute(
+        "news.sentiment_timeseries",
+        (symbol_upper, days),
+        [("news", None)],
+        lambda: _sentiment_timeseries(symbol_upper, days),
+    )
+
 
+def _sentiment_timeseries(symbol_upper: str, days: int) -> SentimentTimeseriesOut:
     with session_scope() as s:
         asset = s.execute(
             select(Asset).where(Asset.symbol == symbol_upper)
@@ -316,36 +363,41 @@ def sentiment_timeseries(
             raise HTTPException(
                 status_code=404, detail=f"Unknown symbol: {symbol_upper}"
             )
+        return _sentiment_points(s, asset, days)
 
-        # SQLite's `date(...)` returns ``YYYY-MM-DD`` directly — no strftime
-        # acrobatics needed. Group on that, average sentiment, count
-        # non-null rows. ORDER BY date so the UI doesn't have to sort.
-        day_col = func.date(Article.published_at).label("day")
-        rows = s.execute(
-            select(
-                day_col,
-                func.avg(Article.sentiment).label("mean"),
-                func.count(Article.id).label("count"),
-            )
-            .join(ArticleAsset, ArticleAsset.article_id == Article.id)
-            .where(
-                ArticleAsset.asset_id == asset.id,
-                Article.published_at >= cutoff,
-                Article.sentiment.is_not(None),
-            )
-            .group_by(day_col)
-            .order_by(day_col.asc())
-        ).all()
-
-        points = [
-            SentimentTimeseriesPoint(
-                date=str(row[0]),
-                mean=float(row[1]),
-                count=int(row[2]),
-            )
-            for row in rows
-        ]
 
-        return SentimentTimeseriesOut(
-            symbol=symbol_upper, days=days, points=points
+def _sentiment_points(s: Session, asset: Asset, days: int) -> SentimentTimeseriesOut:
+    cutoff = datetime.now(UTC) - timedelta(days=days)
+
+    # SQLite's `date(...)` returns ``YYYY-MM-DD`` directly — no strftime
+    # acrobatics needed. Group on that, average sentiment, count
+    # non-null rows. ORDER BY date so the UI doesn't have to sort.
+    day_col = func.date(Article.published_at).label("day")
+    rows = s.execute(
+        select(
+            day_col,
+            func.avg(Article.sentiment).label("mean"),
+            func.count(Article.id).label("count"),
         )
+        .join(ArticleAsset, ArticleAsset.article_id == Article.id)
+        .where(
+            ArticleAsset.asset_id == asset.id,
+            Article.published_at >= cutoff,
+            Article.sentiment.is_not(None),
+        )
+        .group_by(day_col)
+        .order_by(day_col.asc())
+    ).all()
+
+    points = [
+        SentimentTimeseriesPoint(
+            date=str(row[0]),
+            mean=float(row[1]),
+            count=int(row[2]),
+        )
+        for row in rows
+    ]
+
+    return SentimentTimeseriesOut(
+        symbol=asset.symbol, days=days, points=points
+    )
@@ -16,16 +16,20 @@ import csv
 import io
 from datetime import date, datetime
 from decimal import Decimal
+from operator import attrgetter
 from typing import Annotated, Literal
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
+from sidecar.api.conditional import versioned
+from sidecar.api.downsampling import MaxPoints, lttb_rows
+from sidecar.api.fast_json import DecimalFormat, decimal_encoder, dumps, fast_json
+from sidecar.response_cache import response_cache
 from sidecar.services.portfolio import (
     AssetNotFoundError,
     ImportResult,
-    PerformancePoint,
     PortfolioError,
     TransactionNotFoundError,
     TransactionOut,
@@ -172,14 +176,35 @@ def _txn_to_model(t: TransactionOut) -> TransactionOutModel:
 # ---------------------------------------------------------------------------
 
 
-@router.get("/transactions/", response_model=TransactionListOut)
+@router.get(
+    "/transactions/",
+    response_model=TransactionListOut,
+    dependencies=[versioned("portfolio")],
+)
 def list_transactions_route(
+    response: Response,
     asset_id: Annotated[int | None, Query()] = None,
-) -> TransactionListOut:
+    decimals: Annotated[DecimalFormat, Query()] = "string",
+) -> Response:
     txns = list_transactions(asset_id=asset_id)
-    return TransactionListOut(
-        count=len(txns), transactions=[_txn_to_model(t) for t in txns]
-    )
+    dec = decimal_encoder(decimals)
+    rows = [
+        {
+            "id": t.id,
+            "asset_id": t.asset_id,
+            "symbol": t.symbol,
+            "asset_name": t.asset_name,
+            "transaction_type": t.transaction_type.value,
+            "quantity": dec(t.quantity),
+            "price_per_unit": dec(t.price_per_unit),
+            "transaction_date": t.transaction_date,
+            "fee": dec(t.fee),
+            "notes": t.notes,
+            "created_at": t.created_at,
+        }
+        for t in txns
+    ]
+    return fast_json({"count": len(rows), "transactions": rows}, response)
 
 
 @router.get("/transactions/export.csv")
@@ -234,7 +259,11 @@ def export_transactions_csv() -> StreamingResponse:
     )
 
 
-@router.get("/transactions/{transaction_id}/", response_model=TransactionOutModel)
+@router.get(
+    "/transactions/{transaction_id}/",
+    response_model=TransactionOutModel,
+    dependencies=[versioned("portfolio")],
+)
 def get_transaction_route(transaction_id: int) -> TransactionOutModel:
     try:
         return _txn_to_model(get_transaction(transaction_id))
@@ -352,7 +381,11 @@ def delete_transaction_route(transaction_id: int) -> None:
 # ---------------------------------------------------------------------------
 
 
-@router.get("/positions/", response_model=PositionsOut)
+@router.get(
+    "/positions/",
+    response_model=PositionsOut,
+    dependencies=[versioned("portfolio", "prices")],
+)
 def list_positions_route() -> PositionsOut:
     positions = list_positions()
     return PositionsOut(
@@ -378,28 +411,58 @@ def list_positions_route() -> PositionsOut:
     )
 
 
-@router.get("/performance/", response_model=PerformanceOut)
+@router.get(
+    "/performance/",
+    response_model=PerformanceOut,
+    dependencies=[versioned("portfolio", "prices")],
+)
 def performance_route(
+    response: Response,
     lookback_days: Annotated[int, Query(ge=1, le=3650)] = 90,
-) -> PerformanceOut:
-    """Daily portfolio-value timeseries over the last ``lookback_days``."""
-    points = compute_performance(lookback_days=lookback_days)
-    return PerformanceOut(
-        lookback_days=lookback_days,
-        points=[_perf_to_model(p) for p in points],
-    )
+    decimals: Annotated[DecimalFormat, Query()] = "string",
+    max_points: MaxPoints = None,
+) -> Response:
+    """Daily portfolio-value timeseries over the last ``lookback_days``.
 
+    ``max_points`` keeps at most that many days, picked by LTTB on ``value``.
+    """
 
-def _perf_to_model(p: PerformancePoint) -> PerformancePointModel:
-    return PerformancePointModel(
-        date=p.date,
-        value=p.value,
-        cost_basis=p.cost_basis,
-        realized_pl=p.realized_pl,
+    def compute() -> bytes:
+        dec = decimal_encoder(decimals)
+        points = compute_performance(lookback_days=lookback_days)
+        if max_points is not None:
+            points = lttb_rows(
+                points, max_points, x=attrgetter("date"), y=attrgetter("value")
+            )
+        return dumps(
+            {
+                "lookback_days": lookback_days,
+                "points": [
+                    {
+                        "date": p.date,
+                        "value": dec(p.value),
+                        "cost_basis": dec(p.cost_basis),
+                        "realized_pl": dec(p.realized_pl),
+                    }
+                    for p in points
+                ],
+            }
+        )
+
+    body = response_cache.get_or_compute(
+        "portfolio.performance",
+        (lookback_days, decimals, max_points),
+        [("portfolio", None), ("prices", None)],
+        compute,
     )
+    return fast_json(body, response)
 
 
-@router.get("/summary/", response_model=PortfolioSummaryOut)
+@router.get(
+    "/summary/",
+    response_model=PortfolioSummaryOut,
+    dependencies=[versioned("portfolio", "prices")],
+)
 def summary_route() -> PortfolioSummaryOut:
     s = compute_summary()
     return PortfolioSummaryOut(
@@ -1,15 +1,34 @@
 from __future__ import annotations
 
+import csv
+import io
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime
 from decimal import Decimal
-from typing import Annotated
+from operator import itemgetter
+from typing import Annotated, Any, Literal
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict
-from sqlalchemy import select
+from sqlalchemy import Float, Integer, cast, func, select
+from sqlalchemy.orm import Session
 
-from sidecar.db.engine import session_scope
+from sidecar.api.conditional import versioned
+from sidecar.api.downsampling import Downsample, MaxPoints, lttb_rows, ohlc_rows
+from sidecar.api.fast_json import (
+    DecimalFormat,
+    WireFormat,
+    binary_response,
+    columns_of,
+    decimal_encoder,
+    delta_encode,
+    dumps,
+    fast_json,
+)
+from sidecar.db.engine import read_snapshot, session_scope
 from sidecar.db.models import Asset, PricePoint
+from sidecar.ingest_sequence import current_ingest_seq
 
 router = APIRouter(prefix="/api/prices", tags=["prices"])
 
@@ -44,22 +63,346 @@ class PriceSeriesOut(BaseModel):
     symbol: str
     count: int
     points: list[PricePointOut]
+    # Keyset cursor for the next page (``after_ts`` requests only): the last
+    # bar's timestamp while pages come back full, null once exhausted.
+    next_after_ts: datetime | None = None
 
 
-@router.get("/{symbol}/", response_model=PriceSeriesOut)
+# Column order of ``format=columnar`` / ``format=binary``; ``t`` is epoch
+# seconds (UTC).
+PRICE_COLUMNS = ("t", "open", "high", "low", "close", "volume")
+
+
+def _resolve_assets(symbols: str | None) -> list[tuple[int, str]]:
+    """``(asset_id, symbol)`` for a comma-separated ``symbols`` list (every
+    asset when None), in symbol order; 404 on unknowns."""
+    with session_scope() as s:
+        stmt = select(Asset.id, Asset.symbol).order_by(Asset.symbol)
+        if symbols is None:
+            return [(aid, sym) for aid, sym in s.execute(stmt)]
+        wanted = {p.strip().upper() for p in symbols.split(",") if p.strip()}
+        found = [(aid, sym) for aid, sym in s.execute(stmt.where(Asset.symbol.in_(wanted)))]
+    missing = wanted - {sym for _, sym in found}
+    if missing:
+        raise HTTPException(
+            status_code=404, detail=f"Unknown symbols: {', '.join(sorted(missing))}"
+        )
+    return found
+
+
+def _recent_points(
+    s: Session, asset_id: int, interval: str, limit: int, decimals: DecimalFormat
+) -> list[dict[str, Any]]:
+    """The newest ``limit`` bars as ascending ``PricePointOut`` dicts."""
+    rows = s.connection().execute(
+        select(
+            PricePoint.timestamp,
+            PricePoint.open,
+            PricePoint.high,
+            PricePoint.low,
+            PricePoint.close,
+            PricePoint.volume,
+        )
+        .where(PricePoint.asset_id == asset_id, PricePoint.interval == interval)
+        .order_by(PricePoint.timestamp.desc())
+        .limit(limit)
+    ).all()
+    dec = decimal_encoder(decimals)
+    return [
+        {
+            "timestamp": ts,
+            "open": dec(o),
+            "high": dec(h),
+            "low": dec(lo),
+            "close": dec(c),
+            "volume": v,
+        }
+        for ts, o, h, lo, c, v in reversed(rows)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Streaming export
+# ---------------------------------------------------------------------------
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_COLUMNS = ("symbol", "timestamp", "open", "high", "low", "close", "volume")
+# Rows fetched from SQLite, encoded and sent per chunk.
+EXPORT_CHUNK_ROWS = 5000
+
+_EXPORT_MEDIA_TYPES: dict[ExportFormat, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _export_chunks(
+    assets: Sequence[tuple[int, str]],
+    interval: str,
+    start: datetime | None,
+    end: datetime | None,
+) -> Iterator[tuple[str, Sequence[Any]]]:
+    """``(symbol, rows)`` in chunks of at most ``EXPORT_CHUNK_ROWS`` bars.
+
+    One read transaction for the whole export (``read_snapshot``: a
+    consistent snapshot under WAL, without blocking ingests) and one
+    index-ordered query per asset, so SQLite never sorts. The cursor is
+    drained a chunk at a time: memory stays flat however many bars there
+    are.
+    """
+    with read_snapshot() as s:
+        conn = s.connection()
+        for asset_id, symbol in assets:
+            stmt = select(
+                PricePoint.timestamp,
+                PricePoint.open,
+                PricePoint.high,
+                PricePoint.low,
+                PricePoint.close,
+                PricePoint.volume,
+            ).where(PricePoint.asset_id == asset_id, PricePoint.interval == interval)
+            if start is not None:
+                stmt = stmt.where(PricePoint.timestamp >= start)
+            if end is not None:
+                stmt = stmt.where(PricePoint.timestamp <= end)
+            stmt = stmt.order_by(PricePoint.timestamp.asc()).execution_options(
+                yield_per=EXPORT_CHUNK_ROWS
+            )
+            for part in conn.execute(stmt).partitions():
+                yield symbol, part
+
+
+def _ndjson_body(
+    chunks: Iterator[tuple[str, Sequence[Any]]], decimals: DecimalFormat
+) -> Iterator[bytes]:
+    dec = decimal_encoder(decimals)
+    for symbol, rows in chunks:
+        yield b"".join(
+            dumps(
+                {
+                    "symbol": symbol,
+                    "timestamp": ts,
+                    "open": dec(o),
+                    "high": dec(h),
+                    "low": dec(lo),
+                    "close": dec(c),
+                    "volume": v,
+                }
+            )
+            + b"\n"
+            for ts, o, h, lo, c, v in rows
+        )
+
+
+def _csv_body(chunks: Iterator[tuple[str, Sequence[Any]]]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(EXPORT_COLUMNS)
+    for symbol, rows in chunks:
+        writer.writerows(
+            (symbol, ts.isoformat(), o, h, lo, c, v) for ts, o, h, lo, c, v in rows
+        )
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    # Header only: still a well-formed file.
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+@router.get("/export/")
+def export_prices(
+    symbols: Annotated[
+        str | None, Query(description="Comma-separated; every asset when omitted.")
+    ] = None,
+    start: Annotated[datetime | None, Query(alias="from")] = None,
+    end: Annotated[datetime | None, Query(alias="to")] = None,
+    interval: Annotated[str, Query(min_length=1, max_length=16)] = "5m",
+    fmt: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+    decimals: Annotated[DecimalFormat, Query()] = "string",
+) -> StreamingResponse:
+    """Stream every bar of ``symbols`` as NDJSON or CSV, oldest first per
+    symbol (symbols alphabetical).
+
+    No ``limit``: the body is generated chunk by chunk from an open cursor
+    (see ``_export_chunks``), so a million-bar export costs the same memory
+    as a thousand-bar one. Rows carry ``EXPORT_COLUMNS``; CSV writes decimals
+    as ``str(Decimal)``, NDJSON per ``decimals``.
+
+    Declared before ``/{symbol}/`` so the literal path wins. Not
+    ``versioned``: a streamed body has no ETag.
+    """
+    assets = _resolve_assets(symbols)
+    chunks = _export_chunks(assets, interval, _to_naive_utc(start), _to_naive_utc(end))
+    body = _csv_body(chunks) if fmt == "csv" else _ndjson_body(chunks, decimals)
+    headers = {}
+    if fmt == "csv":
+        filename = f"fintrack-prices-{interval}-{datetime.now().strftime('%Y%m%d')}.csv"
+        headers["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return StreamingResponse(body, media_type=_EXPORT_MEDIA_TYPES[fmt], headers=headers)
+
+
+# ---------------------------------------------------------------------------
+# Delta sync
+# ---------------------------------------------------------------------------
+
+
+class PriceChangesOut(BaseModel):
+    # High-water mark to send as ``since_version`` next time.
+    version: int
+    since_version: int | None
+    interval: str
+    # Symbol -> bars inserted after ``since_version``, ascending. Symbols
+    # without new bars are absent.
+    changes: dict[str, list[PricePointOut]]
+    # Symbols the client must reload in full (more than ``limit`` new bars,
+    # or a mark this database never issued).
+    resync: list[str]
+
+
+@router.get(
+    "/changes/",
+    response_model=PriceChangesOut,
+    dependencies=[versioned("prices")],
+)
+def price_changes(
+    response: Response,
+    since_version: Annotated[int | None, Query(ge=0)] = None,
+    symbols: Annotated[
+        str | None, Query(description="Comma-separated; every asset when omitted.")
+    ] = None,
+    interval: Annotated[str, Query(min_length=1, max_length=16)] = "5m",
+    limit: Annotated[int, Query(ge=1, le=10000)] = 500,
+    decimals: Annotated[DecimalFormat, Query()] = "string",
+) -> Response:
+    """Bars inserted since the client's high-water mark, for many symbols.
+
+    Protocol: read ``version`` (call without ``since_version``) *before*
+    the initial full load, then poll with ``since_version=<last version>``
+    and merge the returned bars by timestamp. Anything committed between
+    the probe and the load comes back once more; merging makes that
+    harmless, while the reverse order could lose bars.
+
+    Marks are insert-batch numbers (``sidecar.ingest_sequence``), persistent
+    and committed in order. Both queries are bounded by the ``version`` read
+    first, so a batch committing mid-request is left for the next poll
+    rather than half-reported.
+    """
+    assets = _resolve_assets(symbols)
+    body: dict[str, Any] = {
+        "version": 0,
+        "since_version": since_version,
+        "interval": interval,
+        "changes": {},
+        "resync": [],
+    }
+    with session_scope() as s:
+        version = current_ingest_seq(s)
+        body["version"] = version
+        if since_version is None:
+            return fast_json(body, response)
+        if since_version > version:
+            # A mark from another (or a rebuilt) database.
+            body["resync"] = [sym for _, sym in assets]
+            return fast_json(body, response)
+
+        by_id = dict(assets)
+        # ``asset_id + 0`` keeps SQLite off the asset_id indexes, which it
+        # prefers on its own and which walk each asset's whole history; the
+        # ingest_seq range scan reads only the new rows (2 ms vs 22 ms at 1M
+        # bars for a 4-batch delta).
+        unindexed_asset = PricePoint.asset_id + 0
+        window = (
+            PricePoint.ingest_seq > since_version,
+            PricePoint.ingest_seq <= version,
+            PricePoint.interval == interval,
+        )
+        counts = s.execute(
+            select(PricePoint.asset_id, func.count())
+            .where(*window, unindexed_asset.in_(by_id))
+            .group_by(PricePoint.asset_id)
+        ).all()
+        fresh = [aid for aid, n in counts if n <= limit]
+        body["resync"] = sorted(by_id[aid] for aid, n in counts if n > limit)
+        rows: list[Any] = []
+        if fresh:
+            stmt = (
+                select(
+                    PricePoint.asset_id,
+                    PricePoint.timestamp,
+                    PricePoint.open,
+                    PricePoint.high,
+                    PricePoint.low,
+                    PricePoint.close,
+                    PricePoint.volume,
+                )
+                .where(*window, unindexed_asset.in_(fresh))
+                .order_by(PricePoint.asset_id, PricePoint.timestamp)
+            )
+            rows = list(s.connection().execute(stmt).all())
+
+    dec = decimal_encoder(decimals)
+    changes: dict[str, list[dict[str, Any]]] = body["changes"]
+    for aid, ts, o, h, lo, c, v in rows:
+        changes.setdefault(by_id[aid], []).append(
+            {
+                "timestamp": ts,
+                "open": dec(o),
+                "high": dec(h),
+                "low": dec(lo),
+                "close": dec(c),
+                "volume": v,
+            }
+        )
+    return fast_json(body, response)
+
+
+@router.get(
+    "/{symbol}/",
+    response_model=PriceSeriesOut,
+    dependencies=[versioned("prices", per_asset="symbol")],
+)
 def get_prices(
     symbol: str,
+    response: Response,
     start: Annotated[datetime | None, Query(alias="from")] = None,
     end: Annotated[datetime | None, Query(alias="to")] = None,
     limit: Annotated[int, Query(ge=1, le=10000)] = 500,
     interval: Annotated[str, Query(min_length=1, max_length=16)] = "5m",
-) -> PriceSeriesOut:
+    decimals: Annotated[DecimalFormat, Query()] = "string",
+    fmt: Annotated[WireFormat, Query(alias="format")] = "rows",
+    max_points: MaxPoints = None,
+    downsample: Annotated[Downsample, Query()] = "ohlc",
+    after_ts: Annotated[datetime | None, Query()] = None,
+) -> Response:
     """Return price bars for `symbol`, newest-first-filtered then ascending.
 
     The `interval` filter defaults to "5m" (the intraday cadence served by
     `ingest_prices`) to preserve backward compatibility with callers that
     predate the Phase 2 daily-bar layer. Pass `interval=1d` to consume the
     daily-close series used by the forecasting engine.
+
+    Rows are serialised straight from the column tuples with orjson
+    (``sidecar.api.fast_json``); ``decimals=number`` sends prices as JSON
+    numbers instead of strings.
+
+    ``format=columnar`` returns ``{symbol, count, t, open, high, low, close,
+    volume}`` with one array per field (numbers; ``t`` in epoch seconds,
+    delta-encoded), ``format=binary`` the same ``PRICE_COLUMNS`` as float64
+    typed arrays. Both read floats and epoch seconds straight out of SQLite.
+
+    ``max_points`` reduces the selected bars (after ``limit``) to at most
+    that many: merged candles by default, or the closes LTTB keeps with
+    ``downsample=lttb`` (see ``sidecar.api.downsampling``).
+
+    ``after_ts`` switches to forward keyset paging: the *oldest* ``limit``
+    bars strictly after that timestamp, walked along the unique
+    ``(asset_id, timestamp, interval)`` index, so every page costs the same
+    however deep it is. ``next_after_ts`` (ISO in rows, epoch seconds in
+    columnar; binary clients use the last ``t``) is the cursor for the next
+    page and null on the last one. Full histories are better streamed from
+    ``/api/prices/export/``.
     """
     symbol = symbol.upper()
     with session_scope() as s:
@@ -69,7 +412,25 @@ def get_prices(
 
         start_n = _to_naive_utc(start)
         end_n = _to_naive_utc(end)
-        stmt = select(PricePoint).where(
+        if fmt == "rows":
+            cols: tuple[Any, ...] = (
+                PricePoint.timestamp,
+                PricePoint.open,
+                PricePoint.high,
+                PricePoint.low,
+                PricePoint.close,
+                PricePoint.volume,
+            )
+        else:
+            cols = (
+                cast(func.strftime("%s", PricePoint.timestamp), Integer),
+                cast(PricePoint.open, Float),
+                cast(PricePoint.high, Float),
+                cast(PricePoint.low, Float),
+                cast(PricePoint.close, Float),
+                PricePoint.volume,
+            )
+        stmt = select(*cols).where(
             PricePoint.asset_id == asset.id,
             PricePoint.interval == interval,
         )
@@ -77,9 +438,51 @@ def get_prices(
             stmt = stmt.where(PricePoint.timestamp >= start_n)
         if end_n is not None:
             stmt = stmt.where(PricePoint.timestamp <= end_n)
-        stmt = stmt.order_by(PricePoint.timestamp.desc()).limit(limit)
-
-        rows = list(s.execute(stmt).scalars().all())
+        if after_ts is None:
+            stmt = stmt.order_by(PricePoint.timestamp.desc()).limit(limit)
+        else:
+            stmt = stmt.where(PricePoint.timestamp > _to_naive_utc(after_ts))
+            stmt = stmt.order_by(PricePoint.timestamp.asc()).limit(limit)
+        # Core execution: plain rows, no ORM result processing.
+        rows: list[Any] = list(s.connection().execute(stmt).all())
+    if after_ts is None:
         rows.reverse()
-        points = [PricePointOut.model_validate(r) for r in rows]
-        return PriceSeriesOut(symbol=symbol, count=len(points), points=points)
+    # Taken before downsampling, which may not keep the last bar's time.
+    next_after = rows[-1][0] if after_ts is not None and len(rows) == limit else None
+    if max_points is not None:
+        if downsample == "ohlc":
+            rows = ohlc_rows(rows, max_points)
+        else:
+            rows = lttb_rows(rows, max_points, x=itemgetter(0), y=itemgetter(4))
+
+    if fmt == "binary":
+        return binary_response(columns_of(rows, len(PRICE_COLUMNS)), response)
+    if fmt == "columnar":
+        body: dict[str, Any] = {"symbol": symbol, "count": len(rows)}
+        columns = columns_of(rows, len(PRICE_COLUMNS))
+        columns[0] = delta_encode(columns[0])
+        body.update(zip(PRICE_COLUMNS, columns, strict=True))
+        body["next_after_ts"] = next_after
+        return fast_json(body, response)
+
+    dec = decimal_encoder(decimals)
+    points = [
+        {
+            "timestamp": ts,
+            "open": dec(o),
+            "high": dec(h),
+            "low": dec(lo),
+            "close": dec(c),
+            "volume": v,
+        }
+        for ts, o, h, lo, c, v in rows
+    ]
+    return fast_json(
+        {
+            "symbol": symbol,
+            "count": len(points),
+            "points": points,
+            "next_after_ts": next_after,
+        },
+        response,
+    )
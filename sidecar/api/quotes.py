@@ -7,7 +7,15 @@ from typing import Annotated
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from sidecar.api.conditional import versioned
 from sidecar.db.models import AssetType
+from sidecar.services.movers import (
+    MOVER_WINDOWS,
+    MOVERS_K_MAX,
+    Mover,
+    MoversError,
+    get_movers,
+)
 from sidecar.services.quotes import (
     Quote,
     SymbolNotFoundError,
@@ -47,7 +55,11 @@ class QuoteListOut(BaseModel):
     quotes: list[QuoteOut]
 
 
-@router.get("/", response_model=QuoteListOut)
+@router.get(
+    "/",
+    response_model=QuoteListOut,
+    dependencies=[versioned("prices")],
+)
 def list_quotes(
     symbols: Annotated[str | None, Query()] = None,
     active_only: Annotated[bool, Query()] = True,
@@ -60,7 +72,75 @@ def list_quotes(
     return QuoteListOut(count=len(quotes), quotes=quotes)
 
 
-@router.get("/{symbol}/", response_model=QuoteOut)
+class MoverOut(BaseModel):
+    asset_id: int
+    symbol: str
+    name: str
+    asset_type: AssetType
+    last_price: Decimal
+    last_at: datetime | None
+    # Price at the start of the window the change is measured against.
+    base_price: Decimal
+    change: Decimal
+    change_pct: float
+
+    @classmethod
+    def from_mover(cls, m: Mover) -> MoverOut:
+        return cls(
+            asset_id=m.asset_id,
+            symbol=m.symbol,
+            name=m.name,
+            asset_type=m.asset_type,
+            last_price=m.last_price,
+            last_at=m.last_at,
+            base_price=m.base_price,
+            change=m.change,
+            change_pct=m.change_pct,
+        )
+
+
+class MoversOut(BaseModel):
+    window: str
+    computed_at: datetime
+    universe: int
+    ranked: int
+    by_type: dict[str, int]
+    gainers: list[MoverOut]
+    losers: list[MoverOut]
+
+
+@router.get(
+    "/movers/",
+    response_model=MoversOut,
+    dependencies=[versioned("prices")],
+)
+def list_movers(
+    k: Annotated[int, Query(ge=1, le=MOVERS_K_MAX)] = 5,
+    window: Annotated[str, Query(description=", ".join(MOVER_WINDOWS))] = "1d",
+    active_only: Annotated[bool, Query()] = True,
+) -> MoversOut:
+    """Top ``k`` gainers and losers over ``window`` (see
+    :mod:`sidecar.services.movers`). Cached until the next price ingest."""
+    try:
+        m = get_movers(window, k, active_only=active_only)
+    except MoversError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return MoversOut(
+        window=m.window,
+        computed_at=m.computed_at,
+        universe=m.universe,
+        ranked=m.ranked,
+        by_type=m.by_type,
+        gainers=[MoverOut.from_mover(x) for x in m.gainers],
+        losers=[MoverOut.from_mover(x) for x in m.losers],
+    )
+
+
+@router.get(
+    "/{symbol}/",
+    response_model=QuoteOut,
+    dependencies=[versioned("prices", per_asset="symbol")],
+)
 def single_quote(symbol: str) -> QuoteOut:
     try:
         return QuoteOut.from_quote(get_quote(symbol))
@@ -0,0 +1,186 @@
+"""Server-Sent Events push channel: ``GET /api/stream/``.
+
+One long-lived ``text/event-stream`` response per shell window replaces the
+notification / alert-list polling loops. Event kinds:
+
+- ``alert`` — an alert fired; ``data`` is the same object
+  ``GET /api/alerts/{id}/`` returns. Sent to every client.
+- ``quote`` — new bars landed for a symbol; ``data`` is the
+  ``GET /api/quotes/{symbol}/`` object. Scoped by ``?symbols=AAPL,MSFT``
+  (omit for all symbols).
+- ``job`` — a scheduler job finished: ``{job_id, finished_at, ok, error}``.
+- ``ready`` — sent once per connection after any replay; its id is the
+  resume point when nothing else has arrived yet.
+- ``reset`` — the requested resume point is gone (sidecar restarted, or the
+  client was away longer than the replay buffer covers). The client should
+  re-read its state over REST; the stream then continues live.
+
+Resume follows the SSE spec: every event carries an ``id``; a reconnecting
+client sends it back as ``Last-Event-ID`` (or ``?last_event_id=`` where
+headers cannot be set) and receives what it missed from the hub's replay
+buffer (see ``sidecar.services.push``). A ``: keepalive`` comment every
+``HEARTBEAT_SECONDS`` keeps idle connections open and lets the server
+notice dead clients.
+
+The stream is authenticated like every other route (``X-FinTrack-Token``),
+so the shell reads it with ``fetch`` streaming rather than ``EventSource``,
+which cannot send headers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Annotated
+
+from fastapi import APIRouter, Header, Query, Request
+from fastapi.responses import StreamingResponse
+
+from sidecar.api.alerts import _to_model as _alert_model
+from sidecar.api.quotes import QuoteOut
+from sidecar.events import AlertsTriggered, BarsIngested, JobFinished, subscribe
+from sidecar.services.alerts import get_alerts
+from sidecar.services.push import PushEvent, PushHub, push_hub
+from sidecar.services.quotes import get_quotes_for_assets
+
+router = APIRouter(prefix="/api/stream", tags=["stream"])
+
+HEARTBEAT_SECONDS = 15.0
+# Client reconnect delay hint (SSE ``retry:`` field), milliseconds.
+RETRY_MS = 3000
+
+
+# ---------------------------------------------------------------------------
+# Event bridge: in-process events -> hub
+# ---------------------------------------------------------------------------
+
+
+def _on_alerts_triggered(evt: AlertsTriggered) -> None:
+    for alert in get_alerts(evt.alert_ids):
+        push_hub.publish("alert", _alert_model(alert).model_dump(mode="json"))
+
+
+def _on_bars_ingested(evt: BarsIngested) -> None:
+    # Quotes are current state, not history: a client that connects later
+    # reads them over REST, so with nobody listening there is nothing to
+    # build (two queries per asset) or buffer.
+    if push_hub.subscriber_count() == 0:
+        return
+    for quote in get_quotes_for_assets(evt.asset_ids):
+        push_hub.publish(
+            "quote",
+            QuoteOut.from_quote(quote).model_dump(mode="json"),
+            symbols=[quote.symbol],
+        )
+
+
+def _on_job_finished(evt: JobFinished) -> None:
+    push_hub.publish(
+        "job",
+        {
+            "job_id": evt.job_id,
+            "finished_at": evt.finished_at.isoformat(),
+            "ok": evt.error is None,
+            "error": evt.error,
+        },
+    )
+
+
+subscribe(AlertsTriggered, _on_alerts_triggered)
+subscribe(BarsIngested, _on_bars_ingested)
+subscribe(JobFinished, _on_job_finished)
+
+
+# ---------------------------------------------------------------------------
+# Wire format
+# ---------------------------------------------------------------------------
+
+
+def _frame(event_id: str, kind: str, data: str) -> str:
+    return f"id: {event_id}\nevent: {kind}\ndata: {data}\n\n"
+
+
+def _event_frame(hub: PushHub, evt: PushEvent) -> str:
+    return _frame(hub.event_id(evt.seq), evt.kind, evt.data)
+
+
+def _parse_symbols(raw: str | None) -> frozenset[str] | None:
+    if raw is None:
+        return None
+    return frozenset(s.strip().upper() for s in raw.split(",") if s.strip())
+
+
+async def event_stream(
+    hub: PushHub,
+    *,
+    resume_from: str | None,
+    symbols: frozenset[str] | None,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    heartbeat_seconds: float = HEARTBEAT_SECONDS,
+) -> AsyncGenerator[str, None]:
+    """Yield SSE frames: replay from ``resume_from``, then live events.
+
+    Ends when the client disconnects or falls too far behind (the hub marks
+    its queue overflowed); either way the client reconnects and resumes.
+    """
+    with hub.subscribe() as sub:
+        yield f"retry: {RETRY_MS}\n\n"
+        seq = hub.parse_event_id(resume_from)
+        replay = hub.replay_since(seq) if seq is not None else None
+        if resume_from and replay is None:
+            cursor = hub.head
+            yield _frame(
+                hub.event_id(cursor),
+                "reset",
+                json.dumps({"reason": "resume point unavailable"}),
+            )
+        else:
+            for evt in replay or ():
+                if evt.visible_to(symbols):
+                    yield _event_frame(hub, evt)
+            cursor = replay[-1].seq if replay else (seq if seq is not None else hub.head)
+            yield _frame(
+                hub.event_id(cursor),
+                "ready",
+                json.dumps({"resumed": seq is not None, "replayed": len(replay or ())}),
+            )
+
+        while not sub.overflowed:
+            try:
+                evt = await asyncio.wait_for(sub.queue.get(), heartbeat_seconds)
+            except TimeoutError:
+                if await is_disconnected():
+                    return
+                yield ": keepalive\n\n"
+                continue
+            if evt.seq <= cursor:
+                continue  # already replayed
+            cursor = evt.seq
+            if evt.visible_to(symbols):
+                yield _event_frame(hub, evt)
+
+
+# ---------------------------------------------------------------------------
+# Endpoint
+# ---------------------------------------------------------------------------
+
+
+@router.get("/")
+async def stream(
+    request: Request,
+    symbols: Annotated[str | None, Query()] = None,
+    last_event_id: Annotated[str | None, Query()] = None,
+    last_event_id_header: Annotated[str | None, Header(alias="Last-Event-ID")] = None,
+) -> StreamingResponse:
+    """Push channel for alerts, quotes and job completions (see module doc)."""
+    return StreamingResponse(
+        event_stream(
+            push_hub,
+            resume_from=last_event_id_header or last_event_id,
+            symbols=_parse_symbols(symbols),
+            is_disconnected=request.is_disconnected,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -14,6 +14,7 @@ from __future__ import annotations
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from sidecar.api.conditional import versioned
 from sidecar.services.watchlists import (
     AssetNotFoundError,
     CannotDeleteDefaultError,
@@ -127,14 +128,22 @@ def _detail_out(d: WatchlistDetail) -> WatchlistDetailOut:
 # ---------------------------------------------------------------------------
 
 
-@router.get("/", response_model=WatchlistListOut)
+@router.get(
+    "/",
+    response_model=WatchlistListOut,
+    dependencies=[versioned("watchlists")],
+)
 def list_watchlists_route() -> WatchlistListOut:
     return WatchlistListOut(
         watchlists=[_summary_out(w) for w in list_watchlists()]
     )
 
 
-@router.get("/default/", response_model=WatchlistDetailOut)
+@router.get(
+    "/default/",
+    response_model=WatchlistDetailOut,
+    dependencies=[versioned("watchlists")],
+)
 def get_default_watchlist_route() -> WatchlistDetailOut:
     d = get_default_watchlist()
     if d is None:
@@ -156,7 +165,11 @@ def create_watchlist_route(body: CreateWatchlistIn) -> WatchlistSummaryOut:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
-@router.get("/{watchlist_id}/", response_model=WatchlistDetailOut)
+@router.get(
+    "/{watchlist_id}/",
+    response_model=WatchlistDetailOut,
+    dependencies=[versioned("watchlists")],
+)
 def get_watchlist_route(watchlist_id: int) -> WatchlistDetailOut:
     try:
         return _detail_out(get_watchlist(watchlist_id))
@@ -34,6 +34,11 @@ class Settings(BaseSettings):
     enable_prices_daily_job: bool = True
     enable_forecasts_job: bool = True
     enable_sentiment_job: bool = True
+    # Preload statsmodels / pandas / the VADER lexicon on a low-priority
+    # background thread once /api/health/ is answering, so the first
+    # "Retrain now" or inline news scoring doesn't pay the ~1-2 s import.
+    # Opt-in: the Tauri shell turns it on; tests and standalone runs don't.
+    enable_ml_warmup: bool = False
     ingest_prices_interval_minutes: int = 5
     ingest_crypto_interval_minutes: int = 15
     ingest_news_interval_minutes: int = 15
@@ -44,7 +49,8 @@ class Settings(BaseSettings):
     # INT type cleanly — mapped to the string in _register_jobs. Default = Sunday.
     train_forecasts_cron_day_of_week: int = 6
     train_forecasts_cron_hour: int = 23
-    check_alerts_interval_minutes: int = 1
+    # Safety-net scan only; price alerts are re-checked on every ingest.
+    check_alerts_interval_minutes: int = 15
     # Periodic VADER backfill — `ingest_news` already scores new articles
     # inline, so this is mostly relevant on a fresh install where existing
     # articles need a one-off catch-up. Hourly default keeps the job cheap
@@ -52,8 +58,19 @@ class Settings(BaseSettings):
     score_news_sentiment_interval_minutes: int = 60
     # Default model used by the forecasting engine when the user doesn't
     # pick one explicitly. Constrained at validation time to the literal
-    # set in ``ml.forecast.ENGINES``.
+    # set in ``ml.forecast.ENGINES`` plus ``"auto"`` (per-asset winner).
     forecast_default_engine: str = "sarimax"
+    # "auto" engine mode: max age of a per-asset winning-engine choice, and
+    # the time the weekly retrain may spend re-scoring engines + refitting
+    # challengers on top of the winners themselves.
+    forecast_auto_reevaluate_days: int = 7
+    forecast_auto_budget_seconds: int = 120
+    # Forecast snapshots older than this are thinned to one per week per
+    # engine by the daily retention job; 0 keeps everything.
+    forecast_snapshot_retention_days: int = 90
+    # Memory budget for cached analytics responses (sidecar.response_cache);
+    # least-recently-used entries are evicted past it.
+    response_cache_max_mb: int = 32
 
     def resolved_db_path(self) -> str:
         return self.db_path or _default_db_path()
@@ -0,0 +1,178 @@
+"""Per-domain data versions — the basis for ETags on read endpoints.
+
+Every committed write bumps an in-memory counter for the domain of each
+table it touched; read endpoints derive a weak ETag from the counters their
+response depends on and answer a matching ``If-None-Match`` with ``304``
+before touching the database (see ``sidecar.api.conditional``). A poll that
+finds nothing new then costs a few dictionary lookups.
+
+Tracking is automatic, from two ``Session`` hooks:
+
+- ``after_flush`` sees the ORM unit of work (``session.add`` / attribute
+  changes / ``session.delete``);
+- ``do_orm_execute`` sees Core DML run through a session
+  (``session.execute(insert(...))`` and friends).
+
+Touched domains are parked on the session and bumped from ``after_commit``
+— never earlier, so a reader can not pair a new version with data that is
+not visible yet — and dropped on rollback, mirroring
+``publish_after_commit`` in ``sidecar.events``.
+
+Keyed domains
+-------------
+``prices`` is also versioned per asset, so one symbol's series stays
+cacheable while others ingest. The ORM path reads ``asset_id`` off the
+rows; a Core statement may name the assets it writes with
+``.execution_options(version_keys=...)``. A price write with no known keys
+bumps the whole domain, which every keyed version includes.
+
+Versions live in process memory and start from zero, so each sidecar
+process stamps its ETags with its own ``epoch``: a restart can not
+resurrect a stale tag. ``ON DELETE CASCADE`` rows are not seen by either
+hook; endpoints whose data cascades from ``assets`` include the ``assets``
+domain instead.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable
+from itertools import chain
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState, Session
+
+# Domain -> tables whose writes change it.
+DOMAIN_TABLES: dict[str, tuple[str, ...]] = {
+    "assets": ("assets",),
+    "prices": ("price_points",),
+    "news": ("articles", "article_assets", "asset_sentiment_daily"),
+    "forecasts": (
+        "forecasts",
+        "forecast_snapshots",
+        "forecast_engine_selections",
+        "accuracy_points",
+    ),
+    "alerts": ("price_alerts",),
+    "portfolio": ("portfolio_transactions",),
+    "watchlists": ("watchlists", "watchlist_items"),
+    "macro": ("macro_indicators", "macro_data_points"),
+    "settings": ("settings",),
+}
+TABLE_DOMAINS = {t: d for d, tables in DOMAIN_TABLES.items() for t in tables}
+# Keyed domains: the column on their table that carries the key.
+KEY_COLUMNS = {"price_points": "asset_id"}
+
+VERSION_KEYS_OPTION = "version_keys"
+
+# Key under which touched domains ride on ``Session.info``.
+_PENDING_KEY = "fintrack.touched_domains"
+
+logger = logging.getLogger(__name__)
+
+
+class DataVersions:
+    """Monotonic per-domain (and per-key) write counters. Thread-safe."""
+
+    def __init__(self) -> None:
+        self.epoch = format(time.time_ns() // 1_000_000, "x")
+        self._lock = Lock()
+        # Every write to the domain, keyed or not.
+        self._any: dict[str, int] = {}
+        # Writes whose keys were not known (they touch every key).
+        self._whole: dict[str, int] = {}
+        self._keyed: dict[tuple[str, int], int] = {}
+        self._listeners: list[Callable[[str, frozenset[int] | None], object]] = []
+
+    def add_listener(
+        self, listener: Callable[[str, frozenset[int] | None], object]
+    ) -> None:
+        """Call ``listener(domain, keys)`` after every bump (keys None: all)."""
+        self._listeners.append(listener)
+
+    def bump(self, domain: str, keys: Iterable[int] | None = None) -> None:
+        """Record a committed write to ``keys`` of ``domain`` (None: all)."""
+        touched = None if keys is None else frozenset(keys)
+        with self._lock:
+            self._any[domain] = self._any.get(domain, 0) + 1
+            if touched is None:
+                self._whole[domain] = self._whole.get(domain, 0) + 1
+            else:
+                for key in touched:
+                    self._keyed[(domain, key)] = self._keyed.get((domain, key), 0) + 1
+        for listener in self._listeners:
+            try:
+                listener(domain, touched)
+            except Exception:
+                logger.exception("data-version listener failed for %s", domain)
+
+    def version(self, domain: str, key: int | None = None) -> str:
+        """Version of a whole domain, or of one key of a keyed domain.
+
+        The whole-domain version moves on any write to it; a key's version
+        (``"<whole>:<key>"``) only on writes to that key or of unknown keys.
+        """
+        with self._lock:
+            if key is None:
+                return str(self._any.get(domain, 0))
+            whole = self._whole.get(domain, 0)
+            return f"{whole}:{self._keyed.get((domain, key), 0)}"
+
+
+data_versions = DataVersions()
+
+
+# ---------------------------------------------------------------------------
+# Session tracking
+# ---------------------------------------------------------------------------
+
+
+def _note(session: Session, table: str, keys: Iterable[int] | None) -> None:
+    domain = TABLE_DOMAINS.get(table)
+    if domain is None:
+        return
+    # domain -> keys written, or None once the whole domain is touched.
+    pending: dict[str, set[int] | None] = session.info.setdefault(_PENDING_KEY, {})
+    if keys is None or table not in KEY_COLUMNS:
+        pending[domain] = None
+        return
+    current = pending.setdefault(domain, set())
+    if current is not None:
+        current.update(keys)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session: Session, _flush_context: Any) -> None:
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table is None:
+            continue
+        column = KEY_COLUMNS.get(table)
+        key = getattr(obj, column, None) if column is not None else None
+        _note(session, table, [key] if key is not None else None)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_dml(state: ORMExecuteState) -> None:
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    table = getattr(state.statement, "table", None)
+    name = getattr(table, "name", None)
+    if name is None:
+        return
+    _note(state.session, name, state.execution_options.get(VERSION_KEYS_OPTION))
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_pending(session: Session) -> None:
+    touched: dict[str, set[int] | None] = session.info.pop(_PENDING_KEY, {})
+    for domain, keys in touched.items():
+        data_versions.bump(domain, keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -78,3 +78,18 @@ def session_scope() -> Iterator[Session]:
         raise
     finally:
         s.close()
+
+
+@contextmanager
+def read_snapshot() -> Iterator[Session]:
+    """``session_scope()`` whose reads all see one committed state.
+
+    pysqlite only issues ``BEGIN`` ahead of writes, so each ``SELECT`` in a
+    plain session reads whatever is committed at that moment. An explicit
+    ``BEGIN`` makes SQLite take its WAL read snapshot at the first
+    ``SELECT`` and keep it until the session ends — without blocking
+    writers.
+    """
+    with session_scope() as s:
+        s.connection().exec_driver_sql("BEGIN")
+        yield s
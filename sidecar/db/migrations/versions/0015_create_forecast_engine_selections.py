@@ -0,0 +1,59 @@
+"""create forecast_engine_selections table
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-19 00:00:00
+
+Backs the ``"auto"`` forecast engine mode. Instead of fitting one global
+engine for every asset, the retrain job keeps a per-asset *winning* engine
+— picked from live accuracy once enough horizons have elapsed, from a
+rolling-origin backtest before that — and fits only the winner on each run.
+
+One row per asset:
+- ``engine`` / ``source`` / ``mape`` / ``evaluable_points`` — the current
+  winner and the evidence it was picked on (``"accuracy"`` or
+  ``"backtest"``).
+- ``evaluated_at`` — when the winner was last re-evaluated; the weekly job
+  re-evaluates rows older than the configured interval.
+- ``last_challenger`` / ``challenger_fitted_at`` — round-robin cursor for
+  the occasional challenger refits that keep accuracy evidence flowing for
+  the non-winning engines.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0015"
+down_revision: str | None = "0014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "forecast_engine_selections",
+        sa.Column(
+            "asset_id",
+            sa.Integer(),
+            sa.ForeignKey("assets.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("engine", sa.String(32), nullable=False),
+        sa.Column("source", sa.String(16), nullable=False),
+        sa.Column("mape", sa.Float(), nullable=True),
+        sa.Column(
+            "evaluable_points", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column("evaluated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("last_challenger", sa.String(32), nullable=True),
+        sa.Column(
+            "challenger_fitted_at", sa.DateTime(timezone=True), nullable=True
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("forecast_engine_selections")
@@ -0,0 +1,120 @@
+"""create accuracy_points table
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-19 00:00:01
+
+Materialised forecast-accuracy pairs. ``compute_accuracy`` used to decode
+the JSON of every snapshot in its window and re-score each one against the
+asset's whole daily history on every request. This table holds one row per
+(snapshot, forecast_date) with the prediction, the snapshot's ``last_close``
+and — once the daily bar for that date lands — the ``actual`` close, so the
+metrics become SQL aggregates over already-paired rows.
+
+- Rows are written alongside each snapshot by ``ml.persistence``.
+- ``actual`` is filled incrementally by the daily price ingest; the partial
+  index on still-pending rows keeps that a handful of index probes.
+- ``asset_id`` / ``model`` / ``generated_at`` are denormalised from the
+  snapshot so the accuracy window is a single index range scan.
+
+Existing snapshots are backfilled here (SQLite JSON1 unpacks
+``points_json`` in place), then paired with whatever closes are on file.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0016"
+down_revision: str | None = "0015"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# The daily close on an accuracy point's forecast_date. Daily bars are
+# stamped at midnight, so "on date D" is the [D, D+1) timestamp range.
+_CLOSE_ON_DATE = """
+    SELECT CAST(pp.close AS REAL) FROM price_points pp
+    WHERE pp.asset_id = accuracy_points.asset_id
+      AND pp.interval = '1d'
+      AND pp.timestamp >= accuracy_points.forecast_date
+      AND pp.timestamp < date(accuracy_points.forecast_date, '+1 day')
+    ORDER BY pp.timestamp
+    LIMIT 1
+"""
+
+
+def _backfill(bind: sa.engine.Connection) -> dict[str, int]:
+    """Explode existing snapshots into pairs and fill known actuals."""
+    counts: dict[str, int] = {}
+    counts["points"] = bind.execute(
+        sa.text(
+            """
+            INSERT OR IGNORE INTO accuracy_points (
+                snapshot_id, asset_id, model, generated_at,
+                forecast_date, predicted, last_close
+            )
+            SELECT s.id, s.asset_id, s.model, s.generated_at,
+                   json_extract(p.value, '$.forecast_date'),
+                   CAST(json_extract(p.value, '$.yhat') AS REAL),
+                   CAST(s.last_close AS REAL)
+            FROM forecast_snapshots s, json_each(s.points_json) p
+            """
+        )
+    ).rowcount
+    counts["actuals"] = bind.execute(
+        sa.text(
+            f"""
+            UPDATE accuracy_points
+            SET actual = ({_CLOSE_ON_DATE})
+            WHERE actual IS NULL AND ({_CLOSE_ON_DATE}) IS NOT NULL
+            """
+        )
+    ).rowcount
+    return counts
+
+
+def upgrade() -> None:
+    op.create_table(
+        "accuracy_points",
+        sa.Column(
+            "snapshot_id",
+            sa.Integer(),
+            sa.ForeignKey("forecast_snapshots.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("forecast_date", sa.Date(), primary_key=True),
+        sa.Column(
+            "asset_id",
+            sa.Integer(),
+            sa.ForeignKey("assets.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("model", sa.String(64), nullable=False),
+        sa.Column("generated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("predicted", sa.Float(), nullable=False),
+        sa.Column("last_close", sa.Float(), nullable=False),
+        sa.Column("actual", sa.Float(), nullable=True),
+    )
+    # Accuracy window: "this asset's pairs from snapshots generated since X".
+    op.create_index(
+        "ix_accuracy_points_asset_time",
+        "accuracy_points",
+        ["asset_id", "generated_at"],
+    )
+    # Ingest fill: only rows still waiting for their close are indexed.
+    op.create_index(
+        "ix_accuracy_points_pending",
+        "accuracy_points",
+        ["asset_id", "forecast_date"],
+        sqlite_where=sa.text("actual IS NULL"),
+    )
+    _backfill(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_index("ix_accuracy_points_pending", table_name="accuracy_points")
+    op.drop_index("ix_accuracy_points_asset_time", table_name="accuracy_points")
+    op.drop_table("accuracy_points")
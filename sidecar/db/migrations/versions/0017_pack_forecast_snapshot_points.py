@@ -0,0 +1,145 @@
+"""pack forecast_snapshots points into a binary blob
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-19 00:00:02
+
+Every save appends a snapshot, so ``forecast_snapshots`` is by far the
+fastest-growing table, and its ``points_json`` column (14 objects with six
+keys each) made up most of every row. This replaces it with
+``points_blob``: a version byte, the first forecast date and the point
+columns as packed float64 / float32 arrays. The layout is documented next
+to the codec in ``ml.persistence``.
+
+Existing rows are converted in place. The encoder below is a frozen copy
+of the version-1/2 layout so this revision never depends on application
+code. The old column is dropped with SQLite's native ``DROP COLUMN``
+rather than a batch table rebuild: rebuilding would ``DROP TABLE
+forecast_snapshots``, which with ``foreign_keys=ON`` cascades into
+``accuracy_points``.
+"""
+from __future__ import annotations
+
+import json
+import struct
+from collections.abc import Callable, Sequence
+from datetime import date
+from typing import Any
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0017"
+down_revision: str | None = "0016"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+_HEADER = struct.Struct("<BiH")
+_BANDS = ("lower_80", "upper_80", "lower_95", "upper_95")
+_CHUNK = 500
+
+
+def _encode(raw: str) -> bytes:
+    """JSON points list -> ``points_blob``. Missing bands fall back to yhat,
+    matching the tolerant JSON decoder this replaces."""
+    items: list[dict[str, Any]] = json.loads(raw)
+    n = len(items)
+    ordinals = [date.fromisoformat(i["forecast_date"]).toordinal() for i in items]
+    start = ordinals[0] if ordinals else 0
+    contiguous = ordinals == list(range(start, start + n))
+    out = [_HEADER.pack(1 if contiguous else 2, start, n)]
+    if not contiguous:
+        out.append(struct.pack(f"<{n}i", *ordinals))
+    yhat = [float(i["yhat"]) for i in items]
+    out.append(struct.pack(f"<{n}d", *yhat))
+    for band in _BANDS:
+        out.append(
+            struct.pack(f"<{n}f", *(float(i.get(band, i["yhat"])) for i in items))
+        )
+    return b"".join(out)
+
+
+def _decode(blob: bytes) -> str:
+    """``points_blob`` -> JSON points list, for the downgrade."""
+    version, start, n = _HEADER.unpack_from(blob)
+    offset = _HEADER.size
+    if version == 1:
+        ordinals: Sequence[int] = range(start, start + n)
+    else:
+        ordinals = struct.unpack_from(f"<{n}i", blob, offset)
+        offset += 4 * n
+    columns = {"yhat": struct.unpack_from(f"<{n}d", blob, offset)}
+    offset += 8 * n
+    for band in _BANDS:
+        columns[band] = struct.unpack_from(f"<{n}f", blob, offset)
+        offset += 4 * n
+    return json.dumps(
+        [
+            {
+                "forecast_date": date.fromordinal(o).isoformat(),
+                **{k: v[idx] for k, v in columns.items()},
+            }
+            for idx, o in enumerate(ordinals)
+        ],
+        separators=(",", ":"),
+    )
+
+
+def _rewrite(
+    bind: sa.engine.Connection,
+    select_sql: str,
+    update_sql: str,
+    convert: Callable[[Any], Any],
+) -> int:
+    rows = bind.execute(sa.text(select_sql)).all()
+    batch: list[dict[str, Any]] = []
+    count = 0
+    for row_id, value in rows:
+        batch.append({"id": row_id, "value": convert(value)})
+        if len(batch) >= _CHUNK:
+            bind.execute(sa.text(update_sql), batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        bind.execute(sa.text(update_sql), batch)
+        count += len(batch)
+    return count
+
+
+def convert_rows(bind: sa.engine.Connection) -> int:
+    """Encode every snapshot's ``points_json`` into ``points_blob``."""
+    return _rewrite(
+        bind,
+        "SELECT id, points_json FROM forecast_snapshots",
+        "UPDATE forecast_snapshots SET points_blob = :value WHERE id = :id",
+        _encode,
+    )
+
+
+def upgrade() -> None:
+    op.add_column(
+        "forecast_snapshots",
+        sa.Column(
+            "points_blob",
+            sa.LargeBinary(),
+            nullable=False,
+            server_default=sa.text("x''"),
+        ),
+    )
+    convert_rows(op.get_bind())
+    op.drop_column("forecast_snapshots", "points_json")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "forecast_snapshots",
+        sa.Column("points_json", sa.Text(), nullable=False, server_default="[]"),
+    )
+    _rewrite(
+        op.get_bind(),
+        "SELECT id, points_blob FROM forecast_snapshots WHERE length(points_blob) > 0",
+        "UPDATE forecast_snapshots SET points_json = :value WHERE id = :id",
+        _decode,
+    )
+    op.drop_column("forecast_snapshots", "points_blob")
@@ -0,0 +1,74 @@
+"""add intrabar evaluation columns to price_alerts
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-19 00:00:03
+
+Price alerts used to compare only the latest close against the threshold,
+so a spike through the threshold between two checks (or inside a single
+5-minute bar) never fired. The evaluator now scans every bar since the
+alert's high-water mark, testing ``high`` for "above" and ``low`` for
+"below" alerts:
+
+- ``evaluated_through`` — timestamp of the newest bar already evaluated
+  for the alert. NULL means "nothing yet"; the evaluator then starts from
+  ``created_at``.
+- ``trigger_bar_at`` / ``trigger_price`` — the bar that crossed and its
+  extreme (the high or low that went through the threshold), so the UI
+  can say *when* and *at what* an alert fired, not just that it did.
+
+All nullable. Armed price alerts that already exist are backfilled with
+``evaluated_through`` = the newest stored bar of their asset (the
+migration time if it has none): the old evaluator has already judged
+those bars by their close, and starting from ``created_at`` would fire
+them on excursions that may be weeks old.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import UTC, datetime
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0018"
+down_revision: str | None = "0017"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "price_alerts",
+        sa.Column("evaluated_through", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "price_alerts",
+        sa.Column("trigger_bar_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.add_column(
+        "price_alerts",
+        sa.Column("trigger_price", sa.Numeric(18, 6), nullable=True),
+    )
+    # Stored like the ORM writes naive timestamps: "YYYY-MM-DD HH:MM:SS.ffffff".
+    now = datetime.now(UTC).replace(tzinfo=None).isoformat(sep=" ", timespec="microseconds")
+    op.get_bind().execute(
+        sa.text(
+            """
+            UPDATE price_alerts
+            SET evaluated_through = COALESCE(
+                (SELECT MAX(p.timestamp) FROM price_points p
+                 WHERE p.asset_id = price_alerts.asset_id),
+                :now
+            )
+            WHERE is_active = 1 AND triggered_at IS NULL AND metric = 'price'
+            """
+        ),
+        {"now": now},
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("price_alerts", "trigger_price")
+    op.drop_column("price_alerts", "trigger_bar_at")
+    op.drop_column("price_alerts", "evaluated_through")
@@ -0,0 +1,163 @@
+"""create asset_sentiment_daily aggregate
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-19 00:00:04
+
+Per-asset, per-day sentiment buckets (sum + count of scored articles) so a
+rolling mean over N days is a range sum over at most N small rows instead
+of an ``AVG`` join across ``articles`` x ``article_assets`` for every
+sentiment alert.
+
+The buckets are maintained by triggers rather than by the Python write
+paths. Sentiment reaches the database through several writers: the inline
+VADER pass in ``ingest_news``, the ``score_articles`` backfill job, links
+added for already-scored articles, and cascading deletes. Triggers keep
+the aggregate exact for every one of them.
+
+- ``article_assets`` INSERT / DELETE adds / removes the linked article's
+  score (when it has one).
+- ``articles`` UPDATE OF sentiment / published_at moves the score: the old
+  (day, score) contribution is subtracted and the new one added, for every
+  linked asset.
+- ``articles`` DELETE subtracts the score up front; the cascaded
+  ``article_assets`` deletes then find no article and are no-ops.
+
+Buckets that drop to zero articles are deleted. Existing articles are
+aggregated in place at upgrade time.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0019"
+down_revision: str | None = "0018"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+_ADD = """
+    ON CONFLICT(asset_id, day) DO UPDATE SET
+        sentiment_sum = sentiment_sum + excluded.sentiment_sum,
+        article_count = article_count + excluded.article_count
+"""
+
+_TRIGGERS = {
+    "trg_article_assets_sentiment_insert": f"""
+        CREATE TRIGGER trg_article_assets_sentiment_insert
+        AFTER INSERT ON article_assets
+        BEGIN
+            INSERT INTO asset_sentiment_daily
+                (asset_id, day, sentiment_sum, article_count)
+            SELECT NEW.asset_id, date(a.published_at), a.sentiment, 1
+            FROM articles a
+            WHERE a.id = NEW.article_id AND a.sentiment IS NOT NULL
+            {_ADD};
+        END
+    """,
+    "trg_article_assets_sentiment_delete": """
+        CREATE TRIGGER trg_article_assets_sentiment_delete
+        AFTER DELETE ON article_assets
+        BEGIN
+            UPDATE asset_sentiment_daily
+            SET sentiment_sum = sentiment_sum - (
+                    SELECT a.sentiment FROM articles a WHERE a.id = OLD.article_id
+                ),
+                article_count = article_count - 1
+            WHERE asset_id = OLD.asset_id
+              AND day = (
+                    SELECT date(a.published_at) FROM articles a
+                    WHERE a.id = OLD.article_id AND a.sentiment IS NOT NULL
+              );
+            DELETE FROM asset_sentiment_daily
+            WHERE asset_id = OLD.asset_id AND article_count <= 0;
+        END
+    """,
+    "trg_articles_sentiment_update": f"""
+        CREATE TRIGGER trg_articles_sentiment_update
+        AFTER UPDATE OF sentiment, published_at ON articles
+        WHEN OLD.sentiment IS NOT NEW.sentiment
+          OR OLD.published_at IS NOT NEW.published_at
+        BEGIN
+            UPDATE asset_sentiment_daily
+            SET sentiment_sum = sentiment_sum - OLD.sentiment,
+                article_count = article_count - 1
+            WHERE OLD.sentiment IS NOT NULL
+              AND day = date(OLD.published_at)
+              AND asset_id IN (
+                    SELECT asset_id FROM article_assets
+                    WHERE article_id = OLD.id
+              );
+            INSERT INTO asset_sentiment_daily
+                (asset_id, day, sentiment_sum, article_count)
+            SELECT aa.asset_id, date(NEW.published_at), NEW.sentiment, 1
+            FROM article_assets aa
+            WHERE aa.article_id = NEW.id AND NEW.sentiment IS NOT NULL
+            {_ADD};
+            DELETE FROM asset_sentiment_daily
+            WHERE day = date(OLD.published_at) AND article_count <= 0;
+        END
+    """,
+    "trg_articles_sentiment_delete": """
+        CREATE TRIGGER trg_articles_sentiment_delete
+        BEFORE DELETE ON articles
+        WHEN OLD.sentiment IS NOT NULL
+        BEGIN
+            UPDATE asset_sentiment_daily
+            SET sentiment_sum = sentiment_sum - OLD.sentiment,
+                article_count = article_count - 1
+            WHERE day = date(OLD.published_at)
+              AND asset_id IN (
+                    SELECT asset_id FROM article_assets
+                    WHERE article_id = OLD.id
+              );
+            DELETE FROM asset_sentiment_daily
+            WHERE day = date(OLD.published_at) AND article_count <= 0;
+        END
+    """,
+}
+
+
+def _backfill(bind: sa.engine.Connection) -> int:
+    """Rebuild every bucket from the scored articles on file."""
+    bind.execute(sa.text("DELETE FROM asset_sentiment_daily"))
+    return bind.execute(
+        sa.text(
+            """
+            INSERT INTO asset_sentiment_daily
+                (asset_id, day, sentiment_sum, article_count)
+            SELECT aa.asset_id, date(a.published_at), SUM(a.sentiment), COUNT(*)
+            FROM articles a
+            JOIN article_assets aa ON aa.article_id = a.id
+            WHERE a.sentiment IS NOT NULL
+            GROUP BY aa.asset_id, date(a.published_at)
+            """
+        )
+    ).rowcount
+
+
+def upgrade() -> None:
+    op.create_table(
+        "asset_sentiment_daily",
+        sa.Column(
+            "asset_id",
+            sa.Integer(),
+            sa.ForeignKey("assets.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("sentiment_sum", sa.Float(), nullable=False),
+        sa.Column("article_count", sa.Integer(), nullable=False),
+    )
+    for ddl in _TRIGGERS.values():
+        op.execute(ddl)
+    _backfill(op.get_bind())
+
+
+def downgrade() -> None:
+    for name in _TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.drop_table("asset_sentiment_daily")
@@ -0,0 +1,52 @@
+"""add price_points.ingest_seq and the ingest_sequence counter
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-19 00:00:05
+
+Delta sync (``GET /api/prices/changes/``) hands clients only the bars
+inserted since a high-water mark. Every insert batch takes the next value
+of a persistent counter and stamps it on its rows:
+
+- ``ingest_sequence`` — a single row (``id = 1``) holding the last
+  allocated batch number. Allocation is an ``UPDATE ... RETURNING``, which
+  takes SQLite's write lock until the batch commits, so batch numbers
+  commit in order and a client can never skip past an in-flight batch.
+- ``price_points.ingest_seq`` — the batch that inserted the row, indexed
+  for the ``ingest_seq > ?`` range scan.
+
+Existing bars keep ``0``: they predate every sync a client could have
+started.
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0020"
+down_revision: str | None = "0019"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ingest_sequence",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("seq", sa.Integer(), nullable=False),
+    )
+    op.execute("INSERT INTO ingest_sequence (id, seq) VALUES (1, 0)")
+    op.add_column(
+        "price_points",
+        sa.Column("ingest_seq", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.create_index("ix_price_points_ingest_seq", "price_points", ["ingest_seq"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_price_points_ingest_seq", table_name="price_points")
+    with op.batch_alter_table("price_points") as batch:
+        batch.drop_column("ingest_seq")
+    op.drop_table("ingest_sequence")
@@ -12,10 +12,12 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Index,
+    LargeBinary,
     Numeric,
     String,
     Text,
     UniqueConstraint,
+    text,
 )
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -42,10 +44,22 @@ class AlertMetric(StrEnum):
     ``PRICE`` (default) — fires when the latest close crosses the threshold.
     ``SENTIMENT`` — fires when the rolling-mean compound sentiment over
     ``window_days`` crosses the threshold (range typically -1..+1).
+
+    The bar-derived metrics read the last ``window_days`` daily bars:
+
+    ``PCT_CHANGE`` — percent change of the close over that many bars
+    (threshold in percent, signed: ``-5`` is a 5% drop).
+    ``VOLATILITY`` — annualized realized volatility of the log-returns
+    over that many bars, in percent (``ml.volatility`` conventions).
+    ``VOLUME_SPIKE`` — the latest bar's volume as a multiple of the median
+    volume of the preceding ``window_days`` bars (``3`` = 3x normal).
     """
 
     PRICE = "price"
     SENTIMENT = "sentiment"
+    PCT_CHANGE = "pct_change"
+    VOLATILITY = "volatility"
+    VOLUME_SPIKE = "volume_spike"
 
 
 class TransactionType(StrEnum):
@@ -98,6 +112,10 @@ class PricePoint(Base):
     low: Mapped[Decimal] = mapped_column(Numeric(18, 6))
     close: Mapped[Decimal] = mapped_column(Numeric(18, 6))
     volume: Mapped[int] = mapped_column(BigInteger, default=0)
+    # Insert batch that wrote the bar (``sidecar.ingest_sequence``); delta
+    # sync returns bars with ``ingest_seq`` above the client's mark. Bars
+    # from before migration 0020 hold 0.
+    ingest_seq: Mapped[int] = mapped_column(server_default=text("0"))
 
     asset: Mapped[Asset] = relationship(back_populates="price_points")
 
@@ -109,9 +127,22 @@ class PricePoint(Base):
             name="uq_price_points_asset_ts_interval",
         ),
         Index("ix_price_points_asset_ts", "asset_id", "timestamp"),
+        Index("ix_price_points_ingest_seq", "ingest_seq"),
     )
 
 
+class IngestSequence(Base):
+    """Single-row counter of price insert batches (``id`` is always 1).
+
+    Written only through ``sidecar.ingest_sequence.next_ingest_seq``.
+    """
+
+    __tablename__ = "ingest_sequence"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    seq: Mapped[int] = mapped_column()
+
+
 class MacroIndicator(Base):
     __tablename__ = "macro_indicators"
 
@@ -197,6 +228,25 @@ class ArticleAsset(Base):
     )
 
 
+class AssetSentimentDaily(Base):
+    """Per-asset, per-day sum + count of scored article sentiment.
+
+    Read-only from application code: SQLite triggers on ``articles`` and
+    ``article_assets`` keep it in step with every sentiment write (see
+    migration 0019). Rolling means over N days are range sums over these
+    buckets rather than ``AVG`` joins over the raw articles.
+    """
+
+    __tablename__ = "asset_sentiment_daily"
+
+    asset_id: Mapped[int] = mapped_column(
+        ForeignKey("assets.id", ondelete="CASCADE"), primary_key=True
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    sentiment_sum: Mapped[float] = mapped_column(Float)
+    article_count: Mapped[int] = mapped_column()
+
+
 class Watchlist(Base):
     """A named list of assets the user is tracking.
 
@@ -253,8 +303,10 @@ class WatchlistItem(Base):
 class PriceAlert(Base):
     """A user-configured threshold crossing alert for a single asset.
 
-    Semantics are one-shot: when the scheduler detects a crossing it stamps
-    ``triggered_at`` (and the alert stops re-firing). The shell polls for rows
+    Semantics are one-shot: when the evaluator detects a crossing it stamps
+    ``triggered_at`` plus the crossing bar (and the alert stops re-firing).
+    Price alerts are evaluated against the high / low of every bar since
+    ``evaluated_through``, so intrabar spikes count. The shell polls for rows
     with ``triggered_at IS NOT NULL AND notified_at IS NULL``, fires a native
     desktop notification, then calls the mark-notified endpoint to set
     ``notified_at`` — this is resilient across shell restarts since the
@@ -279,15 +331,14 @@ class PriceAlert(Base):
             values_callable=lambda e: [m.value for m in e],
         )
     )
-    # Which signal the alert thresholds — "price" (latest close) or
-    # "sentiment" (rolling-mean compound score over ``window_days``).
-    # Stored as a free-form String rather than SQLEnum so adding a third
-    # metric (volatility, volume, …) is a no-migration change.
+    # Which signal the alert thresholds — see ``AlertMetric``.
+    # Stored as a free-form String rather than SQLEnum so adding a metric
+    # is a no-migration change.
     metric: Mapped[str] = mapped_column(
         String(32), default="price", server_default="price"
     )
-    # Rolling-window length in days — only meaningful for sentiment
-    # alerts. NULL for price alerts.
+    # Window length — calendar days for sentiment alerts, daily bars for
+    # the bar-derived metrics. NULL for price alerts.
     window_days: Mapped[int | None] = mapped_column(nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     triggered_at: Mapped[datetime | None] = mapped_column(
@@ -296,6 +347,18 @@ class PriceAlert(Base):
     notified_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # High-water mark for price alerts: the newest bar already evaluated.
+    # The next check scans bars after it (after ``created_at`` when NULL).
+    evaluated_through: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # The bar that crossed, and its high (above) / low (below).
+    trigger_bar_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    trigger_price: Mapped[Decimal | None] = mapped_column(
+        Numeric(18, 6), nullable=True
+    )
     note: Mapped[str | None] = mapped_column(String(256), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -415,8 +478,11 @@ class ForecastSnapshot(Base):
     *after* the horizon elapses (was the forecast we made 14 days ago
     actually any good?).
 
-    Rows are never updated or deleted by application code; the cascading
-    FK on ``asset_id`` is the only delete path.
+    Rows are never updated. Besides the cascading FK on ``asset_id``, the
+    only delete path is ``ml.persistence.thin_snapshots``, which thins
+    old history to one snapshot per week per engine. ``points_blob`` is
+    the packed binary encoding from ``ml.persistence`` (not JSON like
+    ``forecasts.points_json``).
     """
 
     __tablename__ = "forecast_snapshots"
@@ -434,7 +500,7 @@ class ForecastSnapshot(Base):
         DateTime(timezone=True),
         default=lambda: datetime.now(UTC),
     )
-    points_json: Mapped[str] = mapped_column(Text)
+    points_blob: Mapped[bytes] = mapped_column(LargeBinary)
 
     asset: Mapped[Asset] = relationship()
 
@@ -445,3 +511,61 @@ class ForecastSnapshot(Base):
             "generated_at",
         ),
     )
+
+
+class ForecastEngineSelection(Base):
+    """Per-asset winning forecast engine for the ``"auto"`` engine mode.
+
+    Maintained by ``ml.jobs`` — re-evaluated on the weekly retrain from live
+    accuracy (or a backtest while live evidence is thin). ``last_challenger``
+    is the round-robin cursor for challenger refits of the other engines.
+    """
+
+    __tablename__ = "forecast_engine_selections"
+
+    asset_id: Mapped[int] = mapped_column(
+        ForeignKey("assets.id", ondelete="CASCADE"), primary_key=True
+    )
+    engine: Mapped[str] = mapped_column(String(32))
+    # "accuracy" | "backtest" — which evidence the winner was picked on.
+    source: Mapped[str] = mapped_column(String(16))
+    mape: Mapped[float | None] = mapped_column(Float, nullable=True)
+    evaluable_points: Mapped[int] = mapped_column(default=0)
+    evaluated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    last_challenger: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    challenger_fitted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+
+class AccuracyPoint(Base):
+    """One (snapshot, forecast_date) prediction paired with its actual close.
+
+    Written next to every ``ForecastSnapshot`` by ``ml.persistence``;
+    ``actual`` stays NULL until the daily bar for ``forecast_date`` lands
+    and the ingest fills it. ``asset_id`` / ``model`` / ``generated_at``
+    are copied from the snapshot so accuracy reads never join back to it.
+    """
+
+    __tablename__ = "accuracy_points"
+
+    snapshot_id: Mapped[int] = mapped_column(
+        ForeignKey("forecast_snapshots.id", ondelete="CASCADE"), primary_key=True
+    )
+    forecast_date: Mapped[date] = mapped_column(Date, primary_key=True)
+    asset_id: Mapped[int] = mapped_column(ForeignKey("assets.id", ondelete="CASCADE"))
+    model: Mapped[str] = mapped_column(String(64))
+    generated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+    predicted: Mapped[float] = mapped_column(Float)
+    last_close: Mapped[float] = mapped_column(Float)
+    actual: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    __table_args__ = (
+        Index("ix_accuracy_points_asset_time", "asset_id", "generated_at"),
+        Index(
+            "ix_accuracy_points_pending",
+            "asset_id",
+            "forecast_date",
+            sqlite_where=text("actual IS NULL"),
+        ),
+    )
@@ -0,0 +1,121 @@
+"""In-process event bus.
+
+Producers publish small frozen event objects; consumers subscribe a handler
+per event type. Everything runs in the sidecar process, synchronously on the
+publishing thread — there is exactly one desktop user, so a broker or a
+queue would be ceremony.
+
+Database writers should not publish mid-transaction: a handler that reads
+the new rows from its own session would not see them yet, and a rollback
+would announce rows that never existed. ``publish_after_commit`` parks the
+event on the writing ``Session`` and publishes it from the session's
+``after_commit`` hook (and drops it on rollback), so handlers always observe
+committed data.
+
+Handler failures are logged and swallowed: a bad subscriber must never fail
+the ingest that published the event.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from threading import Lock
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+EventT = TypeVar("EventT")
+
+# Key under which pending events ride on ``Session.info``.
+_PENDING_KEY = "fintrack.pending_events"
+
+_handlers: dict[type[Any], list[Callable[[Any], None]]] = {}
+_lock = Lock()
+
+
+# ---------------------------------------------------------------------------
+# Events
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class BarsIngested:
+    """New ``price_points`` rows were committed for ``asset_ids``."""
+
+    asset_ids: frozenset[int]
+    intervals: frozenset[str]
+
+
+@dataclass(frozen=True)
+class AlertsTriggered:
+    """Alerts ``alert_ids`` were stamped ``triggered_at`` and committed."""
+
+    alert_ids: frozenset[int]
+
+
+@dataclass(frozen=True)
+class JobFinished:
+    """A scheduler job run ended. ``error`` is None on success."""
+
+    job_id: str
+    finished_at: datetime
+    error: str | None = None
+
+
+# ---------------------------------------------------------------------------
+# Bus
+# ---------------------------------------------------------------------------
+
+
+def subscribe(event_type: type[EventT], handler: Callable[[EventT], None]) -> None:
+    """Register ``handler`` for ``event_type``. Idempotent per handler."""
+    with _lock:
+        handlers = _handlers.setdefault(event_type, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+
+def unsubscribe(
+    event_type: type[EventT], handler: Callable[[EventT], None]
+) -> None:
+    with _lock:
+        handlers = _handlers.get(event_type, [])
+        if handler in handlers:
+            handlers.remove(handler)
+
+
+def publish(evt: object) -> None:
+    """Deliver ``evt`` to every handler subscribed to its exact type."""
+    with _lock:
+        handlers = list(_handlers.get(type(evt), ()))
+    for handler in handlers:
+        try:
+            handler(evt)
+        except Exception:
+            logger.exception(
+                "event handler %s failed for %s",
+                getattr(handler, "__qualname__", handler),
+                type(evt).__name__,
+            )
+
+
+def publish_after_commit(session: Session, evt: object) -> None:
+    """Publish ``evt`` once ``session`` commits; discard it on rollback."""
+    session.info.setdefault(_PENDING_KEY, []).append(evt)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending(session: Session) -> None:
+    for evt in session.info.pop(_PENDING_KEY, ()):
+        publish(evt)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
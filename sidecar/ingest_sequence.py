@@ -0,0 +1,62 @@
+"""Persistent batch numbers for price inserts — the delta-sync high-water mark.
+
+Every batch of ``price_points`` inserts takes the next value of the
+single-row ``ingest_sequence`` counter and stamps it on its rows
+(``price_points.ingest_seq``). ``GET /api/prices/changes/?since_version=N``
+then answers "which bars arrived after batch N" with one range scan of
+``ix_price_points_ingest_seq``.
+
+Why a table and not ``MAX(ingest_seq) + 1`` or the in-memory
+``sidecar.data_version`` counters:
+
+- the value must survive restarts — a client keeps its mark across a
+  sidecar relaunch;
+- batch numbers must become visible in order. Allocation is an
+  ``UPDATE ... RETURNING``, which takes SQLite's write lock, and the lock is
+  held until the batch commits; no later batch can allocate, let alone
+  commit, in between. A reader therefore never sees batch ``N + 1`` before
+  batch ``N``, and a client that synced to ``N + 1`` cannot have skipped
+  ``N``. A ``MAX + 1`` read happens before the lock and gives no such
+  guarantee.
+
+``sidecar.scheduler.jobs._upsert_bars`` allocates once per call and puts
+the number in its Core ``INSERT`` rows. ORM-added ``PricePoint`` objects
+get theirs from a ``before_flush`` hook, one number per flush.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from sidecar.db.models import IngestSequence, PricePoint
+
+
+def next_ingest_seq(session: Session) -> int:
+    """Allocate the next batch number inside ``session``'s transaction."""
+    stmt = (
+        update(IngestSequence)
+        .where(IngestSequence.id == 1)
+        .values(seq=IngestSequence.seq + 1)
+        .returning(IngestSequence.seq)
+    )
+    return int(session.execute(stmt).scalar_one())
+
+
+def current_ingest_seq(session: Session) -> int:
+    """The newest batch number visible to ``session`` (committed batches)."""
+    seq = session.execute(select(IngestSequence.seq).where(IngestSequence.id == 1))
+    return int(seq.scalar_one())
+
+
+@event.listens_for(Session, "before_flush")
+def _stamp_new_bars(session: Session, _flush_context: Any, _instances: Any) -> None:
+    bars = [
+        obj for obj in session.new if isinstance(obj, PricePoint) and obj.ingest_seq is None
+    ]
+    if bars:
+        seq = next_ingest_seq(session)
+        for bar in bars:
+            bar.ingest_seq = seq
@@ -10,15 +10,21 @@ from contextlib import asynccontextmanager
 import uvicorn
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import RequestResponseEndpoint
 from starlette.responses import Response
 
+from ml.warmup import start_background_warmup
 from sidecar import __version__, scheduler
 from sidecar.api.alerts import router as alerts_router
 from sidecar.api.analytics import router as analytics_router
+from sidecar.api.asset_bundle import router as asset_bundle_router
 from sidecar.api.assets import router as assets_router
+from sidecar.api.cache import router as cache_router
 from sidecar.api.config import router as config_router
+from sidecar.api.dashboard import router as dashboard_router
+from sidecar.api.fast_json import GZIP_LEVEL, GZIP_MIN_BYTES
 from sidecar.api.forecast import router as forecast_router
 from sidecar.api.health import router as health_router
 from sidecar.api.macro import router as macro_router
@@ -26,10 +32,12 @@ from sidecar.api.news import router as news_router
 from sidecar.api.portfolio import router as portfolio_router
 from sidecar.api.prices import router as prices_router
 from sidecar.api.quotes import router as quotes_router
+from sidecar.api.stream import router as stream_router
 from sidecar.api.watchlists import router as watchlists_router
 from sidecar.config import settings
 from sidecar.db.migrations_runner import upgrade_to_head
 from sidecar.db.seed import seed_all_defaults
+from sidecar.services.alert_index import alert_index
 from sidecar.services.watchlists import seed_default_watchlist
 
 PARENT_WATCHDOG_INTERVAL_SECONDS = 2.0
@@ -70,12 +78,23 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         except Exception:
             logger.exception("Seeding default watchlist failed (continuing)")
 
+    try:
+        armed = alert_index.rebuild()
+        logger.info("Alert index loaded with %d armed price alerts", armed)
+    except Exception:
+        logger.exception("Alert index rebuild failed (continuing)")
+
     if settings.enable_scheduler:
         try:
             scheduler.start()
         except Exception:
             logger.exception("Scheduler startup failed (continuing)")
 
+    if settings.enable_ml_warmup:
+        # Returns immediately — the thread itself waits for the first health
+        # probe before importing anything, so startup latency is unchanged.
+        start_background_warmup()
+
     try:
         yield
     finally:
@@ -88,6 +107,13 @@ ALLOWED_HOSTS = frozenset({"127.0.0.1", "localhost"})
 
 
 app = FastAPI(title="FinTrack Sidecar", version=__version__, lifespan=lifespan)
+# Large JSON bodies (price history, macro series) shrink ~5x. Registered
+# first so it sits inside the auth middleware, which re-streams bodies and
+# would otherwise defeat the size threshold. SSE (text/event-stream) is
+# excluded by the middleware from Starlette 0.46 on — requirements.txt pins
+# that floor, since an older Starlette would compress /api/stream/ and zlib
+# would hold pushes back.
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MIN_BYTES, compresslevel=GZIP_LEVEL)
 
 
 @app.middleware("http")
@@ -130,8 +156,10 @@ app.add_middleware(
 )
 app.include_router(health_router)
 app.include_router(assets_router)
+app.include_router(asset_bundle_router)
 app.include_router(prices_router)
 app.include_router(quotes_router)
+app.include_router(dashboard_router)
 app.include_router(macro_router)
 app.include_router(news_router)
 app.include_router(watchlists_router)
@@ -140,6 +168,8 @@ app.include_router(forecast_router)
 app.include_router(analytics_router)
 app.include_router(portfolio_router)
 app.include_router(config_router)
+app.include_router(cache_router)
+app.include_router(stream_router)
 
 
 def _watch_parent(initial_ppid: int) -> None:
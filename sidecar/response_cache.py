@@ -0,0 +1,331 @@
+"""In-process response cache for the expensive derived read endpoints.
+
+Correlations, forecast accuracy, volatility, portfolio performance and the
+sentiment timeseries recompute from raw rows on every call, yet their
+inputs only change when an ingest or a user edit commits. ``get_or_compute``
+memoises an endpoint's response model under ``(endpoint, params)``, where
+``params`` is the endpoint's own normalised tuple of query values.
+
+Invalidation is write-driven, not TTL-based. Each entry carries dependency
+*tags*: ``(domain, asset_id)`` for one asset's slice of a keyed domain
+(``("prices", 3)``) or ``(domain, None)`` for the whole domain
+(``("portfolio", None)``). Domains are those of ``sidecar.data_version``,
+whose commit-time bumps evict matching entries straight away. Every entry
+also depends on ``assets`` (rows cascade from it), so any asset write
+clears the cache.
+
+Eviction alone would leave two gaps — a write committing while an entry is
+being computed, and "now"-relative lookbacks rolling over at midnight — so
+each entry also stores a *validator* built from the versions of its tags
+and the UTC date, checked on every hit and compared before and after the
+computation.
+
+Misses go through ``sidecar.single_flight``: callers that miss on the same
+entry (and validator) while it is being computed wait for that computation
+rather than repeating it, and are counted as ``coalesced``.
+
+The cache is bounded by the serialised size of its entries
+(``FINTRACK_RESPONSE_CACHE_MAX_MB``) and evicts least-recently-used first.
+``stats()`` reports hit ratios per endpoint and the compute cost of each
+entry (``GET /api/cache/``).
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from threading import Lock
+from typing import Any, TypeVar
+
+from sidecar.config import settings
+from sidecar.data_version import data_versions
+from sidecar.single_flight import SingleFlight
+
+T = TypeVar("T")
+Tag = tuple[str, int | None]
+
+_Key = tuple[str, Hashable]
+
+
+@dataclass
+class _Entry:
+    value: Any
+    tags: frozenset[Tag]
+    validator: str
+    size: int
+    compute_ms: float
+    created_at: float
+    hits: int = 0
+
+
+@dataclass
+class _Counters:
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    compute_ms: float = 0.0
+
+
+@dataclass(frozen=True)
+class EntryStats:
+    endpoint: str
+    params: str
+    size_bytes: int
+    compute_ms: float
+    hits: int
+    age_seconds: float
+
+
+@dataclass(frozen=True)
+class EndpointStats:
+    endpoint: str
+    entries: int
+    hits: int
+    misses: int
+    # Misses served by a computation another caller had in flight.
+    coalesced: int
+    hit_ratio: float | None
+    mean_compute_ms: float | None
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    coalesced: int
+    hit_ratio: float | None
+    invalidations: int
+    evictions: int
+    endpoints: list[EndpointStats]
+    # Most expensive entries first.
+    top_entries: list[EntryStats]
+
+
+def _ratio(hits: int, misses: int) -> float | None:
+    total = hits + misses
+    return hits / total if total else None
+
+
+def _size_of(value: Any) -> int:
+    dump = getattr(value, "model_dump_json", None)
+    if callable(dump):
+        return len(dump())
+    return sys.getsizeof(value)
+
+
+def _validator(tags: Iterable[Tag]) -> str:
+    parts = [
+        data_versions.epoch,
+        datetime.now(UTC).strftime("%Y%m%d"),
+        data_versions.version("assets"),
+    ]
+    for domain, key in sorted(tags, key=lambda t: (t[0], -1 if t[1] is None else t[1])):
+        parts.append(f"{domain}.{data_versions.version(domain, key)}")
+    return "-".join(parts)
+
+
+class ResponseCache:
+    """LRU, byte-bounded, tag-invalidated memo of endpoint responses."""
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._lock = Lock()
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        # domain -> asset id (None: domain-wide) -> keys of dependent entries
+        self._by_tag: dict[str, dict[int | None, set[_Key]]] = {}
+        self._size = 0
+        self._counters: dict[str, _Counters] = {}
+        self._invalidations = 0
+        self._evictions = 0
+        self._flights = SingleFlight()
+
+    # -- lookups -------------------------------------------------------------
+
+    def get_or_compute(
+        self,
+        endpoint: str,
+        params: Hashable,
+        tags: Iterable[Tag],
+        compute: Callable[[], T],
+    ) -> T:
+        """Cached ``compute()`` for ``(endpoint, params)``.
+
+        Concurrent misses on one entry share a single ``compute()``.
+        Exceptions from ``compute`` propagate and nothing is stored.
+        """
+        key: _Key = (endpoint, params)
+        tagset = frozenset(tags)
+        validator = _validator(tagset)
+        with self._lock:
+            counters = self._counters.setdefault(endpoint, _Counters())
+            entry = self._entries.get(key)
+            if entry is not None and entry.validator == validator:
+                self._entries.move_to_end(key)
+                entry.hits += 1
+                counters.hits += 1
+                value: T = entry.value
+                return value
+            if entry is not None:
+                self._remove(key)
+
+        ran = False
+
+        def compute_and_store() -> T:
+            nonlocal ran
+            ran = True
+            return self._compute_and_store(key, counters, tagset, validator, compute)
+
+        value = self._flights.do(endpoint, (params, validator), compute_and_store)
+        if not ran:
+            with self._lock:
+                counters.coalesced += 1
+        return value
+
+    def _compute_and_store(
+        self,
+        key: _Key,
+        counters: _Counters,
+        tagset: frozenset[Tag],
+        validator: str,
+        compute: Callable[[], T],
+    ) -> T:
+        with self._lock:
+            counters.misses += 1
+
+        started = time.perf_counter()
+        value = compute()
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        size = _size_of(value)
+
+        with self._lock:
+            counters.compute_ms += elapsed_ms
+            # A write that committed mid-computation may not be reflected in
+            # ``value``: serve it, but do not keep it.
+            if size > self.max_bytes or _validator(tagset) != validator:
+                return value
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(
+                value=value,
+                tags=tagset,
+                validator=validator,
+                size=size,
+                compute_ms=elapsed_ms,
+                created_at=time.monotonic(),
+            )
+            self._size += size
+            for domain, asset_id in tagset:
+                self._by_tag.setdefault(domain, {}).setdefault(asset_id, set()).add(key)
+            while self._size > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+        return value
+
+    # -- invalidation --------------------------------------------------------
+
+    def invalidate(self, domain: str, keys: frozenset[int] | None = None) -> int:
+        """Drop entries depending on ``keys`` of ``domain`` (None: all of it).
+
+        Returns the number of entries dropped.
+        """
+        with self._lock:
+            if domain == "assets":
+                doomed = set(self._entries)
+            else:
+                by_key = self._by_tag.get(domain, {})
+                if keys is None:
+                    doomed = set().union(*by_key.values())
+                else:
+                    doomed = set(by_key.get(None, ()))
+                    for k in keys:
+                        doomed |= by_key.get(k, set())
+            for key in doomed:
+                self._remove(key)
+            self._invalidations += len(doomed)
+            return len(doomed)
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._by_tag.clear()
+            self._size = 0
+            self._counters.clear()
+            self._invalidations = 0
+            self._evictions = 0
+
+    def _remove(self, key: _Key) -> None:
+        # Caller holds the lock.
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._size -= entry.size
+        for domain, asset_id in entry.tags:
+            keys = self._by_tag.get(domain, {}).get(asset_id)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[domain][asset_id]
+
+    # -- reporting -----------------------------------------------------------
+
+    def stats(self, top: int = 20) -> CacheStats:
+        now = time.monotonic()
+        with self._lock:
+            per_endpoint: dict[str, int] = {}
+            for endpoint, _params in self._entries:
+                per_endpoint[endpoint] = per_endpoint.get(endpoint, 0) + 1
+            endpoints = [
+                EndpointStats(
+                    endpoint=name,
+                    entries=per_endpoint.get(name, 0),
+                    hits=c.hits,
+                    misses=c.misses,
+                    coalesced=c.coalesced,
+                    hit_ratio=_ratio(c.hits, c.misses),
+                    mean_compute_ms=c.compute_ms / c.misses if c.misses else None,
+                )
+                for name, c in sorted(self._counters.items())
+            ]
+            costly = sorted(
+                self._entries.items(), key=lambda kv: kv[1].compute_ms, reverse=True
+            )[:top]
+            top_entries = [
+                EntryStats(
+                    endpoint=endpoint,
+                    params=repr(params),
+                    size_bytes=e.size,
+                    compute_ms=e.compute_ms,
+                    hits=e.hits,
+                    age_seconds=now - e.created_at,
+                )
+                for (endpoint, params), e in costly
+            ]
+            hits = sum(c.hits for c in self._counters.values())
+            misses = sum(c.misses for c in self._counters.values())
+            coalesced = sum(c.coalesced for c in self._counters.values())
+            return CacheStats(
+                entries=len(self._entries),
+                size_bytes=self._size,
+                max_bytes=self.max_bytes,
+                hits=hits,
+                misses=misses,
+                coalesced=coalesced,
+                hit_ratio=_ratio(hits, misses),
+                invalidations=self._invalidations,
+                evictions=self._evictions,
+                endpoints=endpoints,
+                top_entries=top_entries,
+            )
+
+
+response_cache = ResponseCache(settings.response_cache_max_mb * 1024 * 1024)
+data_versions.add_listener(response_cache.invalidate)
@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from threading import Lock
 from typing import Any
 
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED, JobExecutionEvent
 from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.jobstores.base import JobLookupError
 from apscheduler.jobstores.sqlalchemy import SQLAlchemyJobStore
@@ -15,6 +16,7 @@ from apscheduler.triggers.interval import IntervalTrigger
 
 from sidecar.config import settings
 from sidecar.db.engine import get_engine
+from sidecar.events import JobFinished, publish
 from sidecar.scheduler.jobs import (
     check_price_alerts,
     ingest_crypto,
@@ -24,6 +26,7 @@ from sidecar.scheduler.jobs import (
     ingest_prices_daily,
     refresh_forecasts_job,
     score_news_sentiment_job,
+    thin_forecast_snapshots_job,
     train_forecasts_job,
 )
 from sidecar.services.settings import load_effective_config
@@ -71,6 +74,17 @@ def _first_add_kwargs(
     return {}
 
 
+def _on_job_event(event: JobExecutionEvent) -> None:
+    """Announce every finished job run on the event bus (push stream ``job``)."""
+    publish(
+        JobFinished(
+            job_id=event.job_id,
+            finished_at=datetime.now(UTC),
+            error=repr(event.exception) if event.exception is not None else None,
+        )
+    )
+
+
 def _register_jobs(scheduler: BackgroundScheduler, config: dict[str, Any]) -> None:
     """Add / update / remove jobs to match `config`.
 
@@ -167,7 +181,7 @@ def _register_jobs(scheduler: BackgroundScheduler, config: dict[str, Any]) -> No
                 minutes=int(config["check_alerts.interval_minutes"])
             ),
             id="check_price_alerts",
-            name="Scan active price alerts for threshold crossings",
+            name="Safety-net scan of active alerts (price alerts also fire on ingest)",
             replace_existing=True,
             **_first_add_kwargs(scheduler, "check_price_alerts", now),
         )
@@ -208,11 +222,23 @@ def _register_jobs(scheduler: BackgroundScheduler, config: dict[str, Any]) -> No
             replace_existing=True,
             **_first_add_kwargs(scheduler, "refresh_forecasts", now),
         )
+        # Snapshot retention: daily, and once on first add so an install
+        # that has been accumulating history gets thinned straight away.
+        scheduler.add_job(
+            thin_forecast_snapshots_job,
+            trigger=IntervalTrigger(minutes=1440),
+            id="thin_forecast_snapshots",
+            name="Thin old forecast snapshots to one per week per engine",
+            replace_existing=True,
+            **_first_add_kwargs(scheduler, "thin_forecast_snapshots", now),
+        )
     else:
         with contextlib.suppress(JobLookupError):
             scheduler.remove_job("train_forecasts")
         with contextlib.suppress(JobLookupError):
             scheduler.remove_job("refresh_forecasts")
+        with contextlib.suppress(JobLookupError):
+            scheduler.remove_job("thin_forecast_snapshots")
 
     if bool(config["score_news_sentiment.enabled"]):
         # Backfill any unscored articles via VADER. The new-article path is
@@ -247,6 +273,7 @@ def start() -> BackgroundScheduler | None:
         db_path = settings.resolved_db_path()
         scheduler = _build_scheduler()
         _register_jobs(scheduler, load_effective_config())
+        scheduler.add_listener(_on_job_event, EVENT_JOB_EXECUTED | EVENT_JOB_ERROR)
         scheduler.start()
         logger.info("Scheduler started (jobstore=%s)", db_path)
         _scheduler = scheduler
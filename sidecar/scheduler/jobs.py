@@ -18,6 +18,8 @@ from sidecar.db.models import (
     MacroIndicator,
     PricePoint,
 )
+from sidecar.events import BarsIngested, publish_after_commit
+from sidecar.ingest_sequence import next_ingest_seq
 from sidecar.ingestion.coingecko_fetcher import fetch_crypto_prices
 from sidecar.ingestion.fred_fetcher import fetch_macro_series_many
 from sidecar.ingestion.rss_fetcher import NewsItem, fetch_news_for_many
@@ -59,19 +61,47 @@ def _upsert_bars(session: Session, symbol_to_id: dict[str, int], bars: list[Pric
         )
     if not rows:
         return 0
+    # One batch number for the whole call. The allocating UPDATE takes the
+    # write lock until commit, which keeps batch numbers in commit order
+    # (see ``sidecar.ingest_sequence``).
+    seq = next_ingest_seq(session)
+    for row in rows:
+        row["ingest_seq"] = seq
     # 5y of daily closes for ~10 assets is ~12K rows * 8 cols ≈ 96K bound
     # params — past SQLite's 32766-variable statement cap. Chunk to stay
     # under the ceiling. 500 rows ≈ 4000 params per stmt — comfortable
     # headroom even if the schema grows.
     inserted = 0
+    touched: set[int] = set()
+    intervals: set[str] = set()
     chunk_size = 500
     for offset in range(0, len(rows), chunk_size):
         chunk = rows[offset : offset + chunk_size]
-        stmt = sqlite_insert(PricePoint).values(chunk).on_conflict_do_nothing(
-            index_elements=["asset_id", "timestamp", "interval"]
+        # RETURNING yields only the rows that survived ON CONFLICT DO NOTHING,
+        # i.e. genuinely new bars — exactly what subscribers care about.
+        stmt = (
+            sqlite_insert(PricePoint)
+            .values(chunk)
+            .on_conflict_do_nothing(
+                index_elements=["asset_id", "timestamp", "interval"]
+            )
+            .returning(PricePoint.asset_id, PricePoint.interval)
+            # Per-asset data versions (``sidecar.data_version``) only move
+            # for the assets in this chunk.
+            .execution_options(
+                version_keys=frozenset(cast(int, r["asset_id"]) for r in chunk)
+            )
+        )
+        for asset_id, interval in session.execute(stmt):
+            inserted += 1
+            touched.add(asset_id)
+            intervals.add(interval)
+    if touched:
+        # Alert evaluation (and anything else keyed on fresh prices) runs
+        # once the caller's transaction commits — see ``sidecar.events``.
+        publish_after_commit(
+            session, BarsIngested(frozenset(touched), frozenset(intervals))
         )
-        result = cast(CursorResult[object], session.execute(stmt))
-        inserted += result.rowcount or 0
     return inserted
 
 
@@ -163,7 +193,29 @@ def ingest_prices_daily() -> int:
     if not symbols:
         logger.info("ingest_prices_daily: no active assets, skipping")
         return 0
-    return ingest_prices_for_symbols(symbols, period="5y", interval="1d")
+    inserted = ingest_prices_for_symbols(symbols, period="5y", interval="1d")
+    if inserted:
+        # New closes landed — pair them with the forecast points that were
+        # waiting on them (incremental accuracy), then, with a vectorized
+        # forecast engine configured, re-forecast the whole universe in one
+        # cheap pass (no-op otherwise).
+        try:
+            from ml.jobs import refresh_batch_forecasts
+            from ml.persistence import sync_accuracy_actuals
+
+            sync_accuracy_actuals()
+            refresh_batch_forecasts()
+        except ImportError as exc:
+            logger.info(
+                "ingest_prices_daily: ml package unavailable (%s) — "
+                "skipping accuracy sync + batch forecast refresh",
+                exc,
+            )
+        except Exception:  # pragma: no cover — defensive
+            logger.exception(
+                "ingest_prices_daily: accuracy sync / batch forecast refresh failed"
+            )
+    return inserted
 
 
 def ingest_crypto() -> int:
@@ -405,6 +457,9 @@ def check_price_alerts() -> int:
 
     Thin wrapper around ``sidecar.services.alerts.check_alerts`` so the
     scheduler import path mirrors other jobs (``ingest_*`` live here).
+    Price alerts already fire from the ``BarsIngested`` event raised by
+    ``_upsert_bars``; this periodic full scan is the safety net (missed
+    events, alerts re-armed between ingests) and the sentiment-alert path.
     Returns the number of alerts newly fired.
     """
     try:
@@ -462,6 +517,29 @@ def refresh_forecasts_job() -> int:
         return 0
 
 
+def thin_forecast_snapshots_job() -> int:
+    """Scheduler entry: thin ``forecast_snapshots`` older than
+    ``forecast.snapshot_retention_days`` to one per week per engine.
+
+    Every save appends a snapshot (weekly retrain, 6-hourly stale refresh,
+    per-ingest batch refresh, challenger fits), so without this the table
+    grows without bound. Returns count of snapshots deleted.
+    """
+    try:
+        from ml.persistence import thin_snapshots
+
+        days = int(load_effective_config()["forecast.snapshot_retention_days"])
+        return thin_snapshots(days)
+    except ImportError as exc:
+        logger.info(
+            "thin_forecast_snapshots_job: ml package unavailable (%s)", exc
+        )
+        return 0
+    except Exception:  # pragma: no cover — defensive
+        logger.exception("thin_forecast_snapshots_job failed")
+        return 0
+
+
 def score_news_sentiment_job() -> int:
     """Scheduler entry for the periodic VADER sentiment backfill.
 
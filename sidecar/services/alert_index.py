@@ -0,0 +1,204 @@
+"""In-memory threshold index for armed price alerts.
+
+``check_alerts`` used to load every armed alert and test each one against
+its asset's latest close. This index keeps, per asset, the thresholds of
+armed (active, untriggered) *price* alerts in two sorted arrays — one for
+``above``, one for ``below`` — with the alert ids in parallel arrays. A new
+observation then resolves every crossed alert with one bisect per side:
+
+- ``above`` fires when ``price >= threshold`` → the prefix of the ascending
+  array up to ``bisect_right(price)``.
+- ``below`` fires when ``price <= threshold`` → the suffix from
+  ``bisect_left(price)``.
+
+That is O(log n + k) per asset for n armed alerts and k crossings, instead
+of O(n) Python comparisons.
+
+The database stays the source of truth. ``sidecar.services.alerts`` updates
+the index after each committed create / update / delete / fire, the full
+safety-net scan rebuilds it, and it is rebuilt at startup. It also rebuilds
+itself lazily whenever the process's engine changes (tests swap the DB per
+case). Ids the index returns are always re-checked by a guarded
+``UPDATE ... WHERE triggered_at IS NULL`` before firing, so a stale entry
+can cost a no-op but never a false trigger.
+"""
+
+from __future__ import annotations
+
+import logging
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from decimal import Decimal
+from threading import RLock
+
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+
+from sidecar.db.engine import get_engine, session_scope
+from sidecar.db.models import AlertDirection, AlertMetric, PriceAlert
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Side:
+    """Ascending thresholds with their alert ids in lockstep."""
+
+    thresholds: list[Decimal] = field(default_factory=list)
+    ids: list[int] = field(default_factory=list)
+
+    def insert(self, threshold: Decimal, alert_id: int) -> None:
+        pos = bisect_right(self.thresholds, threshold)
+        self.thresholds.insert(pos, threshold)
+        self.ids.insert(pos, alert_id)
+
+    def remove(self, threshold: Decimal, alert_id: int) -> None:
+        pos = bisect_left(self.thresholds, threshold)
+        end = bisect_right(self.thresholds, threshold)
+        for i in range(pos, end):
+            if self.ids[i] == alert_id:
+                del self.thresholds[i]
+                del self.ids[i]
+                return
+
+
+@dataclass
+class _Book:
+    above: _Side = field(default_factory=_Side)
+    below: _Side = field(default_factory=_Side)
+
+    def side(self, direction: AlertDirection) -> _Side:
+        return self.above if direction == AlertDirection.ABOVE else self.below
+
+
+@dataclass(frozen=True)
+class _Entry:
+    asset_id: int
+    direction: AlertDirection
+    threshold: Decimal
+
+
+class AlertIndex:
+    """Per-asset sorted thresholds of armed price alerts. Thread-safe."""
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._books: dict[int, _Book] = {}
+        self._entries: dict[int, _Entry] = {}
+        # The engine the index was loaded from; None until first load.
+        self._engine: Engine | None = None
+
+    # -- maintenance -------------------------------------------------------
+
+    def rebuild(self) -> int:
+        """Reload every armed price alert from the database. Returns the count."""
+        engine = get_engine()
+        with session_scope() as s:
+            rows = s.execute(
+                select(
+                    PriceAlert.id,
+                    PriceAlert.asset_id,
+                    PriceAlert.direction,
+                    PriceAlert.threshold,
+                ).where(
+                    PriceAlert.is_active.is_(True),
+                    PriceAlert.triggered_at.is_(None),
+                    PriceAlert.metric == AlertMetric.PRICE.value,
+                )
+            ).all()
+        with self._lock:
+            self._books = {}
+            self._entries = {}
+            for alert_id, asset_id, direction, threshold in rows:
+                self._insert(alert_id, asset_id, direction, threshold)
+            self._engine = engine
+        logger.debug("alert index rebuilt with %d armed price alerts", len(rows))
+        return len(rows)
+
+    def _ensure_loaded(self) -> None:
+        if self._engine is not get_engine():
+            self.rebuild()
+
+    def _insert(
+        self,
+        alert_id: int,
+        asset_id: int,
+        direction: AlertDirection,
+        threshold: Decimal,
+    ) -> None:
+        book = self._books.setdefault(asset_id, _Book())
+        book.side(direction).insert(threshold, alert_id)
+        self._entries[alert_id] = _Entry(asset_id, direction, threshold)
+
+    def upsert(self, alert: PriceAlert) -> None:
+        """Sync one alert: (re-)index it if armed, drop it otherwise."""
+        with self._lock:
+            self._ensure_loaded()
+            self._discard(alert.id)
+            armed = (
+                alert.is_active
+                and alert.triggered_at is None
+                and (alert.metric or AlertMetric.PRICE.value)
+                == AlertMetric.PRICE.value
+            )
+            if armed:
+                self._insert(
+                    alert.id, alert.asset_id, alert.direction, alert.threshold
+                )
+
+    def discard(self, alert_ids: Iterable[int]) -> None:
+        with self._lock:
+            for alert_id in alert_ids:
+                self._discard(alert_id)
+
+    def _discard(self, alert_id: int) -> None:
+        entry = self._entries.pop(alert_id, None)
+        if entry is None:
+            return
+        book = self._books[entry.asset_id]
+        book.side(entry.direction).remove(entry.threshold, alert_id)
+        if not (book.above.ids or book.below.ids):
+            del self._books[entry.asset_id]
+
+    # -- queries -----------------------------------------------------------
+
+    def asset_ids(self) -> list[int]:
+        """Assets that currently have at least one armed price alert."""
+        with self._lock:
+            self._ensure_loaded()
+            return list(self._books)
+
+    def crossed(
+        self,
+        asset_id: int,
+        *,
+        high: Decimal | None,
+        low: Decimal | None,
+    ) -> list[int]:
+        """Alert ids on ``asset_id`` crossed by the observed range.
+
+        ``above`` alerts are tested against ``high`` and ``below`` alerts
+        against ``low``; pass the latest close as both for a point check.
+        """
+        with self._lock:
+            self._ensure_loaded()
+            book = self._books.get(asset_id)
+            if book is None:
+                return []
+            out: list[int] = []
+            if high is not None:
+                above = book.above
+                out.extend(above.ids[: bisect_right(above.thresholds, high)])
+            if low is not None:
+                below = book.below
+                out.extend(below.ids[bisect_left(below.thresholds, low) :])
+            return out
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Process-wide instance used by ``sidecar.services.alerts``.
+alert_index = AlertIndex()
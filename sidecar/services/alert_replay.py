@@ -0,0 +1,236 @@
+"""Alert replay — how often would a proposed rule have fired?
+
+Loads the stored history a rule observes and hands it to the vectorized
+evaluator in ``ml.alert_replay``:
+
+- ``price`` rules replay the bars of ``interval`` (default ``5m``) over
+  the last ``days`` days, using each bar's high / low like the live
+  intrabar check.
+- bar-derived metrics (``pct_change`` / ``volatility`` / ``volume_spike``)
+  replay the daily series — the one the live evaluator reads — with
+  ``window_days`` bars of extra history loaded ahead of the range so the
+  first replayed day already has a full window.
+- ``sentiment`` replays the rolling mean over the per-day buckets in
+  ``asset_sentiment_daily``, one observation per UTC day.
+
+Every fire is a fresh crossing: the rule is treated as re-armed after each
+notification, so an excursion that stays beyond the threshold counts once.
+Validation is the alert service's own (same metric / threshold / window
+rules as ``create_alert``), and errors are ``AlertError`` subclasses.
+numpy is an optional dependency; callers see ``ImportError`` when it is
+missing.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime, time, timedelta
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import select
+
+from sidecar.db.engine import session_scope
+from sidecar.db.models import (
+    AlertDirection,
+    AlertMetric,
+    Asset,
+    AssetSentimentDaily,
+    PricePoint,
+)
+from sidecar.services.alerts import (
+    BAR_METRIC_INTERVAL,
+    AlertError,
+    AssetNotFoundError,
+    _parse_direction,
+    _parse_metric,
+    _validate_threshold,
+    _validate_window_days,
+)
+
+REPLAY_DAYS_DEFAULT = 60
+REPLAY_DAYS_MAX = 365
+PRICE_INTERVAL_DEFAULT = "5m"
+# Fire timestamps returned per replay; ``fire_count`` is always exact.
+MAX_REPORTED_FIRES = 500
+
+
+@dataclass(frozen=True)
+class ReplayFire:
+    at: datetime
+    value: Decimal
+
+
+@dataclass(frozen=True)
+class ReplayReport:
+    asset_id: int
+    symbol: str
+    metric: AlertMetric
+    direction: AlertDirection
+    threshold: Decimal
+    window_days: int | None
+    interval: str
+    days: int
+    # Observations in range with a defined metric value.
+    observations: int
+    first_at: datetime | None
+    last_at: datetime | None
+    fire_count: int
+    fires: list[ReplayFire]
+
+    @property
+    def truncated(self) -> bool:
+        return self.fire_count > len(self.fires)
+
+
+def replay_alert(
+    *,
+    asset_id: int,
+    threshold: Any,
+    direction: AlertDirection | str,
+    metric: AlertMetric | str | None = None,
+    window_days: int | None = None,
+    days: int = REPLAY_DAYS_DEFAULT,
+    interval: str | None = None,
+) -> ReplayReport:
+    """Replay an alert rule over the last ``days`` days of stored history.
+
+    ``interval`` only applies to price rules; derived metrics always read
+    the series their live evaluation uses.
+    """
+    metric_enum = _parse_metric(metric)
+    thr = _validate_threshold(metric_enum, threshold)
+    window = _validate_window_days(window_days, metric_enum)
+    dir_enum = _parse_direction(direction)
+    if days < 1 or days > REPLAY_DAYS_MAX:
+        raise AlertError(f"days: must be in [1, {REPLAY_DAYS_MAX}]")
+    if metric_enum == AlertMetric.PRICE:
+        bar_interval = interval or PRICE_INTERVAL_DEFAULT
+    elif interval not in (None, BAR_METRIC_INTERVAL):
+        raise AlertError(
+            f"interval: {metric_enum.value} replays use {BAR_METRIC_INTERVAL!r} bars"
+        )
+    else:
+        bar_interval = BAR_METRIC_INTERVAL
+
+    # Imported here so a missing numpy only breaks this call, not the app.
+    from ml.alert_replay import replay_bars, replay_daily_mean
+
+    above = dir_enum == AlertDirection.ABOVE
+    now = datetime.now(UTC)
+    since = now - timedelta(days=days)
+    with session_scope() as s:
+        asset = s.get(Asset, asset_id)
+        if asset is None:
+            raise AssetNotFoundError(f"asset {asset_id} not found")
+        symbol = asset.symbol
+
+        if metric_enum == AlertMetric.SENTIMENT:
+            assert window is not None
+            first_day = since.date()
+            lead = first_day - timedelta(days=window)
+            span = (now.date() - lead).days + 1
+            sums = [0.0] * span
+            counts = [0] * span
+            for day, total, count in s.execute(
+                select(
+                    AssetSentimentDaily.day,
+                    AssetSentimentDaily.sentiment_sum,
+                    AssetSentimentDaily.article_count,
+                ).where(
+                    AssetSentimentDaily.asset_id == asset_id,
+                    AssetSentimentDaily.day >= lead,
+                    AssetSentimentDaily.day <= now.date(),
+                )
+            ):
+                sums[(day - lead).days] = float(total)
+                counts[(day - lead).days] = int(count)
+            hits = replay_daily_mean(
+                above=above,
+                threshold=float(thr),
+                window=window,
+                sums=sums,
+                counts=counts,
+                warmup=window,
+            )
+            stamps = [
+                datetime.combine(first_day + timedelta(days=i), time(), tzinfo=UTC)
+                for i in range(span - window)
+            ]
+            lead_count = 0
+        else:
+            rows, lead_count = _load_bars(
+                s, asset_id, bar_interval, since, lead_bars=window or 0
+            )
+            hits = replay_bars(
+                metric_enum.value,
+                above=above,
+                threshold=float(thr),
+                window=window,
+                high=[float(r.high) for r in rows],
+                low=[float(r.low) for r in rows],
+                close=[float(r.close) for r in rows],
+                volume=[float(r.volume or 0) for r in rows],
+            )
+            stamps = [_as_utc(r.timestamp) for r in rows]
+
+    fires = [
+        ReplayFire(at=stamps[i], value=Decimal(str(v)))
+        for i, v in zip(
+            hits.indices[:MAX_REPORTED_FIRES],
+            hits.values[:MAX_REPORTED_FIRES],
+            strict=True,
+        )
+    ]
+    in_range = stamps[lead_count:]
+    return ReplayReport(
+        asset_id=asset_id,
+        symbol=symbol,
+        metric=metric_enum,
+        direction=dir_enum,
+        threshold=thr,
+        window_days=window,
+        interval=bar_interval,
+        days=days,
+        observations=hits.evaluated,
+        first_at=in_range[0] if in_range else None,
+        last_at=in_range[-1] if in_range else None,
+        fire_count=len(hits.indices),
+        fires=fires,
+    )
+
+
+def _load_bars(
+    session: Any, asset_id: int, interval: str, since: datetime, *, lead_bars: int
+) -> tuple[list[Any], int]:
+    """Bars of ``interval`` from ``since`` on, preceded by up to
+    ``lead_bars`` older ones so windowed metrics are defined from the first
+    bar in range. Returns the rows and how many of them are lead-in."""
+    cols = (
+        PricePoint.timestamp,
+        PricePoint.high,
+        PricePoint.low,
+        PricePoint.close,
+        PricePoint.volume,
+    )
+    base = select(*cols).where(
+        PricePoint.asset_id == asset_id, PricePoint.interval == interval
+    )
+    lead: list[Any] = []
+    if lead_bars:
+        lead = list(
+            session.execute(
+                base.where(PricePoint.timestamp < since)
+                .order_by(PricePoint.timestamp.desc())
+                .limit(lead_bars)
+            )
+        )
+        lead.reverse()
+    rows = session.execute(
+        base.where(PricePoint.timestamp >= since).order_by(PricePoint.timestamp)
+    )
+    return lead + list(rows), len(lead)
+
+
+def _as_utc(ts: datetime) -> datetime:
+    return ts if ts.tzinfo is not None else ts.replace(tzinfo=UTC)
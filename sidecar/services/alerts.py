@@ -8,21 +8,29 @@ the latest close crosses the threshold in the configured direction, and the
 alert then becomes quiescent until the user explicitly resets it. Resetting
 clears both ``triggered_at`` and ``notified_at`` so it becomes eligible again.
 
-Shell poller handshake
-----------------------
-Delivery to the OS notification surface goes through a polling handshake
-(simpler than SSE, and resilient across shell restarts):
-
-1. Scheduler job calls ``check_alerts()`` which finds active+untriggered
-   alerts whose latest PricePoint satisfies the crossing and stamps
-   ``triggered_at``.
-2. The shell polls ``GET /api/alerts/pending-notifications/`` → returns rows
-   where ``triggered_at IS NOT NULL AND notified_at IS NULL``.
+Shell delivery handshake
+------------------------
+Delivery to the OS notification surface goes through a persisted handshake
+(resilient across shell restarts), woken up by the push stream:
+
+1. ``check_alerts()`` finds active+untriggered alerts that crossed (price
+   alerts: any bar's high / low since the last evaluation) and stamps
+   ``triggered_at`` plus the crossing bar. Price
+   alerts are evaluated event-driven: every price ingest publishes
+   ``BarsIngested`` after its commit and ``on_bars_ingested`` re-checks
+   only the alerts on those assets. The periodic scheduler scan is a
+   low-frequency safety net (and the only path for sentiment alerts).
+2. Each committed fire publishes ``AlertsTriggered``; the push stream
+   (``GET /api/stream/``) forwards it so the shell reacts within the ingest
+   latency. On that event — and on a slow fallback timer — the shell reads
+   ``GET /api/alerts/pending-notifications/`` → rows where
+   ``triggered_at IS NOT NULL AND notified_at IS NULL``.
 3. The shell fires a native notification for each, then POSTs to
    ``/api/alerts/{id}/mark-notified`` → stamps ``notified_at``.
 4. Because both timestamps are persisted, a shell crash between steps 2 and
-   3 simply replays the same notification next poll — no loss, at worst a
-   duplicate ping.
+   3 simply replays the same notification next read — no loss, at worst a
+   duplicate ping. The push event is only a wake-up; the database stays
+   the delivery record.
 
 All functions raise ``AlertError`` subclasses on business-rule violations.
 API endpoints translate those into HTTP 4xx; the service itself has no
@@ -32,23 +40,39 @@ FastAPI dependency so it can be invoked from scripts + tests.
 from __future__ import annotations
 
 import logging
+import math
+import statistics
+from collections.abc import Collection, Iterable, Mapping, Sequence
 from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal, InvalidOperation
-from typing import Any, cast
+from typing import Any, TypeAlias, cast
 
-from sqlalchemy import CursorResult, func, select, update
+from sqlalchemy import CursorResult, and_, case, func, or_, select, update
 
+from ml.volatility import (
+    MIN_RETURNS_FOR_VOL,
+    TRADING_DAYS_PER_YEAR,
+    _log_returns,
+    _stdev,
+)
 from sidecar.db.engine import session_scope
 from sidecar.db.models import (
     AlertDirection,
     AlertMetric,
-    Article,
-    ArticleAsset,
     Asset,
+    AssetSentimentDaily,
     PriceAlert,
     PricePoint,
 )
+from sidecar.events import (
+    AlertsTriggered,
+    BarsIngested,
+    publish_after_commit,
+    subscribe,
+)
+from sidecar.services.alert_index import alert_index
+from sidecar.services.settings import load_effective_config
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +82,21 @@ SENTIMENT_WINDOW_MAX_DAYS = 365
 SENTIMENT_THRESHOLD_MIN = Decimal("-1")
 SENTIMENT_THRESHOLD_MAX = Decimal("1")
 
+# Bar-derived metrics (see ``AlertMetric``) read the daily series; their
+# ``window_days`` counts bars. Minimums keep the statistic meaningful:
+# volatility needs ``MIN_RETURNS_FOR_VOL`` returns, a volume median needs
+# a handful of bars to be a baseline rather than noise.
+BAR_METRIC_INTERVAL = "1d"
+BAR_WINDOW_MIN = {
+    AlertMetric.PCT_CHANGE: 1,
+    AlertMetric.VOLATILITY: MIN_RETURNS_FOR_VOL,
+    AlertMetric.VOLUME_SPIKE: 5,
+}
+BAR_WINDOW_MAX = 250
+BAR_METRICS = frozenset(BAR_WINDOW_MIN)
+# Metrics with a derived observable (everything but the raw close).
+DERIVED_METRICS = BAR_METRICS | {AlertMetric.SENTIMENT}
+
 
 class AlertError(ValueError):
     """Business-rule violation (not found, invalid input, etc.)."""
@@ -101,6 +140,9 @@ class AlertOut:
     # close so the UI can show "$X today" alongside any alert type.
     last_price: Decimal | None
     last_price_at: datetime | None
+    # The bar that fired a price alert and its high / low that crossed.
+    trigger_bar_at: datetime | None
+    trigger_price: Decimal | None
     # The metric's current observed value — for price alerts this is
     # the latest close; for sentiment alerts it's the rolling-mean
     # compound score over ``window_days``. None when no observation is
@@ -145,11 +187,25 @@ def _parse_metric(value: AlertMetric | str | None) -> AlertMetric:
     try:
         return AlertMetric(value.lower())
     except ValueError as exc:
+        choices = ", ".join(repr(m.value) for m in AlertMetric)
         raise AlertError(
-            f"metric: must be 'price' or 'sentiment' (got {value!r})"
+            f"metric: must be one of {choices} (got {value!r})"
         ) from exc
 
 
+def _validate_threshold(metric: AlertMetric, value: Any) -> Decimal:
+    """Parse + range-check a threshold for ``metric``.
+
+    Price, volatility and volume-spike thresholds must be ``> 0``; percent
+    change is signed; sentiment lies in [-1, +1].
+    """
+    signed = metric in (AlertMetric.SENTIMENT, AlertMetric.PCT_CHANGE)
+    thr = _to_decimal(value, field="threshold", allow_negative=signed)
+    if metric == AlertMetric.SENTIMENT:
+        _validate_sentiment_threshold(thr)
+    return thr
+
+
 def _validate_sentiment_threshold(threshold: Decimal) -> None:
     if threshold < SENTIMENT_THRESHOLD_MIN or threshold > SENTIMENT_THRESHOLD_MAX:
         raise AlertError(
@@ -159,48 +215,175 @@ def _validate_sentiment_threshold(threshold: Decimal) -> None:
         )
 
 
-def _validate_window_days(window_days: int | None, *, required: bool) -> int | None:
-    if not required:
+def _validate_window_days(window_days: int | None, metric: AlertMetric) -> int | None:
+    if metric == AlertMetric.PRICE:
         if window_days is not None:
             raise AlertError(
-                "window_days: only valid for sentiment alerts"
+                "window_days: not used by price alerts"
             )
         return None
     if window_days is None:
-        raise AlertError("window_days: required for sentiment alerts")
-    if (
-        window_days < SENTIMENT_WINDOW_MIN_DAYS
-        or window_days > SENTIMENT_WINDOW_MAX_DAYS
-    ):
-        raise AlertError(
-            f"window_days: must be in "
-            f"[{SENTIMENT_WINDOW_MIN_DAYS}, {SENTIMENT_WINDOW_MAX_DAYS}]"
-        )
+        raise AlertError(f"window_days: required for {metric.value} alerts")
+    if metric == AlertMetric.SENTIMENT:
+        lo, hi = SENTIMENT_WINDOW_MIN_DAYS, SENTIMENT_WINDOW_MAX_DAYS
+    else:
+        lo, hi = BAR_WINDOW_MIN[metric], BAR_WINDOW_MAX
+    if window_days < lo or window_days > hi:
+        raise AlertError(f"window_days: must be in [{lo}, {hi}] for {metric.value}")
     return window_days
 
 
-def _compute_sentiment_for_asset(
-    session: Any, asset_id: int, window_days: int
-) -> Decimal | None:
-    """Rolling-mean compound score for one asset over the last ``window_days``.
+SentimentKey: TypeAlias = tuple[int, int]  # (asset_id, window_days)
+
+
+def _rolling_sentiment(
+    session: Any, keys: Iterable[SentimentKey]
+) -> dict[SentimentKey, Decimal]:
+    """Rolling-mean compound score for every (asset, window_days) in ``keys``.
+
+    One grouped query over the ``asset_sentiment_daily`` buckets: each
+    distinct window contributes a ``SUM(CASE WHEN day >= cutoff ...)`` pair
+    of columns, so the cost is O(distinct assets x windows) over small
+    daily rows, independent of how many alerts share a key or how many
+    articles a day holds. Windows are whole UTC days: ``window_days=7``
+    covers the buckets from the day 7 days ago through today.
 
-    Returns None when the window has zero scored articles — distinguishes
-    "no signal" from "signal of 0.0" so alert evaluation can skip rather
-    than misfire on a numerical neutral.
+    Keys whose window has zero scored articles are absent from the result —
+    distinguishes "no signal" from "signal of 0.0" so alert evaluation can
+    skip rather than misfire on a numerical neutral.
     """
-    cutoff = datetime.now(UTC) - timedelta(days=window_days)
-    row = session.execute(
-        select(func.avg(Article.sentiment))
-        .join(ArticleAsset, ArticleAsset.article_id == Article.id)
+    wanted = set(keys)
+    if not wanted:
+        return {}
+    today = datetime.now(UTC).date()
+    cutoffs = {w: today - timedelta(days=w) for w in sorted({w for _, w in wanted})}
+    columns: list[Any] = []
+    for cutoff in cutoffs.values():
+        in_window = AssetSentimentDaily.day >= cutoff
+        columns.append(func.sum(case((in_window, AssetSentimentDaily.sentiment_sum))))
+        columns.append(func.sum(case((in_window, AssetSentimentDaily.article_count))))
+    rows = session.execute(
+        select(AssetSentimentDaily.asset_id, *columns)
         .where(
-            ArticleAsset.asset_id == asset_id,
-            Article.published_at >= cutoff,
-            Article.sentiment.is_not(None),
+            AssetSentimentDaily.asset_id.in_({a for a, _ in wanted}),
+            AssetSentimentDaily.day >= min(cutoffs.values()),
         )
-    ).scalar_one_or_none()
-    if row is None:
-        return None
-    return Decimal(str(float(row)))
+        .group_by(AssetSentimentDaily.asset_id)
+    ).all()
+    out: dict[SentimentKey, Decimal] = {}
+    for asset_id, *sums in rows:
+        for i, window in enumerate(cutoffs):
+            total, count = sums[2 * i], sums[2 * i + 1]
+            if (asset_id, window) in wanted and count:
+                out[(asset_id, window)] = Decimal(str(float(total) / count))
+    return out
+
+
+MetricKey: TypeAlias = tuple[int, str, int]  # (asset_id, metric, window_days)
+
+
+def _bar_metrics(
+    session: Any, keys: Iterable[MetricKey]
+) -> dict[MetricKey, Decimal]:
+    """Bar-derived metric values for every (asset, metric, window) in ``keys``.
+
+    One windowed query pulls the newest ``max(window) + 1`` daily bars of
+    every asset involved (``ROW_NUMBER() OVER (PARTITION BY asset_id ...)``)
+    into per-asset close / volume columns; each distinct key is then
+    computed once from those columns, however many alerts share it.
+    Log-returns are derived once per asset and sliced per window.
+
+    The batching — one query, each key once — is what keeps this cheap; the
+    per-key statistics themselves are plain Python over at most
+    ``BAR_WINDOW_MAX + 1`` values. numpy is an optional ML extra and the
+    alert path has to work without it.
+
+    Keys without enough bars for their window are absent from the result
+    (no signal, no firing).
+    """
+    wanted = set(keys)
+    if not wanted:
+        return {}
+    depth = max(w for _, _, w in wanted) + 1
+    rn = (
+        func.row_number()
+        .over(partition_by=PricePoint.asset_id, order_by=PricePoint.timestamp.desc())
+        .label("rn")
+    )
+    recent = (
+        select(
+            PricePoint.asset_id,
+            PricePoint.timestamp,
+            PricePoint.close,
+            PricePoint.volume,
+            rn,
+        )
+        .where(
+            PricePoint.asset_id.in_({a for a, _, _ in wanted}),
+            PricePoint.interval == BAR_METRIC_INTERVAL,
+        )
+        .subquery()
+    )
+    closes: dict[int, list[tuple[date, float]]] = {}
+    volumes: dict[int, list[float]] = {}
+    for asset_id, ts, close, volume in session.execute(
+        select(recent.c.asset_id, recent.c.timestamp, recent.c.close, recent.c.volume)
+        .where(recent.c.rn <= depth)
+        .order_by(recent.c.asset_id, recent.c.rn.desc())
+    ):
+        closes.setdefault(asset_id, []).append((ts.date(), float(close)))
+        volumes.setdefault(asset_id, []).append(float(volume or 0))
+
+    returns: dict[int, list[float]] = {}
+    out: dict[MetricKey, Decimal] = {}
+    for key in wanted:
+        asset_id, metric, window = key
+        series = closes.get(asset_id, [])
+        value: float | None = None
+        if metric == AlertMetric.PCT_CHANGE and len(series) > window:
+            base = series[-1 - window][1]
+            if base > 0:
+                value = (series[-1][1] / base - 1.0) * 100.0
+        elif metric == AlertMetric.VOLATILITY:
+            if asset_id not in returns:
+                returns[asset_id] = _log_returns(series)
+            tail = returns[asset_id][-window:]
+            if len(tail) >= MIN_RETURNS_FOR_VOL:
+                value = _stdev(tail) * math.sqrt(TRADING_DAYS_PER_YEAR) * 100.0
+        elif metric == AlertMetric.VOLUME_SPIKE:
+            vols = volumes.get(asset_id, [])
+            if len(vols) > window:
+                baseline = statistics.median(vols[-1 - window : -1])
+                if baseline > 0:
+                    value = vols[-1] / baseline
+        if value is not None:
+            out[key] = Decimal(str(value))
+    return out
+
+
+def _metric_keys(alerts: Iterable[PriceAlert]) -> list[MetricKey]:
+    """Keys of the derived-metric alerts in ``alerts`` (price alerts have none)."""
+    return [
+        (alert.asset_id, alert.metric, alert.window_days)
+        for alert in alerts
+        if alert.metric in DERIVED_METRICS and alert.window_days is not None
+    ]
+
+
+def _metric_values(
+    session: Any, keys: Iterable[MetricKey]
+) -> dict[MetricKey, Decimal]:
+    """Current value of every derived-metric key: one sentiment query plus
+    one bar query, regardless of how many alerts or assets are involved."""
+    keys = list(keys)
+    sentiment = _rolling_sentiment(
+        session, [(a, w) for a, m, w in keys if m == AlertMetric.SENTIMENT]
+    )
+    out: dict[MetricKey, Decimal] = {
+        (a, AlertMetric.SENTIMENT.value, w): v for (a, w), v in sentiment.items()
+    }
+    out.update(_bar_metrics(session, [k for k in keys if k[1] in BAR_METRICS]))
+    return out
 
 
 def _latest_point_by_asset(session: Any, asset_ids: list[int]) -> dict[int, PricePoint]:
@@ -266,26 +449,46 @@ def _hydrate(
         created_at=alert.created_at,
         last_price=last_price,
         last_price_at=latest.timestamp if latest is not None else None,
+        trigger_bar_at=alert.trigger_bar_at,
+        trigger_price=alert.trigger_price,
         current_value=current_value,
     )
 
 
 def _hydrate_with_metric_value(
-    session: Any, alert: PriceAlert, asset: Asset, latest: PricePoint | None
+    session: Any,
+    alert: PriceAlert,
+    asset: Asset,
+    latest: PricePoint | None,
+    values: Mapping[MetricKey, Decimal] | None = None,
 ) -> AlertOut:
-    """Hydrate path that fetches the sentiment current value when needed.
+    """Hydrate path that fills in a derived metric's current value.
 
     Used by the read endpoints — list/get/pending — so the UI can show
-    "current sentiment: -0.42" alongside the threshold without a second
-    round-trip.
+    "current sentiment: -0.42" (or "+3.1% over 5 bars") alongside the
+    threshold without a second round-trip. List callers pass ``values``
+    precomputed for every row (see ``_metric_values``); otherwise they
+    are computed for this alert alone.
     """
-    metric = AlertMetric(alert.metric) if alert.metric else AlertMetric.PRICE
-    if metric != AlertMetric.SENTIMENT:
+    keys = _metric_keys([alert])
+    if not keys:
         return _hydrate(alert, asset, latest)
-    if alert.window_days is None:  # pragma: no cover — schema invariant
-        return _hydrate(alert, asset, latest, current_value=None)
-    cv = _compute_sentiment_for_asset(session, asset.id, alert.window_days)
-    return _hydrate(alert, asset, latest, current_value=cv)
+    if values is None:
+        values = _metric_values(session, keys)
+    return _hydrate(alert, asset, latest, current_value=values.get(keys[0]))
+
+
+def _hydrate_rows(session: Any, rows: Sequence[Any]) -> list[AlertOut]:
+    """Hydrate ``(PriceAlert, Asset)`` rows with batched latest-bar and
+    metric-value lookups."""
+    latest = _latest_point_by_asset(session, list({int(r[1].id) for r in rows}))
+    values = _metric_values(session, _metric_keys(r[0] for r in rows))
+    return [
+        _hydrate_with_metric_value(
+            session, alert, asset, latest.get(asset.id), values
+        )
+        for alert, asset in rows
+    ]
 
 
 # ---------------------------------------------------------------------------
@@ -303,15 +506,7 @@ def list_alerts(
         if active_only:
             stmt = stmt.where(PriceAlert.is_active.is_(True))
         stmt = stmt.order_by(PriceAlert.created_at.desc())
-        rows = list(s.execute(stmt).all())
-
-        asset_ids = list({int(r[1].id) for r in rows})
-        latest = _latest_point_by_asset(s, asset_ids)
-
-        return [
-            _hydrate_with_metric_value(s, alert, asset, latest.get(asset.id))
-            for alert, asset in rows
-        ]
+        return _hydrate_rows(s, s.execute(stmt).all())
 
 
 def get_alert(alert_id: int) -> AlertOut:
@@ -328,6 +523,20 @@ def get_alert(alert_id: int) -> AlertOut:
         return _hydrate_with_metric_value(s, alert, asset, latest)
 
 
+def get_alerts(alert_ids: Collection[int]) -> list[AlertOut]:
+    """Hydrate several alerts at once, in id order. Unknown ids are skipped."""
+    if not alert_ids:
+        return []
+    with session_scope() as s:
+        rows = s.execute(
+            select(PriceAlert, Asset)
+            .join(Asset, Asset.id == PriceAlert.asset_id)
+            .where(PriceAlert.id.in_(list(alert_ids)))
+            .order_by(PriceAlert.id)
+        ).all()
+        return _hydrate_rows(s, rows)
+
+
 def list_pending_notifications() -> list[AlertOut]:
     """Alerts that have fired but haven't been shown as an OS notification yet."""
     with session_scope() as s:
@@ -342,12 +551,7 @@ def list_pending_notifications() -> list[AlertOut]:
                 .order_by(PriceAlert.triggered_at)
             ).all()
         )
-        asset_ids = list({int(r[1].id) for r in rows})
-        latest = _latest_point_by_asset(s, asset_ids)
-        return [
-            _hydrate_with_metric_value(s, alert, asset, latest.get(asset.id))
-            for alert, asset in rows
-        ]
+        return _hydrate_rows(s, rows)
 
 
 # ---------------------------------------------------------------------------
@@ -365,13 +569,8 @@ def create_alert(
     window_days: int | None = None,
 ) -> AlertOut:
     metric_enum = _parse_metric(metric)
-    is_sentiment = metric_enum == AlertMetric.SENTIMENT
-    thr = _to_decimal(threshold, field="threshold", allow_negative=is_sentiment)
-    if is_sentiment:
-        _validate_sentiment_threshold(thr)
-    window_days_validated = _validate_window_days(
-        window_days, required=is_sentiment
-    )
+    thr = _validate_threshold(metric_enum, threshold)
+    window_days_validated = _validate_window_days(window_days, metric_enum)
     dir_enum = _parse_direction(direction)
     note_clean: str | None = None
     if note is not None:
@@ -388,9 +587,9 @@ def create_alert(
 
         latest = _latest_point_by_asset(s, [asset_id]).get(asset_id)
         # Reject a PRICE alert whose threshold is already crossed — it would
-        # fire instantly against a possibly-stale bar. Sentiment alerts are
-        # exempt (their observable is a rolling mean, not the last close).
-        if not is_sentiment and latest is not None and _is_crossed(
+        # fire instantly against a possibly-stale bar. Derived metrics are
+        # exempt (their observable is a window statistic, not the last close).
+        if metric_enum == AlertMetric.PRICE and latest is not None and _is_crossed(
             dir_enum, latest.close, thr
         ):
             word = "above" if dir_enum == AlertDirection.ABOVE else "below"
@@ -407,10 +606,14 @@ def create_alert(
             window_days=window_days_validated,
             is_active=True,
             note=note_clean,
+            # Only bars after the one the user was looking at can fire it.
+            evaluated_through=latest.timestamp if latest is not None else None,
         )
         s.add(alert)
         s.flush()
-        return _hydrate_with_metric_value(s, alert, asset, latest)
+        out = _hydrate_with_metric_value(s, alert, asset, latest)
+    alert_index.upsert(alert)
+    return out
 
 
 def update_alert(
@@ -445,15 +648,10 @@ def update_alert(
             metric_enum = (
                 AlertMetric(alert.metric) if alert.metric else AlertMetric.PRICE
             )
-            is_sentiment = metric_enum == AlertMetric.SENTIMENT
-            new_thr = _to_decimal(
-                threshold, field="threshold", allow_negative=is_sentiment
-            )
-            if is_sentiment:
-                _validate_sentiment_threshold(new_thr)
-            alert.threshold = new_thr
+            alert.threshold = _validate_threshold(metric_enum, threshold)
         if direction is not None:
             alert.direction = _parse_direction(direction)
+        rearmed = reset or (is_active is True and not alert.is_active)
         if is_active is not None:
             alert.is_active = bool(is_active)
         if update_note:
@@ -467,10 +665,20 @@ def update_alert(
         if reset:
             alert.triggered_at = None
             alert.notified_at = None
+            alert.trigger_bar_at = None
+            alert.trigger_price = None
 
-        s.flush()
         latest = _latest_point_by_asset(s, [asset.id]).get(asset.id)
-        return _hydrate_with_metric_value(s, alert, asset, latest)
+        if rearmed:
+            # Re-arming starts from now: bars from before the reset (or from
+            # while the alert was paused) must not fire it retroactively.
+            alert.evaluated_through = (
+                latest.timestamp if latest is not None else datetime.now(UTC)
+            )
+        s.flush()
+        out = _hydrate_with_metric_value(s, alert, asset, latest)
+    alert_index.upsert(alert)
+    return out
 
 
 def delete_alert(alert_id: int) -> None:
@@ -479,6 +687,7 @@ def delete_alert(alert_id: int) -> None:
         if alert is None:
             raise AlertNotFoundError(f"alert {alert_id} not found")
         s.delete(alert)
+    alert_index.discard([alert_id])
 
 
 def mark_notified(alert_id: int) -> AlertOut:
@@ -528,71 +737,229 @@ def mark_notified(alert_id: int) -> AlertOut:
 # ---------------------------------------------------------------------------
 
 
-def check_alerts() -> int:
-    """Scan active alerts for threshold crossings and stamp ``triggered_at``.
-
-    Handles both metric types in one pass:
-    - Price alerts compare the latest close against the threshold.
+def check_alerts(
+    *,
+    asset_ids: Collection[int] | None = None,
+    intervals: Collection[str] | None = None,
+) -> int:
+    """Evaluate armed alerts for threshold crossings and stamp ``triggered_at``.
+
+    Handles both metric types:
+    - Price alerts test the high / low of every bar since their
+      high-water mark (see ``_fire_price_alerts``), via the sorted
+      per-asset index in ``alert_index`` (one bisect per side per asset
+      rather than a comparison per alert).
     - Sentiment alerts compute the rolling-mean compound score over the
       alert's ``window_days`` and compare that against the threshold.
       Sentiment alerts whose window has zero scored articles are
       skipped (no signal → no firing).
+    - Bar-derived alerts (percent change, volatility, volume spike) are
+      computed per (asset, metric, window) from one columnar read of the
+      recent daily bars (see ``_bar_metrics``), then compared alike.
+
+    ``asset_ids`` narrows the scan to the bar-driven alerts on those
+    assets — the event-driven path after an ingest, where nothing but
+    prices changed. ``intervals`` are the bar intervals that ingest wrote:
+    bar-derived alerts only read ``BAR_METRIC_INTERVAL`` bars, so they are
+    skipped when it is not among them (a 5m ingest); None means unknown
+    and evaluates them.
+    ``asset_ids=None`` is the periodic safety net: it rebuilds the index from the
+    database (healing any drift) and evaluates everything.
 
     Returns the number of alerts newly fired. Safe to call concurrently
-    with CRUD writes — we only touch active+untriggered rows and always
-    re-check ``triggered_at`` inside the transaction.
+    with CRUD writes — the fire is a guarded UPDATE that only touches rows
+    still active and untriggered.
     """
-    fired = 0
+    if asset_ids is None:
+        alert_index.rebuild()
+        fired = _fire_price_alerts(alert_index.asset_ids())
+        fired += _fire_metric_alerts(DERIVED_METRICS)
+    else:
+        fired = _fire_price_alerts(asset_ids)
+        if intervals is None or BAR_METRIC_INTERVAL in intervals:
+            fired += _fire_metric_alerts(BAR_METRICS, asset_ids)
+    if fired:
+        logger.info("check_alerts: fired %d alerts", fired)
+    return fired
+
+
+def _armed_price_alerts(asset_ids: Collection[int]) -> tuple[Any, ...]:
+    return (
+        PriceAlert.asset_id.in_(list(asset_ids)),
+        PriceAlert.is_active.is_(True),
+        PriceAlert.triggered_at.is_(None),
+        PriceAlert.metric == AlertMetric.PRICE.value,
+    )
+
+
+def _fire_price_alerts(asset_ids: Collection[int]) -> int:
+    """Intrabar evaluation of armed price alerts on ``asset_ids``.
+
+    Each alert carries a high-water mark (``evaluated_through``, falling back
+    to ``created_at``). Per call:
+
+    1. One grouped query for each asset's lowest mark.
+    2. One range query for every bar after those marks, all assets at once.
+    3. The index resolves candidates from each asset's max ``high`` / min
+       ``low`` over the window; only candidates are walked bar by bar (from
+       their own mark) to find the first crossing bar, which is recorded.
+    4. One UPDATE per asset advances the marks of alerts that stayed armed.
+
+    Bars that land with a timestamp at or before an alert's mark (a late
+    backfill) are not re-scanned; the mark only ever moves forward.
+    """
+    armed = set(alert_index.asset_ids())
+    targets = [aid for aid in asset_ids if aid in armed]
+    if not targets:
+        return 0
+    mark = func.coalesce(PriceAlert.evaluated_through, PriceAlert.created_at)
+    fired: list[int] = []
     with session_scope() as s:
-        alerts = list(
-            s.execute(
-                select(PriceAlert).where(
-                    PriceAlert.is_active.is_(True),
-                    PriceAlert.triggered_at.is_(None),
+        asset_marks = {
+            asset_id: floor
+            for asset_id, floor in s.execute(
+                select(PriceAlert.asset_id, func.min(mark))
+                .where(*_armed_price_alerts(targets))
+                .group_by(PriceAlert.asset_id)
+            ).all()
+        }
+        if not asset_marks:
+            return 0
+        bars: dict[int, list[Any]] = {}
+        for row in s.execute(
+            select(
+                PricePoint.asset_id,
+                PricePoint.timestamp,
+                PricePoint.high,
+                PricePoint.low,
+            )
+            .where(
+                or_(
+                    *(
+                        and_(PricePoint.asset_id == aid, PricePoint.timestamp > floor)
+                        for aid, floor in asset_marks.items()
+                    )
                 )
-            ).scalars()
-        )
-        if not alerts:
+            )
+            .order_by(PricePoint.asset_id, PricePoint.timestamp)
+        ):
+            bars.setdefault(row.asset_id, []).append(row)
+        if not bars:
             return 0
 
-        # Pre-load latest prices for any price alerts in one batch — keeps
-        # the loop tight and lets sentiment alerts skip the lookup.
-        price_asset_ids = [
-            alert.asset_id
-            for alert in alerts
-            if (alert.metric or AlertMetric.PRICE.value) == AlertMetric.PRICE.value
+        candidates = [
+            alert_id
+            for asset_id, window in bars.items()
+            for alert_id in alert_index.crossed(
+                asset_id,
+                high=max(b.high for b in window),
+                low=min(b.low for b in window),
+            )
         ]
-        latest = _latest_point_by_asset(s, list(set(price_asset_ids)))
         now = datetime.now(UTC)
+        if candidates:
+            rows = s.execute(
+                select(
+                    PriceAlert.id,
+                    PriceAlert.asset_id,
+                    PriceAlert.direction,
+                    PriceAlert.threshold,
+                    mark,
+                ).where(PriceAlert.id.in_(candidates))
+            ).all()
+            for alert_id, asset_id, direction, threshold, since in rows:
+                above = direction == AlertDirection.ABOVE
+                bar = next(
+                    (
+                        b
+                        for b in bars.get(asset_id, ())
+                        if b.timestamp > since
+                        and _is_crossed(
+                            direction, b.high if above else b.low, threshold
+                        )
+                    ),
+                    None,
+                )
+                if bar is None:
+                    continue
+                hit = s.execute(
+                    update(PriceAlert)
+                    .where(PriceAlert.id == alert_id, *_armed_price_alerts([asset_id]))
+                    .values(
+                        triggered_at=now,
+                        trigger_bar_at=bar.timestamp,
+                        trigger_price=bar.high if above else bar.low,
+                    )
+                    .returning(PriceAlert.id)
+                    .execution_options(synchronize_session=False)
+                ).first()
+                if hit is not None:
+                    fired.append(alert_id)
+            if fired:
+                publish_after_commit(s, AlertsTriggered(frozenset(fired)))
+
+        for asset_id, window in bars.items():
+            newest = window[-1].timestamp
+            s.execute(
+                update(PriceAlert)
+                .where(
+                    *_armed_price_alerts([asset_id]),
+                    or_(
+                        PriceAlert.evaluated_through.is_(None),
+                        PriceAlert.evaluated_through < newest,
+                    ),
+                )
+                .values(evaluated_through=newest)
+                .execution_options(synchronize_session=False)
+            )
+    alert_index.discard(fired)
+    return len(fired)
+
 
+def _fire_metric_alerts(
+    metrics: Collection[AlertMetric], asset_ids: Collection[int] | None = None
+) -> int:
+    """Fire armed derived-metric alerts (``metrics``, optionally on
+    ``asset_ids`` only) whose current value crosses the threshold."""
+    fired: list[int] = []
+    with session_scope() as s:
+        stmt = select(PriceAlert).where(
+            PriceAlert.is_active.is_(True),
+            PriceAlert.triggered_at.is_(None),
+            PriceAlert.metric.in_([m.value for m in metrics]),
+        )
+        if asset_ids is not None:
+            stmt = stmt.where(PriceAlert.asset_id.in_(list(asset_ids)))
+        alerts = list(s.execute(stmt).scalars())
+        if not alerts:
+            return 0
+        values = _metric_values(s, _metric_keys(alerts))
+        now = datetime.now(UTC)
         for alert in alerts:
-            if alert.triggered_at is not None:  # defensive re-check
+            keys = _metric_keys([alert])
+            value = values.get(keys[0]) if keys else None
+            if value is None:
                 continue
-            metric = (
-                AlertMetric(alert.metric) if alert.metric else AlertMetric.PRICE
-            )
-            if metric == AlertMetric.PRICE:
-                point = latest.get(alert.asset_id)
-                if point is None:
-                    continue
-                if _is_crossed(alert.direction, point.close, alert.threshold):
-                    alert.triggered_at = now
-                    fired += 1
-            else:  # AlertMetric.SENTIMENT
-                if alert.window_days is None:  # schema invariant; defensive
-                    continue
-                value = _compute_sentiment_for_asset(
-                    s, alert.asset_id, alert.window_days
-                )
-                if value is None:
-                    continue
-                if _is_crossed(alert.direction, value, alert.threshold):
-                    alert.triggered_at = now
-                    fired += 1
+            if _is_crossed(alert.direction, value, alert.threshold):
+                alert.triggered_at = now
+                fired.append(alert.id)
+        if fired:
+            publish_after_commit(s, AlertsTriggered(frozenset(fired)))
+    return len(fired)
 
-    if fired:
-        logger.info("check_alerts: fired %d alerts", fired)
-    return fired
+
+def on_bars_ingested(evt: BarsIngested) -> None:
+    """Event handler: re-check price and bar-derived alerts on the assets
+    that just got bars.
+
+    Honours ``check_alerts.enabled`` so the toggle still pauses all firing.
+    """
+    if not bool(load_effective_config()["check_alerts.enabled"]):
+        return
+    check_alerts(asset_ids=evt.asset_ids, intervals=evt.intervals)
+
+
+subscribe(BarsIngested, on_bars_ingested)
 
 
 # ---------------------------------------------------------------------------
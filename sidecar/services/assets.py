@@ -24,6 +24,7 @@ from sqlalchemy import func, select
 from sidecar.db.engine import session_scope
 from sidecar.db.models import Asset, AssetType
 from sidecar.ingestion.yfinance_fetcher import fetch_prices
+from sidecar.single_flight import single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -158,6 +159,7 @@ def resolve_symbol(raw: str) -> ResolvedSymbol:
     """Validate a user-supplied symbol against yfinance and return canonical info.
 
     Raises :class:`SymbolNotFoundError` if yfinance can't resolve the symbol.
+    Concurrent lookups of the same symbol share one set of Yahoo calls.
     """
     symbol = raw.strip().upper()
     if not symbol:
@@ -166,7 +168,11 @@ def resolve_symbol(raw: str) -> ResolvedSymbol:
         raise AssetServiceError(
             f"symbol too long (max {_MAX_SYMBOL_LEN} chars)"
         )
+    return single_flight.do("assets.resolve", symbol, lambda: _resolve_uncached(symbol))
 
+
+def _resolve_uncached(symbol: str) -> ResolvedSymbol:
+    """The Yahoo lookups behind :func:`resolve_symbol` (``symbol`` normalised)."""
     ticker = yf.Ticker(symbol)
     fast = _safe_fast_info(ticker)
     info = _safe_info(ticker)
@@ -445,7 +451,11 @@ def search_symbols(query: str, limit: int = 10) -> list[SymbolSearchHit]:
     if cached is not None:
         return cached
 
-    quotes = _fetch_search_quotes(q, limit)
+    # Misses for the same key that race each other (two search boxes, a
+    # fast retype before the first answer lands) share one upstream call.
+    quotes = single_flight.do(
+        "assets.search", cache_key, lambda: _fetch_search_quotes(q, limit)
+    )
 
     seen: set[str] = set()
     hits: list[SymbolSearchHit] = []
@@ -0,0 +1,229 @@
+"""Dashboard service — quotes + sparklines for a whole watchlist at once.
+
+The Dashboard used to assemble its cards client-side: the default
+watchlist, the full asset list, a batch quote call and one
+``/api/prices/{symbol}/?limit=60`` request per asset — N + 3 round-trips,
+N price queries and 60 fully-validated OHLCV objects per card, of which
+the sparkline only draws the closes.
+
+``get_dashboard`` answers the same question with one windowed query over
+``price_points``::
+
+    ROW_NUMBER() OVER (PARTITION BY asset_id, interval
+                       ORDER BY timestamp DESC) AS rn
+
+filtered to the newest ``points`` bars of the sparkline interval and the
+newest two daily / one intraday bar per asset. The window only sees bars
+after a per-asset floor: the asset's newest bar minus the calendar span
+those rows can cover (``_floor_days``), so SQLite numbers a week or two of
+history instead of everything stored. The floor counts back from the
+newest bar rather than the clock, so a dashboard opened after days
+offline still shows the last sessions. The quote for each asset
+is derived from those same rows (``sidecar.services.quotes`` math), and
+the sparkline goes out as packed parallel arrays (epoch seconds + closes)
+rather than per-bar objects.
+
+Which assets: the requested watchlist, else the default watchlist, else
+every active asset — the same fallback the Dashboard applied before any
+watchlist exists.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import and_, func, or_, select
+
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Asset, PricePoint, Watchlist, WatchlistItem
+from sidecar.services.quotes import (
+    DAILY_INTERVAL,
+    INTRADAY_INTERVAL,
+    Quote,
+    _compose_quote,
+)
+from sidecar.services.watchlists import WatchlistNotFoundError
+
+SPARKLINE_POINTS = 60
+SPARKLINE_POINTS_MAX = 500
+
+# Bar cadence of the intervals the floor can be sized for. Other intervals
+# (the column is free-form) read without a floor.
+INTERVAL_STEPS = {
+    INTRADAY_INTERVAL: timedelta(minutes=5),
+    DAILY_INTERVAL: timedelta(days=1),
+}
+# Shortest trading session (US equities); intraday bars only print in one.
+SESSION_HOURS = 6.5
+# Calendar days added on top of weekends: holidays, a daily bar that has
+# not landed yet.
+FLOOR_SLACK_DAYS = 7
+
+
+@dataclass(frozen=True)
+class Sparkline:
+    interval: str
+    # Parallel arrays, oldest first: bar open time (epoch seconds) + close.
+    t: list[int]
+    close: list[float]
+
+
+@dataclass(frozen=True)
+class DashboardItem:
+    asset_id: int
+    is_active: bool
+    quote: Quote
+    sparkline: Sparkline
+
+
+@dataclass(frozen=True)
+class Dashboard:
+    # None when no watchlist exists and all active assets are shown.
+    watchlist_id: int | None
+    watchlist_name: str | None
+    items: list[DashboardItem]
+
+
+def _epoch(ts: datetime) -> int:
+    return int((ts if ts.tzinfo is not None else ts.replace(tzinfo=UTC)).timestamp())
+
+
+def _floor_days(depth: dict[str, int]) -> int | None:
+    """Calendar days that hold the newest ``n`` bars of every interval in
+    ``depth``, or ``None`` if one of them has no known cadence."""
+    days = 0
+    for interval, bars in depth.items():
+        step = INTERVAL_STEPS.get(interval)
+        if step is None:
+            return None
+        per_session = max(step, timedelta(hours=SESSION_HOURS))
+        days = max(days, math.ceil(bars * step / per_session) * 7 // 5)
+    return days + FLOOR_SLACK_DAYS
+
+
+def get_dashboard(
+    *,
+    watchlist_id: int | None = None,
+    points: int = SPARKLINE_POINTS,
+    interval: str = INTRADAY_INTERVAL,
+) -> Dashboard:
+    """Quotes and ``points``-bar sparklines for every asset on a watchlist.
+
+    ``watchlist_id`` defaults to the default watchlist. Raises
+    ``WatchlistNotFoundError`` for an unknown id.
+    """
+    with session_scope() as s:
+        if watchlist_id is not None:
+            watchlist = s.get(Watchlist, watchlist_id)
+            if watchlist is None:
+                raise WatchlistNotFoundError(f"watchlist {watchlist_id} not found")
+        else:
+            watchlist = s.execute(
+                select(Watchlist).where(Watchlist.is_default.is_(True))
+            ).scalar_one_or_none()
+
+        if watchlist is not None:
+            assets = list(
+                s.execute(
+                    select(Asset)
+                    .join(WatchlistItem, WatchlistItem.asset_id == Asset.id)
+                    .where(WatchlistItem.watchlist_id == watchlist.id)
+                    .order_by(WatchlistItem.position)
+                ).scalars()
+            )
+        else:
+            assets = list(
+                s.execute(
+                    select(Asset)
+                    .where(Asset.is_active.is_(True))
+                    .order_by(Asset.symbol)
+                ).scalars()
+            )
+
+        # Rows needed per interval: the sparkline plus what the quote reads.
+        depth = {INTRADAY_INTERVAL: 1, DAILY_INTERVAL: 2}
+        depth[interval] = max(depth.get(interval, 0), points)
+        floor_days = _floor_days(depth)
+        rn = (
+            func.row_number()
+            .over(
+                partition_by=(PricePoint.asset_id, PricePoint.interval),
+                order_by=PricePoint.timestamp.desc(),
+            )
+            .label("rn")
+        )
+        rows = select(
+            PricePoint.asset_id,
+            PricePoint.interval,
+            PricePoint.timestamp,
+            PricePoint.open,
+            PricePoint.close,
+            rn,
+        ).where(
+            PricePoint.asset_id.in_([a.id for a in assets]),
+            PricePoint.interval.in_(list(depth)),
+        )
+        if floor_days is not None:
+            newest = (
+                select(PricePoint.timestamp)
+                .where(PricePoint.asset_id == Asset.id)
+                .order_by(PricePoint.timestamp.desc())
+                .limit(1)
+                .correlate(Asset)
+                .scalar_subquery()
+            )
+            floors = (
+                select(
+                    Asset.id.label("asset_id"),
+                    func.datetime(newest, f"-{floor_days} days").label("floor"),
+                )
+                .where(Asset.id.in_([a.id for a in assets]))
+                .subquery()
+            )
+            rows = rows.join(floors, floors.c.asset_id == PricePoint.asset_id).where(
+                PricePoint.timestamp >= floors.c.floor
+            )
+        recent = rows.subquery()
+        bars: dict[tuple[int, str], list[Any]] = {}
+        for row in s.execute(
+            select(recent)
+            .where(
+                or_(
+                    *(
+                        and_(recent.c.interval == iv, recent.c.rn <= n)
+                        for iv, n in depth.items()
+                    )
+                )
+            )
+            .order_by(recent.c.asset_id, recent.c.interval, recent.c.rn)
+        ):
+            bars.setdefault((row.asset_id, row.interval), []).append(row)
+
+        items: list[DashboardItem] = []
+        for asset in assets:
+            daily = bars.get((asset.id, DAILY_INTERVAL), [])
+            intraday = bars.get((asset.id, INTRADAY_INTERVAL), [])
+            spark = bars.get((asset.id, interval), [])[:points]
+            spark.reverse()
+            items.append(
+                DashboardItem(
+                    asset_id=asset.id,
+                    is_active=asset.is_active,
+                    quote=_compose_quote(
+                        asset, daily[:2], intraday[0] if intraday else None
+                    ),
+                    sparkline=Sparkline(
+                        interval=interval,
+                        t=[_epoch(r.timestamp) for r in spark],
+                        close=[float(r.close) for r in spark],
+                    ),
+                )
+            )
+        return Dashboard(
+            watchlist_id=watchlist.id if watchlist is not None else None,
+            watchlist_name=watchlist.name if watchlist is not None else None,
+            items=items,
+        )
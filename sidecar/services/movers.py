@@ -0,0 +1,299 @@
+"""Top movers — heap-ranked gainers / losers over a choice of windows.
+
+The Market overview used to rank client-side from ``GET /api/quotes/``,
+which builds every quote with two queries per asset. ``get_movers``
+computes the window's return for the whole universe from a single
+windowed statement over ``price_points`` and keeps only the top ``k`` of
+each side with ``heapq.nlargest`` / ``heapq.nsmallest`` (O(n log k)).
+
+Windows
+-------
+- ``1d`` — last price vs. the previous session close: exactly the quote's
+  ``change_pct`` (``sidecar.services.quotes``).
+- ``5d`` / ``1m`` — last price vs. the daily close 5 / 21 sessions before
+  the latest daily bar.
+- ``24h`` — rolling: last price vs. the newest intraday bar at or before
+  ``now - 24h``. An asset that has not traded since then shows 0%.
+
+"Last price" follows the quote rule (latest intraday close, else latest
+daily close). One statement reads, per asset:
+
+- the newest ``sessions + 1`` daily bars, numbered with ``ROW_NUMBER()``
+  over a lookback sized from the window (``_daily_lookback``). No index
+  leads with ``interval``, so the daily scan walks every bar in that
+  range; the lookback is what keeps it small.
+- the latest intraday bar, and for ``24h`` the newest one at or before
+  the boundary, each as a correlated ``ORDER BY timestamp DESC LIMIT 1``
+  on the ``(asset_id, timestamp)`` index — a few index steps per asset,
+  where numbering every intraday bar would visit weeks of 5m history.
+
+The ranked universe per window is cached and dropped on ``BarsIngested``,
+so repeat requests between ingests are a heap selection over a list in
+memory.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import and_, func, literal, select, union_all
+
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Asset, AssetType, PricePoint
+from sidecar.events import BarsIngested, subscribe
+from sidecar.services.quotes import DAILY_INTERVAL, INTRADAY_INTERVAL, _compose_quote
+
+# Sessions back for the daily-bar windows (``1d`` is the quote itself).
+SESSION_WINDOWS = {"1d": 1, "5d": 5, "1m": 21}
+ROLLING_WINDOWS = {"24h": timedelta(hours=24)}
+MOVER_WINDOWS = (*SESSION_WINDOWS, *ROLLING_WINDOWS)
+MOVERS_K_MAX = 100
+# Calendar days added to a daily window on top of its weekends: holidays
+# and a daily bar that has not landed yet.
+DAILY_LOOKBACK_SLACK_DAYS = 10
+# How far before the 24h boundary an intraday anchor may be.
+ROLLING_ANCHOR_SLACK = timedelta(days=7)
+
+
+class MoversError(ValueError):
+    """Base for movers-service errors."""
+
+
+@dataclass(frozen=True)
+class Mover:
+    asset_id: int
+    symbol: str
+    name: str
+    asset_type: AssetType
+    last_price: Decimal
+    last_at: datetime | None
+    base_price: Decimal
+    change: Decimal
+    change_pct: float
+
+
+@dataclass(frozen=True)
+class Movers:
+    window: str
+    computed_at: datetime
+    # Assets considered, and how many had a return for the window.
+    universe: int
+    ranked: int
+    by_type: dict[str, int]
+    gainers: list[Mover]
+    losers: list[Mover]
+
+
+@dataclass(frozen=True)
+class _Ranking:
+    computed_at: datetime
+    universe: int
+    by_type: dict[str, int]
+    movers: list[Mover]
+
+
+_cache: dict[tuple[str, bool], _Ranking] = {}
+_cache_lock = Lock()
+# Bumped on every invalidation so a ranking computed across an ingest is
+# not cached as current.
+_generation = 0
+
+
+def invalidate_movers() -> None:
+    """Drop every cached ranking (new bars, or a test switching databases)."""
+    global _generation
+    with _cache_lock:
+        _cache.clear()
+        _generation += 1
+
+
+def _on_bars_ingested(_evt: BarsIngested) -> None:
+    invalidate_movers()
+
+
+subscribe(BarsIngested, _on_bars_ingested)
+
+
+# ---------------------------------------------------------------------------
+# Ranking
+# ---------------------------------------------------------------------------
+
+
+def _daily_lookback(sessions: int) -> timedelta:
+    """Calendar days that hold the newest ``sessions + 1`` daily bars."""
+    return timedelta(days=(sessions + 1) * 7 // 5 + DAILY_LOOKBACK_SLACK_DAYS)
+
+
+def _intraday_at(asset_ids: Any, *bounds: Any) -> Any:
+    """``(asset_id, timestamp)`` of each asset's newest intraday bar within
+    ``bounds`` — a correlated ``LIMIT 1`` per asset, walked off the index."""
+    newest = (
+        select(PricePoint.timestamp)
+        .where(
+            PricePoint.asset_id == Asset.id,
+            PricePoint.interval == INTRADAY_INTERVAL,
+            *bounds,
+        )
+        .order_by(PricePoint.timestamp.desc())
+        .limit(1)
+        .correlate(Asset)
+        .scalar_subquery()
+    )
+    return (
+        select(Asset.id.label("asset_id"), newest.label("ts"))
+        .where(Asset.id.in_(asset_ids))
+        .subquery()
+    )
+
+
+def _rank(window: str, *, active_only: bool) -> _Ranking:
+    now = datetime.now(UTC)
+    sessions = SESSION_WINDOWS.get(window, 1)
+
+    with session_scope() as s:
+        stmt = select(Asset)
+        if active_only:
+            stmt = stmt.where(Asset.is_active.is_(True))
+        assets = list(s.execute(stmt.order_by(Asset.symbol)).scalars())
+
+        cols = (
+            PricePoint.asset_id,
+            PricePoint.interval,
+            PricePoint.timestamp,
+            PricePoint.open,
+            PricePoint.close,
+        )
+        asset_ids = select(Asset.id)
+        if active_only:
+            asset_ids = asset_ids.where(Asset.is_active.is_(True))
+        rn = (
+            func.row_number()
+            .over(partition_by=PricePoint.asset_id, order_by=PricePoint.timestamp.desc())
+            .label("rn")
+        )
+        daily_rows = (
+            select(*cols, rn, literal("recent").label("kind"))
+            .where(
+                PricePoint.asset_id.in_(asset_ids),
+                PricePoint.interval == DAILY_INTERVAL,
+                PricePoint.timestamp >= now - _daily_lookback(sessions),
+            )
+            .subquery()
+        )
+        parts: list[Any] = [select(daily_rows).where(daily_rows.c.rn <= sessions + 1)]
+
+        def intraday_rows(kind: str, *bounds: Any) -> Any:
+            at = _intraday_at(asset_ids, *bounds)
+            return select(*cols, literal(1).label("rn"), literal(kind).label("kind")).join(
+                at,
+                and_(
+                    PricePoint.asset_id == at.c.asset_id,
+                    PricePoint.timestamp == at.c.ts,
+                    PricePoint.interval == INTRADAY_INTERVAL,
+                ),
+            )
+
+        parts.append(intraday_rows("recent"))
+        if window in ROLLING_WINDOWS:
+            boundary = now - ROLLING_WINDOWS[window]
+            parts.append(
+                intraday_rows(
+                    "anchor",
+                    PricePoint.timestamp <= boundary,
+                    PricePoint.timestamp >= boundary - ROLLING_ANCHOR_SLACK,
+                )
+            )
+
+        daily: dict[int, list[Any]] = {}
+        intraday: dict[int, Any] = {}
+        anchors: dict[int, Any] = {}
+        for row in s.execute(union_all(*parts).order_by("asset_id", "rn")):
+            if row.kind == "anchor":
+                anchors[row.asset_id] = row
+            elif row.interval == DAILY_INTERVAL:
+                daily.setdefault(row.asset_id, []).append(row)
+            else:
+                intraday[row.asset_id] = row
+
+        movers: list[Mover] = []
+        by_type: dict[str, int] = {}
+        for asset in assets:
+            by_type[asset.asset_type.value] = by_type.get(asset.asset_type.value, 0) + 1
+            bars = daily.get(asset.id, [])
+            quote = _compose_quote(asset, bars[:2], intraday.get(asset.id))
+            if quote.last_price is None:
+                continue
+            base: Decimal | None
+            if window == "1d":
+                base = quote.previous_close
+            elif window in SESSION_WINDOWS:
+                base = bars[sessions].close if len(bars) > sessions else None
+            else:
+                anchor_row = anchors.get(asset.id)
+                base = anchor_row.close if anchor_row is not None else None
+            if base is None or base == 0:
+                continue
+            change = quote.last_price - base
+            movers.append(
+                Mover(
+                    asset_id=asset.id,
+                    symbol=asset.symbol,
+                    name=asset.name,
+                    asset_type=asset.asset_type,
+                    last_price=quote.last_price,
+                    last_at=quote.last_at,
+                    base_price=base,
+                    change=change,
+                    change_pct=float(change / base) * 100.0,
+                )
+            )
+    return _Ranking(
+        computed_at=now, universe=len(assets), by_type=by_type, movers=movers
+    )
+
+
+def get_movers(
+    window: str = "1d", k: int = 5, *, active_only: bool = True
+) -> Movers:
+    """Top ``k`` gainers (change > 0) and losers (change < 0) over ``window``.
+
+    Gainers are ordered best first, losers worst first. Raises
+    ``MoversError`` for an unknown window or a ``k`` out of range.
+    """
+    if window not in MOVER_WINDOWS:
+        raise MoversError(
+            f"window: must be one of {', '.join(MOVER_WINDOWS)} (got {window!r})"
+        )
+    if k < 1 or k > MOVERS_K_MAX:
+        raise MoversError(f"k: must be in [1, {MOVERS_K_MAX}]")
+    key = (window, active_only)
+    with _cache_lock:
+        ranking = _cache.get(key)
+        generation = _generation
+    if ranking is None:
+        ranking = _rank(window, active_only=active_only)
+        with _cache_lock:
+            if generation == _generation:
+                _cache[key] = ranking
+
+    def pct(m: Mover) -> float:
+        return m.change_pct
+
+    return Movers(
+        window=window,
+        computed_at=ranking.computed_at,
+        universe=ranking.universe,
+        ranked=len(ranking.movers),
+        by_type=dict(ranking.by_type),
+        gainers=heapq.nlargest(
+            k, (m for m in ranking.movers if m.change_pct > 0), key=pct
+        ),
+        losers=heapq.nsmallest(
+            k, (m for m in ranking.movers if m.change_pct < 0), key=pct
+        ),
+    )
@@ -0,0 +1,182 @@
+"""Push hub — fan-out and replay buffer behind the ``/api/stream/`` channel.
+
+The shell used to learn about new data by polling: pending alert
+notifications every 30 s, the alert list every 60 s. The hub turns the
+sidecar's in-process events (``sidecar.events``) into a numbered stream
+that any number of connected clients consume:
+
+- ``publish(kind, payload, symbols=...)`` is called from whatever thread
+  produced the event (scheduler workers, request handlers). It stamps the
+  next sequence number, appends the event to a bounded replay buffer and
+  hands it to every subscriber's asyncio queue via
+  ``loop.call_soon_threadsafe`` — the only safe way to touch a queue owned
+  by the server's event loop from another thread.
+- ``subscribe()`` registers a queue on the running loop. The stream
+  endpoint subscribes *before* it reads the replay buffer, so an event
+  published in between is seen once (duplicates are dropped by id).
+
+Resume
+------
+Event ids are ``"<epoch>-<seq>"``: ``epoch`` is fixed per hub instance
+(i.e. per sidecar process) and ``seq`` increases by one per event. A client
+that reconnects with ``Last-Event-ID`` is replayed everything after that
+id when the buffer still holds it. When it does not — the sidecar
+restarted (different epoch) or the client was away for longer than the
+buffer covers — ``replay_since`` returns None and the stream tells the
+client to ``reset``: re-read its state over REST, then carry on live.
+
+Slow consumers
+--------------
+Each subscriber queue is bounded. A client that falls ``QUEUE_MAX`` events
+behind is marked overflowed and its stream ends; it reconnects and resumes
+from the buffer like any other reconnect. The publisher never blocks on a
+slow client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+REPLAY_BUFFER = 1000
+QUEUE_MAX = 500
+
+
+@dataclass(frozen=True)
+class PushEvent:
+    """One stream event. ``symbols`` scopes it; None means every client."""
+
+    seq: int
+    kind: str
+    data: str
+    symbols: frozenset[str] | None = None
+
+    def visible_to(self, symbols: frozenset[str] | None) -> bool:
+        """True when a client subscribed to ``symbols`` (None: all) gets it."""
+        return self.symbols is None or symbols is None or not self.symbols.isdisjoint(
+            symbols
+        )
+
+
+@dataclass(eq=False)
+class Subscriber:
+    loop: asyncio.AbstractEventLoop
+    queue: asyncio.Queue[PushEvent] = field(
+        default_factory=lambda: asyncio.Queue(QUEUE_MAX)
+    )
+    overflowed: bool = False
+
+    def _offer(self, evt: PushEvent) -> None:
+        # Runs on ``loop``.
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(evt)
+        except asyncio.QueueFull:
+            # The consumer is blocked writing to the socket; it notices the
+            # flag before its next read and ends the stream.
+            self.overflowed = True
+
+
+class PushHub:
+    """Numbered event fan-out with a bounded replay buffer. Thread-safe."""
+
+    def __init__(self, *, buffer_size: int = REPLAY_BUFFER) -> None:
+        self.epoch = format(time.time_ns() // 1_000_000, "x")
+        self._lock = Lock()
+        self._seq = 0
+        self._buffer: deque[PushEvent] = deque(maxlen=buffer_size)
+        self._subscribers: set[Subscriber] = set()
+
+    # -- ids ---------------------------------------------------------------
+
+    def event_id(self, seq: int) -> str:
+        return f"{self.epoch}-{seq}"
+
+    def parse_event_id(self, raw: str | None) -> int | None:
+        """Sequence number of ``raw`` if it was issued by this hub, else None."""
+        if not raw:
+            return None
+        epoch, _, seq = raw.strip().rpartition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        return int(seq)
+
+    @property
+    def head(self) -> int:
+        """Sequence number of the newest event (0 before the first)."""
+        with self._lock:
+            return self._seq
+
+    # -- publish / subscribe -------------------------------------------------
+
+    def publish(
+        self,
+        kind: str,
+        payload: Any,
+        *,
+        symbols: Iterable[str] | None = None,
+    ) -> PushEvent:
+        """Record and fan out one event. Callable from any thread."""
+        data = json.dumps(payload, separators=(",", ":"), default=str)
+        with self._lock:
+            self._seq += 1
+            evt = PushEvent(
+                self._seq,
+                kind,
+                data,
+                frozenset(symbols) if symbols is not None else None,
+            )
+            self._buffer.append(evt)
+            subscribers = list(self._subscribers)
+        for sub in subscribers:
+            try:
+                sub.loop.call_soon_threadsafe(sub._offer, evt)
+            except RuntimeError:
+                # Loop closed under us (server shutting down).
+                self._drop(sub)
+        return evt
+
+    @contextmanager
+    def subscribe(self) -> Iterator[Subscriber]:
+        """Register a queue on the running event loop for the ``with`` body."""
+        sub = Subscriber(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.add(sub)
+        try:
+            yield sub
+        finally:
+            self._drop(sub)
+
+    def _drop(self, sub: Subscriber) -> None:
+        with self._lock:
+            self._subscribers.discard(sub)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    # -- replay --------------------------------------------------------------
+
+    def replay_since(self, seq: int) -> list[PushEvent] | None:
+        """Buffered events after ``seq``, or None if some were already evicted."""
+        with self._lock:
+            if seq > self._seq:
+                return None
+            if seq == self._seq:
+                return []
+            oldest = self._buffer[0].seq if self._buffer else self._seq + 1
+            if seq + 1 < oldest:
+                return None
+            return [e for e in self._buffer if e.seq > seq]
+
+
+# Process-wide instance fed by ``sidecar.api.stream``.
+push_hub = PushHub()
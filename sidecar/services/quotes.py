@@ -23,9 +23,11 @@ scripts/tests and by the alerts engine.
 
 from __future__ import annotations
 
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
+from typing import Protocol
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -83,10 +85,29 @@ def _recent_daily(session: Session, asset_id: int) -> list[PricePoint]:
     )
 
 
-def _build_quote(session: Session, asset: Asset) -> Quote:
-    daily = _recent_daily(session, asset.id)
-    intraday = _latest_intraday(session, asset.id)
+class _Bar(Protocol):
+    """What quote math reads from a bar — a ``PricePoint`` or a result row."""
 
+    @property
+    def timestamp(self) -> datetime: ...
+    @property
+    def open(self) -> Decimal: ...
+    @property
+    def close(self) -> Decimal: ...
+
+
+def build_quote(session: Session, asset: Asset) -> Quote:
+    """``asset``'s quote, read through the caller's session."""
+    return _compose_quote(
+        asset, _recent_daily(session, asset.id), _latest_intraday(session, asset.id)
+    )
+
+
+def _compose_quote(
+    asset: Asset, daily: Sequence[_Bar], intraday: _Bar | None
+) -> Quote:
+    """Quote from the two newest daily bars (newest first) and the latest
+    intraday bar — the figures described in the module docstring."""
     previous_close: Decimal | None
     if len(daily) >= 2:
         previous_close = daily[1].close
@@ -145,7 +166,7 @@ def get_quotes(
             stmt = stmt.where(Asset.is_active.is_(True))
         assets = list(s.execute(stmt.order_by(Asset.symbol)).scalars())
 
-        quotes = [_build_quote(s, a) for a in assets]
+        quotes = [build_quote(s, a) for a in assets]
 
     if requested is not None:
         order = {sym: i for i, sym in enumerate(requested)}
@@ -153,6 +174,17 @@ def get_quotes(
     return quotes
 
 
+def get_quotes_for_assets(asset_ids: Collection[int]) -> list[Quote]:
+    """Quotes for the given asset ids, in symbol order. Unknown ids are skipped."""
+    if not asset_ids:
+        return []
+    with session_scope() as s:
+        assets = s.execute(
+            select(Asset).where(Asset.id.in_(list(asset_ids))).order_by(Asset.symbol)
+        ).scalars()
+        return [build_quote(s, a) for a in assets]
+
+
 def get_quote(symbol: str) -> Quote:
     sym = symbol.strip().upper()
     with session_scope() as s:
@@ -161,4 +193,4 @@ def get_quote(symbol: str) -> Quote:
         ).scalar_one_or_none()
         if asset is None:
             raise SymbolNotFoundError(f"Unknown symbol: {sym}")
-        return _build_quote(s, asset)
+        return build_quote(s, asset)
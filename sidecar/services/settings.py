@@ -194,19 +194,20 @@ SETTINGS_SPECS: tuple[SettingSpec, ...] = (
         default=True,
         label="Enable price alert checks",
         description=(
-            "Periodically scan active alerts against the latest price bar. "
-            "Disable to pause all alert firing without deleting alerts."
+            "Check active alerts against the latest price bar as new prices "
+            "land. Disable to pause all alert firing without deleting alerts."
         ),
     ),
     SettingSpec(
         key="check_alerts.interval_minutes",
         type=SettingType.INT,
         env_attr="check_alerts_interval_minutes",
-        default=1,
-        label="Alert check interval (minutes)",
+        default=15,
+        label="Alert safety-net scan interval (minutes)",
         description=(
-            "How often to evaluate active alerts. Lower values catch crossings "
-            "sooner but add more DB work. 1 minute is fine for tens of alerts."
+            "Price alerts are re-checked as soon as new prices land; this "
+            "periodic full scan is a safety net and also evaluates "
+            "sentiment alerts."
         ),
         min=1,
         max=60,
@@ -242,15 +243,70 @@ SETTINGS_SPECS: tuple[SettingSpec, ...] = (
         type=SettingType.STRING,
         env_attr="forecast_default_engine",
         default="sarimax",
-        allowed_values=("sarimax", "holt_winters"),
+        allowed_values=(
+            "sarimax",
+            "holt_winters",
+            "drift",
+            "ewma",
+            "damped_trend",
+            "theta",
+            "auto",
+        ),
         label="Forecast engine",
         description=(
             "Which model fits new forecasts when the user clicks "
             "“Retrain” without an explicit engine choice. SARIMAX "
             "is a strong default for short-term price drift; Holt-Winters "
             "(ETS) tracks slow trends with tighter bands when the series "
-            "is mostly trend + noise."
+            "is mostly trend + noise. Drift, EWMA, damped trend and Theta "
+            "are lightweight engines that forecast every asset in one "
+            "vectorized pass and refresh after each daily ingest. Auto "
+            "picks the most accurate engine per asset from measured "
+            "accuracy (or a backtest while history is short) and fits "
+            "only that one."
+        ),
+    ),
+    SettingSpec(
+        key="forecast.auto_reevaluate_days",
+        type=SettingType.INT,
+        env_attr="forecast_auto_reevaluate_days",
+        default=7,
+        label="Auto engine: re-evaluate every (days)",
+        description=(
+            "With the Auto engine, how old an asset's winning-engine choice "
+            "may get before the weekly retrain re-scores the engines for it."
+        ),
+        min=1,
+        max=90,
+    ),
+    SettingSpec(
+        key="forecast.auto_budget_seconds",
+        type=SettingType.INT,
+        env_attr="forecast_auto_budget_seconds",
+        default=120,
+        label="Auto engine: evaluation budget (seconds)",
+        description=(
+            "Time the weekly retrain may spend on top of fitting each "
+            "asset's winning engine: re-scoring engines and refitting "
+            "challenger engines so their accuracy stays measured. 0 "
+            "disables both."
+        ),
+        min=0,
+        max=3600,
+    ),
+    SettingSpec(
+        key="forecast.snapshot_retention_days",
+        type=SettingType.INT,
+        env_attr="forecast_snapshot_retention_days",
+        default=90,
+        label="Keep every forecast snapshot for (days)",
+        description=(
+            "Forecast history older than this is thinned to one snapshot "
+            "per week per engine, which is enough for long-run accuracy. "
+            "0 keeps every snapshot."
         ),
+        min=0,
+        max=3650,
     ),
     SettingSpec(
         key="fred_api_key",
@@ -0,0 +1,80 @@
+"""Single-flight: coalesce concurrent calls that would do the same work.
+
+Sync endpoints run on FastAPI's worker threads, so two views asking for the
+same expensive thing at the same moment — the correlation matrix from two
+panels, a double-clicked "Retrain now", a search typed in two places before
+its cache is filled — used to run it twice in parallel. ``SingleFlight.do``
+keys each call by ``(operation, key)``: the first caller runs ``fn`` and
+publishes the outcome on a ``Future``; callers that arrive while it is
+running wait on that future and get the same value, or the same exception,
+instead of starting their own.
+
+Only *concurrent* calls are shared. The flight is forgotten as soon as it
+finishes, so the next caller runs ``fn`` again; keeping results around is
+the job of a cache (``sidecar.response_cache``, the search cache in
+``sidecar.services.assets``). Shared results are the same object for every
+caller — treat them as read-only.
+
+Call sites:
+
+- ``ResponseCache.get_or_compute`` — every cache miss (correlations,
+  forecast accuracy, volatility, ...), keyed by entry and validator;
+- ``POST /api/forecast/{symbol}/retrain/`` — keyed by symbol and engine, so
+  a double click fits once and writes one ``forecast_snapshots`` row;
+- ``search_symbols`` and ``resolve_symbol`` — the Yahoo round-trips.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_Key = tuple[str, Hashable]
+
+
+class SingleFlight:
+    """Per-key in-flight call registry. Thread-safe."""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._flights: dict[_Key, Future[Any]] = {}
+
+    def do(self, operation: str, key: Hashable, fn: Callable[[], T]) -> T:
+        """``fn()``, or the result of an identical call already in flight.
+
+        Exceptions from ``fn`` propagate to the caller that ran it and to
+        every caller that waited on it.
+        """
+        flight_key: _Key = (operation, key)
+        with self._lock:
+            flight = self._flights.get(flight_key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[flight_key] = Future()
+        if not leader:
+            value: T = flight.result()
+            return value
+
+        try:
+            value = fn()
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._flights[flight_key]
+
+    def in_flight(self) -> int:
+        """Number of calls currently running (for tests and diagnostics)."""
+        with self._lock:
+            return len(self._flights)
+
+
+single_flight = SingleFlight()
@@ -10,8 +10,10 @@ from pathlib import Path
 
 import pytest
 
+from sidecar.api import conditional
 from sidecar.db import engine as engine_mod
 from sidecar.db.migrations_runner import upgrade_to_head
+from sidecar.response_cache import response_cache
 
 
 @pytest.fixture
@@ -26,6 +28,10 @@ def isolated_db(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Pat
 
     monkeypatch.setattr(engine_mod, "_engine", None)
     monkeypatch.setattr(engine_mod, "_SessionLocal", None)
+    # Process-wide caches keyed on data versions, which do not see a
+    # database swap.
+    monkeypatch.setattr(conditional, "_symbols", None)
+    response_cache.clear()
 
     upgrade_to_head(db_path=str(db_file))
     try:
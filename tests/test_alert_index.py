@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Asset, AssetType, PriceAlert, PricePoint
+from sidecar.services import alerts as svc
+from sidecar.services.alert_index import AlertIndex, alert_index
+
+
+def _seed_asset(symbol: str = "AAPL") -> int:
+    with session_scope() as s:
+        a = Asset(symbol=symbol, name=symbol, asset_type=AssetType.STOCK)
+        s.add(a)
+        s.flush()
+        return a.id
+
+
+def test_crossed_bisects_both_sides_inclusively(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    above = {
+        t: svc.create_alert(asset_id=aid, threshold=t, direction="above").id
+        for t in ("110", "120", "120", "130")
+    }
+    below = {
+        t: svc.create_alert(asset_id=aid, threshold=t, direction="below").id
+        for t in ("90", "100")
+    }
+
+    idx = AlertIndex()
+    assert idx.rebuild() == 6
+    assert idx.crossed(aid, high=Decimal("105"), low=Decimal("105")) == []
+    # Thresholds are inclusive on both sides; duplicates both fire.
+    hit = idx.crossed(aid, high=Decimal("120"), low=Decimal("120"))
+    assert len(hit) == 3 and above["110"] in hit and above["130"] not in hit
+    assert idx.crossed(aid, high=None, low=Decimal("90")) == [
+        below["90"],
+        below["100"],
+    ]
+    assert idx.crossed(aid + 1, high=Decimal("1e9"), low=Decimal("0")) == []
+
+
+def test_index_tracks_create_update_delete_and_fire(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    a = svc.create_alert(asset_id=aid, threshold="150", direction="above")
+    sentiment = svc.create_alert(
+        asset_id=aid,
+        threshold="0.2",
+        direction="above",
+        metric="sentiment",
+        window_days=7,
+    )
+    assert alert_index.crossed(aid, high=Decimal("150"), low=None) == [a.id]
+    assert sentiment.id not in alert_index.crossed(aid, high=Decimal("1"), low=None)
+
+    svc.update_alert(a.id, threshold="160")
+    assert alert_index.crossed(aid, high=Decimal("150"), low=None) == []
+    assert alert_index.crossed(aid, high=Decimal("160"), low=None) == [a.id]
+
+    svc.update_alert(a.id, is_active=False)
+    assert len(alert_index) == 0
+    svc.update_alert(a.id, is_active=True)
+    assert len(alert_index) == 1
+
+    # Firing disarms; a reset re-arms.
+    with session_scope() as s:
+        s.add(
+            PricePoint(
+                asset_id=aid,
+                timestamp=datetime.now(UTC) + timedelta(minutes=1),
+                open=Decimal("170"),
+                high=Decimal("170"),
+                low=Decimal("170"),
+                close=Decimal("170"),
+                volume=0,
+            )
+        )
+    assert svc.check_alerts(asset_ids=[aid]) == 1
+    assert len(alert_index) == 0
+    svc.update_alert(a.id, reset=True)
+    assert len(alert_index) == 1
+
+    svc.delete_alert(a.id)
+    assert len(alert_index) == 0
+
+
+def test_full_scan_rebuilds_index_from_database(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    svc.create_alert(asset_id=aid, threshold="150", direction="above")
+    assert len(alert_index) == 1
+    # Bypass the service: only the full scan's rebuild can see this row.
+    with session_scope() as s:
+        s.add(
+            PriceAlert(
+                asset_id=aid,
+                threshold=Decimal("10"),
+                direction="below",
+                metric="price",
+                is_active=True,
+            )
+        )
+    assert len(alert_index) == 1
+    assert svc.check_alerts() == 0
+    assert len(alert_index) == 2
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
@@ -562,7 +563,7 @@ def test_unknown_metric_rejected(isolated_db: Path) -> None:
             asset_id=aid,
             threshold=Decimal("0.3"),
             direction="above",
-            metric="volatility",  # not a known metric
+            metric="vwap",  # not a known metric
         )
 
 
@@ -681,6 +682,323 @@ def test_list_alerts_hydrates_current_value_for_sentiment(
     assert abs(float(listed[0].current_value) - 0.5) < 1e-6
 
 
+def test_rolling_sentiment_batches_assets_and_windows(isolated_db: Path) -> None:
+    aapl = _seed_asset("AAPL", "Apple")
+    msft = _seed_asset("MSFT", "Microsoft")
+    _add_article(aapl, sentiment=0.6, url="https://test/a1")
+    _add_article(aapl, sentiment=-0.2, days_ago=5, url="https://test/a2")
+    _add_article(aapl, sentiment=-0.9, days_ago=20, url="https://test/a3")
+    _add_article(msft, sentiment=None, url="https://test/m1")
+
+    with session_scope() as s:
+        means = svc._rolling_sentiment(
+            s, [(aapl, 1), (aapl, 7), (aapl, 30), (msft, 7)]
+        )
+
+    assert float(means[(aapl, 1)]) == pytest.approx(0.6)
+    assert float(means[(aapl, 7)]) == pytest.approx(0.2)
+    assert float(means[(aapl, 30)]) == pytest.approx(-0.5 / 3)
+    # No scored articles in the window: absent rather than 0.
+    assert (msft, 7) not in means
+
+
+def test_rolling_sentiment_follows_late_scoring(isolated_db: Path) -> None:
+    """The daily aggregate tracks sentiment written after the link exists,
+    as the ``score_articles`` backfill does."""
+    aid = _seed_asset()
+    article_id = _add_article(aid, sentiment=None)
+    with session_scope() as s:
+        assert svc._rolling_sentiment(s, [(aid, 7)]) == {}
+    with session_scope() as s:
+        article = s.get(Article, article_id)
+        assert article is not None
+        article.sentiment = -0.4
+    with session_scope() as s:
+        assert float(svc._rolling_sentiment(s, [(aid, 7)])[(aid, 7)]) == (
+            pytest.approx(-0.4)
+        )
+
+
 def test_mark_notified_unknown_alert(isolated_db: Path) -> None:
     with pytest.raises(svc.AlertNotFoundError):
         svc.mark_notified(9999)
+
+
+# ---------------------------------------------------------------------------
+# Event-driven evaluation
+# ---------------------------------------------------------------------------
+
+
+def test_check_alerts_scoped_to_assets_skips_others_and_sentiment(
+    isolated_db: Path,
+) -> None:
+    aapl = _seed_asset("AAPL", "Apple")
+    msft = _seed_asset("MSFT", "Microsoft")
+    _add_article(aapl, sentiment=0.9)
+    svc.create_alert(asset_id=aapl, threshold=Decimal("150"), direction="above")
+    svc.create_alert(
+        asset_id=aapl,
+        threshold=Decimal("0.5"),
+        direction="above",
+        metric="sentiment",
+        window_days=7,
+    )
+    svc.create_alert(asset_id=msft, threshold=Decimal("150"), direction="above")
+    _add_price(aapl, Decimal("200"))
+    _add_price(msft, Decimal("200"))
+
+    assert svc.check_alerts(asset_ids=[]) == 0
+    # Only AAPL's price alert: MSFT is out of scope, sentiment isn't bar-driven.
+    assert svc.check_alerts(asset_ids={aapl}) == 1
+    # The full scan picks up the rest.
+    assert svc.check_alerts() == 2
+
+
+def test_ingested_bars_fire_alerts_without_a_scan(
+    isolated_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sidecar.ingestion.yfinance_fetcher import PriceBar
+    from sidecar.scheduler import jobs
+    from sidecar.services.settings import apply_updates
+
+    aid = _seed_asset()
+    a = svc.create_alert(asset_id=aid, threshold=Decimal("150"), direction="above")
+    bar = PriceBar(
+        symbol="AAPL",
+        timestamp=datetime.now(UTC),
+        open=Decimal("160"),
+        high=Decimal("160"),
+        low=Decimal("160"),
+        close=Decimal("160"),
+        volume=0,
+    )
+    monkeypatch.setattr(jobs, "fetch_prices", lambda symbols, **_kw: [bar])
+
+    # Toggle off: the ingest still lands, nothing fires.
+    apply_updates({"check_alerts.enabled": False})
+    assert jobs.ingest_prices() == 1
+    assert svc.get_alert(a.id).triggered_at is None
+
+    apply_updates({"check_alerts.enabled": True})
+    later = replace(bar, timestamp=bar.timestamp + timedelta(minutes=5))
+    monkeypatch.setattr(jobs, "fetch_prices", lambda symbols, **_kw: [later])
+    assert jobs.ingest_prices() == 1
+    assert svc.get_alert(a.id).triggered_at is not None
+
+
+# ---------------------------------------------------------------------------
+# Intrabar crossings
+# ---------------------------------------------------------------------------
+
+
+def _add_bar(
+    asset_id: int, ts: datetime, *, high: str, low: str, close: str
+) -> None:
+    with session_scope() as s:
+        s.add(
+            PricePoint(
+                asset_id=asset_id,
+                timestamp=ts,
+                open=Decimal(close),
+                high=Decimal(high),
+                low=Decimal(low),
+                close=Decimal(close),
+                volume=0,
+            )
+        )
+
+
+def test_intrabar_spike_fires_and_records_the_crossing_bar(
+    isolated_db: Path,
+) -> None:
+    aid = _seed_asset()
+    t0 = datetime.now(UTC).replace(microsecond=0)
+    _add_bar(aid, t0, high="101", low="99", close="100")
+    up = svc.create_alert(asset_id=aid, threshold="110", direction="above")
+    down = svc.create_alert(asset_id=aid, threshold="90", direction="below")
+
+    # Two bars land between checks: the spike to 112 is in the first one,
+    # and both close back under the threshold.
+    _add_bar(aid, t0 + timedelta(minutes=5), high="112", low="100", close="104")
+    _add_bar(aid, t0 + timedelta(minutes=10), high="111", low="89", close="101")
+    assert svc.check_alerts(asset_ids=[aid]) == 2
+
+    fired_up = svc.get_alert(up.id)
+    assert fired_up.trigger_price == Decimal("112")
+    assert fired_up.trigger_bar_at is not None
+    assert fired_up.trigger_bar_at.replace(tzinfo=UTC) == t0 + timedelta(minutes=5)
+    fired_down = svc.get_alert(down.id)
+    assert fired_down.trigger_price == Decimal("89")
+    assert fired_down.trigger_bar_at is not None
+    assert fired_down.trigger_bar_at.replace(tzinfo=UTC) == t0 + timedelta(minutes=10)
+
+
+def test_high_water_mark_skips_already_evaluated_bars(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    t0 = datetime.now(UTC).replace(microsecond=0)
+    _add_bar(aid, t0, high="101", low="99", close="100")
+    a = svc.create_alert(asset_id=aid, threshold="110", direction="above")
+
+    _add_bar(aid, t0 + timedelta(minutes=5), high="105", low="100", close="104")
+    assert svc.check_alerts(asset_ids=[aid]) == 0
+    with session_scope() as s:
+        alert = s.get(PriceAlert, a.id)
+        assert alert is not None and alert.evaluated_through is not None
+        assert alert.evaluated_through.replace(tzinfo=UTC) == t0 + timedelta(minutes=5)
+
+    # Lowering the threshold under an already-evaluated high doesn't re-scan it...
+    svc.update_alert(a.id, threshold="104")
+    assert svc.check_alerts(asset_ids=[aid]) == 0
+    # ...but the next bar through it fires.
+    _add_bar(aid, t0 + timedelta(minutes=10), high="104.5", low="103", close="103")
+    assert svc.check_alerts(asset_ids=[aid]) == 1
+
+
+def test_reset_does_not_refire_on_bars_from_before_the_reset(
+    isolated_db: Path,
+) -> None:
+    aid = _seed_asset()
+    t0 = datetime.now(UTC).replace(microsecond=0)
+    a = svc.create_alert(asset_id=aid, threshold="110", direction="above")
+    _add_bar(aid, t0 + timedelta(minutes=5), high="115", low="100", close="101")
+    assert svc.check_alerts() == 1
+
+    reset = svc.update_alert(a.id, reset=True)
+    assert reset.trigger_bar_at is None and reset.trigger_price is None
+    assert svc.check_alerts() == 0
+
+
+# ---------------------------------------------------------------------------
+# Bar-derived metrics
+# ---------------------------------------------------------------------------
+
+
+def _add_daily(
+    asset_id: int, closes: list[float], volumes: list[int] | None = None
+) -> None:
+    """Daily bars ending today, oldest first."""
+    today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    n = len(closes)
+    with session_scope() as s:
+        for i, close in enumerate(closes):
+            price = Decimal(str(close))
+            s.add(
+                PricePoint(
+                    asset_id=asset_id,
+                    timestamp=today - timedelta(days=n - 1 - i),
+                    interval="1d",
+                    open=price,
+                    high=price,
+                    low=price,
+                    close=price,
+                    volume=volumes[i] if volumes is not None else 0,
+                )
+            )
+
+
+def test_bar_metrics_computed_per_key_from_one_window(isolated_db: Path) -> None:
+    aapl = _seed_asset("AAPL", "Apple")
+    msft = _seed_asset("MSFT", "Microsoft")
+    _add_daily(
+        aapl,
+        [100, 102, 101, 103, 104, 110],
+        [1000, 1200, 800, 1000, 1100, 4000],
+    )
+    _add_daily(msft, [50, 50])
+
+    with session_scope() as s:
+        values = svc._bar_metrics(
+            s,
+            [
+                (aapl, "pct_change", 1),
+                (aapl, "pct_change", 5),
+                (aapl, "volatility", 5),
+                (aapl, "volume_spike", 5),
+                (msft, "pct_change", 5),  # only two bars: no signal
+            ],
+        )
+
+    assert float(values[(aapl, "pct_change", 1)]) == pytest.approx(110 / 104 * 100 - 100)
+    assert float(values[(aapl, "pct_change", 5)]) == pytest.approx(10.0)
+    # Median of the five preceding volumes is 1000.
+    assert float(values[(aapl, "volume_spike", 5)]) == pytest.approx(4.0)
+    assert float(values[(aapl, "volatility", 5)]) > 0
+    assert (msft, "pct_change", 5) not in values
+
+
+def test_create_bar_metric_alert_validation(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    with pytest.raises(svc.AlertError, match="window_days: required"):
+        svc.create_alert(
+            asset_id=aid, threshold="5", direction="above", metric="pct_change"
+        )
+    with pytest.raises(svc.AlertError, match="window_days"):
+        svc.create_alert(
+            asset_id=aid,
+            threshold="40",
+            direction="above",
+            metric="volatility",
+            window_days=2,  # fewer returns than the volatility floor
+        )
+    with pytest.raises(svc.AlertError, match="must be > 0"):
+        svc.create_alert(
+            asset_id=aid,
+            threshold="-2",
+            direction="above",
+            metric="volume_spike",
+            window_days=20,
+        )
+    drop = svc.create_alert(
+        asset_id=aid,
+        threshold="-5",
+        direction="below",
+        metric="pct_change",
+        window_days=3,
+    )
+    assert drop.metric == AlertMetric.PCT_CHANGE
+    assert drop.threshold == Decimal("-5")
+
+
+def test_bar_metric_alerts_fire_on_ingest_and_hydrate_current_value(
+    isolated_db: Path,
+) -> None:
+    aid = _seed_asset()
+    _add_daily(aid, [100, 100, 100, 100, 100, 100], [1000] * 6)
+    drop = svc.create_alert(
+        asset_id=aid,
+        threshold="-5",
+        direction="below",
+        metric="pct_change",
+        window_days=3,
+    )
+    spike = svc.create_alert(
+        asset_id=aid,
+        threshold="3",
+        direction="above",
+        metric="volume_spike",
+        window_days=5,
+    )
+    assert drop.current_value == Decimal("0.0")
+    assert svc.check_alerts(asset_ids=[aid]) == 0
+
+    with session_scope() as s:
+        s.add(
+            PricePoint(
+                asset_id=aid,
+                timestamp=datetime.now(UTC) + timedelta(days=1),
+                interval="1d",
+                open=Decimal("93"),
+                high=Decimal("94"),
+                low=Decimal("92"),
+                close=Decimal("93"),
+                volume=5000,
+            )
+        )
+    # An intraday-only ingest leaves the daily metrics alone.
+    assert svc.check_alerts(asset_ids=[aid], intervals={"5m"}) == 0
+    assert svc.get_alert(drop.id).triggered_at is None
+    assert svc.check_alerts(asset_ids=[aid], intervals={"5m", "1d"}) == 2
+    fired = {a.id: a for a in svc.list_alerts()}
+    assert fired[drop.id].triggered_at is not None
+    assert float(fired[drop.id].current_value or 0) == pytest.approx(-7.0)
+    assert float(fired[spike.id].current_value or 0) == pytest.approx(5.0)
@@ -202,7 +202,7 @@ def test_create_unknown_metric_422(isolated_db: Path) -> None:
                 "asset_id": aid,
                 "threshold": "100",
                 "direction": "above",
-                "metric": "volatility",  # not in the literal set
+                "metric": "vwap",  # not in the literal set
                 "window_days": 7,
             },
         )
@@ -4,9 +4,12 @@ from __future__ import annotations
 
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
+from itertools import accumulate
 from pathlib import Path
 
 from fastapi.testclient import TestClient
+from sqlalchemy import delete, func, select
+from sqlalchemy.orm import Session
 
 from sidecar.db.engine import session_scope
 from sidecar.db.models import (
@@ -180,3 +183,78 @@ def test_default_watchlist_correlations_lookback_validation(isolated_db: Path) -
             ).status_code
             == 422
         )
+
+
+# ---------------------------------------------------------------------------
+# /api/analytics/compare/
+# ---------------------------------------------------------------------------
+
+
+def max_ts(s: Session, asset_id: int) -> datetime:
+    return s.execute(
+        select(func.max(PricePoint.timestamp)).where(PricePoint.asset_id == asset_id)
+    ).scalar_one()
+
+
+def test_compare_aligns_and_rebases_in_one_response(isolated_db: Path) -> None:
+    aapl = _seed_asset("AAPL")
+    msft = _seed_asset("MSFT")
+    _seed_daily_closes(aapl, days=10, base=100.0, drift=1.0)
+    _seed_daily_closes(msft, days=10, base=50.0, drift=5.0)
+    # MSFT misses the most recent day: its last close is carried forward.
+    with session_scope() as s:
+        s.execute(
+            delete(PricePoint).where(
+                PricePoint.asset_id == msft,
+                PricePoint.timestamp == max_ts(s, msft),
+            )
+        )
+
+    start = date.today() - timedelta(days=8)
+    with TestClient(app) as client:
+        r = client.get(
+            "/api/analytics/compare/",
+            params={"symbols": "msft,AAPL,NOPE", "from": start.isoformat()},
+        )
+    assert r.status_code == 200
+    body = r.json()
+    assert body["symbols"] == ["MSFT", "AAPL"]
+    assert body["missing"] == ["NOPE"]
+    assert body["count"] == 8
+    t = list(accumulate(body["t"]))
+    assert t[0] == int(datetime.combine(start, datetime.min.time(), UTC).timestamp())
+    assert set(body["t"][1:]) == {86400}
+    # Day i of the seed is ``base + drift * i``; the window starts at i = 2.
+    assert body["values"]["AAPL"] == [round((102 + i) / 102 * 100, 4) for i in range(8)]
+    msft_values = [round((60 + 5 * i) / 60 * 100, 4) for i in range(7)]
+    assert body["values"]["MSFT"] == [*msft_values, msft_values[-1]]
+    assert body["first_close"] == {"MSFT": 60.0, "AAPL": 102.0}
+    assert body["last_close"] == {"MSFT": 90.0, "AAPL": 109.0}
+
+
+def test_compare_carries_the_last_bar_before_the_start(isolated_db: Path) -> None:
+    aapl = _seed_asset("AAPL")
+    _seed_daily_closes(aapl, days=10, base=100.0, drift=1.0)
+    # A start date after the newest bar: the newest bar is carried onto it.
+    start = date.today() + timedelta(days=3)
+    with TestClient(app) as client:
+        body = client.get(
+            "/api/analytics/compare/",
+            params={"symbols": "AAPL", "from": start.isoformat(), "base": 1},
+        ).json()
+    assert body["count"] == 1
+    assert body["values"] == {"AAPL": [1.0]}
+    assert body["first_close"] == body["last_close"] == {"AAPL": 109.0}
+
+
+def test_compare_validation(isolated_db: Path) -> None:
+    with TestClient(app) as client:
+        assert client.get("/api/analytics/compare/", params={"symbols": ","}).status_code == 422
+        many = ",".join(f"S{i}" for i in range(51))
+        assert client.get("/api/analytics/compare/", params={"symbols": many}).status_code == 422
+        assert (
+            client.get("/api/analytics/compare/", params={"symbols": "A", "base": 0}).status_code
+            == 422
+        )
+        body = client.get("/api/analytics/compare/", params={"symbols": "NOPE"}).json()
+    assert body["symbols"] == [] and body["missing"] == ["NOPE"] and body["count"] == 0
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import func, select
 
-from sidecar.db.engine import session_scope
-from sidecar.db.models import Asset, AssetType
+from sidecar.api.asset_bundle import BUNDLE_SECTIONS
+from sidecar.db.engine import read_snapshot, session_scope
+from sidecar.db.models import Article, ArticleAsset, Asset, AssetType, PricePoint
 from sidecar.main import app
 from sidecar.services import assets as assets_service
 from sidecar.services.assets import ResolvedSymbol
@@ -637,3 +641,109 @@ def test_search_assets_forwards_limit(
     r = client.get("/api/assets/search/", params={"q": "btc", "limit": 7})
     assert r.status_code == 200
     assert captured == {"query": "btc", "limit": 7}
+
+
+# ---------------------------------------------------------------------------
+# GET /api/assets/{symbol}/bundle/
+# ---------------------------------------------------------------------------
+
+
+def _seed_bundle_asset() -> None:
+    """AAPL with 40 recent daily bars, 12 intraday bars and two scored articles."""
+    now = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
+    with session_scope() as s:
+        asset = Asset(symbol="AAPL", name="Apple Inc.", asset_type=AssetType.STOCK)
+        s.add(asset)
+        s.flush()
+        for interval, n, step in (("1d", 40, timedelta(days=1)), ("5m", 12, timedelta(minutes=5))):
+            for i in range(n):
+                price = Decimal(100 + i % 7) + Decimal("0.25")
+                s.add(
+                    PricePoint(
+                        asset_id=asset.id,
+                        timestamp=now - step * (n - i),
+                        interval=interval,
+                        open=price,
+                        high=price + 1,
+                        low=price - 1,
+                        close=price,
+                        volume=1000 + i,
+                    )
+                )
+        for i, score in enumerate((0.6, -0.4)):
+            article = Article(
+                url=f"https://example.com/{i}",
+                headline=f"Story {i}",
+                source="Yahoo Finance",
+                published_at=now - timedelta(days=i + 1),
+                sentiment=score,
+            )
+            s.add(article)
+            s.flush()
+            s.add(ArticleAsset(article_id=article.id, asset_id=asset.id))
+
+
+def test_asset_bundle_matches_the_standalone_endpoints(isolated_db: Path) -> None:
+    _seed_bundle_asset()
+    client = TestClient(app)
+
+    r = client.get("/api/assets/aapl/bundle/?limit=20&news_limit=5&timeseries_days=90")
+    assert r.status_code == 200
+    assert r.headers["etag"]
+    body = r.json()
+    assert body["asset"]["symbol"] == "AAPL"
+    assert body["include"] == list(BUNDLE_SECTIONS)
+    standalone = {
+        "quote": "/api/quotes/AAPL/",
+        "prices": "/api/prices/AAPL/?limit=20",
+        "daily": "/api/prices/AAPL/?interval=1d&limit=20",
+        "accuracy": "/api/forecast/AAPL/accuracy/",
+        "volatility": "/api/forecast/AAPL/volatility/",
+        "sentiment": "/api/news/sentiment-summary/AAPL/?days=30",
+        "sentiment_timeseries": "/api/news/sentiment-timeseries/AAPL/?days=90",
+        "news": "/api/news/?symbol=AAPL&limit=5",
+    }
+    for section, url in standalone.items():
+        assert body[section] == client.get(url).json(), section
+    assert body["daily"]["count"] == 20
+    assert body["volatility"]["returns_used"] > 0
+    assert body["news"]["count"] == 2
+    # No forecast trained yet: null here, 404 standalone.
+    assert body["forecast"] is None
+
+
+def test_asset_bundle_include_and_errors(isolated_db: Path) -> None:
+    _seed_bundle_asset()
+    client = TestClient(app)
+
+    body = client.get("/api/assets/AAPL/bundle/?include=news,quote").json()
+    assert body["include"] == ["quote", "news"]
+    assert body["quote"]["symbol"] == "AAPL"
+    assert "prices" not in body
+
+    assert client.get("/api/assets/AAPL/bundle/?include=quote,nope").status_code == 422
+    assert client.get("/api/assets/NOPE/bundle/").status_code == 404
+
+
+def test_read_snapshot_ignores_commits_after_its_first_read(isolated_db: Path) -> None:
+    _seed_bundle_asset()
+    count = select(func.count()).select_from(PricePoint)
+    with read_snapshot() as snap:
+        before = snap.execute(count).scalar_one()
+        with session_scope() as s:
+            bar = s.execute(select(PricePoint).limit(1)).scalar_one()
+            s.add(
+                PricePoint(
+                    asset_id=bar.asset_id,
+                    timestamp=bar.timestamp - timedelta(days=365),
+                    interval=bar.interval,
+                    open=bar.open,
+                    high=bar.high,
+                    low=bar.low,
+                    close=bar.close,
+                    volume=bar.volume,
+                )
+            )
+        assert snap.execute(count).scalar_one() == before
+    with session_scope() as s:
+        assert s.execute(count).scalar_one() == before + 1
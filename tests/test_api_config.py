@@ -36,6 +36,9 @@ def test_get_config_returns_defaults(isolated_db: Path) -> None:
         "score_news_sentiment.enabled",
         "score_news_sentiment.interval_minutes",
         "forecast.default_engine",
+        "forecast.auto_reevaluate_days",
+        "forecast.auto_budget_seconds",
+        "forecast.snapshot_retention_days",
     }
 
     by_key = {s["key"]: s for s in body["settings"]}
@@ -144,7 +147,7 @@ def test_put_empty_updates_noop(isolated_db: Path) -> None:
     r = client.put("/api/config/", json={"updates": {}})
     assert r.status_code == 200
     # Should return current state without error.
-    assert len(r.json()["settings"]) == 17
+    assert len(r.json()["settings"]) == 20
 
 
 def test_put_atomic_on_validation_failure(isolated_db: Path) -> None:
@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+
+from sidecar.db.engine import get_engine, session_scope
+from sidecar.db.models import Asset, AssetType, PricePoint
+from sidecar.main import app
+from sidecar.services import watchlists as wl
+from sidecar.services.quotes import get_quotes
+
+
+def _seed(symbol: str, *, active: bool = True) -> int:
+    with session_scope() as s:
+        a = Asset(
+            symbol=symbol,
+            name=f"{symbol} Inc.",
+            asset_type=AssetType.STOCK,
+            is_active=active,
+        )
+        s.add(a)
+        s.flush()
+        return a.id
+
+
+def _add_bars(asset_id: int, interval: str, step: timedelta, closes: list[str]) -> None:
+    end = datetime(2026, 6, 12, 15, 0, tzinfo=UTC)
+    with session_scope() as s:
+        for i, close in enumerate(closes):
+            s.add(
+                PricePoint(
+                    asset_id=asset_id,
+                    timestamp=end - step * (len(closes) - 1 - i),
+                    interval=interval,
+                    open=Decimal(close),
+                    high=Decimal(close),
+                    low=Decimal(close),
+                    close=Decimal(close),
+                    volume=0,
+                )
+            )
+
+
+@contextmanager
+def _count_price_queries() -> Iterator[list[str]]:
+    seen: list[str] = []
+
+    def _on_execute(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        if "price_points" in statement:
+            seen.append(statement)
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    try:
+        yield seen
+    finally:
+        event.remove(engine, "before_cursor_execute", _on_execute)
+
+
+def test_dashboard_follows_default_watchlist_in_one_price_query(
+    isolated_db: Path,
+) -> None:
+    aapl = _seed("AAPL")
+    msft = _seed("MSFT")
+    _seed("TSLA")  # active but not on the list
+    _add_bars(aapl, "5m", timedelta(minutes=5), [str(100 + i) for i in range(80)])
+    _add_bars(aapl, "1d", timedelta(days=1), ["150", "160"])
+    _add_bars(msft, "1d", timedelta(days=1), ["300", "330", "297"])
+    default = wl.create_watchlist("Main", is_default=True)
+    wl.add_item(default.id, msft)
+    wl.add_item(default.id, aapl)
+
+    with TestClient(app) as client, _count_price_queries() as queries:
+        resp = client.get("/api/dashboard/")
+    assert resp.status_code == 200
+    assert len(queries) == 1
+    body = resp.json()
+    assert body["watchlist_name"] == "Main"
+    assert [i["quote"]["symbol"] for i in body["items"]] == ["MSFT", "AAPL"]
+
+    # Quotes are the same figures /api/quotes/ serves.
+    expected = {q.symbol: q for q in get_quotes(["AAPL", "MSFT"])}
+    for item in body["items"]:
+        q = expected[item["quote"]["symbol"]]
+        assert Decimal(item["quote"]["last_price"]) == q.last_price
+        assert item["quote"]["change_pct"] == q.change_pct
+
+    spark = body["items"][1]["sparkline"]
+    assert spark["interval"] == "5m"
+    assert spark["close"] == [float(100 + i) for i in range(20, 80)]
+    assert len(spark["t"]) == 60
+    assert spark["t"] == sorted(spark["t"])
+    assert spark["t"][-1] == int(datetime(2026, 6, 12, 15, 0, tzinfo=UTC).timestamp())
+    # No intraday bars: empty sparkline, quote from the daily bars.
+    assert body["items"][0]["sparkline"]["close"] == []
+    assert body["items"][0]["quote"]["change_pct"] == -10.0
+
+
+def test_dashboard_reads_only_recent_history(isolated_db: Path) -> None:
+    # 20 assets x 60 sessions of 5m bars + daily bars: ~95k rows. Numbering
+    # every stored bar made the dashboard ~20x slower than the quote list;
+    # bounded by the floor it stays within a few times of it.
+    end = datetime(2026, 6, 12, 20, 0)  # a Friday close
+    sessions = [d for d in (end - timedelta(days=i) for i in range(90)) if d.weekday() < 5]
+    ids = [_seed(f"S{i:02d}") for i in range(20)]
+    with session_scope() as s:
+        s.execute(
+            insert(PricePoint),
+            [
+                {
+                    "asset_id": aid,
+                    "timestamp": ts,
+                    "interval": interval,
+                    "open": Decimal(100 + n),
+                    "high": Decimal(100 + n),
+                    "low": Decimal(100 + n),
+                    "close": Decimal(100 + n + k % 7),
+                    "volume": 0,
+                }
+                for n, aid in enumerate(ids)
+                for day in sessions[:60]
+                for k, (ts, interval) in enumerate(
+                    [(day, "1d")]
+                    + [(day - timedelta(minutes=5 * b), "5m") for b in range(78)]
+                )
+            ],
+        )
+
+    def best_of_3(fn: Any) -> float:
+        times = []
+        for _ in range(3):
+            started = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - started)
+        return min(times)
+
+    with TestClient(app) as client:
+        assert best_of_3(lambda: client.get("/api/dashboard/")) < 6 * best_of_3(
+            lambda: client.get("/api/quotes/")
+        )
+        body = client.get("/api/dashboard/").json()
+    quotes = {q.symbol: q for q in get_quotes()}
+    assert len(body["items"]) == 20
+    for item in body["items"]:
+        assert len(item["sparkline"]["close"]) == 60
+        quote = quotes[item["quote"]["symbol"]]
+        assert Decimal(item["quote"]["previous_close"]) == quote.previous_close
+        assert Decimal(item["quote"]["last_price"]) == quote.last_price
+
+
+def test_dashboard_daily_sparkline_and_points(isolated_db: Path) -> None:
+    aid = _seed("AAPL")
+    _add_bars(aid, "1d", timedelta(days=1), ["10", "11", "12", "13"])
+    with TestClient(app) as client:
+        body = client.get(
+            "/api/dashboard/", params={"interval": "1d", "points": 3}
+        ).json()
+    (item,) = body["items"]
+    assert item["sparkline"]["close"] == [11.0, 12.0, 13.0]
+    assert Decimal(item["quote"]["previous_close"]) == Decimal("12")
+
+
+def test_dashboard_without_default_watchlist_lists_active_assets(
+    isolated_db: Path,
+) -> None:
+    _seed("MSFT")
+    _seed("AAPL")
+    _seed("OLD", active=False)
+    with TestClient(app) as client:
+        body = client.get("/api/dashboard/").json()
+    assert body["watchlist_id"] is None
+    assert [i["quote"]["symbol"] for i in body["items"]] == ["AAPL", "MSFT"]
+
+
+def test_dashboard_unknown_watchlist_404(isolated_db: Path) -> None:
+    with TestClient(app) as client:
+        resp = client.get("/api/dashboard/", params={"watchlist_id": 999})
+    assert resp.status_code == 404
@@ -9,17 +9,22 @@ keep the count modest; finer-grained ML mechanics live in test_ml_jobs.py.
 from __future__ import annotations
 
 import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from ml.jobs import train_one
+from sidecar.api import forecast as forecast_api
 from sidecar.db.engine import session_scope
-from sidecar.db.models import Asset, AssetType, PricePoint
+from sidecar.db.models import Asset, AssetType, ForecastSnapshot, PricePoint
 from sidecar.main import app
 
 
@@ -81,7 +86,14 @@ def test_list_availability_empty_when_no_assets(isolated_db: Path) -> None:
         assert resp.json() == {
             "eligible": [],
             "persisted": [],
-            "engines": ["sarimax", "holt_winters"],
+            "engines": [
+                "sarimax",
+                "holt_winters",
+                "drift",
+                "ewma",
+                "damped_trend",
+                "theta",
+            ],
         }
 
 
@@ -210,6 +222,35 @@ def test_retrain_happy_path(isolated_db: Path) -> None:
         assert resp2.status_code == 200
 
 
+def test_concurrent_retrains_share_one_fit(
+    isolated_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A double-clicked "Retrain now" fits once and writes one snapshot."""
+    _seed_asset_with_daily_closes("AAPL", n_rows=80)
+    release = threading.Event()
+    fits: list[str] = []
+
+    def slow_train_one(symbol: str, **kwargs: Any) -> Any:
+        fits.append(symbol)
+        assert release.wait(timeout=5)
+        return train_one(symbol, **kwargs)
+
+    monkeypatch.setattr(forecast_api, "train_one", slow_train_one)
+    with TestClient(app) as client, ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [
+            pool.submit(client.post, "/api/forecast/AAPL/retrain/") for _ in range(3)
+        ]
+        time.sleep(0.2)
+        release.set()
+        responses = [f.result(timeout=30) for f in futures]
+
+    assert [r.status_code for r in responses] == [200] * 3
+    assert fits == ["AAPL"]
+    with session_scope() as s:
+        snapshots = s.execute(select(func.count()).select_from(ForecastSnapshot)).scalar_one()
+    assert snapshots == 1
+
+
 def test_retrain_unknown_symbol_404(isolated_db: Path) -> None:
     with TestClient(app) as client:
         resp = client.post("/api/forecast/NOPE/retrain/")
@@ -296,7 +337,14 @@ def test_availability_returns_engine_list(isolated_db: Path) -> None:
     with TestClient(app) as client:
         resp = client.get("/api/forecast/")
         body = resp.json()
-        assert body["engines"] == ["sarimax", "holt_winters"]
+        assert body["engines"] == [
+            "sarimax",
+            "holt_winters",
+            "drift",
+            "ewma",
+            "damped_trend",
+            "theta",
+        ]
 
 
 # ---------------------------------------------------------------------------
@@ -512,3 +560,47 @@ def test_volatility_lookback_validation(isolated_db: Path) -> None:
             ).status_code
             == 422
         )
+
+
+# ---------------------------------------------------------------------------
+# GET /api/forecast/{symbol}/backtest/
+# ---------------------------------------------------------------------------
+
+
+def test_backtest_endpoint_reports_engines_and_caches(isolated_db: Path) -> None:
+    from ml.backtest import clear_cache
+
+    clear_cache()
+    _seed_asset_with_daily_closes("AAPL", n_rows=120)
+    params = {"engines": "drift,theta", "horizon_days": 7, "max_origins": 4}
+    with TestClient(app) as client:
+        resp = client.get("/api/forecast/AAPL/backtest/", params=params)
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["symbol"] == "AAPL"
+        assert body["origins"] == 4
+        assert {e["engine"] for e in body["per_engine"]} == {"drift", "theta"}
+        assert body["naive"] is not None
+        assert body["cached"] is False
+
+        again = client.get("/api/forecast/AAPL/backtest/", params=params).json()
+        assert again["cached"] is True
+        assert again["fingerprint"] == body["fingerprint"]
+
+
+def test_backtest_endpoint_errors(isolated_db: Path) -> None:
+    _seed_asset_with_daily_closes("AAPL", n_rows=80)
+    with TestClient(app) as client:
+        assert client.get("/api/forecast/NOPE/backtest/").status_code == 404
+        assert (
+            client.get(
+                "/api/forecast/AAPL/backtest/", params={"engines": "prophet"}
+            ).status_code
+            == 422
+        )
+        assert (
+            client.get(
+                "/api/forecast/AAPL/backtest/", params={"step_days": 0}
+            ).status_code
+            == 422
+        )
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
-from datetime import date
+import struct
+from array import array
+from datetime import UTC, date, datetime
 from decimal import Decimal
+from itertools import accumulate
 from pathlib import Path
 
 from fastapi.testclient import TestClient
@@ -104,3 +107,28 @@ def test_series_id_is_case_insensitive(isolated_db: Path) -> None:
     r = client.get("/api/macro/cpiaucsl/")
     assert r.status_code == 200
     assert r.json()["series_id"] == "CPIAUCSL"
+
+
+def test_get_series_columnar_and_binary(isolated_db: Path) -> None:
+    _seed_series()
+    client = TestClient(app)
+    body = client.get("/api/macro/CPIAUCSL/", params={"format": "columnar"}).json()
+    assert body["count"] == 4
+    assert list(accumulate(body["t"])) == [
+        int(datetime(2026, m, 1, tzinfo=UTC).timestamp()) for m in (1, 2, 3, 4)
+    ]
+    assert body["value"] == [300.0, 301.0, 302.0, 303.0]
+
+    r = client.get("/api/macro/CPIAUCSL/", params={"format": "binary", "limit": 2})
+    _magic, _version, ncols, count = struct.unpack_from("<4sHHI", r.content)
+    assert (ncols, count) == (2, 2)
+    assert array("d", r.content[16:]).tolist()[count:] == [302.0, 303.0]
+
+
+def test_get_series_max_points(isolated_db: Path) -> None:
+    _seed_series()
+    client = TestClient(app)
+    body = client.get("/api/macro/CPIAUCSL/", params={"max_points": 3}).json()
+    assert body["count"] == 3
+    dates = [p["date"] for p in body["points"]]
+    assert dates[0] == "2026-01-01" and dates[-1] == "2026-04-01"
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
 
@@ -359,6 +359,44 @@ def test_performance_with_position_returns_points(isolated_db: Path) -> None:
         assert any(Decimal(p["value"]) > 0 for p in body["points"])
 
 
+def test_performance_max_points(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    today = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+    with session_scope() as s:
+        for i in range(20):
+            close = Decimal(100 + (i * 7) % 13)
+            s.add(
+                PricePoint(
+                    asset_id=aid,
+                    timestamp=today - timedelta(days=20 - i),
+                    interval="1d",
+                    open=close,
+                    high=close,
+                    low=close,
+                    close=close,
+                    volume=0,
+                )
+            )
+    with TestClient(app) as client:
+        client.post(
+            "/api/portfolio/transactions/",
+            json={
+                "asset_id": aid,
+                "transaction_type": "buy",
+                "quantity": "10",
+                "price_per_unit": "100",
+                "transaction_date": "2026-04-01",
+            },
+        )
+        full = client.get("/api/portfolio/performance/").json()["points"]
+        assert len(full) > 3
+        reduced = client.get(
+            "/api/portfolio/performance/", params={"max_points": 3}
+        ).json()["points"]
+        assert len(reduced) == 3
+        assert reduced[0] == full[0] and reduced[-1] == full[-1]
+
+
 def test_performance_lookback_validation(isolated_db: Path) -> None:
     with TestClient(app) as client:
         assert (
@@ -1,14 +1,25 @@
 from __future__ import annotations
 
+import struct
+from array import array
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
+from itertools import accumulate
 from pathlib import Path
 
+import orjson
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import select
 
+from sidecar.api import prices as prices_api
+from sidecar.api.fast_json import BINARY_MAGIC
+from sidecar.api.prices import PRICE_COLUMNS, PricePointOut, PriceSeriesOut
 from sidecar.db.engine import session_scope
 from sidecar.db.models import Asset, AssetType, PricePoint
+from sidecar.ingestion.yfinance_fetcher import PriceBar
 from sidecar.main import app
+from sidecar.scheduler.jobs import _upsert_bars
 
 
 def _seed_price_series(symbol: str, n: int = 5) -> datetime:
@@ -130,3 +141,318 @@ def test_get_prices_filters_by_interval(isolated_db: Path) -> None:
     r_empty = client.get("/api/prices/AAPL/", params={"interval": "1h"})
     assert r_empty.status_code == 200
     assert r_empty.json()["count"] == 0
+
+
+def test_get_prices_matches_the_pydantic_encoding(isolated_db: Path) -> None:
+    _seed_price_series("AAPL", n=4)
+    with session_scope() as s:
+        rows = s.query(PricePoint).order_by(PricePoint.timestamp).all()
+        expected = PriceSeriesOut(
+            symbol="AAPL",
+            count=len(rows),
+            points=[PricePointOut.model_validate(r) for r in rows],
+        ).model_dump_json()
+    client = TestClient(app)
+    r = client.get("/api/prices/AAPL/")
+    assert r.headers["content-type"] == "application/json"
+    assert r.content == expected.encode()
+    assert r.headers["etag"].startswith('W/"')
+
+
+def test_get_prices_decimals_as_numbers(isolated_db: Path) -> None:
+    _seed_price_series("AAPL", n=2)
+    client = TestClient(app)
+    body = client.get("/api/prices/AAPL/", params={"decimals": "number"}).json()
+    assert body["points"][1]["close"] == 101.5
+    assert body["points"][1]["open"] == 100.0
+    assert client.get(
+        "/api/prices/AAPL/", params={"decimals": "float"}
+    ).status_code == 422
+
+
+def test_get_prices_large_payload_is_gzipped(isolated_db: Path) -> None:
+    _seed_price_series("AAPL", n=600)
+    client = TestClient(app)
+    small = client.get("/api/prices/AAPL/?limit=5", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    r = client.get("/api/prices/AAPL/?limit=600", headers={"Accept-Encoding": "gzip"})
+    assert r.headers["content-encoding"] == "gzip"
+    assert int(r.headers["content-length"]) < len(r.content) / 5
+    assert r.json()["count"] == 600
+    assert "etag" in r.headers
+
+    plain = client.get("/api/prices/AAPL/?limit=600", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+
+
+def test_get_prices_columnar(isolated_db: Path) -> None:
+    base = _seed_price_series("AAPL", n=4)
+    client = TestClient(app)
+    r = client.get("/api/prices/AAPL/", params={"format": "columnar"})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["count"] == 4
+    assert body["t"] == [int(base.timestamp()), 300, 300, 300]
+    assert list(accumulate(body["t"]))[-1] == int((base + timedelta(minutes=15)).timestamp())
+    assert body["close"] == [100.5, 101.5, 102.5, 103.5]
+    assert body["volume"] == [1000, 2000, 3000, 4000]
+    assert "etag" in r.headers
+
+
+def test_get_prices_binary(isolated_db: Path) -> None:
+    base = _seed_price_series("AAPL", n=3)
+    client = TestClient(app)
+    r = client.get("/api/prices/AAPL/", params={"format": "binary"})
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/octet-stream"
+    assert "etag" in r.headers
+    magic, version, ncols, count = struct.unpack_from("<4sHHI", r.content)
+    assert (magic, version, ncols, count) == (BINARY_MAGIC, 1, len(PRICE_COLUMNS), 3)
+    assert len(r.content) == 16 + ncols * count * 8
+
+    values = array("d", r.content[16:])
+    cols = [values[i * count : (i + 1) * count].tolist() for i in range(ncols)]
+    assert cols[0][0] == base.timestamp()
+    assert cols[PRICE_COLUMNS.index("close")] == [100.5, 101.5, 102.5]
+
+
+def test_get_prices_columnar_empty_series(isolated_db: Path) -> None:
+    _seed_price_series("AAPL", n=1)
+    client = TestClient(app)
+    body = client.get(
+        "/api/prices/AAPL/", params={"format": "columnar", "interval": "1h"}
+    ).json()
+    assert body["count"] == 0
+    assert body["t"] == [] and body["close"] == []
+    empty = client.get("/api/prices/AAPL/", params={"format": "binary", "interval": "1h"})
+    assert len(empty.content) == 16
+
+
+def test_get_prices_max_points_merges_candles(isolated_db: Path) -> None:
+    base = _seed_price_series("AAPL", n=10)
+    client = TestClient(app)
+    body = client.get("/api/prices/AAPL/", params={"max_points": 3}).json()
+    assert body["count"] == 3
+    first, _, last = body["points"]
+    assert first["timestamp"] == base.strftime("%Y-%m-%dT%H:%M:%S")
+    assert first["open"] == "100.000000"
+    assert (first["close"], first["volume"]) == ("102.500000", 1000 + 2000 + 3000)
+    assert last["close"] == "109.500000"
+    assert sum(p["volume"] for p in body["points"]) == sum(1000 * i for i in range(1, 11))
+
+    cols = client.get(
+        "/api/prices/AAPL/", params={"max_points": 3, "format": "columnar"}
+    ).json()
+    assert cols["close"] == [102.5, 105.5, 109.5]
+
+    # Within budget: unchanged.
+    assert client.get("/api/prices/AAPL/", params={"max_points": 50}).json()["count"] == 10
+    assert client.get("/api/prices/AAPL/", params={"max_points": 2}).status_code == 422
+
+
+def test_get_prices_max_points_lttb_keeps_whole_bars(isolated_db: Path) -> None:
+    _seed_price_series("AAPL", n=10)
+    client = TestClient(app)
+    full = client.get("/api/prices/AAPL/").json()["points"]
+    body = client.get(
+        "/api/prices/AAPL/", params={"max_points": 4, "downsample": "lttb", "limit": 8}
+    ).json()
+    assert body["count"] == 4
+    # The newest ``limit`` bars are selected first, then reduced.
+    assert body["points"][0] == full[2]
+    assert body["points"][-1] == full[-1]
+    assert all(p in full for p in body["points"])
+
+
+def test_get_prices_keyset_pages_cover_the_series_once(isolated_db: Path) -> None:
+    base = _seed_price_series("AAPL", n=10)
+    client = TestClient(app)
+    full = client.get("/api/prices/AAPL/").json()
+    assert full["next_after_ts"] is None
+
+    seen: list[dict[str, object]] = []
+    cursor = (base - timedelta(minutes=1)).isoformat()
+    sizes = []
+    while cursor is not None:
+        page = client.get("/api/prices/AAPL/", params={"after_ts": cursor, "limit": 3}).json()
+        sizes.append(page["count"])
+        seen.extend(page["points"])
+        cursor = page["next_after_ts"]
+    # A full last page needs one more (empty) request to know it was last.
+    assert sizes == [3, 3, 3, 1]
+    assert seen == full["points"]
+
+
+def test_get_prices_keyset_columnar_cursor_is_epoch(isolated_db: Path) -> None:
+    base = _seed_price_series("AAPL", n=5)
+    client = TestClient(app)
+    params: dict[str, str | int] = {"format": "columnar", "limit": 2, "after_ts": "0"}
+    first = client.get("/api/prices/AAPL/", params=params).json()
+    assert first["next_after_ts"] == int((base + timedelta(minutes=5)).timestamp())
+    params["after_ts"] = first["next_after_ts"]
+    second = client.get("/api/prices/AAPL/", params=params).json()
+    assert second["close"] == [102.5, 103.5]
+
+
+# ---------------------------------------------------------------------------
+# Streaming export
+# ---------------------------------------------------------------------------
+
+
+def test_export_prices_ndjson_streams_every_bar(isolated_db: Path) -> None:
+    _seed_price_series("MSFT", n=3)
+    _seed_price_series("AAPL", n=4)
+    client = TestClient(app)
+    r = client.get("/api/prices/export/")
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/x-ndjson"
+    lines = [orjson.loads(line) for line in r.content.splitlines()]
+    assert [row["symbol"] for row in lines] == ["AAPL"] * 4 + ["MSFT"] * 3
+    assert lines[0] == {
+        "symbol": "AAPL",
+        "timestamp": "2026-04-22T12:00:00",
+        "open": "100.000000",
+        "high": "101.000000",
+        "low": "99.000000",
+        "close": "100.500000",
+        "volume": 1000,
+    }
+    only = client.get("/api/prices/export/", params={"symbols": "msft", "decimals": "number"})
+    assert [orjson.loads(line)["close"] for line in only.content.splitlines()] == [
+        100.5,
+        101.5,
+        102.5,
+    ]
+
+
+def test_export_prices_csv(isolated_db: Path) -> None:
+    _seed_price_series("AAPL", n=2)
+    client = TestClient(app)
+    r = client.get("/api/prices/export/", params={"symbols": "AAPL", "format": "csv"})
+    assert r.headers["content-type"].startswith("text/csv")
+    assert "attachment" in r.headers["content-disposition"]
+    assert r.text.splitlines() == [
+        "symbol,timestamp,open,high,low,close,volume",
+        "AAPL,2026-04-22T12:00:00,100.000000,101.000000,99.000000,100.500000,1000",
+        "AAPL,2026-04-22T12:05:00,100.000000,101.000000,99.000000,101.500000,2000",
+    ]
+    empty = client.get(
+        "/api/prices/export/", params={"symbols": "AAPL", "format": "csv", "interval": "1d"}
+    )
+    assert empty.text == "symbol,timestamp,open,high,low,close,volume\n"
+    missing = client.get("/api/prices/export/", params={"symbols": "AAPL,NOPE"})
+    assert missing.status_code == 404
+
+
+def test_export_chunks_drain_the_cursor_incrementally(
+    isolated_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed_price_series("AAPL", n=10)
+    monkeypatch.setattr(prices_api, "EXPORT_CHUNK_ROWS", 4)
+    assets = prices_api._resolve_assets("AAPL")
+    chunks = prices_api._export_chunks(assets, "5m", None, None)
+    assert [len(rows) for _, rows in chunks] == [4, 4, 2]
+
+
+def test_export_chunks_read_one_snapshot(isolated_db: Path) -> None:
+    """Bars committed mid-export — here to the second asset, after the
+    first one was read — stay out of it."""
+    _seed_price_series("AAPL", n=2)
+    _seed_price_series("MSFT", n=2)
+    chunks = prices_api._export_chunks(prices_api._resolve_assets(None), "5m", None, None)
+    first_symbol, _ = next(chunks)
+    assert first_symbol == "AAPL"
+
+    with session_scope() as s:
+        msft = s.execute(select(Asset.id).where(Asset.symbol == "MSFT")).scalar_one()
+        s.add(
+            PricePoint(
+                asset_id=msft,
+                timestamp=datetime(2026, 4, 23, 12, 0),
+                interval="5m",
+                open=Decimal("1"),
+                high=Decimal("1"),
+                low=Decimal("1"),
+                close=Decimal("1"),
+                volume=1,
+            )
+        )
+
+    rest = [(symbol, len(rows)) for symbol, rows in chunks]
+    assert rest == [("MSFT", 2)]
+
+
+# ---------------------------------------------------------------------------
+# Delta sync
+# ---------------------------------------------------------------------------
+
+
+def _ingest(bars: list[PriceBar]) -> None:
+    with session_scope() as s:
+        ids = dict(s.execute(select(Asset.symbol, Asset.id)).all())
+        _upsert_bars(s, ids, bars)
+
+
+def _bar(symbol: str, ts: datetime, close: str) -> PriceBar:
+    price = Decimal(close)
+    return PriceBar(
+        symbol=symbol,
+        timestamp=ts,
+        open=price,
+        high=price,
+        low=price,
+        close=price,
+        volume=10,
+    )
+
+
+def test_price_changes_returns_only_bars_since_the_mark(isolated_db: Path) -> None:
+    base = _seed_price_series("AAPL", n=5)
+    _seed_price_series("MSFT", n=5)
+    client = TestClient(app)
+    probe = client.get("/api/prices/changes/").json()
+    assert probe["changes"] == {} and probe["version"] >= 2
+
+    later = base + timedelta(hours=1)
+    _ingest([_bar("AAPL", later, "120"), _bar("AAPL", later + timedelta(minutes=5), "121")])
+    r = client.get(
+        "/api/prices/changes/",
+        params={"since_version": probe["version"], "symbols": "AAPL,MSFT"},
+    )
+    body = r.json()
+    assert body["version"] == probe["version"] + 1
+    assert list(body["changes"]) == ["AAPL"]
+    assert [p["close"] for p in body["changes"]["AAPL"]] == ["120.000000", "121.000000"]
+    assert body["resync"] == []
+
+    # Caught up: nothing more, and the ETag revalidates.
+    again = client.get(
+        "/api/prices/changes/",
+        params={"since_version": body["version"], "symbols": "AAPL,MSFT"},
+    )
+    assert again.json()["changes"] == {}
+    assert client.get(
+        "/api/prices/changes/",
+        params={"since_version": body["version"], "symbols": "AAPL,MSFT"},
+        headers={"If-None-Match": again.headers["etag"]},
+    ).status_code == 304
+
+
+def test_price_changes_asks_for_resync(isolated_db: Path) -> None:
+    _seed_price_series("AAPL", n=5)
+    _seed_price_series("MSFT", n=1)
+    client = TestClient(app)
+    body = client.get(
+        "/api/prices/changes/", params={"since_version": 0, "limit": 3}
+    ).json()
+    assert body["resync"] == ["AAPL"]
+    assert [p["close"] for p in body["changes"]["MSFT"]] == ["100.500000"]
+
+    ahead = client.get(
+        "/api/prices/changes/", params={"since_version": body["version"] + 10}
+    ).json()
+    assert ahead["resync"] == ["AAPL", "MSFT"] and ahead["changes"] == {}
+    assert client.get(
+        "/api/prices/changes/", params={"symbols": "NOPE"}
+    ).status_code == 404
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from datetime import UTC, datetime
+import time
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
 
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import insert
 
 from sidecar.db.engine import session_scope
 from sidecar.db.models import Asset, AssetType, PricePoint
+from sidecar.events import BarsIngested, publish
 from sidecar.main import app
+from sidecar.services.movers import get_movers, invalidate_movers
+from sidecar.services.quotes import get_quotes
 
 
 def _seed(symbol: str = "AAPL") -> int:
@@ -73,3 +80,155 @@ def test_list_quotes_symbol_filter(isolated_db: Path) -> None:
         assert resp.status_code == 200
         body = resp.json()
         assert [q["symbol"] for q in body["quotes"]] == ["MSFT"]
+
+
+# ---------------------------------------------------------------------------
+# Movers
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def fresh_movers(isolated_db: Path) -> Iterator[Path]:
+    invalidate_movers()
+    yield isolated_db
+    invalidate_movers()
+
+
+def _add_series(asset_id: int, interval: str, step: timedelta, closes: list[str]) -> None:
+    end = datetime.now(UTC).replace(second=0, microsecond=0)
+    for i, close in enumerate(closes):
+        ts = end - step * (len(closes) - 1 - i)
+        with session_scope() as s:
+            s.add(
+                PricePoint(
+                    asset_id=asset_id,
+                    timestamp=ts,
+                    interval=interval,
+                    open=Decimal(close),
+                    high=Decimal(close),
+                    low=Decimal(close),
+                    close=Decimal(close),
+                    volume=0,
+                )
+            )
+
+
+def test_movers_day_window_matches_quotes_and_ranks_top_k(fresh_movers: Path) -> None:
+    day = timedelta(days=1)
+    for symbol, prev, last in [
+        ("AAA", "100", "110"),
+        ("BBB", "100", "105"),
+        ("CCC", "100", "120"),
+        ("DDD", "100", "90"),
+        ("EEE", "100", "100"),
+    ]:
+        _add_series(_seed(symbol), "1d", day, [prev, last])
+    with TestClient(app) as client:
+        body = client.get("/api/quotes/movers/", params={"k": 2}).json()
+        quotes = {q["symbol"]: q for q in client.get("/api/quotes/").json()["quotes"]}
+    assert body["window"] == "1d"
+    assert [m["symbol"] for m in body["gainers"]] == ["CCC", "AAA"]
+    # Only negative movers are losers; flat EEE is on neither side.
+    assert [m["symbol"] for m in body["losers"]] == ["DDD"]
+    assert body["universe"] == 5
+    assert body["ranked"] == 5
+    assert body["by_type"]["stock"] == 5
+    for m in body["gainers"] + body["losers"]:
+        assert m["change_pct"] == quotes[m["symbol"]]["change_pct"]
+
+
+def test_movers_session_and_rolling_windows(fresh_movers: Path) -> None:
+    aid = _seed("AAPL")
+    _add_series(aid, "1d", timedelta(days=1), ["50", "60", "70", "80", "90", "95", "100"])
+    short = _seed("MSFT")
+    _add_series(short, "1d", timedelta(days=1), ["10", "11"])
+    # Intraday bars every 6 hours: 200 exactly a day ago, 210 now.
+    _add_series(aid, "5m", timedelta(hours=6), ["200", "204", "205", "208", "210"])
+    with TestClient(app) as client:
+        week = client.get("/api/quotes/movers/", params={"window": "5d"}).json()
+        rolling = client.get("/api/quotes/movers/", params={"window": "24h"}).json()
+    # Last price is the intraday close (210) vs. the close 5 sessions back (60).
+    (top,) = week["gainers"]
+    assert top["symbol"] == "AAPL"
+    assert Decimal(top["base_price"]) == Decimal("60")
+    assert top["change_pct"] == 250.0
+    assert week["ranked"] == 1  # MSFT lacks 5 sessions of history
+    (top,) = rolling["gainers"]
+    assert Decimal(top["base_price"]) == Decimal("200")
+    assert top["change_pct"] == 5.0
+
+
+def test_movers_cached_until_next_ingest(fresh_movers: Path) -> None:
+    aid = _seed("AAPL")
+    _add_series(aid, "1d", timedelta(days=1), ["100", "110"])
+    with TestClient(app) as client:
+        first = client.get("/api/quotes/movers/").json()
+        _add_series(aid, "5m", timedelta(minutes=5), ["90"])
+        assert client.get("/api/quotes/movers/").json() == first
+        publish(BarsIngested(frozenset({aid}), frozenset({"5m"})))
+        after = client.get("/api/quotes/movers/").json()
+    assert after["gainers"] == []
+    assert [m["symbol"] for m in after["losers"]] == ["AAPL"]
+
+
+def test_movers_rank_a_few_hundred_assets_quickly(fresh_movers: Path) -> None:
+    # 200 assets x (30 daily bars + 8 sessions of 5m bars): ~130k rows.
+    # Numbering every intraday bar made a ranking several times slower
+    # than the quote list over the same assets; it should cost about the
+    # same.
+    end = datetime.now(UTC).replace(second=0, microsecond=0)
+    with session_scope() as s:
+        ids = s.execute(
+            insert(Asset).returning(Asset.id),
+            [
+                {"symbol": f"S{i:03d}", "name": f"S{i:03d}", "asset_type": AssetType.STOCK}
+                for i in range(200)
+            ],
+        ).scalars().all()
+        rows = []
+        for n, aid in enumerate(ids):
+            for day in range(30):
+                close = Decimal(100 + n % 17 + day % 5)
+                rows.append((aid, end - timedelta(days=day), "1d", close))
+                if day < 8:
+                    for bar in range(78):
+                        ts = end - timedelta(days=day, minutes=5 * bar)
+                        rows.append((aid, ts, "5m", close + bar % 3))
+        s.execute(
+            insert(PricePoint),
+            [
+                {
+                    "asset_id": aid,
+                    "timestamp": ts,
+                    "interval": interval,
+                    "open": close,
+                    "high": close,
+                    "low": close,
+                    "close": close,
+                    "volume": 0,
+                }
+                for aid, ts, interval, close in rows
+            ],
+        )
+
+    def best_of_3(fn: Callable[[], object]) -> float:
+        times = []
+        for _ in range(3):
+            invalidate_movers()
+            started = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - started)
+        return min(times)
+
+    quotes = best_of_3(get_quotes)
+    for window in ("1d", "1m", "24h"):
+        assert best_of_3(lambda: get_movers(window)) < 2 * quotes, window
+    movers = get_movers("24h")
+    assert movers.universe == 200
+    assert movers.ranked == 200
+
+
+def test_movers_unknown_window_400(fresh_movers: Path) -> None:
+    with TestClient(app) as client:
+        resp = client.get("/api/quotes/movers/", params={"window": "3w"})
+        assert resp.status_code == 400
@@ -7,6 +7,9 @@ don't hit the live network — the fetcher fallback path is also stubbed.
 
 from __future__ import annotations
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -564,6 +567,30 @@ def test_search_symbols_forwards_query_and_limit(
     assert calls == [("BTC-USD", 7)]
 
 
+def test_search_symbols_concurrent_misses_share_one_fetch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Two search boxes firing the same query before the cache is filled
+    must cost Yahoo one request, not two."""
+    calls: list[tuple[str, int]] = []
+    release = threading.Event()
+
+    def _fetch(query: str, limit: int) -> list[Any]:
+        calls.append((query, limit))
+        assert release.wait(timeout=5)
+        return [{"symbol": "AAPL", "quoteType": "EQUITY", "longname": "Apple"}]
+
+    monkeypatch.setattr(assets_service, "_fetch_search_quotes", _fetch)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(assets_service.search_symbols, "apple", 5) for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        results = [f.result(timeout=5) for f in futures]
+
+    assert calls == [("apple", 5)]
+    assert all([h.symbol for h in r] == ["AAPL"] for r in results)
+
+
 # ---------------------------------------------------------------------------
 # _fetch_search_quotes — yfinance.Search adapter
 # ---------------------------------------------------------------------------
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from sidecar.api.conditional import etag_matches
+from sidecar.data_version import data_versions
+from sidecar.db.engine import get_engine, session_scope
+from sidecar.db.models import Asset, AssetType, PricePoint, Watchlist
+from sidecar.ingestion.yfinance_fetcher import PriceBar
+from sidecar.main import app
+from sidecar.scheduler.jobs import _upsert_bars
+
+_T0 = datetime(2026, 6, 1, 14, 0, tzinfo=UTC)
+
+
+def _seed(symbol: str) -> int:
+    with session_scope() as s:
+        a = Asset(symbol=symbol, name=symbol, asset_type=AssetType.STOCK)
+        s.add(a)
+        s.flush()
+        return a.id
+
+
+def _bar(asset_id: int, minutes: int) -> PricePoint:
+    return PricePoint(
+        asset_id=asset_id,
+        timestamp=_T0 + timedelta(minutes=minutes),
+        interval="5m",
+        open=Decimal("10"),
+        high=Decimal("10"),
+        low=Decimal("10"),
+        close=Decimal("10"),
+        volume=0,
+    )
+
+
+def _ingest(symbol: str, asset_id: int, minutes: int) -> None:
+    bar = PriceBar(
+        symbol=symbol,
+        timestamp=_T0 + timedelta(minutes=minutes),
+        interval="5m",
+        open=Decimal("11"),
+        high=Decimal("11"),
+        low=Decimal("11"),
+        close=Decimal("11"),
+        volume=0,
+    )
+    with session_scope() as s:
+        _upsert_bars(s, {symbol: asset_id}, [bar])
+
+
+@contextmanager
+def _count_queries() -> Iterator[list[str]]:
+    seen: list[str] = []
+
+    def _on_execute(_conn: Any, _cursor: Any, statement: str, *_args: Any) -> None:
+        seen.append(statement)
+
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", _on_execute)
+    try:
+        yield seen
+    finally:
+        event.remove(engine, "before_cursor_execute", _on_execute)
+
+
+# ---------------------------------------------------------------------------
+# Version tracking
+# ---------------------------------------------------------------------------
+
+
+def test_orm_writes_bump_after_commit_only(isolated_db: Path) -> None:
+    before = data_versions.version("watchlists")
+    with session_scope() as s:
+        s.add(Watchlist(name="Tech"))
+        s.flush()
+        assert data_versions.version("watchlists") == before
+    after = data_versions.version("watchlists")
+    assert after != before
+
+    with pytest.raises(RuntimeError), session_scope() as s:
+        s.add(Watchlist(name="Energy"))
+        s.flush()
+        raise RuntimeError("boom")
+    assert data_versions.version("watchlists") == after
+
+
+def test_price_versions_are_per_asset(isolated_db: Path) -> None:
+    aapl = _seed("AAPL")
+    msft = _seed("MSFT")
+    a0 = data_versions.version("prices", aapl)
+    m0 = data_versions.version("prices", msft)
+    whole0 = data_versions.version("prices")
+
+    # ORM path keys off the row's asset_id.
+    with session_scope() as s:
+        s.add(_bar(aapl, 0))
+    a1 = data_versions.version("prices", aapl)
+    assert a1 != a0
+    assert data_versions.version("prices", msft) == m0
+
+    # Core bulk upsert keys off ``version_keys``.
+    _ingest("MSFT", msft, 5)
+    assert data_versions.version("prices", msft) != m0
+    assert data_versions.version("prices", aapl) == a1
+    # The domain-wide version sees both.
+    assert data_versions.version("prices") != whole0
+
+
+def test_etag_matching_is_weak_and_accepts_lists() -> None:
+    tag = 'W/"abc-1"'
+    assert etag_matches('W/"abc-1"', tag)
+    assert etag_matches('"abc-1"', tag)
+    assert etag_matches('"x", W/"abc-1"', tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches('W/"abc-2"', tag)
+    assert not etag_matches(None, tag)
+
+
+# ---------------------------------------------------------------------------
+# Conditional GETs
+# ---------------------------------------------------------------------------
+
+
+def test_prices_not_modified_until_that_asset_changes(isolated_db: Path) -> None:
+    aapl = _seed("AAPL")
+    msft = _seed("MSFT")
+    with session_scope() as s:
+        s.add(_bar(aapl, 0))
+
+    with TestClient(app) as client:
+        first = client.get("/api/prices/AAPL/")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert etag.startswith('W/"')
+        assert "no-cache" in first.headers["cache-control"]
+
+        # Revalidation answers before the database is touched.
+        with _count_queries() as queries:
+            again = client.get("/api/prices/aapl/", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+        assert again.headers["etag"] == etag
+        assert queries == []
+
+        # Another asset's ingest leaves AAPL's series valid...
+        _ingest("MSFT", msft, 5)
+        resp = client.get("/api/prices/AAPL/", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+
+        # ...its own does not.
+        _ingest("AAPL", aapl, 5)
+        resp = client.get("/api/prices/AAPL/", headers={"If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()["count"] == 2
+        assert resp.headers["etag"] != etag
+
+
+def test_list_endpoints_follow_their_domains(isolated_db: Path) -> None:
+    aapl = _seed("AAPL")
+    with TestClient(app) as client:
+        etag = client.get("/api/quotes/").headers["etag"]
+        # A watchlist write does not touch quotes.
+        client.post("/api/watchlists/", json={"name": "Tech"})
+        assert (
+            client.get("/api/quotes/", headers={"If-None-Match": etag}).status_code
+            == 304
+        )
+        _ingest("AAPL", aapl, 0)
+        assert (
+            client.get("/api/quotes/", headers={"If-None-Match": etag}).status_code
+            == 200
+        )
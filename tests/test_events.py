@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from sidecar import events
+from sidecar.db.engine import session_scope
+from sidecar.events import BarsIngested
+
+_EVT = BarsIngested(frozenset({1}), frozenset({"5m"}))
+
+
+@pytest.fixture
+def received() -> Iterator[list[BarsIngested]]:
+    got: list[BarsIngested] = []
+    events.subscribe(BarsIngested, got.append)
+    try:
+        yield got
+    finally:
+        events.unsubscribe(BarsIngested, got.append)
+
+
+def test_publish_after_commit_waits_for_the_commit(
+    isolated_db: Path, received: list[BarsIngested]
+) -> None:
+    with session_scope() as s:
+        events.publish_after_commit(s, _EVT)
+        assert received == []
+    assert received == [_EVT]
+
+
+def test_publish_after_commit_drops_events_on_rollback(
+    isolated_db: Path, received: list[BarsIngested]
+) -> None:
+    with pytest.raises(RuntimeError), session_scope() as s:
+        events.publish_after_commit(s, _EVT)
+        raise RuntimeError("boom")
+    assert received == []
+
+    # The next transaction on a fresh session starts clean.
+    with session_scope():
+        pass
+    assert received == []
+
+
+def test_failing_handler_does_not_block_others(
+    isolated_db: Path, received: list[BarsIngested]
+) -> None:
+    def _boom(_evt: BarsIngested) -> None:
+        raise ValueError("bad subscriber")
+
+    events.subscribe(BarsIngested, _boom)
+    try:
+        events.publish(_EVT)
+    finally:
+        events.unsubscribe(BarsIngested, _boom)
+    assert received == [_EVT]
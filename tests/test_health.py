@@ -10,4 +10,13 @@ def test_health_ok() -> None:
     client = TestClient(app)
     response = client.get("/api/health/")
     assert response.status_code == 200
-    assert response.json() == {"status": "ok", "version": __version__}
+    body = response.json()
+    assert body["status"] == "ok"
+    assert body["version"] == __version__
+
+
+def test_health_reports_warmup_disabled_by_default() -> None:
+    client = TestClient(app)
+    body = client.get("/api/health/").json()
+    assert body["warmup"]["state"] == "disabled"
+    assert body["warmup"]["elapsed_ms"] is None
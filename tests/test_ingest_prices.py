@@ -75,6 +75,27 @@ def test_ingest_prices_is_idempotent(
         assert len(rows) == 3
 
 
+def test_ingest_prices_stamps_each_batch_with_the_next_sequence(
+    isolated_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _seed_assets()
+    base = datetime(2026, 4, 22, 13, 0, tzinfo=UTC)
+    batches = [_make_bars("AAPL", 2, base), _make_bars("AAPL", 3, base)]
+
+    from sidecar.scheduler import jobs
+
+    monkeypatch.setattr(jobs, "fetch_prices", lambda symbols, **_kw: batches.pop(0))
+    jobs.ingest_prices()
+    jobs.ingest_prices()
+
+    with session_scope() as s:
+        seqs = s.execute(
+            select(PricePoint.ingest_seq).order_by(PricePoint.timestamp)
+        ).scalars().all()
+    # The overlapping bars keep the batch that first inserted them.
+    assert seqs == [1, 1, 2]
+
+
 def test_ingest_prices_skips_unknown_symbols(
     isolated_db: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
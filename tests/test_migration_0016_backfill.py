@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+import sqlite3
+from pathlib import Path
+
+import sqlalchemy as sa
+from alembic import command
+
+from sidecar.db.migrations_runner import _make_config
+
+# Migration files live outside an importable package (names start with a digit),
+# so load 0016 by file path to reach its `_backfill` helper.
+_MIG = (
+    Path(__file__).resolve().parents[1]
+    / "sidecar/db/migrations/versions/0016_create_accuracy_points.py"
+)
+_spec = importlib.util.spec_from_file_location("mig_0016", _MIG)
+assert _spec and _spec.loader
+mig_0016 = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(mig_0016)
+
+
+def test_backfill_explodes_json_snapshots_and_pairs_actuals(tmp_path: Path) -> None:
+    # Stop at 0016: later revisions replace ``points_json`` with a blob.
+    db_file = tmp_path / "test.db"
+    command.upgrade(_make_config(str(db_file)), "0016")
+
+    points = [
+        {"forecast_date": "2026-04-21", "yhat": 105.0},
+        {"forecast_date": "2026-04-22", "yhat": 110.0},
+    ]
+    conn = sqlite3.connect(db_file)
+    try:
+        conn.execute(
+            "INSERT INTO assets (symbol, name, asset_type, is_active, created_at) "
+            "VALUES ('AAPL', 'Apple', 'stock', 1, CURRENT_TIMESTAMP)"
+        )
+        # A pre-0016 snapshot: written straight to the table, no pairs.
+        conn.execute(
+            "INSERT INTO forecast_snapshots "
+            "(asset_id, model, horizon_days, training_rows, last_close, "
+            " last_close_date, generated_at, points_json) "
+            "VALUES (1, 'SARIMAX(1,1,1)', 2, 100, 100, '2026-04-20', "
+            " '2026-04-20 23:00:00.000000', ?)",
+            (json.dumps(points),),
+        )
+        conn.execute(
+            "INSERT INTO price_points "
+            "(asset_id, timestamp, interval, open, high, low, close, volume) "
+            "VALUES (1, '2026-04-21 00:00:00.000000', '1d', 103, 103, 103, 103, 0)"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+    engine = sa.create_engine(f"sqlite:///{db_file}")
+    try:
+        with engine.begin() as bind:
+            counts = mig_0016._backfill(bind)
+            rows = bind.execute(
+                sa.text(
+                    "SELECT forecast_date, predicted, last_close, actual "
+                    "FROM accuracy_points ORDER BY forecast_date"
+                )
+            ).all()
+        assert counts == {"points": 2, "actuals": 1}
+        assert [tuple(r) for r in rows] == [
+            ("2026-04-21", 105.0, 100.0, 103.0),
+            ("2026-04-22", 110.0, 100.0, None),
+        ]
+
+        # Idempotent: re-running adds no duplicate pairs.
+        with engine.begin() as bind:
+            assert mig_0016._backfill(bind)["points"] == 0
+    finally:
+        engine.dispose()
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from datetime import date
+from pathlib import Path
+
+import pytest
+from alembic import command
+
+from ml.persistence import decode_points_blob
+from sidecar.db.migrations_runner import _make_config
+
+_FULL = [
+    {
+        "forecast_date": f"2026-04-2{d}",
+        "yhat": 100.0 + d,
+        "lower_80": 99.0 + d,
+        "upper_80": 101.0 + d,
+        "lower_95": 98.5 + d,
+        "upper_95": 101.5 + d,
+    }
+    for d in (1, 2, 3)
+]
+# Legacy shape: a gap in the dates and no bands at all.
+_SPARSE = [
+    {"forecast_date": "2026-04-21", "yhat": 50.0},
+    {"forecast_date": "2026-04-24", "yhat": 51.0},
+]
+
+
+def _seed_0016(db_file: Path) -> None:
+    conn = sqlite3.connect(db_file)
+    try:
+        conn.execute(
+            "INSERT INTO assets (symbol, name, asset_type, is_active, created_at) "
+            "VALUES ('AAPL', 'Apple', 'stock', 1, CURRENT_TIMESTAMP)"
+        )
+        for points in (_FULL, _SPARSE):
+            conn.execute(
+                "INSERT INTO forecast_snapshots "
+                "(asset_id, model, horizon_days, training_rows, last_close, "
+                " last_close_date, generated_at, points_json) "
+                "VALUES (1, 'SARIMAX(1,1,1)', 3, 100, 100, '2026-04-20', "
+                " '2026-04-20 23:00:00.000000', ?)",
+                (json.dumps(points),),
+            )
+        conn.execute(
+            "INSERT INTO accuracy_points (snapshot_id, forecast_date, asset_id, "
+            " model, generated_at, predicted, last_close) "
+            "VALUES (1, '2026-04-21', 1, 'SARIMAX(1,1,1)', "
+            " '2026-04-20 23:00:00.000000', 101.0, 100.0)"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_0017_converts_json_points_to_blob_and_back(tmp_path: Path) -> None:
+    db_file = tmp_path / "test.db"
+    cfg = _make_config(str(db_file))
+    command.upgrade(cfg, "0016")
+    _seed_0016(db_file)
+
+    command.upgrade(cfg, "0017")
+
+    conn = sqlite3.connect(db_file)
+    try:
+        cols = {
+            r[1] for r in conn.execute("PRAGMA table_info(forecast_snapshots)")
+        }
+        blobs = [
+            r[0]
+            for r in conn.execute(
+                "SELECT points_blob FROM forecast_snapshots ORDER BY id"
+            )
+        ]
+        # Dropping the column must not rebuild the table (and cascade).
+        pairs = conn.execute("SELECT COUNT(*) FROM accuracy_points").fetchone()[0]
+    finally:
+        conn.close()
+    assert "points_json" not in cols
+    assert "points_blob" in cols
+    assert pairs == 1
+
+    full = decode_points_blob(blobs[0]).to_points()
+    assert [p.forecast_date for p in full] == [
+        date(2026, 4, 21),
+        date(2026, 4, 22),
+        date(2026, 4, 23),
+    ]
+    assert [p.yhat for p in full] == [101.0, 102.0, 103.0]
+    assert full[2].upper_95 == pytest.approx(104.5)
+
+    sparse = decode_points_blob(blobs[1]).to_points()
+    assert [p.forecast_date for p in sparse] == [date(2026, 4, 21), date(2026, 4, 24)]
+    assert sparse[1].lower_80 == sparse[1].yhat == 51.0
+
+    command.downgrade(cfg, "0016")
+
+    conn = sqlite3.connect(db_file)
+    try:
+        restored = [
+            json.loads(r[0])
+            for r in conn.execute(
+                "SELECT points_json FROM forecast_snapshots ORDER BY id"
+            )
+        ]
+    finally:
+        conn.close()
+    assert [p["forecast_date"] for p in restored[1]] == ["2026-04-21", "2026-04-24"]
+    assert restored[0][0]["yhat"] == 101.0
+    assert restored[0][0]["lower_95"] == pytest.approx(99.5)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from alembic import command
+
+from sidecar.db.migrations_runner import _make_config
+
+
+def _seed_0018(db_file: Path) -> None:
+    conn = sqlite3.connect(db_file)
+    try:
+        conn.execute(
+            "INSERT INTO assets (symbol, name, asset_type, is_active, created_at) "
+            "VALUES ('AAPL', 'Apple', 'stock', 1, CURRENT_TIMESTAMP)"
+        )
+        for i, (published, score) in enumerate(
+            [
+                ("2026-04-20 09:00:00.000000", 0.5),
+                ("2026-04-20 17:30:00.000000", -0.1),
+                ("2026-04-21 08:00:00.000000", 0.3),
+                ("2026-04-21 09:00:00.000000", None),  # unscored: excluded
+            ]
+        ):
+            conn.execute(
+                "INSERT INTO articles (id, url, headline, source, published_at, "
+                " created_at, sentiment) "
+                "VALUES (?, ?, 'h', 'Test', ?, CURRENT_TIMESTAMP, ?)",
+                (i + 1, f"https://test/{i}", published, score),
+            )
+            conn.execute(
+                "INSERT INTO article_assets (article_id, asset_id) VALUES (?, 1)",
+                (i + 1,),
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def _buckets(conn: sqlite3.Connection) -> dict[str, tuple[float, int]]:
+    return {
+        day: (total, count)
+        for day, total, count in conn.execute(
+            "SELECT day, sentiment_sum, article_count "
+            "FROM asset_sentiment_daily WHERE asset_id = 1"
+        )
+    }
+
+
+def test_0019_backfills_and_triggers_maintain_buckets(tmp_path: Path) -> None:
+    db_file = tmp_path / "test.db"
+    cfg = _make_config(str(db_file))
+    command.upgrade(cfg, "0018")
+    _seed_0018(db_file)
+
+    command.upgrade(cfg, "0019")
+
+    conn = sqlite3.connect(db_file)
+    conn.execute("PRAGMA foreign_keys = ON")
+    try:
+        buckets = _buckets(conn)
+        assert set(buckets) == {"2026-04-20", "2026-04-21"}
+        assert buckets["2026-04-20"][0] == pytest.approx(0.4)
+        assert buckets["2026-04-20"][1] == 2
+        assert buckets["2026-04-21"] == (pytest.approx(0.3), 1)
+
+        # Late scoring adds to the day's bucket.
+        conn.execute("UPDATE articles SET sentiment = 0.7 WHERE id = 4")
+        assert _buckets(conn)["2026-04-21"] == (pytest.approx(1.0), 2)
+
+        # Re-dating moves the score between buckets; an emptied day vanishes.
+        conn.execute(
+            "UPDATE articles SET published_at = '2026-04-20 12:00:00.000000' "
+            "WHERE id = 3"
+        )
+        conn.execute("DELETE FROM articles WHERE id = 4")
+        buckets = _buckets(conn)
+        assert set(buckets) == {"2026-04-20"}
+        assert buckets["2026-04-20"] == (pytest.approx(0.7), 3)
+
+        # Unlinking an article removes its contribution.
+        conn.execute("DELETE FROM article_assets WHERE article_id = 1")
+        assert _buckets(conn)["2026-04-20"] == (pytest.approx(0.2), 2)
+        conn.commit()
+    finally:
+        conn.close()
+
+    command.downgrade(cfg, "0018")
+
+    conn = sqlite3.connect(db_file)
+    try:
+        tables = {
+            r[0] for r in conn.execute("SELECT name FROM sqlite_master")
+        }
+    finally:
+        conn.close()
+    assert "asset_sentiment_daily" not in tables
+    assert not any(name.startswith("trg_") for name in tables)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import sqlite3
+from datetime import UTC, datetime
 from pathlib import Path
 
-from sidecar.db.migrations_runner import upgrade_to_head
+from alembic import command
+
+from sidecar.db.migrations_runner import _make_config, upgrade_to_head
 
 
 def test_upgrade_to_head_creates_assets_table(tmp_path: Path) -> None:
@@ -166,6 +169,7 @@ def test_upgrade_to_head_creates_article_tables(tmp_path: Path) -> None:
         }
         assert "articles" in tables
         assert "article_assets" in tables
+        assert "asset_sentiment_daily" in tables
 
         art_cols = {r[1] for r in conn.execute("PRAGMA table_info(articles)").fetchall()}
         assert {
@@ -278,6 +282,10 @@ def test_upgrade_to_head_creates_price_alerts_table(tmp_path: Path) -> None:
             # 0012 — sentiment-aware alerts
             "metric",
             "window_days",
+            # 0018 — intrabar evaluation
+            "evaluated_through",
+            "trigger_bar_at",
+            "trigger_price",
         }
         assert expected <= cols, f"missing columns: {expected - cols}"
 
@@ -297,6 +305,62 @@ def test_upgrade_to_head_creates_price_alerts_table(tmp_path: Path) -> None:
         conn.close()
 
 
+def test_0018_starts_armed_price_alerts_at_the_newest_bar(tmp_path: Path) -> None:
+    """Armed price alerts get a high-water mark, so the first intrabar scan
+    doesn't replay every bar since ``created_at``."""
+    db_file = tmp_path / "test.db"
+    cfg = _make_config(str(db_file))
+    command.upgrade(cfg, "0017")
+
+    conn = sqlite3.connect(db_file)
+    try:
+        conn.execute(
+            "INSERT INTO assets (id, symbol, name, asset_type, is_active, created_at) "
+            "VALUES (1, 'AAPL', 'Apple', 'stock', 1, '2026-01-01 00:00:00'), "
+            "       (2, 'MSFT', 'Microsoft', 'stock', 1, '2026-01-01 00:00:00')"
+        )
+        for ts, interval in [
+            ("2026-06-11 00:00:00.000000", "1d"),
+            ("2026-06-12 19:55:00.000000", "5m"),
+            ("2026-06-12 00:00:00.000000", "1d"),
+        ]:
+            conn.execute(
+                "INSERT INTO price_points (asset_id, timestamp, interval, open, high, "
+                " low, close, volume) VALUES (1, ?, ?, 1, 1, 1, 1, 0)",
+                (ts, interval),
+            )
+        for alert_id, asset_id, triggered_at, is_active, metric in [
+            (1, 1, None, 1, "price"),  # armed, asset has bars
+            (2, 2, None, 1, "price"),  # armed, no bars
+            (3, 1, "2026-06-01 00:00:00.000000", 1, "price"),  # already fired
+            (4, 1, None, 0, "price"),  # disabled
+            (5, 1, None, 1, "sentiment"),
+        ]:
+            conn.execute(
+                "INSERT INTO price_alerts (id, asset_id, threshold, direction, "
+                " is_active, triggered_at, created_at, metric) "
+                "VALUES (?, ?, 100, 'above', ?, ?, '2026-03-01 00:00:00.000000', ?)",
+                (alert_id, asset_id, is_active, triggered_at, metric),
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+    before = datetime.now(UTC).replace(tzinfo=None)
+    command.upgrade(cfg, "0018")
+
+    conn = sqlite3.connect(db_file)
+    try:
+        marks = dict(conn.execute("SELECT id, evaluated_through FROM price_alerts"))
+    finally:
+        conn.close()
+    assert marks[1] == "2026-06-12 19:55:00.000000"
+    assert datetime.fromisoformat(marks[2]) >= before
+    assert marks[3] is None
+    assert marks[4] is None
+    assert marks[5] is None
+
+
 def test_upgrade_to_head_creates_forecasts_table(tmp_path: Path) -> None:
     """0009 adds a `forecasts` table with at most one row per asset.
 
@@ -387,7 +451,8 @@ def test_upgrade_to_head_creates_forecast_snapshots_table(tmp_path: Path) -> Non
     """0011 adds an append-only ``forecast_snapshots`` table mirroring
     ``forecasts`` minus the unique-asset_id constraint, plus a composite
     index on (asset_id, generated_at) for the accuracy job's "last N
-    snapshots per asset" query path."""
+    snapshots per asset" query path. 0017 swaps ``points_json`` for the
+    packed ``points_blob``."""
     db_file = tmp_path / "test.db"
     upgrade_to_head(db_path=str(db_file))
 
@@ -410,7 +475,7 @@ def test_upgrade_to_head_creates_forecast_snapshots_table(tmp_path: Path) -> Non
             "last_close",
             "last_close_date",
             "generated_at",
-            "points_json",
+            "points_blob",
         }
         assert expected <= cols
 
@@ -502,3 +567,55 @@ def test_upgrade_to_head_creates_macro_tables(tmp_path: Path) -> None:
         assert any(fk[2] == "macro_indicators" for fk in fks)
     finally:
         conn.close()
+
+
+def test_upgrade_to_head_creates_forecast_engine_selections_table(
+    tmp_path: Path,
+) -> None:
+    """0015 adds one row per asset holding the ``"auto"`` engine mode's
+    winning engine, keyed (and cascaded) on ``asset_id``."""
+    db_file = tmp_path / "test.db"
+    upgrade_to_head(db_path=str(db_file))
+
+    conn = sqlite3.connect(db_file)
+    try:
+        cols = {
+            r[1]: r
+            for r in conn.execute(
+                "PRAGMA table_info(forecast_engine_selections)"
+            ).fetchall()
+        }
+        assert {
+            "asset_id",
+            "engine",
+            "source",
+            "mape",
+            "evaluable_points",
+            "evaluated_at",
+            "last_challenger",
+            "challenger_fitted_at",
+        } <= cols.keys()
+        assert cols["asset_id"][5] == 1, "asset_id must be the primary key"
+
+        fks = conn.execute(
+            "PRAGMA foreign_key_list(forecast_engine_selections)"
+        ).fetchall()
+        assert [(fk[2], fk[6]) for fk in fks] == [("assets", "CASCADE")]
+    finally:
+        conn.close()
+
+
+def test_upgrade_to_head_adds_ingest_sequence(tmp_path: Path) -> None:
+    """0020 adds the delta-sync batch counter and ``price_points.ingest_seq``."""
+    db_file = tmp_path / "test.db"
+    upgrade_to_head(db_path=str(db_file))
+
+    conn = sqlite3.connect(db_file)
+    try:
+        assert conn.execute("SELECT id, seq FROM ingest_sequence").fetchall() == [(1, 0)]
+        cols = {r[1]: r for r in conn.execute("PRAGMA table_info(price_points)")}
+        assert cols["ingest_seq"][3] == 1, "ingest_seq must be NOT NULL"
+        indexes = {r[1] for r in conn.execute("PRAGMA index_list(price_points)")}
+        assert "ix_price_points_ingest_seq" in indexes
+    finally:
+        conn.close()
@@ -21,9 +21,9 @@ from ml.accuracy import (
     compute_accuracy,
 )
 from ml.forecast import ForecastPoint, ForecastResult
-from ml.persistence import save_forecast
+from ml.persistence import save_forecast, sync_accuracy_actuals
 from sidecar.db.engine import session_scope
-from sidecar.db.models import Asset, AssetType, PricePoint
+from sidecar.db.models import AccuracyPoint, Asset, AssetType, PricePoint
 
 # ---------------------------------------------------------------------------
 # Pure-compute helpers
@@ -434,3 +434,99 @@ def test_compute_accuracy_includes_naive_random_walk_baseline(
     assert report.overall.mape > report.naive.mape
     # A no-change baseline makes no directional call.
     assert report.naive.directional is None
+
+
+# ---------------------------------------------------------------------------
+# Materialised accuracy_points
+# ---------------------------------------------------------------------------
+
+
+def _pending_points(asset_id: int) -> int:
+    with session_scope() as s:
+        return len(
+            s.query(AccuracyPoint)
+            .filter(AccuracyPoint.asset_id == asset_id, AccuracyPoint.actual.is_(None))
+            .all()
+        )
+
+
+def test_actuals_landing_after_the_snapshot_are_synced_incrementally(
+    isolated_db: Path,
+) -> None:
+    asset_id = _seed_asset()
+    save_forecast(
+        asset_id,
+        _snapshot(
+            model="SARIMAX(1,1,1)",
+            last_close=100.0,
+            last_close_date=date(2026, 4, 20),
+            generated_at=datetime.now(UTC) - timedelta(days=3),
+            forecasts=[(date(2026, 4, 21), 110.0), (date(2026, 4, 22), 90.0)],
+        ),
+    )
+    assert compute_accuracy("AAPL").per_engine[0].evaluable_points == 0
+
+    _seed_actuals(asset_id, [(date(2026, 4, 21), 100.0)])
+    assert sync_accuracy_actuals([asset_id]) == 1
+    eng = compute_accuracy("AAPL").per_engine[0]
+    assert eng.evaluable_points == 1
+    assert eng.mape == pytest.approx(10.0)
+
+    # Idempotent: nothing left to pair until the next bar lands.
+    assert sync_accuracy_actuals() == 0
+    _seed_actuals(asset_id, [(date(2026, 4, 23), 100.0)])
+    assert sync_accuracy_actuals() == 0
+
+
+def test_sync_drops_points_that_can_never_be_filled(isolated_db: Path) -> None:
+    """A forecast date with no bar (weekend / holiday) that's well behind the
+    newest bar is pruned, so the pending set doesn't grow forever."""
+    asset_id = _seed_asset()
+    save_forecast(
+        asset_id,
+        _snapshot(
+            model="SARIMAX(1,1,1)",
+            last_close=100.0,
+            last_close_date=date(2026, 4, 3),
+            generated_at=datetime.now(UTC) - timedelta(days=3),
+            forecasts=[(date(2026, 4, 4), 101.0), (date(2026, 4, 30), 101.0)],
+        ),
+    )
+    _seed_actuals(asset_id, [(date(2026, 4, 20), 100.0)])
+    sync_accuracy_actuals([asset_id])
+    # 04-04 is >7 days behind the newest bar → dropped; 04-30 still pending.
+    assert _pending_points(asset_id) == 1
+    report = compute_accuracy("AAPL")
+    assert report.per_engine[0].snapshots == 1
+
+
+def test_sql_aggregates_match_reference_metrics(isolated_db: Path) -> None:
+    """The SQL path must agree with ``_compute_metrics`` on the same pairs."""
+    asset_id = _seed_asset()
+    start = date(2026, 3, 2)
+    closes = [(start + timedelta(days=i), 100.0 + ((i * 7) % 11) - 5) for i in range(30)]
+    _seed_actuals(asset_id, closes)
+    actuals = dict(closes)
+    pairs: list[tuple[float, float, float]] = []
+    for k in range(5):
+        origin = 3 + 5 * k
+        last = closes[origin - 1][1]
+        preds = [
+            (closes[origin + h][0], last + (h - 2) * 0.7 * (-1) ** k) for h in range(6)
+        ]
+        snap = _snapshot(
+            model="Theta",
+            last_close=last,
+            last_close_date=closes[origin - 1][0],
+            generated_at=datetime.now(UTC) - timedelta(days=1),
+            forecasts=preds,
+        )
+        save_forecast(asset_id, snap)
+        pairs.extend(_evaluable_pairs(snap, actuals))
+
+    eng = compute_accuracy("AAPL").per_engine[0]
+    mape, rmse, directional = _compute_metrics(pairs)
+    assert eng.evaluable_points == len(pairs)
+    assert eng.mape == pytest.approx(mape)
+    assert eng.rmse == pytest.approx(rmse)
+    assert eng.directional == pytest.approx(directional)
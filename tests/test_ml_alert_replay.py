@@ -0,0 +1,315 @@
+"""Alert rule replay — ``ml.alert_replay`` plus the loader in
+``sidecar.services.alert_replay``.
+
+The vectorized series must agree with the scalar live evaluator (same
+rolling windows, same annualization), and a fire is a fresh crossing: an
+excursion that stays beyond the threshold counts once.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ml.alert_replay import (
+    _rolling_volatility,
+    replay_bars,
+    replay_daily_mean,
+)
+from ml.forecast import _import_numpy
+from ml.volatility import TRADING_DAYS_PER_YEAR, _log_returns, _stdev
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Article, ArticleAsset, Asset, AssetType, PricePoint
+from sidecar.main import app
+from sidecar.services.alert_replay import replay_alert
+from sidecar.services.alerts import AlertError
+
+
+def _bars(
+    metric: str,
+    closes: list[float],
+    *,
+    above: bool,
+    threshold: float,
+    window: int | None,
+    volume: list[float] | None = None,
+) -> list[int]:
+    return replay_bars(
+        metric,
+        above=above,
+        threshold=threshold,
+        window=window,
+        high=closes,
+        low=closes,
+        close=closes,
+        volume=volume or [0.0] * len(closes),
+    ).indices
+
+
+# ---------------------------------------------------------------------------
+# Pure arrays
+# ---------------------------------------------------------------------------
+
+
+def test_price_counts_each_fresh_crossing_once() -> None:
+    closes = [99.0, 101, 102, 98, 97, 100, 99]
+    assert _bars("price", closes, above=True, threshold=100.0, window=None) == [1, 5]
+    assert _bars("price", closes, above=False, threshold=98.0, window=None) == [3]
+
+
+def test_price_uses_intrabar_extremes_and_never_fires_on_first_bar() -> None:
+    closes = [105.0, 99, 99, 99]
+    high = [105.0, 99, 101, 99]
+    hits = replay_bars(
+        "price",
+        above=True,
+        threshold=100.0,
+        window=None,
+        high=high,
+        low=closes,
+        close=closes,
+        volume=[0.0] * 4,
+    )
+    # Bar 0 already satisfies the rule but has no predecessor to cross from.
+    assert hits.indices == [2]
+    assert hits.values == [101.0]
+    assert hits.evaluated == 4
+
+
+def test_pct_change_waits_for_a_full_window() -> None:
+    closes = [100.0, 100, 100, 106, 106, 100]
+    hits = replay_bars(
+        "pct_change",
+        above=True,
+        threshold=5.0,
+        window=2,
+        high=closes,
+        low=closes,
+        close=closes,
+        volume=[0.0] * 6,
+    )
+    assert hits.indices == [3]
+    assert hits.values[0] == pytest.approx(6.0)
+    assert hits.evaluated == 4
+
+
+def test_rolling_volatility_matches_the_scalar_estimator() -> None:
+    closes = [100 * math.exp(0.01 * math.sin(i * 1.7) + 0.002 * i) for i in range(40)]
+    window = 10
+    np = _import_numpy()
+    vol = _rolling_volatility(np, np.asarray(closes), window)
+    assert np.isnan(vol[:window]).all()
+    dated = [(date(2026, 1, 1) + timedelta(days=i), c) for i, c in enumerate(closes)]
+    for j in range(window, len(closes)):
+        expected = (
+            _stdev(_log_returns(dated[: j + 1])[-window:])
+            * math.sqrt(TRADING_DAYS_PER_YEAR)
+            * 100
+        )
+        assert vol[j] == pytest.approx(expected, rel=1e-9)
+
+
+def test_volume_spike_against_median_of_preceding_bars() -> None:
+    volumes = [100.0, 300, 100, 100, 500, 100, 100]
+    assert _bars(
+        "volume_spike",
+        [1.0] * 7,
+        above=True,
+        threshold=3.0,
+        window=3,
+        volume=volumes,
+    ) == [4]
+
+
+def test_daily_mean_uses_inclusive_window_and_skips_empty_days() -> None:
+    # Warmup day, then: one article at +0.6, two empty days, a -0.8 day.
+    hits = replay_daily_mean(
+        above=False,
+        threshold=-0.2,
+        window=1,
+        sums=[0.0, 0.6, 0.0, 0.0, -0.8, 0.0],
+        counts=[0, 1, 0, 0, 1, 0],
+        warmup=1,
+    )
+    # Means over (day-1, day]: 0.6, 0.6, nan, -0.8, -0.8 — the crossing
+    # after an empty window has no valid predecessor.
+    assert hits.indices == []
+    assert hits.evaluated == 4
+    hits = replay_daily_mean(
+        above=False,
+        threshold=-0.2,
+        window=2,
+        sums=[0.0, 0.0, 0.6, 0.0, -0.8],
+        counts=[0, 0, 1, 0, 1],
+        warmup=2,
+    )
+    # Means: 0.6, 0.6, -0.1 ((0.6 - 0.8) / 2) — no fire; lower the bar.
+    assert hits.indices == []
+    assert replay_daily_mean(
+        above=False,
+        threshold=-0.05,
+        window=2,
+        sums=[0.0, 0.0, 0.6, 0.0, -0.8],
+        counts=[0, 0, 1, 0, 1],
+        warmup=2,
+    ).indices == [2]
+
+
+def test_sixty_days_of_five_minute_bars_is_fast() -> None:
+    n = 60 * 288
+    closes = [100 + 5 * math.sin(i / 50) for i in range(n)]
+    started = time.perf_counter()
+    hits = replay_bars(
+        "price",
+        above=True,
+        threshold=104.0,
+        window=None,
+        high=closes,
+        low=closes,
+        close=closes,
+        volume=[0.0] * n,
+    )
+    assert time.perf_counter() - started < 0.5
+    assert len(hits.indices) == pytest.approx(n / (2 * math.pi * 50), abs=1)
+
+
+# ---------------------------------------------------------------------------
+# Service + endpoint
+# ---------------------------------------------------------------------------
+
+
+def _seed_asset() -> int:
+    with session_scope() as s:
+        a = Asset(symbol="AAPL", name="Apple Inc.", asset_type=AssetType.STOCK)
+        s.add(a)
+        s.flush()
+        return a.id
+
+
+def _add_bars(asset_id: int, interval: str, step: timedelta, closes: list[float]) -> None:
+    end = datetime.now(UTC).replace(second=0, microsecond=0)
+    with session_scope() as s:
+        for i, close in enumerate(closes):
+            price = Decimal(str(close))
+            s.add(
+                PricePoint(
+                    asset_id=asset_id,
+                    timestamp=end - step * (len(closes) - 1 - i),
+                    interval=interval,
+                    open=price,
+                    high=price,
+                    low=price,
+                    close=price,
+                    volume=0,
+                )
+            )
+
+
+def test_replay_price_over_stored_bars(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    _add_bars(aid, "5m", timedelta(minutes=5), [99, 101, 99, 101, 101, 99])
+    # Other intervals are not part of a 5m replay.
+    _add_bars(aid, "1d", timedelta(days=1), [50, 150])
+    report = replay_alert(asset_id=aid, threshold="100", direction="above")
+    assert report.symbol == "AAPL"
+    assert report.interval == "5m"
+    assert report.observations == 6
+    assert report.fire_count == 2
+    assert [f.value for f in report.fires] == [Decimal("101.0")] * 2
+    assert report.fires[0].at.tzinfo is not None
+    assert not report.truncated
+
+
+def test_replay_bar_metric_loads_lead_in_history(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    # 12 daily bars; only the last 4 days are replayed but the 3-bar
+    # window is filled from the bars before them.
+    _add_bars(aid, "1d", timedelta(days=1), [100] * 8 + [100, 110, 110, 100])
+    report = replay_alert(
+        asset_id=aid,
+        threshold="5",
+        direction="above",
+        metric="pct_change",
+        window_days=3,
+        days=4,
+    )
+    assert report.interval == "1d"
+    assert report.observations == 4
+    assert report.fire_count == 1
+    assert report.first_at is not None and report.last_at is not None
+    assert (report.last_at - report.first_at).days == 3
+
+
+def test_replay_sentiment_from_daily_buckets(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    with session_scope() as s:
+        for days_ago, score in [(10, 0.5), (3, -0.9)]:
+            article = Article(
+                url=f"https://test/{days_ago}",
+                headline="x",
+                source="Test",
+                published_at=datetime.now(UTC) - timedelta(days=days_ago),
+                sentiment=score,
+            )
+            s.add(article)
+            s.flush()
+            s.add(ArticleAsset(article_id=article.id, asset_id=aid))
+    report = replay_alert(
+        asset_id=aid,
+        threshold="-0.1",
+        direction="below",
+        metric="sentiment",
+        window_days=7,
+        days=14,
+    )
+    # The -0.9 day pulls the 7-day mean to -0.2; it stays below until now.
+    assert report.fire_count == 1
+    assert report.fires[0].at.date() == (datetime.now(UTC) - timedelta(days=3)).date()
+    assert float(report.fires[0].value) == pytest.approx(-0.2)
+
+
+def test_replay_validates_like_create(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    with pytest.raises(AlertError, match="window_days"):
+        replay_alert(asset_id=aid, threshold="1", direction="above", metric="volatility")
+    with pytest.raises(AlertError, match="interval"):
+        replay_alert(
+            asset_id=aid,
+            threshold="1",
+            direction="above",
+            metric="pct_change",
+            window_days=5,
+            interval="5m",
+        )
+
+
+def test_replay_endpoint(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    _add_bars(aid, "5m", timedelta(minutes=5), [99, 101, 99])
+    with TestClient(app) as client:
+        resp = client.post(
+            "/api/alerts/replay/",
+            json={"asset_id": aid, "threshold": "100", "direction": "above"},
+        )
+        assert resp.status_code == 200
+        body = resp.json()
+        assert body["fire_count"] == 1
+        assert body["metric"] == "price"
+        assert len(body["fires"]) == 1
+
+        missing = client.post(
+            "/api/alerts/replay/",
+            json={"asset_id": 9999, "threshold": "100", "direction": "above"},
+        )
+        assert missing.status_code == 404
+        bad = client.post(
+            "/api/alerts/replay/",
+            json={"asset_id": aid, "threshold": "-1", "direction": "above"},
+        )
+        assert bad.status_code == 400
@@ -0,0 +1,173 @@
+"""Rolling-origin backtests — ``ml.backtest``.
+
+Mostly pure compute over synthetic series; one DB round-trip for the
+symbol-loading wrapper. statsmodels fits are kept to a handful of origins
+so the file stays fast.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from itertools import pairwise
+from pathlib import Path
+
+import pytest
+
+from ml import backtest
+from ml.accuracy import _compute_metrics
+from ml.backtest import (
+    BacktestError,
+    _origins,
+    backtest_series_many,
+    backtest_symbol,
+)
+from ml.forecast import BATCH_ENGINES, MIN_TRAINING_ROWS, forecast_series
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Asset, AssetType, PricePoint
+
+
+def _gen_series(n: int, *, slope: float = 0.3) -> list[tuple[date, float]]:
+    start = date(2022, 1, 1)
+    return [
+        (start + timedelta(days=i), 100.0 + slope * i + 2.0 * math.sin(i / 7.0))
+        for i in range(n)
+    ]
+
+
+def _seed_asset_with_daily_closes(symbol: str, *, n_rows: int) -> None:
+    with session_scope() as s:
+        asset = Asset(symbol=symbol, name=symbol, asset_type=AssetType.STOCK)
+        s.add(asset)
+        s.flush()
+        for d, close in _gen_series(n_rows):
+            price = Decimal(str(round(close, 4)))
+            s.add(
+                PricePoint(
+                    asset_id=asset.id,
+                    timestamp=datetime(d.year, d.month, d.day, tzinfo=UTC),
+                    interval="1d",
+                    open=price,
+                    high=price,
+                    low=price,
+                    close=price,
+                    volume=1_000,
+                )
+            )
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    backtest.clear_cache()
+
+
+def test_origins_respect_training_floor_and_cap() -> None:
+    origins = _origins(200, step_days=7, max_origins=5)
+    assert origins == sorted(origins)
+    assert len(origins) == 5
+    assert origins[-1] == 199
+    assert {b - a for a, b in pairwise(origins)} == {7}
+
+    all_origins = _origins(200, step_days=7, max_origins=1000)
+    assert min(all_origins) >= MIN_TRAINING_ROWS
+    assert _origins(MIN_TRAINING_ROWS, step_days=1, max_origins=10) == []
+
+
+def test_batch_engines_match_per_origin_refits() -> None:
+    """The stacked-matrix path must score exactly what refitting each
+    origin independently through ``forecast_series`` would."""
+    closes = _gen_series(150)
+    report = backtest_series_many(
+        {"X": closes}, engines=["theta"], horizon_days=7, step_days=10, max_origins=6
+    )["X"]
+    (theta,) = report.per_engine
+    assert theta.origins == 6
+
+    pairs = []
+    actuals = dict(closes)
+    for origin in _origins(150, step_days=10, max_origins=6):
+        result = forecast_series(closes[:origin], horizon_days=7, engine="theta")
+        last_close = closes[origin - 1][1]
+        for p in result.points:
+            if p.forecast_date in actuals:
+                pairs.append((p.yhat, actuals[p.forecast_date], last_close))
+
+    mape, rmse, directional = _compute_metrics(pairs)
+    assert theta.evaluable_points == len(pairs)
+    assert theta.mape == pytest.approx(mape)
+    assert theta.rmse == pytest.approx(rmse)
+    assert theta.directional == pytest.approx(directional)
+
+
+def test_report_sorted_by_mape_with_naive_baseline() -> None:
+    report = backtest_series_many(
+        {"X": _gen_series(160)},
+        engines=[*BATCH_ENGINES, "holt_winters"],
+        horizon_days=7,
+        step_days=14,
+        max_origins=4,
+    )["X"]
+    assert [e.engine for e in report.per_engine] != []
+    mapes = [e.mape for e in report.per_engine if e.mape is not None]
+    assert mapes == sorted(mapes)
+    assert report.naive is not None
+    assert report.naive.evaluable_points > 0
+    # A steady uptrend: drift should beat "no change".
+    drift = next(e for e in report.per_engine if e.engine == "drift")
+    assert drift.mape is not None and drift.mape < report.naive.mape  # type: ignore[operator]
+    hw = next(e for e in report.per_engine if e.engine == "holt_winters")
+    assert hw.origins == 4
+    assert hw.fit_seconds > 0
+
+
+def test_short_series_yields_empty_report() -> None:
+    report = backtest_series_many({"X": _gen_series(MIN_TRAINING_ROWS)})["X"]
+    assert report.origins == 0
+    assert report.naive is None
+    assert all(e.mape is None for e in report.per_engine)
+
+
+def test_repeat_run_is_served_from_cache_until_data_changes() -> None:
+    closes = _gen_series(120)
+    kwargs = {"engines": ["drift", "ewma"], "horizon_days": 5, "max_origins": 3}
+    first = backtest_series_many({"X": closes}, **kwargs)["X"]  # type: ignore[arg-type]
+    again = backtest_series_many({"Y": closes}, **kwargs)["Y"]  # type: ignore[arg-type]
+    assert not first.cached
+    assert again.cached
+    assert again.symbol == "Y"
+    assert again.fingerprint == first.fingerprint
+
+    closes.append((closes[-1][0] + timedelta(days=1), 200.0))
+    changed = backtest_series_many({"X": closes}, **kwargs)["X"]  # type: ignore[arg-type]
+    assert not changed.cached
+    assert changed.fingerprint != first.fingerprint
+
+
+def test_rejects_unknown_engine_and_bad_params() -> None:
+    with pytest.raises(BacktestError, match="unknown engine"):
+        backtest_series_many({"X": _gen_series(100)}, engines=["prophet"])
+    with pytest.raises(BacktestError):
+        backtest_series_many({"X": _gen_series(100)}, step_days=0)
+    with pytest.raises(BacktestError):
+        backtest_series_many({"X": _gen_series(100)}, horizon_days=0)
+
+
+def test_backtest_symbol_loads_from_db(isolated_db: Path) -> None:
+    _seed_asset_with_daily_closes("AAPL", n_rows=120)
+    report = backtest_symbol("aapl", engines=["drift"], horizon_days=7, max_origins=3)
+    assert report is not None
+    assert report.symbol == "AAPL"
+    assert report.training_rows == 120
+    assert report.origins == 3
+    assert backtest_symbol("NOPE", engines=["drift"]) is None
+
+
+def test_cli_prints_table(isolated_db: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    _seed_asset_with_daily_closes("AAPL", n_rows=100)
+    rc = backtest.main(["AAPL", "MISSING", "--engines", "drift,ewma", "--max-origins", "2"])
+    out = capsys.readouterr().out
+    assert rc == 0
+    assert "AAPL: 2 origins" in out
+    assert "MISSING: no daily closes tracked" in out
+    assert backtest.main(["AAPL", "--engines", "bogus"]) == 2
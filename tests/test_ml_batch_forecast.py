@@ -0,0 +1,120 @@
+"""Vectorized lightweight engines — ``ml.batch_forecast``.
+
+Pure compute, no DB. The key properties: every engine emits a proper
+horizon of banded points, stacking ragged series into one matrix gives the
+same answer as forecasting each alone, and the vectorized volatility cone
+matches the scalar one ``ml.forecast`` applies to the statsmodels engines.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import date, timedelta
+
+import pytest
+
+from ml.batch_forecast import (
+    _ewma_daily_vol_matrix,
+    forecast_batch,
+    forecast_matrix,
+)
+from ml.forecast import (
+    BATCH_ENGINES,
+    DRIFT_MODEL_NAME,
+    MIN_TRAINING_ROWS,
+    ForecastError,
+    InsufficientDataError,
+    _ewma_daily_vol,
+    _import_numpy,
+    forecast_series,
+)
+
+
+def _gen_series(
+    n: int, *, start: date = date(2020, 1, 1), slope: float = 0.3
+) -> list[tuple[date, float]]:
+    return [
+        (start + timedelta(days=i), 100.0 + slope * i + 2.0 * math.sin(i / 7.0))
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("engine", BATCH_ENGINES)
+def test_batch_engine_emits_ordered_bands(engine: str) -> None:
+    result = forecast_series(_gen_series(120), horizon_days=14, engine=engine)  # type: ignore[arg-type]
+    assert len(result.points) == 14
+    assert result.training_rows == 120
+    for p in result.points:
+        assert p.lower_95 <= p.lower_80 <= p.yhat <= p.upper_80 <= p.upper_95
+
+
+def test_drift_extrapolates_average_change() -> None:
+    series = [(date(2020, 1, 1) + timedelta(days=i), 100.0 + i) for i in range(80)]
+    result = forecast_series(series, horizon_days=3, engine="drift")
+    assert result.model == DRIFT_MODEL_NAME
+    assert [p.yhat for p in result.points] == pytest.approx([180.0, 181.0, 182.0])
+
+
+def test_ewma_forecast_is_flat() -> None:
+    result = forecast_series(_gen_series(100), horizon_days=5, engine="ewma")
+    assert len({round(p.yhat, 9) for p in result.points}) == 1
+
+
+def test_damped_trend_slope_decays() -> None:
+    result = forecast_series(_gen_series(200, slope=1.0), horizon_days=20, engine="damped_trend")
+    steps = [b.yhat - a.yhat for a, b in zip(result.points, result.points[1:])]
+    assert steps[0] > 0
+    assert steps[-1] < steps[0]
+
+
+@pytest.mark.parametrize("engine", BATCH_ENGINES)
+def test_stacked_ragged_series_match_individual_forecasts(engine: str) -> None:
+    short = _gen_series(70, start=date(2021, 3, 1), slope=-0.2)
+    long = _gen_series(300)
+    outcome = forecast_batch({"A": short, "B": long}, horizon_days=7, engine=engine)  # type: ignore[arg-type]
+    for key, series in (("A", short), ("B", long)):
+        alone = forecast_batch({key: series}, horizon_days=7, engine=engine)  # type: ignore[arg-type]
+        batched = outcome.results[key].points
+        single = alone.results[key].points
+        assert [p.yhat for p in batched] == pytest.approx([p.yhat for p in single])
+        assert [p.upper_95 for p in batched] == pytest.approx(
+            [p.upper_95 for p in single]
+        )
+        assert batched[0].forecast_date == series[-1][0] + timedelta(days=1)
+
+
+def test_vectorized_vol_matches_scalar_ewma() -> None:
+    np = _import_numpy()
+    a = [v for _, v in _gen_series(90)]
+    b = [v for _, v in _gen_series(150, slope=0.05)]
+    width = len(b)
+    matrix = np.array([[a[0]] * (width - len(a)) + a, b])
+    sigma = _ewma_daily_vol_matrix(np, matrix, np.array([len(a), len(b)]))
+    assert sigma[0] == pytest.approx(_ewma_daily_vol(a), rel=1e-12)
+    assert sigma[1] == pytest.approx(_ewma_daily_vol(b), rel=1e-12)
+
+
+def test_batch_collects_per_series_errors() -> None:
+    outcome = forecast_batch(
+        {"ok": _gen_series(80), "short": _gen_series(MIN_TRAINING_ROWS - 1)},
+        horizon_days=5,
+        engine="theta",
+    )
+    assert set(outcome.results) == {"ok"}
+    assert isinstance(outcome.errors["short"], InsufficientDataError)
+
+
+def test_batch_rejects_statsmodels_engine_and_bad_horizon() -> None:
+    with pytest.raises(ForecastError):
+        forecast_batch({"A": _gen_series(80)}, engine="sarimax")
+    with pytest.raises(ForecastError):
+        forecast_batch({"A": _gen_series(80)}, horizon_days=0, engine="drift")
+
+
+def test_forecast_matrix_handles_a_large_universe() -> None:
+    np = _import_numpy()
+    rng = np.random.default_rng(7)
+    values = 100.0 * np.exp(np.cumsum(rng.normal(0, 0.01, (1000, 500)), axis=1))
+    out = forecast_matrix(values, np.full(1000, 500), horizon_days=14, engine="theta")
+    assert out.yhat.shape == (1000, 14)
+    assert np.all(out.upper_95 >= out.upper_80)
@@ -0,0 +1,53 @@
+"""Tests for ``ml.comparison.align_and_rebase`` — shared axis, LOCF, rebasing.
+
+The query and the endpoint are covered in ``test_api_analytics``.
+"""
+
+from __future__ import annotations
+
+import math
+
+from ml.comparison import align_and_rebase
+
+
+def _nan_to_none(values: list[float]) -> list[float | None]:
+    return [None if math.isnan(v) else v for v in values]
+
+
+def test_align_carries_last_close_forward_on_the_union_of_dates() -> None:
+    # Series 0 trades days 0, 1, 3; series 1 trades days 1, 2, 3.
+    out = align_and_rebase(
+        [0, 0, 1, 1, 0, 1],
+        [0, 1, 1, 2, 3, 3],
+        [10.0, 11.0, 50.0, 55.0, 12.0, 60.0],
+        2,
+        base=100.0,
+    )
+    assert out.days == [0, 1, 2, 3]
+    assert out.values[0] == [100.0, 110.0, 110.0, 120.0]
+    # No value before its first bar; rebased from that bar.
+    assert _nan_to_none(out.values[1]) == [None, 100.0, 110.0, 120.0]
+    assert out.first_close == [10.0, 50.0]
+    assert out.last_close == [12.0, 60.0]
+
+
+def test_align_moves_the_carried_bar_onto_the_start_day() -> None:
+    # Series 0's last bar before day 5 is day 2; series 1 trades on day 5.
+    out = align_and_rebase([0, 1, 0, 1], [2, 4, 6, 5], [20.0, 1.0, 30.0, 2.0], 2, start_day=5, base=1.0)
+    assert out.days == [5, 6]
+    assert out.values[0] == [1.0, 1.5]
+    # A bar on the start day wins over one carried onto it.
+    assert out.values[1] == [1.0, 1.0]
+    assert out.first_close == [20.0, 2.0]
+
+
+def test_align_handles_empty_and_dataless_series() -> None:
+    empty = align_and_rebase([], [], [], 2)
+    assert empty.days == []
+    assert empty.values == [[], []]
+    assert all(math.isnan(v) for v in empty.first_close)
+
+    out = align_and_rebase([0, 0], [0, 1], [4.0, 5.0], 2)
+    assert out.values[0] == [100.0, 125.0]
+    assert all(math.isnan(v) for v in out.values[1])
+    assert math.isnan(out.first_close[1])
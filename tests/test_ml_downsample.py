@@ -0,0 +1,81 @@
+"""Tests for ``ml.downsample`` — LTTB index selection and OHLC bucketing.
+
+The endpoint side (``max_points`` on prices / macro / portfolio) is
+covered next to each endpoint's other tests.
+"""
+
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from ml.downsample import lttb, ohlc_buckets
+
+
+def _naive_lttb(x: list[float], y: list[float], n_out: int) -> list[int]:
+    """Textbook scalar LTTB, for checking the vectorised version."""
+    n = len(x)
+    every = (n - 2) / (n_out - 2)
+    out = [0]
+    a = 0
+    for i in range(n_out - 2):
+        lo = int(i * every) + 1
+        hi = int((i + 1) * every) + 1
+        nlo, nhi = hi, min(int((i + 2) * every) + 1, n)
+        if i == n_out - 3:
+            nlo, nhi = n - 1, n
+        avg_x = sum(x[nlo:nhi]) / (nhi - nlo)
+        avg_y = sum(y[nlo:nhi]) / (nhi - nlo)
+        areas = [
+            abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            for j in range(lo, hi)
+        ]
+        a = lo + areas.index(max(areas))
+        out.append(a)
+    out.append(n - 1)
+    return out
+
+
+def test_lttb_keeps_endpoints_and_spikes() -> None:
+    x = [float(i) for i in range(1000)]
+    y = [0.0] * 1000
+    y[137] = 50.0
+    y[612] = -40.0
+    keep = lttb(x, y, 20)
+    assert len(keep) == 20
+    assert keep[0] == 0 and keep[-1] == 999
+    assert keep == sorted(set(keep))
+    assert 137 in keep and 612 in keep
+
+
+def test_lttb_matches_the_scalar_reference() -> None:
+    # Wide buckets (numpy path) and narrow ones (plain loop) alike.
+    x = [float(i * 60) for i in range(3000)]
+    y = [math.sin(i / 37) * 10 + (i % 7) for i in range(3000)]
+    for n_out in (3, 10, 400, 2000):
+        assert lttb(x, y, n_out) == _naive_lttb(x, y, n_out)
+
+
+def test_lttb_within_budget_returns_everything() -> None:
+    assert lttb([1.0, 2.0, 3.0], [3.0, 1.0, 2.0], 3) == [0, 1, 2]
+    assert lttb([], [], 5) == []
+    with pytest.raises(ValueError):
+        lttb([1.0, 2.0], [1.0, 2.0], 2)
+    with pytest.raises(ValueError):
+        lttb([1.0, 2.0], [1.0], 5)
+
+
+def test_ohlc_buckets_pick_extremes_per_bucket() -> None:
+    high = [5.0, 7.0, 6.0, 1.0, 9.0, 9.0, 2.0]
+    low = [4.0, 3.0, 5.0, 0.5, 8.0, 1.0, 1.0]
+    b = ohlc_buckets(high, low, 3)
+    assert b.starts == [0, 2, 4]
+    assert b.ends == [2, 4, 7]
+    assert b.high_idx == [1, 2, 4]  # ties keep the earliest bar
+    assert b.low_idx == [1, 3, 5]
+
+
+def test_ohlc_buckets_within_budget_is_identity() -> None:
+    b = ohlc_buckets([1.0, 2.0], [0.5, 1.5], 5)
+    assert (b.starts, b.ends, b.high_idx, b.low_idx) == ([0, 1], [1, 2], [0, 1], [0, 1])
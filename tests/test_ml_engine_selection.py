@@ -0,0 +1,246 @@
+"""``"auto"`` forecast engine mode — ``ml.engine_selection`` + ``ml.jobs``.
+
+Selection rules are tested pure; the orchestration tests seed synthetic
+daily closes into an isolated SQLite and flip ``forecast.default_engine``
+to ``"auto"`` through the settings service, exactly as the UI would.
+Backtest origins are trimmed so each statsmodels evaluation is only a
+couple of fits.
+"""
+
+from __future__ import annotations
+
+import math
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+from sqlalchemy import func, select
+
+import ml.jobs
+from ml import backtest
+from ml.accuracy import AccuracyReport, EngineAccuracy
+from ml.backtest import BacktestReport, EngineBacktest
+from ml.engine_selection import (
+    AUTO_FALLBACK_ENGINE,
+    Winner,
+    load_selections,
+    next_challenger,
+    save_selection,
+    winner_from_accuracy,
+    winner_from_backtest,
+)
+from ml.forecast import (
+    ENGINES,
+    HOLT_WINTERS_MODEL_NAME,
+    MODEL_NAME_TO_ENGINE,
+    SARIMAX_MODEL_NAME,
+    THETA_MODEL_NAME,
+)
+from ml.jobs import refresh_stale_forecasts, train_forecasts, train_one
+from ml.persistence import load_forecast
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Asset, AssetType, ForecastSnapshot, PricePoint
+from sidecar.services.settings import apply_updates
+
+
+def _seed_asset_with_daily_closes(symbol: str, *, n_rows: int) -> int:
+    with session_scope() as s:
+        asset = Asset(symbol=symbol, name=symbol, asset_type=AssetType.STOCK)
+        s.add(asset)
+        s.flush()
+        start = datetime(2024, 1, 1, tzinfo=UTC)
+        for i in range(n_rows):
+            price = Decimal(str(100.0 + 0.2 * i + 1.5 * math.sin(i / 5.0)))
+            s.add(
+                PricePoint(
+                    asset_id=asset.id,
+                    timestamp=start + timedelta(days=i),
+                    interval="1d",
+                    open=price,
+                    high=price,
+                    low=price,
+                    close=price,
+                    volume=1_000_000,
+                )
+            )
+        return asset.id
+
+
+def _snapshot_count(asset_id: int) -> int:
+    with session_scope() as s:
+        return int(
+            s.execute(
+                select(func.count())
+                .select_from(ForecastSnapshot)
+                .where(ForecastSnapshot.asset_id == asset_id)
+            ).scalar_one()
+        )
+
+
+def _accuracy(*entries: tuple[str, float | None, int]) -> AccuracyReport:
+    return AccuracyReport(
+        symbol="X",
+        days=90,
+        per_engine=[
+            EngineAccuracy(
+                engine=name,
+                snapshots=1,
+                evaluable_points=points,
+                mape=mape,
+                rmse=None,
+                directional=None,
+            )
+            for name, mape, points in entries
+        ],
+        overall=None,
+        naive=None,
+        actuals_available=0,
+    )
+
+
+@pytest.fixture
+def auto_mode(
+    isolated_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    apply_updates({"forecast.default_engine": "auto"})
+    monkeypatch.setattr(ml.jobs, "BACKTEST_MAX_ORIGINS", 2)
+    backtest.clear_cache()
+
+
+# ---------------------------------------------------------------------------
+# Selection rules
+# ---------------------------------------------------------------------------
+
+
+def test_model_names_map_back_to_every_engine() -> None:
+    assert sorted(MODEL_NAME_TO_ENGINE.values()) == sorted(ENGINES)
+
+
+def test_accuracy_winner_needs_two_engines_with_evidence() -> None:
+    # Only one engine has enough points — not a comparison.
+    assert (
+        winner_from_accuracy(
+            _accuracy((SARIMAX_MODEL_NAME, 2.0, 30), (THETA_MODEL_NAME, 1.0, 5))
+        )
+        is None
+    )
+    winner = winner_from_accuracy(
+        _accuracy(
+            (SARIMAX_MODEL_NAME, 2.0, 30),
+            (THETA_MODEL_NAME, 1.5, 25),
+            (HOLT_WINTERS_MODEL_NAME, None, 40),
+            ("Retired model", 0.1, 99),
+        )
+    )
+    assert winner == Winner(
+        engine="theta", source="accuracy", mape=1.5, evaluable_points=25
+    )
+
+
+def test_backtest_winner_is_best_scored_engine() -> None:
+    def entry(engine: str, mape: float | None) -> EngineBacktest:
+        return EngineBacktest(engine, 4, 20 if mape else 0, 0, mape, None, None, 0.1)
+
+    report = BacktestReport(
+        symbol="X",
+        horizon_days=14,
+        step_days=7,
+        origins=4,
+        training_rows=200,
+        per_engine=[entry("drift", 1.2), entry("sarimax", 3.0), entry("ewma", None)],
+        naive=None,
+        fingerprint="f",
+        elapsed_seconds=0.0,
+    )
+    winner = winner_from_backtest(report)
+    assert winner is not None
+    assert (winner.engine, winner.source, winner.mape) == ("drift", "backtest", 1.2)
+
+
+def test_challenger_rotation_skips_winner_and_wraps() -> None:
+    seen = []
+    last = None
+    for _ in range(len(ENGINES)):
+        last = next_challenger("theta", last)
+        seen.append(last)
+    assert "theta" not in seen
+    assert seen[: len(ENGINES) - 1] == [e for e in ENGINES if e != "theta"]
+    assert seen[-1] == seen[0]
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------------
+
+
+def test_auto_train_evaluates_fits_winner_and_one_challenger(auto_mode: None) -> None:
+    aid = _seed_asset_with_daily_closes("AAPL", n_rows=120)
+
+    assert train_forecasts() == 1
+
+    with session_scope() as s:
+        selection = load_selections(s, [aid])[aid]
+    assert selection.source == "backtest"
+    assert selection.last_challenger == next_challenger(selection.engine, None)
+    stored = load_forecast(aid)
+    assert stored is not None
+    assert MODEL_NAME_TO_ENGINE[stored.model] == selection.engine
+    # Winner + one challenger snapshot — not one fit per engine.
+    assert _snapshot_count(aid) == 2
+
+
+def test_auto_without_budget_fits_fallback_only(auto_mode: None) -> None:
+    aid = _seed_asset_with_daily_closes("AAPL", n_rows=120)
+
+    assert train_forecasts(auto_budget_seconds=0) == 1
+
+    with session_scope() as s:
+        assert load_selections(s, [aid]) == {}
+    stored = load_forecast(aid)
+    assert stored is not None
+    assert MODEL_NAME_TO_ENGINE[stored.model] == AUTO_FALLBACK_ENGINE
+    assert _snapshot_count(aid) == 1
+
+
+def test_auto_groups_batch_winners_and_honours_existing_choice(
+    auto_mode: None,
+) -> None:
+    a = _seed_asset_with_daily_closes("AAPL", n_rows=120)
+    b = _seed_asset_with_daily_closes("MSFT", n_rows=120)
+    save_selection(a, Winner("theta", "backtest", 1.0, 10))
+    save_selection(b, Winner("ewma", "backtest", 1.0, 10))
+
+    assert train_forecasts(auto_budget_seconds=0) == 2
+
+    forecast_a, forecast_b = load_forecast(a), load_forecast(b)
+    assert forecast_a is not None and forecast_b is not None
+    assert MODEL_NAME_TO_ENGINE[forecast_a.model] == "theta"
+    assert MODEL_NAME_TO_ENGINE[forecast_b.model] == "ewma"
+    assert train_one("aapl").model == forecast_a.model
+
+
+def test_expired_selection_is_reevaluated(auto_mode: None) -> None:
+    aid = _seed_asset_with_daily_closes("AAPL", n_rows=120)
+    stale_at = datetime.now(UTC) - timedelta(days=30)
+    save_selection(aid, Winner("sarimax", "backtest", 99.0, 1), evaluated_at=stale_at)
+
+    # The stale refresh never re-scores an existing winner...
+    refresh_stale_forecasts()
+    with session_scope() as s:
+        assert load_selections(s, [aid])[aid].mape == 99.0
+
+    # ...the weekly run does, once it's older than the configured interval.
+    train_forecasts()
+    with session_scope() as s:
+        fresh = load_selections(s, [aid])[aid]
+    assert fresh.evaluated_at > stale_at
+    assert fresh.mape != 99.0
+
+
+def test_auto_setting_is_accepted_and_explicit_engine_still_wins(
+    auto_mode: None,
+) -> None:
+    _seed_asset_with_daily_closes("AAPL", n_rows=120)
+    result = train_one("AAPL", engine="drift")
+    assert MODEL_NAME_TO_ENGINE[result.model] == "drift"
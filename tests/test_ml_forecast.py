@@ -156,7 +156,14 @@ def test_unknown_engine_raises_forecast_error() -> None:
 def test_engines_constant_is_stable() -> None:
     """Catches accidental drift in the literal set — must stay aligned with
     the API's `_validate_engine_param` and the Settings dropdown."""
-    assert set(ENGINES) == {"sarimax", "holt_winters"}
+    assert set(ENGINES) == {
+        "sarimax",
+        "holt_winters",
+        "drift",
+        "ewma",
+        "damped_trend",
+        "theta",
+    }
 
 
 # ---------------------------------------------------------------------------
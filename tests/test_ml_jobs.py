@@ -271,3 +271,36 @@ def test_refresh_retrains_when_a_new_bar_lands(isolated_db: Path) -> None:
     after = load_forecast(aid)
     assert after is not None
     assert after.last_close_date > before.last_close_date
+
+
+def test_train_forecasts_batch_engine_fits_every_asset_in_one_pass(
+    isolated_db: Path,
+) -> None:
+    _seed_asset_with_daily_closes("AAPL", n_rows=90)
+    _seed_asset_with_daily_closes("MSFT", n_rows=70, start=date(2024, 2, 1))
+    _seed_asset_with_daily_closes("TINY", n_rows=10)
+
+    assert train_forecasts(engine="theta") == 2
+
+    stored = load_forecast(_resolve_asset_id("MSFT"))
+    assert stored is not None
+    assert stored.model == "Theta"
+    assert stored.training_rows == 70
+    assert load_forecast(_resolve_asset_id("TINY")) is None
+
+
+def test_refresh_batch_forecasts_is_noop_for_statsmodels_engine(
+    isolated_db: Path,
+) -> None:
+    from ml.jobs import refresh_batch_forecasts
+
+    _seed_asset_with_daily_closes("AAPL", n_rows=80)
+    # Default engine is SARIMAX → nothing to do after a daily ingest.
+    assert refresh_batch_forecasts() == 0
+    assert load_forecast(_resolve_asset_id("AAPL")) is None
+
+
+def test_refresh_stale_forecasts_batch_skips_current_assets(isolated_db: Path) -> None:
+    _seed_asset_with_daily_closes("AAPL", n_rows=80)
+    assert refresh_stale_forecasts(engine="drift") == 1
+    assert refresh_stale_forecasts(engine="drift") == 0
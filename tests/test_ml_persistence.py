@@ -7,25 +7,36 @@ covered in `test_ml_forecast.py`.
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import UTC, date, datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
 
-from sqlalchemy import select
+import pytest
+from sqlalchemy import func, select
 
 from ml.forecast import ForecastPoint, ForecastResult
 from ml.persistence import (
     _decode_points,
     _encode_points,
     all_forecast_asset_ids,
+    decode_points_blob,
     delete_forecast,
+    encode_points_blob,
     load_forecast,
     load_forecast_by_symbol,
     load_snapshots,
     save_forecast,
+    thin_snapshots,
 )
 from sidecar.db.engine import session_scope
-from sidecar.db.models import Asset, AssetType, Forecast, ForecastSnapshot
+from sidecar.db.models import (
+    AccuracyPoint,
+    Asset,
+    AssetType,
+    Forecast,
+    ForecastSnapshot,
+)
 
 
 def _make_result(horizon: int = 14, training_rows: int = 150) -> ForecastResult:
@@ -73,6 +84,42 @@ def test_encode_decode_round_trip() -> None:
         assert orig.upper_95 == back.upper_95
 
 
+def test_points_blob_round_trip_contiguous_dates() -> None:
+    result = _make_result(horizon=14)
+    blob = encode_points_blob(result.points)
+    # Header + float64 yhat + four float32 bands; dates are implied.
+    assert len(blob) == 7 + 14 * 8 + 14 * 4 * 4
+    assert blob[0] == 1
+
+    packed = decode_points_blob(blob)
+    assert list(packed.yhat) == [p.yhat for p in result.points]
+    decoded = packed.to_points()
+    for orig, back in zip(result.points, decoded, strict=True):
+        assert orig.forecast_date == back.forecast_date
+        assert orig.yhat == back.yhat
+        assert orig.lower_80 == pytest.approx(back.lower_80, rel=1e-6)
+        assert orig.upper_95 == pytest.approx(back.upper_95, rel=1e-6)
+
+
+def test_points_blob_keeps_explicit_dates_when_not_contiguous() -> None:
+    points = _make_result(horizon=4).points
+    gappy = [points[0], points[1], points[3]]
+    blob = encode_points_blob(gappy)
+    assert blob[0] == 2
+    decoded = decode_points_blob(blob).to_points()
+    assert [p.forecast_date for p in decoded] == [p.forecast_date for p in gappy]
+
+    assert decode_points_blob(encode_points_blob([])).to_points() == []
+
+
+def test_points_blob_rejects_unknown_version_and_truncation() -> None:
+    blob = encode_points_blob(_make_result(horizon=3).points)
+    with pytest.raises(ValueError, match="version"):
+        decode_points_blob(b"\x09" + blob[1:])
+    with pytest.raises(ValueError, match="truncated"):
+        decode_points_blob(blob[:-1])
+
+
 def test_save_and_load_forecast_round_trip(isolated_db: Path) -> None:
     asset_id = _seed_asset()
     result = _make_result()
@@ -286,3 +333,40 @@ def test_snapshots_cascade_with_asset_delete(isolated_db: Path) -> None:
         s.execute(Asset.__table__.delete().where(Asset.id == asset_id))
 
     assert load_snapshots(asset_id) == []
+
+
+def test_thin_snapshots_keeps_one_per_week_per_engine(isolated_db: Path) -> None:
+    """Past the cutoff only the newest snapshot per (model, week) survives,
+    and the deleted snapshots' accuracy points go with them."""
+    asset_id = _seed_asset()
+    now = datetime(2026, 10, 19, 12, 0, tzinfo=UTC)  # a Monday
+    base = _make_result(horizon=3)
+    # Old history: the week of 2026-06-01 (Mon) holds three SARIMAX
+    # snapshots and one drift snapshot; the week after holds one.
+    old = [
+        ("SARIMAX(1,1,1)", datetime(2026, 6, 1, 6, tzinfo=UTC)),
+        ("SARIMAX(1,1,1)", datetime(2026, 6, 3, 6, tzinfo=UTC)),
+        ("SARIMAX(1,1,1)", datetime(2026, 6, 5, 6, tzinfo=UTC)),
+        ("Drift", datetime(2026, 6, 2, 6, tzinfo=UTC)),
+        ("SARIMAX(1,1,1)", datetime(2026, 6, 9, 6, tzinfo=UTC)),
+    ]
+    recent = [
+        ("SARIMAX(1,1,1)", now - timedelta(days=2)),
+        ("SARIMAX(1,1,1)", now - timedelta(days=1)),
+    ]
+    for model, generated_at in old + recent:
+        save_forecast(asset_id, replace(base, model=model, generated_at=generated_at))
+
+    assert thin_snapshots(30, now=now) == 2
+
+    survivors = load_snapshots(asset_id)
+    assert [(s.model, s.generated_at) for s in survivors] == sorted(
+        [old[2], old[3], old[4], *recent], key=lambda r: r[1]
+    )
+    with session_scope() as s:
+        points = s.execute(select(func.count()).select_from(AccuracyPoint)).scalar_one()
+    assert points == len(survivors) * 3
+
+    # Idempotent, and 0 disables retention.
+    assert thin_snapshots(30, now=now) == 0
+    assert thin_snapshots(0, now=now) == 0
@@ -0,0 +1,66 @@
+"""Background ML warm-up — readiness tracking and the health-probe gate."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from ml import warmup as warmup_mod
+
+
+@pytest.fixture(autouse=True)
+def _fresh_tracker(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(warmup_mod, "_tracker", warmup_mod._WarmupTracker())
+    monkeypatch.setattr(warmup_mod, "_serving", threading.Event())
+    monkeypatch.setattr(warmup_mod, "_thread", None)
+
+
+def test_status_is_disabled_until_started() -> None:
+    status = warmup_mod.warmup_status()
+    assert status.state == "disabled"
+    assert status.components == {}
+
+
+def test_run_warmup_marks_components_ready() -> None:
+    status = warmup_mod.run_warmup()
+    assert status.state == "done"
+    assert status.components == {"forecast": "ready", "sentiment": "ready"}
+    assert status.elapsed_ms is not None
+
+
+def test_run_warmup_marks_missing_backend_unavailable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _missing() -> None:
+        raise ImportError("No module named 'statsmodels'")
+
+    monkeypatch.setattr(
+        warmup_mod,
+        "_COMPONENTS",
+        (("forecast", _missing), ("sentiment", lambda: None)),
+    )
+    status = warmup_mod.run_warmup()
+    assert status.state == "done"
+    assert status.components == {"forecast": "unavailable", "sentiment": "ready"}
+
+
+def test_background_warmup_waits_for_first_health_probe(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    ran = threading.Event()
+    monkeypatch.setattr(
+        warmup_mod, "_COMPONENTS", (("forecast", ran.set),)
+    )
+
+    assert warmup_mod.start_background_warmup() is True
+    assert warmup_mod.start_background_warmup() is False  # idempotent
+    assert warmup_mod.warmup_status().state == "pending"
+    assert not ran.wait(timeout=0.2)
+
+    warmup_mod.notify_serving()
+    assert ran.wait(timeout=5.0)
+    thread = warmup_mod._thread
+    assert thread is not None
+    thread.join(timeout=5.0)
+    assert warmup_mod.warmup_status().components == {"forecast": "ready"}
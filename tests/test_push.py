@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import AsyncGenerator
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+from sidecar.api.stream import event_stream
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Asset, AssetType, PricePoint
+from sidecar.events import BarsIngested, JobFinished, publish
+from sidecar.services import alerts as alerts_svc
+from sidecar.services.push import PushHub, push_hub
+
+
+async def _never_disconnected() -> bool:
+    return False
+
+
+async def _take(frames: AsyncGenerator[str, None], n: int) -> list[str]:
+    out: list[str] = []
+    async for frame in frames:
+        if frame.startswith(("retry:", ":")):
+            continue
+        out.append(frame)
+        if len(out) == n:
+            break
+    return out
+
+
+def _parse(frame: str) -> dict[str, str]:
+    return dict(line.split(": ", 1) for line in frame.strip().splitlines())
+
+
+# ---------------------------------------------------------------------------
+# Hub
+# ---------------------------------------------------------------------------
+
+
+def test_replay_since_returns_missed_events_or_none_when_evicted() -> None:
+    hub = PushHub(buffer_size=3)
+    for i in range(5):
+        hub.publish("job", {"n": i})
+    assert hub.head == 5
+    assert [e.seq for e in hub.replay_since(3) or []] == [4, 5]
+    assert hub.replay_since(5) == []
+    # Events 2 and 3 have been evicted from a buffer of 3.
+    assert hub.replay_since(1) is None
+    assert hub.replay_since(99) is None
+
+
+def test_event_ids_are_scoped_to_the_hub_epoch() -> None:
+    hub = PushHub()
+    other = PushHub()
+    other.epoch = hub.epoch + "0"
+    evt = hub.publish("job", {})
+    assert hub.parse_event_id(hub.event_id(evt.seq)) == evt.seq
+    assert hub.parse_event_id(other.event_id(evt.seq)) is None
+    assert hub.parse_event_id("garbage") is None
+
+
+def test_symbol_scoping() -> None:
+    hub = PushHub()
+    scoped = hub.publish("quote", {}, symbols=["AAPL"])
+    broadcast = hub.publish("alert", {})
+    assert scoped.visible_to(frozenset({"AAPL", "MSFT"}))
+    assert not scoped.visible_to(frozenset({"MSFT"}))
+    assert scoped.visible_to(None)
+    assert broadcast.visible_to(frozenset({"MSFT"}))
+
+
+# ---------------------------------------------------------------------------
+# Stream
+# ---------------------------------------------------------------------------
+
+
+def test_stream_sends_ready_then_live_filtered_events() -> None:
+    hub = PushHub()
+
+    async def run() -> list[str]:
+        frames = event_stream(
+            hub,
+            resume_from=None,
+            symbols=frozenset({"AAPL"}),
+            is_disconnected=_never_disconnected,
+        )
+        ready = await _take(frames, 1)
+        hub.publish("quote", {"symbol": "MSFT"}, symbols=["MSFT"])
+        hub.publish("quote", {"symbol": "AAPL"}, symbols=["AAPL"])
+        live = await _take(frames, 1)
+        await frames.aclose()
+        return ready + live
+
+    ready, live = (_parse(f) for f in asyncio.run(run()))
+    assert ready["event"] == "ready"
+    assert json.loads(ready["data"]) == {"resumed": False, "replayed": 0}
+    assert live["event"] == "quote"
+    assert json.loads(live["data"]) == {"symbol": "AAPL"}
+    assert live["id"] == hub.event_id(2)
+
+
+def test_stream_resumes_from_last_event_id() -> None:
+    hub = PushHub()
+    first = hub.publish("job", {"n": 1})
+    hub.publish("job", {"n": 2})
+    hub.publish("job", {"n": 3})
+
+    async def run() -> list[str]:
+        frames = event_stream(
+            hub,
+            resume_from=hub.event_id(first.seq),
+            symbols=None,
+            is_disconnected=_never_disconnected,
+        )
+        out = await _take(frames, 3)
+        await frames.aclose()
+        return out
+
+    frames = [_parse(f) for f in asyncio.run(run())]
+    assert [f["event"] for f in frames] == ["job", "job", "ready"]
+    assert [json.loads(f["data"]).get("n") for f in frames[:2]] == [2, 3]
+    assert json.loads(frames[2]["data"]) == {"resumed": True, "replayed": 2}
+    assert frames[2]["id"] == hub.event_id(3)
+
+
+def test_stream_resets_when_resume_point_is_unknown() -> None:
+    hub = PushHub()
+    hub.publish("job", {})
+
+    async def run() -> list[str]:
+        frames = event_stream(
+            hub,
+            resume_from="deadbeef-7",  # a previous sidecar process
+            symbols=None,
+            is_disconnected=_never_disconnected,
+        )
+        out = await _take(frames, 1)
+        await frames.aclose()
+        return out
+
+    (frame,) = (_parse(f) for f in asyncio.run(run()))
+    assert frame["event"] == "reset"
+    assert frame["id"] == hub.event_id(1)
+
+
+def test_stream_heartbeats_and_ends_on_disconnect() -> None:
+    hub = PushHub()
+    calls = 0
+
+    async def disconnected_on_second_check() -> bool:
+        nonlocal calls
+        calls += 1
+        return calls > 1
+
+    async def run() -> list[str]:
+        return [
+            frame
+            async for frame in event_stream(
+                hub,
+                resume_from=None,
+                symbols=None,
+                is_disconnected=disconnected_on_second_check,
+                heartbeat_seconds=0.01,
+            )
+        ]
+
+    frames = asyncio.run(run())
+    assert frames[0].startswith("retry:")
+    assert frames[-1] == ": keepalive\n\n"
+
+
+# ---------------------------------------------------------------------------
+# Event bridge
+# ---------------------------------------------------------------------------
+
+
+def _seed_asset() -> int:
+    with session_scope() as s:
+        a = Asset(symbol="AAPL", name="Apple Inc.", asset_type=AssetType.STOCK)
+        s.add(a)
+        s.flush()
+        return a.id
+
+
+def test_fired_alert_and_new_bars_reach_the_hub(isolated_db: Path) -> None:
+    aid = _seed_asset()
+    alerts_svc.create_alert(asset_id=aid, threshold=Decimal("150"), direction="above")
+    start = push_hub.head
+    with session_scope() as s:
+        s.add(
+            PricePoint(
+                asset_id=aid,
+                timestamp=datetime.now(UTC) + timedelta(minutes=1),
+                interval="5m",
+                open=Decimal("149"),
+                high=Decimal("151"),
+                low=Decimal("148"),
+                close=Decimal("149"),
+                volume=0,
+            )
+        )
+    assert alerts_svc.check_alerts(asset_ids=[aid]) == 1
+
+    async def connected() -> None:
+        # Quotes are only built while a client is subscribed.
+        with push_hub.subscribe():
+            publish(BarsIngested(frozenset({aid}), frozenset({"5m"})))
+            publish(JobFinished("ingest_prices", datetime.now(UTC)))
+
+    asyncio.run(connected())
+
+    events = push_hub.replay_since(start) or []
+    kinds = [e.kind for e in events]
+    assert kinds[0] == "alert"
+    alert = json.loads(events[0].data)
+    assert alert["symbol"] == "AAPL"
+    assert alert["trigger_price"] == "151.000000"
+    quote = next(e for e in events if e.kind == "quote")
+    assert quote.symbols == frozenset({"AAPL"})
+    job = json.loads(events[-1].data)
+    assert job["job_id"] == "ingest_prices"
+    assert job["ok"] is True
+
+
+def test_ingest_builds_no_quotes_without_subscribers(
+    isolated_db: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from sidecar.api import stream
+
+    aid = _seed_asset()
+    built: list[frozenset[int]] = []
+
+    def get_quotes(asset_ids: frozenset[int]) -> list[object]:
+        built.append(asset_ids)
+        return []
+
+    monkeypatch.setattr(stream, "get_quotes_for_assets", get_quotes)
+    start = push_hub.head
+    publish(BarsIngested(frozenset({aid}), frozenset({"5m"})))
+    assert built == []
+    assert [e.kind for e in push_hub.replay_since(start) or []] == []
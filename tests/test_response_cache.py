@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+
+from sidecar.data_version import data_versions
+from sidecar.db.engine import session_scope
+from sidecar.db.models import Asset, AssetType, PricePoint
+from sidecar.main import app
+from sidecar.response_cache import ResponseCache, response_cache
+
+
+def _seed_asset(symbol: str) -> int:
+    with session_scope() as s:
+        a = Asset(symbol=symbol, name=symbol, asset_type=AssetType.STOCK)
+        s.add(a)
+        s.flush()
+        return a.id
+
+
+def _seed_daily_closes(asset_id: int, *, days: int, drift: float) -> None:
+    today = date.today()
+    with session_scope() as s:
+        for i in range(days):
+            d = today - timedelta(days=days - i)
+            price = Decimal(str(100 + drift * i + (i % 3)))
+            s.add(
+                PricePoint(
+                    asset_id=asset_id,
+                    timestamp=datetime(d.year, d.month, d.day, tzinfo=UTC),
+                    interval="1d",
+                    open=price,
+                    high=price,
+                    low=price,
+                    close=price,
+                    volume=0,
+                )
+            )
+
+
+class _Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, value: str = "x") -> str:
+        self.calls += 1
+        return value
+
+
+# ---------------------------------------------------------------------------
+# ResponseCache
+# ---------------------------------------------------------------------------
+
+
+def test_hits_until_a_tagged_domain_is_bumped() -> None:
+    cache = ResponseCache(max_bytes=1 << 20)
+    compute = _Counter()
+    tags = [("prices", 10_001), ("portfolio", None)]
+
+    for _ in range(3):
+        assert cache.get_or_compute("ep", 1, tags, compute) == "x"
+    assert compute.calls == 1
+
+    # Another asset's prices: still valid.
+    data_versions.bump("prices", [10_002])
+    cache.invalidate("prices", frozenset({10_002}))
+    cache.get_or_compute("ep", 1, tags, compute)
+    assert compute.calls == 1
+
+    data_versions.bump("portfolio")
+    assert cache.invalidate("portfolio") == 1
+    cache.get_or_compute("ep", 1, tags, compute)
+    assert compute.calls == 2
+
+    # The validator catches a bump even when no eviction ran.
+    data_versions.bump("prices", [10_001])
+    cache.get_or_compute("ep", 1, tags, compute)
+    assert compute.calls == 3
+
+    stats = cache.stats()
+    (ep,) = stats.endpoints
+    assert (ep.hits, ep.misses) == (3, 3)
+    assert stats.hit_ratio == 0.5
+    assert stats.invalidations == 1
+
+
+def test_lru_eviction_respects_the_byte_budget() -> None:
+    cache = ResponseCache(max_bytes=3 * 200)
+    big = "y" * 150  # sys.getsizeof ~ 200 bytes
+
+    def compute() -> str:
+        return big
+
+    for params in (1, 2, 3):
+        cache.get_or_compute("ep", params, [], compute)
+    cache.get_or_compute("ep", 1, [], compute)  # 1 is now most recent
+    cache.get_or_compute("ep", 4, [], compute)
+
+    stats = cache.stats()
+    assert stats.entries == 3
+    assert stats.evictions == 1
+    assert stats.size_bytes <= stats.max_bytes
+    assert {e.params for e in stats.top_entries} == {"1", "3", "4"}
+
+
+def test_failed_compute_is_not_cached() -> None:
+    cache = ResponseCache(max_bytes=1 << 20)
+
+    def boom() -> str:
+        raise ValueError("no data")
+
+    for _ in range(2):
+        try:
+            cache.get_or_compute("ep", 1, [], boom)
+        except ValueError:
+            pass
+    assert cache.stats().entries == 0
+    assert cache.stats().misses == 2
+
+
+def test_concurrent_misses_share_one_compute() -> None:
+    cache = ResponseCache(max_bytes=1 << 20)
+    started = threading.Event()
+    release = threading.Event()
+    calls = 0
+
+    def slow() -> str:
+        nonlocal calls
+        calls += 1
+        started.set()
+        assert release.wait(timeout=5)
+        return "matrix"
+
+    def release_when_joined() -> None:
+        assert started.wait(timeout=5)
+        time.sleep(0.1)
+        release.set()
+
+    threading.Thread(target=release_when_joined, daemon=True).start()
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [
+            pool.submit(cache.get_or_compute, "ep", 1, [("prices", 1)], slow)
+            for _ in range(4)
+        ]
+        assert [f.result(timeout=5) for f in futures] == ["matrix"] * 4
+
+    assert calls == 1
+    (ep,) = cache.stats().endpoints
+    assert (ep.hits, ep.misses, ep.coalesced) == (0, 1, 3)
+    # The shared result was stored once and now serves plain hits.
+    assert cache.get_or_compute("ep", 1, [("prices", 1)], slow) == "matrix"
+    assert cache.stats().entries == 1 and calls == 1
+
+
+# ---------------------------------------------------------------------------
+# Endpoints
+# ---------------------------------------------------------------------------
+
+
+def test_correlations_are_served_from_cache_until_an_ingest(isolated_db: Path) -> None:
+    aapl = _seed_asset("AAPL")
+    msft = _seed_asset("MSFT")
+    tsla = _seed_asset("TSLA")
+    _seed_daily_closes(aapl, days=60, drift=0.5)
+    _seed_daily_closes(msft, days=60, drift=1.0)
+    params = {"symbols": "AAPL,MSFT", "lookback_days": 90}
+
+    with TestClient(app) as client:
+        first = client.get("/api/analytics/correlations/", params=params).json()
+        assert client.get("/api/analytics/correlations/", params=params).json() == first
+        stats = client.get("/api/cache/").json()
+        (ep,) = stats["endpoints"]
+        assert ep["endpoint"] == "analytics.correlations"
+        assert (ep["hits"], ep["misses"]) == (1, 1)
+        assert stats["top_entries"][0]["compute_ms"] > 0
+
+        # TSLA is not part of the matrix.
+        _seed_daily_closes(tsla, days=5, drift=1.0)
+        assert client.get("/api/cache/").json()["entries"] == 1
+
+        # New AAPL bars drop the entry on commit.
+        with session_scope() as s:
+            s.add(
+                PricePoint(
+                    asset_id=aapl,
+                    timestamp=datetime.now(UTC).replace(microsecond=0),
+                    interval="1d",
+                    open=Decimal("50"),
+                    high=Decimal("50"),
+                    low=Decimal("50"),
+                    close=Decimal("50"),
+                    volume=0,
+                )
+            )
+        assert client.get("/api/cache/").json()["entries"] == 0
+        client.get("/api/analytics/correlations/", params=params)
+        assert client.get("/api/cache/").json()["misses"] == 2
+
+        assert client.delete("/api/cache/").status_code == 204
+        assert client.get("/api/cache/").json()["entries"] == 0
+
+
+def test_portfolio_performance_cache_follows_transactions(isolated_db: Path) -> None:
+    aid = _seed_asset("AAPL")
+    _seed_daily_closes(aid, days=10, drift=1.0)
+    with TestClient(app) as client:
+        assert client.get("/api/portfolio/performance/").json()["points"] == []
+        resp = client.post(
+            "/api/portfolio/transactions/",
+            json={
+                "asset_id": aid,
+                "transaction_type": "buy",
+                "quantity": "2",
+                "price_per_unit": "100",
+                "transaction_date": (date.today() - timedelta(days=5)).isoformat(),
+            },
+        )
+        assert resp.status_code == 201, resp.text
+        assert client.get("/api/portfolio/performance/").json()["points"] != []
+    assert response_cache.stats().hits == 0
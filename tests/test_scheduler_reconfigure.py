@@ -51,6 +51,9 @@ DEFAULT_CONFIG = {
     "score_news_sentiment.enabled": True,
     "score_news_sentiment.interval_minutes": 60,
     "forecast.default_engine": "sarimax",
+    "forecast.auto_reevaluate_days": 7,
+    "forecast.auto_budget_seconds": 120,
+    "forecast.snapshot_retention_days": 90,
 }
 
 
@@ -154,4 +154,4 @@ def test_validate_and_serialize_bool_accepts_strings() -> None:
 
 
 def test_all_specs_have_unique_keys() -> None:
-    assert len(SPECS_BY_KEY) == 17, "spec list drifted — update assertions"
+    assert len(SPECS_BY_KEY) == 20, "spec list drifted — update assertions"
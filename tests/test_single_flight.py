@@ -0,0 +1,115 @@
+"""Tests for the single-flight call coalescer."""
+
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+
+from sidecar.single_flight import SingleFlight
+
+
+def _run_concurrently(n: int, call: Any) -> list[Any]:
+    """Run ``call`` on ``n`` threads; return each result or raised exception."""
+
+    def wrapped() -> Any:
+        try:
+            return call()
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(wrapped) for _ in range(n)]
+        return [f.result(timeout=5) for f in futures]
+
+
+class _Slow:
+    """Blocks until released, so every concurrent caller overlaps."""
+
+    def __init__(self, result: Any = "value", exc: Exception | None = None) -> None:
+        self.calls = 0
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.result = result
+        self.exc = exc
+
+    def __call__(self) -> Any:
+        self.calls += 1
+        self.started.set()
+        assert self.release.wait(timeout=5)
+        if self.exc is not None:
+            raise self.exc
+        return self.result
+
+
+def _release_after_start(fn: _Slow) -> None:
+    def release() -> None:
+        assert fn.started.wait(timeout=5)
+        # Let the remaining callers reach ``do`` and join the flight.
+        time.sleep(0.1)
+        fn.release.set()
+
+    threading.Thread(target=release, daemon=True).start()
+
+
+def test_concurrent_callers_share_one_call() -> None:
+    flights = SingleFlight()
+    fn = _Slow(result=["shared"])
+    _release_after_start(fn)
+
+    results = _run_concurrently(8, lambda: flights.do("op", ("a", 1), fn))
+
+    assert fn.calls == 1
+    assert all(r is results[0] for r in results)
+    assert flights.in_flight() == 0
+
+
+def test_exception_reaches_every_waiter_and_is_not_remembered() -> None:
+    flights = SingleFlight()
+    fn = _Slow(exc=ValueError("upstream down"))
+    _release_after_start(fn)
+
+    results = _run_concurrently(4, lambda: flights.do("op", 1, fn))
+
+    assert fn.calls == 1
+    assert all(isinstance(r, ValueError) for r in results)
+    # The failed flight is gone: the next call runs again.
+    assert flights.do("op", 1, lambda: "retried") == "retried"
+
+
+def test_sequential_calls_and_distinct_keys_run_separately() -> None:
+    flights = SingleFlight()
+    calls: list[tuple[str, int]] = []
+
+    def make(op: str, key: int) -> Any:
+        def fn() -> int:
+            calls.append((op, key))
+            return key
+
+        return fn
+
+    assert flights.do("op", 1, make("op", 1)) == 1
+    assert flights.do("op", 1, make("op", 1)) == 1
+    assert flights.do("op", 2, make("op", 2)) == 2
+    assert flights.do("other", 1, make("other", 1)) == 1
+    assert calls == [("op", 1), ("op", 1), ("op", 2), ("other", 1)]
+
+
+def test_nested_flights_on_other_keys_do_not_deadlock() -> None:
+    flights = SingleFlight()
+    result = flights.do("outer", 1, lambda: flights.do("inner", 1, lambda: "ok"))
+    assert result == "ok"
+
+
+def test_base_exceptions_release_the_flight() -> None:
+    flights = SingleFlight()
+
+    def interrupted() -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        flights.do("op", 1, interrupted)
+    assert flights.in_flight() == 0